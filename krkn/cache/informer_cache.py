@@ -0,0 +1,148 @@
+# Copyright 2025 The Krkn Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+import threading
+from typing import Callable, Optional
+
+from krkn_lib.k8s import KrknKubernetes
+from krkn_lib.utils.functions import get_yaml_item_value
+
+from krkn.cache.shared_informer import DEFAULT_WATCH_TIMEOUT, SharedInformer
+
+PODS = "pods"
+NODES = "nodes"
+VMIS = "vmis"
+
+DEFAULT_MAX_STALENESS = 120
+DEFAULT_SYNC_TIMEOUT = 60
+
+
+def _node_name(obj: dict) -> Optional[str]:
+    return (obj.get("spec") or {}).get("nodeName") or (
+        obj.get("status") or {}
+    ).get("nodeName")
+
+
+class InformerCache:
+    """
+    Process wide registry of the shared informers, every kind is listed
+    and watched once per cluster client and shared by all the scenario
+    and health check plugins. The cache is disabled by default, when
+    disabled (or when an informer is not synced or is stale) `get`
+    returns None and the callers fall back to a live LIST.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._informers: dict[tuple[str, int], SharedInformer] = {}
+        self.enabled = False
+        self.watch_timeout = DEFAULT_WATCH_TIMEOUT
+        self.max_staleness = DEFAULT_MAX_STALENESS
+        self.sync_timeout = DEFAULT_SYNC_TIMEOUT
+        # kind -> builder, overridable to run against fake watch streams
+        self.factories: dict[str, Callable[[KrknKubernetes], SharedInformer]] = {
+            PODS: self._pod_informer,
+            NODES: self._node_informer,
+            VMIS: self._vmi_informer,
+        }
+
+    def configure(self, config: Optional[dict]):
+        """
+        Configures the cache from the `tunings.informer_cache` config.
+
+        :param config: the `tunings.informer_cache` dict
+        """
+        config = config or {}
+        self.enabled = get_yaml_item_value(config, "enabled", False)
+        self.watch_timeout = get_yaml_item_value(
+            config, "watch_timeout", DEFAULT_WATCH_TIMEOUT
+        )
+        self.max_staleness = get_yaml_item_value(
+            config, "max_staleness", DEFAULT_MAX_STALENESS
+        )
+        self.sync_timeout = get_yaml_item_value(
+            config, "sync_timeout", DEFAULT_SYNC_TIMEOUT
+        )
+
+    def get(self, kind: str, kubecli: KrknKubernetes) -> Optional[SharedInformer]:
+        """
+        Returns the synced informer of a kind, starting it on first use.
+
+        :param kind: one of `pods`, `nodes` and `vmis`
+        :param kubecli: the client of the cluster
+        :return: the informer, None if the cache is disabled or the
+            informer can't currently be trusted
+        """
+        if not self.enabled or kubecli is None:
+            return None
+        key = (kind, id(kubecli))
+        created = False
+        with self._lock:
+            informer = self._informers.get(key)
+            if informer is None:
+                informer = self.factories[kind](kubecli)
+                self._informers[key] = informer
+                informer.start()
+                created = True
+        # only the first caller waits for the initial LIST
+        if not informer.wait_for_sync(self.sync_timeout if created else 0):
+            logging.warning(
+                f"{kind} informer not synced, falling back to the apiserver"
+            )
+            return None
+        staleness = informer.staleness()
+        if staleness > self.max_staleness:
+            logging.warning(
+                f"{kind} informer is stale ({staleness:.0f}s), "
+                f"falling back to the apiserver"
+            )
+            return None
+        return informer
+
+    def metrics(self) -> list[dict]:
+        with self._lock:
+            return [informer.metrics() for informer in self._informers.values()]
+
+    def stop(self):
+        with self._lock:
+            informers = list(self._informers.values())
+            self._informers.clear()
+        for informer in informers:
+            logging.debug(f"informer metrics: {informer.metrics()}")
+            informer.stop()
+
+    def _pod_informer(self, kubecli: KrknKubernetes) -> SharedInformer:
+        return SharedInformer(
+            PODS,
+            kubecli.cli.list_pod_for_all_namespaces,
+            index_func=_node_name,
+            watch_timeout=self.watch_timeout,
+        )
+
+    def _node_informer(self, kubecli: KrknKubernetes) -> SharedInformer:
+        return SharedInformer(
+            NODES, kubecli.cli.list_node, watch_timeout=self.watch_timeout
+        )
+
+    def _vmi_informer(self, kubecli: KrknKubernetes) -> SharedInformer:
+        return SharedInformer(
+            VMIS,
+            kubecli.custom_object_client.list_cluster_custom_object,
+            list_args=("kubevirt.io", "v1", "virtualmachineinstances"),
+            index_func=_node_name,
+            watch_timeout=self.watch_timeout,
+        )
+
+
+informer_cache = InformerCache()
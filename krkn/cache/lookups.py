@@ -0,0 +1,164 @@
+# Copyright 2025 The Krkn Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Drop-in replacements of the KrknKubernetes lookups used by the plugins,
+served by the shared informer cache when it is enabled and synced and by
+the apiserver otherwise.
+"""
+import re
+from typing import Optional
+
+from krkn_lib.k8s import KrknKubernetes
+
+from krkn.cache.informer_cache import NODES, PODS, VMIS, informer_cache
+from krkn.cache.shared_informer import SharedInformer, is_equality_selector
+
+
+def _cached(kind: str, kubecli: KrknKubernetes, label_selector: str = None) -> Optional[SharedInformer]:
+    if not is_equality_selector(label_selector):
+        return None
+    return informer_cache.get(kind, kubecli)
+
+
+def is_node_ready(node: dict) -> bool:
+    for condition in (node.get("status") or {}).get("conditions") or []:
+        if condition.get("type") == "Ready":
+            return condition.get("status") == "True"
+    return False
+
+
+def list_nodes(kubecli: KrknKubernetes, label_selector: str = None) -> list[str]:
+    """
+    Same as `KrknKubernetes.list_nodes`.
+    """
+    informer = _cached(NODES, kubecli, label_selector)
+    if informer is None:
+        return kubecli.list_nodes(label_selector=label_selector)
+    return [node["metadata"]["name"] for node in informer.list(label_selector=label_selector)]
+
+
+def list_ready_nodes(kubecli: KrknKubernetes, label_selector: str = None) -> list[str]:
+    """
+    Same as `KrknKubernetes.list_ready_nodes`.
+    """
+    informer = _cached(NODES, kubecli, label_selector)
+    if informer is None:
+        return kubecli.list_ready_nodes(label_selector)
+    return [
+        node["metadata"]["name"]
+        for node in informer.list(label_selector=label_selector, predicate=is_node_ready)
+    ]
+
+
+def find_kraken_node(kubecli: KrknKubernetes) -> Optional[str]:
+    """
+    Same as `KrknKubernetes.find_kraken_node`.
+    """
+    informer = _cached(PODS, kubecli)
+    if informer is None:
+        return kubecli.find_kraken_node()
+    for pod in informer.list():
+        if "kraken-deployment" in pod["metadata"]["name"]:
+            return (pod.get("spec") or {}).get("nodeName")
+    return None
+
+
+def list_killable_nodes(kubecli: KrknKubernetes, label_selector: str = None) -> list[str]:
+    """
+    Same as `KrknKubernetes.list_killable_nodes`.
+    """
+    informer = _cached(NODES, kubecli, label_selector)
+    if informer is None:
+        return kubecli.list_killable_nodes(label_selector)
+    kraken_node_name = find_kraken_node(kubecli)
+    return [
+        node["metadata"]["name"]
+        for node in informer.list(label_selector=label_selector, predicate=is_node_ready)
+        if node["metadata"]["name"] != kraken_node_name
+    ]
+
+
+def resolve_namespaces(kubecli: KrknKubernetes, namespace_pattern: str) -> list[str]:
+    """
+    Resolves a namespace pattern to the namespaces it targets. The pattern
+    is matched from the start of the namespace names, like the
+    `KrknKubernetes.select_pods_by_*` and `KrknKubernetes.get_vmis` methods
+    do, so a plain name also selects the namespaces it prefixes.
+
+    :param kubecli: the client of the cluster
+    :param namespace_pattern: a namespace name or regex
+    :return: the namespaces
+    """
+    return kubecli.list_namespaces_by_regex(namespace_pattern)
+
+
+def get_vmi(kubecli: KrknKubernetes, name: str, namespace: str) -> Optional[dict]:
+    """
+    Same as `KrknKubernetes.get_vmi`.
+    """
+    informer = _cached(VMIS, kubecli)
+    if informer is None:
+        return kubecli.get_vmi(name, namespace)
+    return informer.get(name, namespace)
+
+
+def pods_informer(kubecli: KrknKubernetes, label_selector: str = None) -> Optional[SharedInformer]:
+    """
+    Returns the pods informer if it can serve the label selector, None
+    if the pods must be selected through the apiserver.
+    """
+    return _cached(PODS, kubecli, label_selector)
+
+
+def select_pods(
+    informer: SharedInformer,
+    namespace_pattern: str,
+    label_selector: str = None,
+    name_pattern: str = None,
+    phase: str = None,
+    node_names: list[str] = None,
+) -> list[tuple[str, str]]:
+    """
+    Selects the `(name, namespace)` of the cached pods matching the
+    patterns, like `KrknKubernetes.select_pods_by_*`.
+
+    :param informer: the pods informer
+    :param namespace_pattern: regex matched against the namespace
+    :param label_selector: label selector of the pods (optional)
+    :param name_pattern: regex matched against the pod name (optional)
+    :param phase: phase of the pods (optional, e.g. `Running`)
+    :param node_names: nodes the pods must be scheduled on (optional)
+    :return: the list of pod name and namespace tuples
+    """
+    namespace_re = re.compile(namespace_pattern)
+    name_re = re.compile(name_pattern) if name_pattern else None
+    nodes = set(node_names) if node_names is not None else None
+
+    def _match(pod: dict) -> bool:
+        metadata = pod["metadata"]
+        if not namespace_re.match(metadata.get("namespace", "")):
+            return False
+        if name_re and not name_re.match(metadata["name"]):
+            return False
+        if phase and (pod.get("status") or {}).get("phase") != phase:
+            return False
+        if nodes is not None and (pod.get("spec") or {}).get("nodeName") not in nodes:
+            return False
+        return True
+
+    index = node_names[0] if node_names and len(node_names) == 1 else None
+    return [
+        (pod["metadata"]["name"], pod["metadata"]["namespace"])
+        for pod in informer.list(label_selector=label_selector, index=index, predicate=_match)
+    ]
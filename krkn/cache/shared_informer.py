@@ -0,0 +1,452 @@
+# Copyright 2025 The Krkn Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import logging
+import threading
+import time
+from typing import Callable, Iterable, Optional
+
+from kubernetes import watch
+from kubernetes.client.rest import ApiException
+
+DEFAULT_PAGE_SIZE = 500
+DEFAULT_WATCH_TIMEOUT = 60
+DEFAULT_RETRY_BACKOFF = 1
+MAX_RETRY_BACKOFF = 30
+
+
+def parse_label_selector(label_selector: Optional[str]) -> list[tuple]:
+    """
+    Parses an equality based label selector (`k=v`, `k==v`, `k!=v`, `k`,
+    `!k`, comma separated) into a list of `(operator, key, value)`.
+
+    :param label_selector: the label selector string
+    :return: the list of requirements, empty if the selector is empty
+    """
+    requirements = []
+    if not label_selector:
+        return requirements
+    for term in label_selector.split(","):
+        term = term.strip()
+        if not term:
+            continue
+        if "!=" in term:
+            key, value = term.split("!=", 1)
+            requirements.append(("!=", key.strip(), value.strip()))
+        elif "==" in term:
+            key, value = term.split("==", 1)
+            requirements.append(("=", key.strip(), value.strip()))
+        elif "=" in term:
+            key, value = term.split("=", 1)
+            requirements.append(("=", key.strip(), value.strip()))
+        elif term.startswith("!"):
+            requirements.append(("!", term[1:].strip(), None))
+        else:
+            requirements.append(("exists", term, None))
+    return requirements
+
+
+def is_equality_selector(label_selector: Optional[str]) -> bool:
+    """
+    Returns True if the selector can be evaluated by `parse_label_selector`,
+    set based selectors (`k in (a,b)`) are served by the apiserver only.
+    """
+    return not label_selector or not any(
+        token in label_selector for token in ("(", " in ", " notin ")
+    )
+
+
+def labels_match(labels: dict, requirements: list[tuple]) -> bool:
+    for operator, key, value in requirements:
+        if operator == "=" and labels.get(key) != value:
+            return False
+        if operator == "!=" and labels.get(key) == value:
+            return False
+        if operator == "exists" and key not in labels:
+            return False
+        if operator == "!" and key in labels:
+            return False
+    return True
+
+
+def object_key(obj: dict) -> str:
+    metadata = obj.get("metadata", {})
+    namespace = metadata.get("namespace")
+    name = metadata.get("name")
+    return f"{namespace}/{name}" if namespace else name
+
+
+class SharedInformer:
+    """
+    Keeps an in memory copy of a kind of Kubernetes objects with a single
+    LIST followed by a WATCH resumed from the last seen resourceVersion, a
+    new LIST is done only when the apiserver answers 410 Gone. The objects
+    are stored as the raw dicts returned by the apiserver and are indexed
+    by namespace, by label and by the optional `index_func` (e.g. the node
+    of a pod), so selector lookups do not scan the whole store.
+    """
+
+    def __init__(
+        self,
+        resource: str,
+        list_func: Callable,
+        list_args: Iterable = (),
+        list_kwargs: dict = None,
+        index_func: Callable[[dict], Optional[str]] = None,
+        watch_timeout: int = DEFAULT_WATCH_TIMEOUT,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        watch_factory: Callable = watch.Watch,
+    ):
+        """
+        :param resource: the name of the kind, used in logs and metrics
+        :param list_func: the kubernetes client list function of the kind,
+            supporting `watch=True` (e.g. `CoreV1Api.list_pod_for_all_namespaces`)
+        :param list_args: positional arguments of `list_func`
+            (e.g. group, version and plural of a custom resource)
+        :param list_kwargs: keyword arguments of `list_func` applied to
+            both the LIST and the WATCH (e.g. a server side `label_selector`)
+        :param index_func: returns the value the objects are indexed by
+            in `by_index` (optional)
+        :param watch_timeout: server side timeout of every watch request
+        :param page_size: limit of every page of the initial LIST
+        :param watch_factory: builds the `kubernetes.watch.Watch` used to
+            stream the events
+        """
+        self.resource = resource
+        self._list_func = list_func
+        self._list_args = tuple(list_args)
+        self._list_kwargs = dict(list_kwargs or {})
+        self._index_func = index_func
+        self._watch_timeout = watch_timeout
+        self._page_size = page_size
+        self._watch_factory = watch_factory
+
+        self._lock = threading.RLock()
+        self._synced = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._watch = None
+        self._listeners: list[Callable[[str, dict], None]] = []
+
+        self._objects: dict[str, dict] = {}
+        self._by_namespace: dict[str, set[str]] = {}
+        self._by_label: dict[tuple[str, str], set[str]] = {}
+        self._by_index: dict[str, set[str]] = {}
+
+        self.resource_version: Optional[str] = None
+        self._last_update = 0.0
+        self._events = 0
+        self._relists = 0
+        self._watch_errors = 0
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name=f"krkn-informer-{self.resource}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._watch is not None:
+            self._watch.stop()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def sync(self):
+        """
+        Loads the initial LIST in the calling thread, so its errors are
+        raised to the caller; `start` then resumes with the watch.
+        """
+        self._relist()
+
+    def wait_for_sync(self, timeout: float = None) -> bool:
+        """
+        Waits until the initial LIST has been loaded.
+
+        :param timeout: maximum time to wait in seconds
+        :return: True if the store is synced
+        """
+        return self._synced.wait(timeout)
+
+    @property
+    def synced(self) -> bool:
+        return self._synced.is_set()
+
+    def add_listener(self, listener: Callable[[str, dict], None]):
+        """
+        Registers a callable invoked with `(event_type, object)` for every
+        change applied to the store, from the informer thread. The LIST
+        replacing the store is notified as `ADDED` events.
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[str, dict], None]):
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+    def get(self, name: str, namespace: str = None) -> Optional[dict]:
+        key = f"{namespace}/{name}" if namespace else name
+        with self._lock:
+            return self._objects.get(key)
+
+    def list(
+        self,
+        namespace: str = None,
+        label_selector: str = None,
+        index: str = None,
+        predicate: Callable[[dict], bool] = None,
+    ) -> list[dict]:
+        """
+        Returns the stored objects matching all the given filters.
+
+        :param namespace: namespace of the objects
+        :param label_selector: equality based label selector
+        :param index: value returned by `index_func` for the objects
+        :param predicate: additional filter evaluated on every candidate
+        :return: the matching objects
+        """
+        requirements = parse_label_selector(label_selector)
+        with self._lock:
+            candidates = None
+            if namespace is not None:
+                candidates = set(self._by_namespace.get(namespace, set()))
+            if index is not None:
+                if self._index_func is None:
+                    raise ValueError(f"{self.resource} informer has no index")
+                candidates = self._intersect(
+                    candidates, self._by_index.get(index, set())
+                )
+            for operator, key, value in requirements:
+                if operator == "=":
+                    candidates = self._intersect(
+                        candidates, self._by_label.get((key, value), set())
+                    )
+            if candidates is None:
+                candidates = self._objects.keys()
+            result = []
+            for key in candidates:
+                obj = self._objects[key]
+                if not labels_match(
+                    obj.get("metadata", {}).get("labels") or {}, requirements
+                ):
+                    continue
+                if predicate is not None and not predicate(obj):
+                    continue
+                result.append(obj)
+            return result
+
+    @staticmethod
+    def _intersect(candidates: Optional[set], keys: set) -> set:
+        if candidates is None:
+            return set(keys)
+        return candidates & keys
+
+    def staleness(self) -> float:
+        """
+        Seconds since the store was last confirmed up to date by the
+        apiserver (an event or the clean end of a watch request).
+        """
+        if not self.synced:
+            return float("inf")
+        return time.monotonic() - self._last_update
+
+    def metrics(self) -> dict:
+        with self._lock:
+            return {
+                "resource": self.resource,
+                "synced": self.synced,
+                "objects": len(self._objects),
+                "resource_version": self.resource_version,
+                "events": self._events,
+                "relists": self._relists,
+                "watch_errors": self._watch_errors,
+                "staleness_seconds": self.staleness(),
+            }
+
+    # ------------------------------------------------------------------
+    # List and watch
+    # ------------------------------------------------------------------
+    def _run(self):
+        backoff = DEFAULT_RETRY_BACKOFF
+        while not self._stop.is_set():
+            try:
+                if self.resource_version is None:
+                    self._relist()
+                self._watch_once()
+                backoff = DEFAULT_RETRY_BACKOFF
+            except ApiException as e:
+                if e.status == 410:
+                    logging.debug(
+                        f"{self.resource} informer resourceVersion "
+                        f"{self.resource_version} expired, listing again"
+                    )
+                    self.resource_version = None
+                    continue
+                self._watch_errors += 1
+                logging.warning(f"{self.resource} informer watch failed: {e}")
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, MAX_RETRY_BACKOFF)
+            except Exception as e:
+                self._watch_errors += 1
+                logging.warning(f"{self.resource} informer watch failed: {e}")
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, MAX_RETRY_BACKOFF)
+
+    def _relist(self):
+        objects = []
+        continue_token = None
+        while True:
+            kwargs = {
+                **self._list_kwargs,
+                "limit": self._page_size,
+                "_preload_content": False,
+            }
+            if continue_token:
+                kwargs["_continue"] = continue_token
+            response = self._list_func(*self._list_args, **kwargs)
+            page = json.loads(response.data)
+            objects.extend(page.get("items") or [])
+            metadata = page.get("metadata") or {}
+            continue_token = metadata.get("continue")
+            if not continue_token:
+                resource_version = metadata.get("resourceVersion")
+                break
+        with self._lock:
+            self._objects.clear()
+            self._by_namespace.clear()
+            self._by_label.clear()
+            self._by_index.clear()
+            for obj in objects:
+                self._store(obj)
+            self.resource_version = resource_version
+            self._relists += 1
+            self._last_update = time.monotonic()
+            listeners = list(self._listeners)
+        self._synced.set()
+        logging.debug(
+            f"{self.resource} informer listed {len(objects)} objects "
+            f"at resourceVersion {resource_version}"
+        )
+        for obj in objects:
+            self._notify(listeners, "ADDED", obj)
+
+    def _watch_once(self):
+        self._watch = self._watch_factory()
+        stream = self._watch.stream(
+            self._list_func,
+            *self._list_args,
+            **self._list_kwargs,
+            resource_version=self.resource_version,
+            timeout_seconds=self._watch_timeout,
+            allow_watch_bookmarks=True,
+            # the store keeps the raw dicts, skip the model deserialization
+            deserialize=False,
+        )
+        while not self._stop.is_set():
+            try:
+                event = next(stream)
+            except StopIteration:
+                break
+            except KeyError as e:
+                # without deserialization `Watch.stream` fails to read the
+                # status of the ERROR events (e.g. 410 Gone), the
+                # resourceVersion can't be trusted anymore
+                logging.debug(
+                    f"{self.resource} informer watch returned an error "
+                    f"event ({e}), listing again"
+                )
+                self.resource_version = None
+                return
+            self._handle_event(event)
+        # a watch ending without errors confirms the store is up to date
+        self._last_update = time.monotonic()
+
+    def _handle_event(self, event: dict):
+        event_type = event.get("type")
+        obj = event.get("raw_object") or event.get("object")
+        if event_type == "ERROR":
+            status = obj if isinstance(obj, dict) else {}
+            raise ApiException(
+                status=status.get("code", 500), reason=status.get("message")
+            )
+        metadata = obj.get("metadata", {})
+        resource_version = metadata.get("resourceVersion")
+        if event_type == "BOOKMARK":
+            with self._lock:
+                self.resource_version = resource_version
+                self._last_update = time.monotonic()
+            return
+        with self._lock:
+            if event_type == "DELETED":
+                self._remove(object_key(obj))
+            else:
+                self._store(obj)
+            if resource_version:
+                self.resource_version = resource_version
+            self._events += 1
+            self._last_update = time.monotonic()
+            listeners = list(self._listeners)
+        self._notify(listeners, event_type, obj)
+
+    @staticmethod
+    def _notify(listeners, event_type: str, obj: dict):
+        for listener in listeners:
+            try:
+                listener(event_type, obj)
+            except Exception as e:
+                logging.error(f"informer listener failed: {e}")
+
+    def _store(self, obj: dict):
+        key = object_key(obj)
+        self._remove(key)
+        self._objects[key] = obj
+        metadata = obj.get("metadata", {})
+        namespace = metadata.get("namespace")
+        if namespace:
+            self._by_namespace.setdefault(namespace, set()).add(key)
+        for label in (metadata.get("labels") or {}).items():
+            self._by_label.setdefault(label, set()).add(key)
+        if self._index_func:
+            index = self._index_func(obj)
+            if index:
+                self._by_index.setdefault(index, set()).add(key)
+
+    def _remove(self, key: str):
+        obj = self._objects.pop(key, None)
+        if obj is None:
+            return
+        metadata = obj.get("metadata", {})
+        self._discard(self._by_namespace, metadata.get("namespace"), key)
+        for label in (metadata.get("labels") or {}).items():
+            self._discard(self._by_label, label, key)
+        if self._index_func:
+            self._discard(self._by_index, self._index_func(obj), key)
+
+    @staticmethod
+    def _discard(index: dict, value, key: str):
+        if value is None or value not in index:
+            return
+        index[value].discard(key)
+        if not index[value]:
+            del index[value]
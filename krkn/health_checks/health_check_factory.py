@@ -19,6 +19,7 @@ import queue
 import threading
 from typing import Type, Tuple, Optional, Any
 from krkn.health_checks.abstract_health_check_plugin import AbstractHealthCheckPlugin
+from krkn.plugin_registry import LazyPluginRegistry, load_manifest
 
 
 class HealthCheckPluginNotFound(Exception):
@@ -32,7 +33,8 @@ class HealthCheckFactory:
 
     This factory automatically discovers and loads all health check plugins in the
     krkn.health_checks package that follow the naming conventions and inherit from
-    AbstractHealthCheckPlugin.
+    AbstractHealthCheckPlugin. When the package has an up to date plugin manifest,
+    the plugins are registered from it and only imported when created.
     """
 
     loaded_plugins: dict[str, Any] = {}
@@ -41,16 +43,36 @@ class HealthCheckFactory:
     package_name = None
     active_plugins: list = []
 
-    def __init__(self, package_name: str = "krkn.health_checks"):
+    def __init__(self, package_name: str = "krkn.health_checks", lazy: bool = True):
         """
         Initializes the HealthCheckFactory and loads all available health check plugins.
 
         :param package_name: the package to scan for health check plugins
+        :param lazy: register the plugins from the plugin manifest of the package
+            and import them on first use; without an up to date manifest all the
+            plugins are imported
         """
         self.package_name = package_name
         self.active_plugins = []
         self.config_key_map = {}
-        self.__load_plugins(AbstractHealthCheckPlugin)
+        self.loaded_plugins = {}
+        self.failed_plugins = []
+        manifest = None
+        if lazy:
+            manifest = load_manifest(
+                package_name,
+                "_health_check_plugin",
+                exclude=[AbstractHealthCheckPlugin.__module__],
+            )
+        if manifest is not None:
+            self.loaded_plugins = LazyPluginRegistry(
+                manifest, AbstractHealthCheckPlugin, self.failed_plugins
+            )
+            for plugin in manifest["plugins"]:
+                if plugin.get("config_key"):
+                    self.config_key_map[plugin["config_key"]] = plugin["types"][0]
+        else:
+            self.__load_plugins(AbstractHealthCheckPlugin)
 
     def create_plugin(
         self, health_check_type: str, iterations: int = 1, **kwargs
@@ -68,10 +90,9 @@ class HealthCheckFactory:
         :return: an instance of the class that implements this health check and
             inherits from the AbstractHealthCheckPlugin abstract class
         """
-        if health_check_type in self.loaded_plugins:
-            plugin = self.loaded_plugins[health_check_type](
-                health_check_type, iterations=iterations, **kwargs
-            )
+        plugin_class = self.loaded_plugins.get(health_check_type)
+        if plugin_class is not None:
+            plugin = plugin_class(health_check_type, iterations=iterations, **kwargs)
             self.active_plugins.append(plugin)
             return plugin
         else:
@@ -27,6 +27,12 @@ Example configuration in config.yaml:
           auth: "username,password"   # Optional (basic auth)
           verify_url: true             # Optional, default: true
           exit_on_failure: false       # Optional, default: false
+      max_workers: 10                  # Optional, concurrent requests per cycle
+      metrics_window: 30               # Optional, seconds per latency window
+
+The URLs of a cycle are probed concurrently and the latency percentiles
+(p50/p95/p99) and error rate of every URL are recorded per metrics window
+into the `latency_metrics` of its last health check record.
 """
 
 import logging
@@ -39,6 +45,13 @@ import requests
 from krkn_lib.models.telemetry.models import HealthCheck
 
 from krkn.health_checks.abstract_health_check_plugin import AbstractHealthCheckPlugin
+from krkn.health_checks.http_probe import (
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_METRICS_WINDOW,
+    HttpProber,
+    ProbeMetrics,
+    ThreadLocalSessions,
+)
 
 
 class HttpHealthCheckPlugin(AbstractHealthCheckPlugin):
@@ -65,13 +78,26 @@ class HttpHealthCheckPlugin(AbstractHealthCheckPlugin):
         super().__init__(health_check_type)
         self.iterations = iterations
         self.current_iterations = 0
-        self.http_session = requests.Session()
+        self._sessions = ThreadLocalSessions()
+
+    @property
+    def http_session(self) -> requests.Session | None:
+        """The HTTP session of the calling thread, None once closed."""
+        if self._sessions is None:
+            return None
+        return self._sessions.get()
+
+    @http_session.setter
+    def http_session(self, session: requests.Session) -> None:
+        if self._sessions is None:
+            self._sessions = ThreadLocalSessions()
+        self._sessions.set(session)
 
     def close(self) -> None:
-        """Close the HTTP session and release resources."""
-        if self.http_session:
-            self.http_session.close()
-            self.http_session = None
+        """Close the HTTP sessions and release resources."""
+        if self._sessions is not None:
+            self._sessions.close()
+            self._sessions = None
 
     def __enter__(self):
         return self
@@ -132,6 +158,49 @@ class HttpHealthCheckPlugin(AbstractHealthCheckPlugin):
 
         return response_data
 
+    @staticmethod
+    def _request_args(check_config: dict[str, Any]) -> tuple:
+        """
+        Builds the make_request arguments of a health check config.
+
+        :param check_config: the configuration of a URL
+        :return: the url, auth, headers and verify arguments
+        """
+        auth, headers = None, None
+        if check_config.get("bearer_token"):
+            bearer_token = "Bearer " + check_config["bearer_token"]
+            headers = {"Authorization": bearer_token}
+        if check_config.get("auth"):
+            auth = tuple(check_config["auth"].split(","))
+        return (
+            check_config["url"], auth, headers, check_config.get("verify_url", True)
+        )
+
+    @staticmethod
+    def _attach_latency_metrics(
+        health_check_telemetry: list[HealthCheck], metrics: ProbeMetrics
+    ) -> None:
+        """
+        Attaches the latency metrics of every URL to its last health check
+        record.
+
+        :param health_check_telemetry: the health check records
+        :param metrics: the metrics of the probes
+        :return: None
+        """
+        last_records = {record.url: record for record in health_check_telemetry}
+        for url in metrics.urls():
+            latency_metrics = metrics.to_dict(url)
+            logging.info(
+                f"HTTP health check {url}: requests={latency_metrics['requests']} "
+                f"error_rate={latency_metrics['error_rate']} "
+                f"p50={latency_metrics['p50_ms']}ms "
+                f"p95={latency_metrics['p95_ms']}ms "
+                f"p99={latency_metrics['p99_ms']}ms"
+            )
+            if url in last_records:
+                last_records[url].latency_metrics = latency_metrics
+
     def run_health_check(
         self,
         config: dict[str, Any],
@@ -157,88 +226,79 @@ class HttpHealthCheckPlugin(AbstractHealthCheckPlugin):
         health_check_telemetry = []
         health_check_tracker = {}
         interval = config.get("interval", 2)
+        max_workers = config.get("max_workers", DEFAULT_MAX_WORKERS)
+        metrics = ProbeMetrics(config.get("metrics_window", DEFAULT_METRICS_WINDOW))
+        checks = [cfg for cfg in config["config"] if cfg.get("url")]
+        if self._sessions is not None:
+            self._sessions.mount([cfg["url"] for cfg in checks])
 
         # Track current response status for each URL
-        response_tracker = {
-            cfg["url"]: True for cfg in config["config"] if cfg.get("url")
-        }
-
-        while self.current_iterations < self.iterations and not self._stop_event.is_set():
-            for check_config in config.get("config", []):
-                auth, headers = None, None
-                verify_url = check_config.get("verify_url", True)
-                url = check_config.get("url")
-
-                if not url:
-                    continue
-
-                # Set up authentication
-                if check_config.get("bearer_token"):
-                    bearer_token = "Bearer " + check_config["bearer_token"]
-                    headers = {"Authorization": bearer_token}
-
-                if check_config.get("auth"):
-                    auth = tuple(check_config["auth"].split(","))
-
-                # Make the HTTP request
-                try:
-                    response = self.make_request(url, auth, headers, verify_url)
-                except Exception as e:
-                    logging.error(f"Exception during HTTP health check: {e}")
-                    response = {
-                        "url": url,
-                        "status": False,
-                        "status_code": 500
-                    }
-
-                # Track status changes
-                if url not in health_check_tracker:
-                    # First time seeing this URL in this run
-                    start_timestamp = datetime.now()
-                    health_check_tracker[url] = {
-                        "status_code": response["status_code"],
-                        "start_timestamp": start_timestamp,
-                    }
-                    if response["status_code"] != 200:
-                        if response_tracker[url] != False:
-                            response_tracker[url] = False
-                        if (
-                            check_config.get("exit_on_failure", False)
-                            and self.ret_value == 0
-                        ):
-                            self.ret_value = 3
-                else:
-                    # Check if status changed
-                    if (
-                        response["status_code"]
-                        != health_check_tracker[url]["status_code"]
-                    ):
-                        end_timestamp = datetime.now()
-                        start_timestamp = health_check_tracker[url]["start_timestamp"]
-                        previous_status_code = str(
-                            health_check_tracker[url]["status_code"]
-                        )
-                        duration = (end_timestamp - start_timestamp).total_seconds()
-
-                        # Record the status change period
-                        change_record = {
+        response_tracker = {cfg["url"]: True for cfg in checks}
+
+        with HttpProber(self.make_request, metrics, max_workers) as prober:
+            while self.current_iterations < self.iterations and not self._stop_event.is_set():
+                # Probe all the URLs of the cycle at once
+                responses = prober.probe_all(
+                    [self._request_args(check_config) for check_config in checks]
+                )
+                for check_config, response in zip(checks, responses):
+                    url = check_config["url"]
+                    if isinstance(response, Exception):
+                        logging.error(f"Exception during HTTP health check: {response}")
+                        response = {
                             "url": url,
-                            "status": previous_status_code == "200",
-                            "status_code": previous_status_code,
-                            "start_timestamp": start_timestamp.isoformat(),
-                            "end_timestamp": end_timestamp.isoformat(),
-                            "duration": duration,
+                            "status": False,
+                            "status_code": 500
+                        }
+
+                    # Track status changes
+                    if url not in health_check_tracker:
+                        # First time seeing this URL in this run
+                        start_timestamp = datetime.now()
+                        health_check_tracker[url] = {
+                            "status_code": response["status_code"],
+                            "start_timestamp": start_timestamp,
                         }
+                        if response["status_code"] != 200:
+                            if response_tracker[url] != False:
+                                response_tracker[url] = False
+                            if (
+                                check_config.get("exit_on_failure", False)
+                                and self.ret_value == 0
+                            ):
+                                self.ret_value = 3
+                    else:
+                        # Check if status changed
+                        if (
+                            response["status_code"]
+                            != health_check_tracker[url]["status_code"]
+                        ):
+                            end_timestamp = datetime.now()
+                            start_timestamp = health_check_tracker[url]["start_timestamp"]
+                            previous_status_code = str(
+                                health_check_tracker[url]["status_code"]
+                            )
+                            duration = (end_timestamp - start_timestamp).total_seconds()
 
-                        health_check_telemetry.append(HealthCheck(change_record))
+                            # Record the status change period
+                            change_record = {
+                                "url": url,
+                                "status": previous_status_code == "200",
+                                "status_code": previous_status_code,
+                                "start_timestamp": start_timestamp.isoformat(),
+                                "end_timestamp": end_timestamp.isoformat(),
+                                "duration": duration,
+                            }
 
-                        if response_tracker[url] != True:
-                            response_tracker[url] = True
+                            health_check_telemetry.append(HealthCheck(change_record))
 
-                        # Reset tracker with new status
-                        del health_check_tracker[url]
+                            if response_tracker[url] != True:
+                                response_tracker[url] = True
 
-            time.sleep(interval)
+                            # Reset tracker with new status
+                            del health_check_tracker[url]
+
+                time.sleep(interval)
 
         # Record final status for all tracked URLs
         health_check_end_timestamp = datetime.now()
@@ -259,5 +319,7 @@ class HttpHealthCheckPlugin(AbstractHealthCheckPlugin):
             }
             health_check_telemetry.append(HealthCheck(final_record))
 
+        self._attach_latency_metrics(health_check_telemetry, metrics)
+
         # Put telemetry data in the queue
         telemetry_queue.put(health_check_telemetry)
@@ -0,0 +1,282 @@
+# Copyright 2026 The Krkn Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Concurrent probing engine of the HTTP health check plugin.
+
+Every probe cycle sends the requests of all the configured URLs at once
+on a small thread pool, every thread having its own session (a
+requests.Session isn't thread-safe) keeping alive a connection per host.
+The latency and the outcome of every probe are recorded into a per-URL
+latency histogram for each metrics window, so degradations that stay
+under the request timeout show up in the p50/p95/p99 time series.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+from urllib.parse import urlsplit
+
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+
+from krkn.utils.latency_histogram import (
+    LatencyHistogram,
+    log_buckets,
+)
+
+# maximum number of requests sent at the same time
+DEFAULT_MAX_WORKERS = 10
+# width of the windows of the latency time series in seconds
+DEFAULT_METRICS_WINDOW = 30
+
+# latency buckets from 1ms to 60s, lower bounds in nanoseconds
+_BOUNDS = log_buckets(min_latency=1e6, max_latency=6e10)
+
+
+def mount_connection_pool(
+    session: requests.Session, urls: list[str], max_workers: int
+) -> None:
+    """
+    Mounts on the session an adapter keeping alive a connection pool per
+    host, big enough for the concurrent requests of a probe cycle.
+
+    :param session: the session of a probe thread
+    :param urls: the probed URLs
+    :param max_workers: maximum number of requests sent at the same time
+    """
+    hosts = {urlsplit(url).netloc for url in urls}
+    adapter = HTTPAdapter(
+        pool_connections=max(len(hosts), 1), pool_maxsize=max(max_workers, 1)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+
+class ThreadLocalSessions:
+    """
+    One requests.Session per thread, created on first use. The adapter of
+    `mount` is mounted on every session, the ones created later included.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._sessions: list[requests.Session] = []
+        self._urls: list[str] = []
+        self._lock = threading.Lock()
+
+    def mount(self, urls: list[str]) -> None:
+        """
+        Keeps alive a connection per host of the URLs in every session, a
+        thread sends a single request at a time.
+
+        :param urls: the probed URLs
+        """
+        with self._lock:
+            self._urls = list(urls)
+            sessions = list(self._sessions)
+        for session in sessions:
+            mount_connection_pool(session, urls, 1)
+
+    def get(self) -> requests.Session:
+        """
+        Returns the session of the calling thread.
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            self.set(session)
+        return session
+
+    def set(self, session: requests.Session) -> None:
+        """
+        Replaces the session of the calling thread, it is closed by `close`.
+        """
+        self._local.session = session
+        with self._lock:
+            self._sessions.append(session)
+            urls = self._urls
+        if urls:
+            mount_connection_pool(session, urls, 1)
+
+    def close(self) -> None:
+        """
+        Closes the sessions of all the threads.
+        """
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+
+
+class _Window:
+    __slots__ = ("requests", "errors", "histogram")
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.histogram = LatencyHistogram.empty(_BOUNDS)
+
+
+class ProbeMetrics:
+    """
+    Latency histograms and error counts of the probes of every URL, one
+    histogram per window of `window` seconds. Thread-safe.
+    """
+
+    def __init__(self, window: float = DEFAULT_METRICS_WINDOW):
+        """
+        :param window: width of the windows in seconds
+        """
+        if window <= 0:
+            raise ValueError("the metrics window must be positive")
+        self.window = window
+        self._windows: dict[str, dict[int, _Window]] = {}
+        self._lock = threading.Lock()
+
+    def add(
+        self, url: str, latency: float, success: bool, timestamp: float = None
+    ) -> None:
+        """
+        Records a probe.
+
+        :param url: the probed URL
+        :param latency: the latency of the probe in seconds
+        :param success: whether the probe succeeded
+        :param timestamp: epoch time of the probe, now by default
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        with self._lock:
+            window = self._windows.setdefault(url, {}).setdefault(
+                int(timestamp // self.window), _Window()
+            )
+            window.requests += 1
+            window.errors += 0 if success else 1
+            window.histogram.record(latency * 1e9)
+
+    def urls(self) -> list[str]:
+        with self._lock:
+            return list(self._windows)
+
+    def to_dict(self, url: str) -> Optional[dict[str, Any]]:
+        """
+        Returns the columnar time series of a URL (latencies in
+        milliseconds, the empty windows included) with the percentiles of
+        the whole run.
+
+        :param url: the probed URL
+        :return: the metrics or None if the URL was never probed
+        """
+        with self._lock:
+            windows = self._windows.get(url)
+            if not windows:
+                return None
+            first, last = min(windows), max(windows)
+            series = [windows.get(i) or _Window() for i in range(first, last + 1)]
+            counts = [w.histogram.counts.copy() for w in series]
+            requests_count = np.array([w.requests for w in series], dtype=float)
+            errors = np.array([w.errors for w in series], dtype=float)
+
+        quantiles = np.array(
+            [LatencyHistogram(_BOUNDS, c).quantiles([0.5, 0.95, 0.99]) for c in counts]
+        ) / 1e6
+        total = LatencyHistogram(_BOUNDS, np.sum(counts, axis=0))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            error_rate = np.where(requests_count > 0, errors / requests_count, 0.0)
+        p50, p95, p99 = total.quantiles([0.5, 0.95, 0.99]) / 1e6
+        return {
+            "requests": int(requests_count.sum()),
+            "error_rate": round(float(errors.sum() / max(requests_count.sum(), 1)), 4),
+            "p50_ms": round(float(p50), 2),
+            "p95_ms": round(float(p95), 2),
+            "p99_ms": round(float(p99), 2),
+            "timeseries": {
+                "window": self.window,
+                "start": first * self.window,
+                "requests": [int(r) for r in requests_count],
+                "error_rate": [round(float(e), 4) for e in error_rate],
+                "p50_ms": [round(float(q), 2) for q in quantiles[:, 0]],
+                "p95_ms": [round(float(q), 2) for q in quantiles[:, 1]],
+                "p99_ms": [round(float(q), 2) for q in quantiles[:, 2]],
+            },
+        }
+
+
+class HttpProber:
+    """
+    Sends the probes of a cycle concurrently and records them into
+    `ProbeMetrics`.
+    """
+
+    def __init__(
+        self,
+        request_func: Callable[..., dict[str, Any]],
+        metrics: ProbeMetrics,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
+        """
+        :param request_func: sends a probe, called with the URL, auth,
+            headers and verify flag, returns a dict with the url, status and
+            status_code
+        :param metrics: where the probes are recorded
+        :param max_workers: maximum number of requests sent at the same time
+        """
+        self.request_func = request_func
+        self.metrics = metrics
+        self.max_workers = max(max_workers, 1)
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def __enter__(self):
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="http-probe"
+        )
+        return self
+
+    def __exit__(self, *args):
+        self._executor.shutdown(wait=True)
+        self._executor = None
+
+    def _timed_probe(self, url: str, auth, headers, verify: bool) -> dict[str, Any]:
+        start = time.monotonic()
+        timestamp = time.time()
+        try:
+            response = self.request_func(url, auth, headers, verify)
+        except Exception:
+            self.metrics.add(url, time.monotonic() - start, False, timestamp)
+            raise
+        self.metrics.add(
+            url,
+            time.monotonic() - start,
+            response.get("status_code") == 200,
+            timestamp,
+        )
+        return response
+
+    def probe_all(self, probes: list[tuple]) -> list:
+        """
+        Sends the probes of a cycle concurrently.
+
+        :param probes: (url, auth, headers, verify) of every probe
+        :return: the response of every probe in the same order, or the
+            exception it raised
+        """
+        futures = [self._executor.submit(self._timed_probe, *probe) for probe in probes]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+        return results
@@ -0,0 +1,290 @@
+# Copyright 2026 The Krkn Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Persistent SSH sessions of the virt health check access probes.
+
+The disconnected probes hop through a node (`ssh core@<node> 'ssh root@<vm>'`).
+Instead of a new ssh process authenticating to the node on every probe, an
+OpenSSH ControlMaster session is opened once per node and every probe runs
+as a channel multiplexed on it; the session is only opened again after it
+failed. The time spent opening the sessions is recorded apart from the time
+of the probes themselves.
+"""
+import atexit
+import copy
+import hashlib
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from krkn.utils.latency_histogram import LatencyHistogram, log_buckets
+
+# how long an idle master session is kept open, in seconds
+DEFAULT_CONTROL_PERSIST = 600
+DEFAULT_CONNECT_TIMEOUT = 5
+DEFAULT_COMMAND_TIMEOUT = 15
+
+# exit status of the ssh client when the connection itself failed
+SSH_ERROR = 255
+
+# latency buckets from 100us to 60s, lower bounds in nanoseconds
+_BOUNDS = log_buckets(min_latency=1e5, max_latency=6e10)
+
+
+@dataclass
+class SshResult:
+    """Outcome of a command run on a pooled session."""
+    returncode: Optional[int]
+    output: str
+    # seconds spent opening the session, None if an open one was reused
+    connect_latency: Optional[float]
+    # seconds spent running the command on the session
+    command_latency: Optional[float]
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode is not None and self.returncode != SSH_ERROR
+
+
+class SshSessionPool:
+    """
+    OpenSSH ControlMaster sessions keyed by destination (`user@host`).
+    Thread-safe: a destination is opened once even when the probes of
+    several batches hop through it at the same time.
+    """
+
+    def __init__(
+        self,
+        control_persist: int = DEFAULT_CONTROL_PERSIST,
+        connect_timeout: int = DEFAULT_CONNECT_TIMEOUT,
+        command_timeout: int = DEFAULT_COMMAND_TIMEOUT,
+        ssh_binary: str = "ssh",
+        ssh_options: list[str] = None,
+        run_func: Callable = subprocess.run,
+    ):
+        """
+        :param control_persist: how long an idle session is kept open
+        :param connect_timeout: timeout of the connection to a destination
+        :param command_timeout: timeout of a command run on a session
+        :param ssh_binary: the ssh client
+        :param ssh_options: extra `-o` options of every ssh call
+            (e.g. `Port=2222`)
+        :param run_func: runs the ssh processes, `subprocess.run` signature
+        """
+        self.control_persist = control_persist
+        self.connect_timeout = connect_timeout
+        self.command_timeout = command_timeout
+        self.ssh_binary = ssh_binary
+        self.ssh_options = list(ssh_options or [])
+        self._run = run_func
+        self._control_dir = tempfile.mkdtemp(prefix="krkn-ssh-")
+        self._connected: set[str] = set()
+        self._locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        # the masters outlive krkn unless closed, whatever the exit path
+        atexit.register(self.close_all)
+
+    def _control_path(self, destination: str) -> str:
+        # unix socket paths are limited to ~100 characters
+        digest = hashlib.sha1(destination.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self._control_dir, digest)
+
+    def _base_command(self, destination: str) -> list[str]:
+        command = [self.ssh_binary]
+        for option in self.ssh_options:
+            command.extend(["-o", option])
+        return command + ["-o", f"ControlPath={self._control_path(destination)}"]
+
+    def _destination_lock(self, destination: str) -> threading.Lock:
+        with self._lock:
+            return self._locks.setdefault(destination, threading.Lock())
+
+    def is_connected(self, destination: str) -> bool:
+        # the socket disappears when the master exits (ControlPersist expired)
+        return destination in self._connected and os.path.exists(
+            self._control_path(destination)
+        )
+
+    def connect(self, destination: str) -> Optional[float]:
+        """
+        Opens the master session of a destination if it isn't open.
+
+        :param destination: `user@host` to connect to
+        :return: the seconds spent connecting, None if the session was
+            already open
+        :raises ConnectionError: if the session can't be opened
+        """
+        with self._destination_lock(destination):
+            if self.is_connected(destination):
+                return None
+            command = self._base_command(destination) + [
+                "-o", "ControlMaster=yes",
+                "-o", f"ControlPersist={self.control_persist}",
+                "-o", f"ConnectTimeout={self.connect_timeout}",
+                "-o", "BatchMode=yes",
+                "-N", "-f", destination,
+            ]
+            start = time.monotonic()
+            try:
+                result = self._run(
+                    command,
+                    capture_output=True,
+                    text=True,
+                    timeout=self.connect_timeout + self.command_timeout,
+                )
+            except (OSError, subprocess.TimeoutExpired) as e:
+                raise ConnectionError(f"ssh session to {destination} failed: {e}")
+            if result.returncode != 0:
+                raise ConnectionError(
+                    f"ssh session to {destination} failed: {result.stderr.strip()}"
+                )
+            latency = time.monotonic() - start
+            self._connected.add(destination)
+            logging.debug(f"Opened ssh session to {destination} in {latency:.3f}s")
+            return latency
+
+    def run(self, destination: str, remote_command: str) -> SshResult:
+        """
+        Runs a command on the session of a destination, opening it first if
+        needed. A session that fails is closed, the next run reconnects.
+
+        :param destination: `user@host` to run the command on
+        :param remote_command: the command line run by the remote shell
+        :return: the result, with a None returncode if the command timed out
+        """
+        try:
+            connect_latency = self.connect(destination)
+        except ConnectionError as e:
+            return SshResult(SSH_ERROR, str(e), None, None)
+        command = self._base_command(destination) + [
+            "-o", "ControlMaster=no", destination, remote_command,
+        ]
+        start = time.monotonic()
+        try:
+            result = self._run(
+                command, capture_output=True, text=True, timeout=self.command_timeout
+            )
+            returncode, output = result.returncode, result.stdout + result.stderr
+        except subprocess.TimeoutExpired as e:
+            returncode, output = None, str(e)
+        command_latency = time.monotonic() - start
+        if returncode is None or returncode == SSH_ERROR:
+            logging.debug(f"ssh session to {destination} failed, closing it: {output}")
+            self.close(destination)
+        return SshResult(returncode, output, connect_latency, command_latency)
+
+    def close(self, destination: str):
+        with self._destination_lock(destination):
+            if destination not in self._connected:
+                return
+            self._connected.discard(destination)
+            try:
+                self._run(
+                    self._base_command(destination) + ["-O", "exit", destination],
+                    capture_output=True,
+                    text=True,
+                    timeout=self.connect_timeout,
+                )
+            except (OSError, subprocess.TimeoutExpired):
+                pass
+
+    def close_all(self):
+        """
+        Closes all the sessions and removes their control sockets directory.
+        Registered with atexit, calling it more than once is harmless.
+        """
+        atexit.unregister(self.close_all)
+        for destination in list(self._connected):
+            self.close(destination)
+        shutil.rmtree(self._control_dir, ignore_errors=True)
+
+
+class _LatencyStats:
+    __slots__ = ("count", "total", "maximum", "histogram")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+        self.histogram = LatencyHistogram.empty(_BOUNDS)
+
+    def add(self, latency: float):
+        self.count += 1
+        self.total += latency
+        self.maximum = max(self.maximum, latency)
+        self.histogram.record(latency * 1e9)
+
+
+class ProbeLatencies:
+    """
+    Connect and command latencies of the access probes of every VM, kept
+    as count, sum, max and a fixed size histogram so the memory doesn't
+    grow with the duration of the run. Thread-safe.
+    """
+
+    def __init__(self):
+        self._connect: dict[str, _LatencyStats] = {}
+        self._command: dict[str, _LatencyStats] = {}
+        self._lock = threading.Lock()
+
+    def add(
+        self,
+        vm_name: str,
+        connect_latency: Optional[float] = None,
+        command_latency: Optional[float] = None,
+    ):
+        with self._lock:
+            if connect_latency is not None:
+                self._connect.setdefault(vm_name, _LatencyStats()).add(connect_latency)
+            if command_latency is not None:
+                self._command.setdefault(vm_name, _LatencyStats()).add(command_latency)
+
+    def to_dict(self, vm_name: str) -> Optional[dict]:
+        """
+        Returns the number of connections and probes of a VM with their
+        mean/p50/p95/max latencies in milliseconds, the percentiles being
+        interpolated in their histogram bucket.
+
+        :param vm_name: the VM
+        :return: the metrics or None if the VM was never probed
+        """
+        with self._lock:
+            stats = {
+                "connect": copy.deepcopy(self._connect.get(vm_name)),
+                "command": copy.deepcopy(self._command.get(vm_name)),
+            }
+        if not any(stats.values()):
+            return None
+        metrics = {
+            "connects": stats["connect"].count if stats["connect"] else 0,
+            "commands": stats["command"].count if stats["command"] else 0,
+        }
+        for name, values in stats.items():
+            if not values:
+                continue
+            p50, p95 = values.histogram.quantiles(
+                [0.5, 0.95], max_latency=values.maximum * 1e9
+            ) / 1e6
+            maximum = values.maximum * 1000
+            metrics[f"{name}_mean_ms"] = round(values.total / values.count * 1000, 2)
+            metrics[f"{name}_p50_ms"] = round(float(min(p50, maximum)), 2)
+            metrics[f"{name}_p95_ms"] = round(float(min(p95, maximum)), 2)
+            metrics[f"{name}_max_ms"] = round(maximum, 2)
+        return metrics
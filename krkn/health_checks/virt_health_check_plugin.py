@@ -29,6 +29,8 @@ kubevirt_checks:
     ssh_node: ""                  # Common SSH node for fallback
     node_names: ""                # Comma-separated node names to filter
     exit_on_failure: false        # Exit if failures persist at end
+    vmi_watch: true               # Track the VMIs with a list/watch instead of a GET per VM and check
+    ssh_session_pool: true        # Reuse one SSH session per node for the disconnected checks
 """
 
 import logging
@@ -42,7 +44,10 @@ from typing import Any
 from krkn_lib.k8s import KrknKubernetes
 from krkn_lib.models.telemetry.models import VirtCheck
 from krkn_lib.utils.functions import get_yaml_item_value
+from krkn.cache import lookups
 from krkn.health_checks.abstract_health_check_plugin import AbstractHealthCheckPlugin
+from krkn.health_checks.ssh_session_pool import ProbeLatencies, SshSessionPool
+from krkn.health_checks.vmi_status_tracker import VmiStatusTracker, is_vmi_ready
 from krkn.invoke.command import invoke_no_exit
 from krkn.scenario_plugins.kubevirt_vm_outage.kubevirt_vm_outage_scenario_plugin import (
     KubevirtVmOutageScenarioPlugin,
@@ -93,6 +98,13 @@ class VirtHealthCheckPlugin(AbstractHealthCheckPlugin):
         self.exit_on_failure = False
         self.kube_vm_plugin = None
         self.vmis_list = []
+        self.vmi_watch = True
+        self.vmi_tracker = None
+        self.ssh_session_pool = True
+        self.ssh_pool = None
+        self.probe_latencies = ProbeLatencies()
+        # virtctl target form (root@<vm> or root@vmi/<vm>) that last worked per VM
+        self._virtctl_targets = {}
 
     def get_health_check_types(self) -> list[str]:
         """
@@ -144,6 +156,8 @@ class VirtHealthCheckPlugin(AbstractHealthCheckPlugin):
         self.exit_on_failure = get_yaml_item_value(config, "exit_on_failure", False)
         vmi_name_match = get_yaml_item_value(config, "name", None) or ".*"
         label_selector = get_yaml_item_value(config, "label_selector", None) or None
+        self.vmi_watch = get_yaml_item_value(config, "vmi_watch", True)
+        self.ssh_session_pool = get_yaml_item_value(config, "ssh_session_pool", True)
 
         if self.namespace == "":
             logging.info("kubevirt checks config namespace is not defined, skipping them")
@@ -152,9 +166,16 @@ class VirtHealthCheckPlugin(AbstractHealthCheckPlugin):
         try:
             self.kube_vm_plugin = KubevirtVmOutageScenarioPlugin()
             self.kube_vm_plugin.init_clients(k8s_client=self.krkn_lib)
-            self.vmis_list = self.kube_vm_plugin.k8s_client.get_vmis(
-                vmi_name_match, self.namespace, label_selector=label_selector
-            )
+            if self.vmi_watch:
+                self.vmi_tracker = self._start_vmi_tracker(
+                    vmi_name_match, label_selector
+                )
+            if self.vmi_tracker is not None:
+                self.vmis_list = self.vmi_tracker.list()
+            else:
+                self.vmis_list = self.kube_vm_plugin.k8s_client.get_vmis(
+                    vmi_name_match, self.namespace, label_selector=label_selector
+                )
         except Exception as e:
             logging.error(f"Virt Check init exception: {str(e)}")
             return False
@@ -189,8 +210,63 @@ class VirtHealthCheckPlugin(AbstractHealthCheckPlugin):
                 )
 
         self.batch_size = math.ceil(len(self.vm_list) / self.threads_limit)
+        if self.disconnected and self.ssh_session_pool:
+            self.ssh_pool = SshSessionPool()
         return True
 
+    def _start_vmi_tracker(
+        self, vmi_name_match: str, label_selector: str = None
+    ) -> VmiStatusTracker | None:
+        """
+        Lists and starts watching the monitored VMIs.
+
+        :param vmi_name_match: VMI name regex pattern
+        :param label_selector: VMI label selector (optional)
+        :return: the tracker, None if the VMIs can't be watched and have to
+            be read with a GET per VM and check
+        """
+        tracker = VmiStatusTracker(
+            self.krkn_lib, self.namespace, vmi_name_match, label_selector
+        )
+        try:
+            tracker.start()
+        except Exception as e:
+            logging.warning(
+                f"Unable to watch the VMIs, reading them on every check: {e}"
+            )
+            tracker.stop()
+            return None
+        return tracker
+
+    def _get_vmi(self, vmi_name: str) -> dict | None:
+        """
+        Returns a monitored VMI, from the tracker when the VMIs are watched.
+
+        :param vmi_name: VMI name
+        :return: the VMI or None
+        """
+        if self.vmi_tracker is not None:
+            return self.vmi_tracker.get_vmi(vmi_name, self.namespace)
+        return self.kube_vm_plugin.get_vmi(vmi_name, self.namespace)
+
+    def _ready_transition_time(self, vm, since: datetime) -> datetime | None:
+        """
+        Returns when the watch saw the last Ready transition of a VMI, if it
+        happened after `since`.
+
+        :param vm: VirtCheck object representing the VM
+        :param since: start of the open tracker entry of the VM
+        :return: the transition time or None
+        """
+        if self.vmi_tracker is None:
+            return None
+        state = self.vmi_tracker.get(vm.vm_name, vm.namespace)
+        if state is None or state.last_transition is None:
+            return None
+        if state.last_transition <= since:
+            return None
+        return state.last_transition
+
     def check_disconnected_access(
         self, ip_address: str, worker_name: str = "", vmi_name: str = ""
     ) -> tuple[bool, str | None, str | None]:
@@ -202,62 +278,72 @@ class VirtHealthCheckPlugin(AbstractHealthCheckPlugin):
         :param vmi_name: VMI name
         :return: tuple of (success, new_ip_address, new_node_name)
         """
-        virtctl_vm_cmd = f"ssh core@{worker_name} -o ConnectTimeout=5 'ssh -o BatchMode=yes -o ConnectTimeout=5 -o StrictHostKeyChecking=no root@{ip_address}'"
-
-        all_out = invoke_no_exit(virtctl_vm_cmd)
-        logging.debug(
-            f"Checking disconnected access for {ip_address} on {worker_name} output: {all_out}"
-        )
-
-        virtctl_vm_cmd = f"ssh core@{worker_name} -o ConnectTimeout=5 'ssh -o BatchMode=yes -o ConnectTimeout=5 -o StrictHostKeyChecking=no root@{ip_address} 2>&1 | grep Permission' && echo 'True' || echo 'False'"
-        output = invoke_no_exit(virtctl_vm_cmd)
-
-        if "True" in output:
+        if self.ssh_pool is None:
+            virtctl_vm_cmd = f"ssh core@{worker_name} -o ConnectTimeout=5 'ssh -o BatchMode=yes -o ConnectTimeout=5 -o StrictHostKeyChecking=no root@{ip_address}'"
+            all_out = invoke_no_exit(virtctl_vm_cmd)
             logging.debug(
-                f"Disconnected access for {ip_address} on {worker_name} is successful: {output}"
+                f"Checking disconnected access for {ip_address} on {worker_name} output: {all_out}"
             )
+
+        if self._hop_probe(worker_name, ip_address, vmi_name):
             return True, None, None
-        else:
-            logging.debug(
-                f"Disconnected access for {ip_address} on {worker_name} failed: {output}"
-            )
-            vmi = self.kube_vm_plugin.get_vmi(vmi_name, self.namespace)
-            interfaces = vmi.get("status", {}).get("interfaces", [])
-            new_ip_address = interfaces[0].get("ipAddress") if interfaces else None
-            new_node_name = vmi.get("status", {}).get("nodeName")
 
-            # Check if VM restarted with new IP
-            if new_ip_address != ip_address:
-                virtctl_vm_cmd = f"ssh core@{worker_name} -o ConnectTimeout=5 'ssh -o BatchMode=yes -o ConnectTimeout=5 -o StrictHostKeyChecking=no root@{new_ip_address} 2>&1 | grep Permission' && echo 'True' || echo 'False'"
-                new_output = invoke_no_exit(virtctl_vm_cmd)
-                logging.debug(
-                    f"Disconnected access for {ip_address} on {worker_name}: {new_output}"
-                )
-                if "True" in new_output:
-                    return True, new_ip_address, None
+        vmi = self._get_vmi(vmi_name) or {}
+        interfaces = vmi.get("status", {}).get("interfaces", [])
+        new_ip_address = interfaces[0].get("ipAddress") if interfaces else None
+        new_node_name = vmi.get("status", {}).get("nodeName")
 
-            # Check if VM migrated to new node
-            if new_node_name != worker_name:
-                virtctl_vm_cmd = f"ssh core@{new_node_name} -o ConnectTimeout=5 'ssh -o BatchMode=yes -o ConnectTimeout=5 -o StrictHostKeyChecking=no root@{new_ip_address} 2>&1 | grep Permission' && echo 'True' || echo 'False'"
-                new_output = invoke_no_exit(virtctl_vm_cmd)
-                logging.debug(
-                    f"Disconnected access for {ip_address} on {new_node_name}: {new_output}"
-                )
-                if "True" in new_output:
-                    return True, new_ip_address, new_node_name
+        # Check if VM restarted with new IP
+        if new_ip_address != ip_address:
+            if self._hop_probe(worker_name, new_ip_address, vmi_name):
+                return True, new_ip_address, None
 
-            # Try common SSH node as fallback
-            if self.ssh_node:
-                virtctl_vm_cmd = f"ssh core@{self.ssh_node} -o ConnectTimeout=5 'ssh -o BatchMode=yes -o ConnectTimeout=5 -o StrictHostKeyChecking=no root@{new_ip_address} 2>&1 | grep Permission' && echo 'True' || echo 'False'"
-                new_output = invoke_no_exit(virtctl_vm_cmd)
-                logging.debug(
-                    f"Disconnected access for {new_ip_address} on {self.ssh_node}: {new_output}"
-                )
-                if "True" in new_output:
-                    return True, new_ip_address, None
+        # Check if VM migrated to new node
+        if new_node_name != worker_name:
+            if self._hop_probe(new_node_name, new_ip_address, vmi_name):
+                return True, new_ip_address, new_node_name
+
+        # Try common SSH node as fallback
+        if self.ssh_node:
+            if self._hop_probe(self.ssh_node, new_ip_address, vmi_name):
+                return True, new_ip_address, None
 
         return False, None, None
 
+    def _hop_probe(self, node_name: str, ip_address: str, vmi_name: str) -> bool:
+        """
+        Check that the SSH server of a VM answers, from a node. The probe runs
+        on the pooled session of the node when the session pool is enabled.
+
+        :param node_name: node the VM is reached from
+        :param ip_address: VM IP address
+        :param vmi_name: VMI name the latencies are recorded for
+        :return: True if the VM SSH server denied the login
+        """
+        if self.ssh_pool is None:
+            virtctl_vm_cmd = f"ssh core@{node_name} -o ConnectTimeout=5 'ssh -o BatchMode=yes -o ConnectTimeout=5 -o StrictHostKeyChecking=no root@{ip_address} 2>&1 | grep Permission' && echo 'True' || echo 'False'"
+            output = invoke_no_exit(virtctl_vm_cmd)
+            logging.debug(
+                f"Disconnected access for {ip_address} on {node_name}: {output}"
+            )
+            return "True" in output
+
+        # the exit status of the probe is ignored so that only a failure of
+        # the node session itself is reported as the ssh error status
+        result = self.ssh_pool.run(
+            f"core@{node_name}",
+            f"ssh -o BatchMode=yes -o ConnectTimeout=5 -o StrictHostKeyChecking=no root@{ip_address} 2>&1 || true",
+        )
+        self.probe_latencies.add(
+            vmi_name,
+            result.connect_latency,
+            result.command_latency if result.ok else None,
+        )
+        logging.debug(
+            f"Disconnected access for {ip_address} on {node_name}: {result.output}"
+        )
+        return result.ok and "Permission" in result.output
+
     def _get_ssh_status(self, vm) -> bool:
         """
         Check SSH accessibility for a VM, updating vm.new_ip_address and vm.node_name
@@ -289,19 +375,18 @@ class VirtHealthCheckPlugin(AbstractHealthCheckPlugin):
         :param namespace: namespace
         :return: True if VMI is ready, False otherwise
         """
+        if self.vmi_tracker is not None:
+            return self.vmi_tracker.is_ready(vmi_name, namespace)
         try:
-            vmi = self.krkn_lib.get_vmi(vmi_name, namespace)
+            vmi = lookups.get_vmi(self.krkn_lib, vmi_name, namespace)
             if vmi is None:
                 return False
-            phase = vmi.get("status", {}).get("phase", "")
-            if phase != "Running":
-                logging.debug(f"VMI {vmi_name} phase is '{phase}', not Running")
+            if not is_vmi_ready(vmi):
+                logging.debug(
+                    f"VMI {vmi_name} is not Running with a Ready=True condition"
+                )
                 return False
-            for cond in vmi.get("status", {}).get("conditions", []):
-                if cond.get("type") == "Ready" and cond.get("status") == "True":
-                    return True
-            logging.debug(f"VMI {vmi_name} has no Ready=True condition")
-            return False
+            return True
         except Exception:
             logging.exception(f"Exception checking VMI ready state for {vmi_name}")
             return False
@@ -314,16 +399,22 @@ class VirtHealthCheckPlugin(AbstractHealthCheckPlugin):
         :param namespace: namespace
         :return: True if accessible, False otherwise
         """
-        virtctl_vm_cmd = f"virtctl ssh --local-ssh-opts='-o BatchMode=yes' --local-ssh-opts='-o PasswordAuthentication=no' --local-ssh-opts='-o ConnectTimeout=5' root@vmi/{vm_name} -n {namespace} 2>&1 |egrep 'denied|verification failed'  && echo 'True' || echo 'False'"
-        check_virtctl_vm_cmd = f"virtctl ssh --local-ssh-opts='-o BatchMode=yes' --local-ssh-opts='-o PasswordAuthentication=no' --local-ssh-opts='-o ConnectTimeout=5' root@{vm_name} -n {namespace} 2>&1 |egrep 'denied|verification failed'  && echo 'True' || echo 'False'"
-
-        if "True" in invoke_no_exit(check_virtctl_vm_cmd):
-            return True
-        else:
-            second_invoke = invoke_no_exit(virtctl_vm_cmd)
-            if "True" in second_invoke:
+        targets = [f"root@{vm_name}", f"root@vmi/{vm_name}"]
+        # start with the target form that worked last time for this VM
+        if self._virtctl_targets.get(vm_name) == targets[1]:
+            targets.reverse()
+
+        for target in targets:
+            virtctl_vm_cmd = f"virtctl ssh --local-ssh-opts='-o BatchMode=yes' --local-ssh-opts='-o PasswordAuthentication=no' --local-ssh-opts='-o ConnectTimeout=5' {target} -n {namespace} 2>&1 |egrep 'denied|verification failed'  && echo 'True' || echo 'False'"
+            start = time.monotonic()
+            if "True" in invoke_no_exit(virtctl_vm_cmd):
+                # every virtctl probe is a new connection to the VM
+                self.probe_latencies.add(
+                    vm_name, connect_latency=time.monotonic() - start
+                )
+                self._virtctl_targets[vm_name] = target
                 return True
-            return False
+        return False
 
     @staticmethod
     def _compute_check_type(ssh_status: bool, vmi_ready: bool) -> str:
@@ -342,13 +433,20 @@ class VirtHealthCheckPlugin(AbstractHealthCheckPlugin):
             return "vmi_ready"
         return "healthy"
 
-    def _make_tracker_entry(self, vm, ssh_status: bool, vmi_ready: bool) -> dict:
+    def _make_tracker_entry(
+        self,
+        vm,
+        ssh_status: bool,
+        vmi_ready: bool,
+        start_timestamp: datetime = None,
+    ) -> dict:
         """
         Build a fresh tracker entry dict for a VM with the current check results.
 
         :param vm: VirtCheck object representing the VM
         :param ssh_status: result of the SSH access check
         :param vmi_ready: result of the VMI readiness check
+        :param start_timestamp: override start time; defaults to now
         :return: tracker entry dict
         """
         return {
@@ -360,7 +458,7 @@ class VirtHealthCheckPlugin(AbstractHealthCheckPlugin):
             "vmi_ready": vmi_ready,
             "status": ssh_status and vmi_ready,
             "check_type": self._compute_check_type(ssh_status, vmi_ready),
-            "start_timestamp": datetime.now(),
+            "start_timestamp": start_timestamp or datetime.now(),
             "new_ip_address": vm.new_ip_address,
         }
 
@@ -394,7 +492,9 @@ class VirtHealthCheckPlugin(AbstractHealthCheckPlugin):
 
         Each VM gets a single combined tracker entry that carries both ssh_status
         and vmi_ready. An entry is closed and a new one started whenever either
-        check changes state.
+        check changes state; when the VMIs are watched, a vmi_ready change is
+        stamped with the time the watch saw the transition instead of the
+        time of the check.
 
         :param vm_list_batch: list of VMs to check
         :param virt_check_telemetry_queue: queue for telemetry
@@ -431,11 +531,16 @@ class VirtHealthCheckPlugin(AbstractHealthCheckPlugin):
                         )
                     if vm.new_ip_address:
                         vm_tracker[vm.vm_name]["new_ip_address"] = vm.new_ip_address
+                    transition_time = None
+                    if vmi_ready != vm_tracker[vm.vm_name]["vmi_ready"]:
+                        transition_time = self._ready_transition_time(
+                            vm, vm_tracker[vm.vm_name]["start_timestamp"]
+                        )
                     self._close_tracker_entry(
-                        vm_tracker, vm.vm_name, virt_check_telemetry
+                        vm_tracker, vm.vm_name, virt_check_telemetry, transition_time
                     )
                     vm_tracker[vm.vm_name] = self._make_tracker_entry(
-                        vm, ssh_status, vmi_ready
+                        vm, ssh_status, vmi_ready, transition_time
                     )
 
             time.sleep(self.interval)
@@ -447,6 +552,7 @@ class VirtHealthCheckPlugin(AbstractHealthCheckPlugin):
                 vm_tracker, vm_name, virt_check_telemetry, end_timestamp, delete=False
             )
 
+        self._attach_latency_metrics(virt_check_telemetry)
         try:
             virt_check_telemetry_queue.put(virt_check_telemetry)
         except Exception as e:
@@ -481,6 +587,21 @@ class VirtHealthCheckPlugin(AbstractHealthCheckPlugin):
         if delete:
             del tracker[vm_name]
 
+    def _attach_latency_metrics(self, virt_check_telemetry: list) -> None:
+        """
+        Store the probe latencies of every VM into the `latency_metrics` of
+        its last record.
+
+        :param virt_check_telemetry: the records of a batch
+        """
+        last_records = {}
+        for record in virt_check_telemetry:
+            last_records[record.vm_name] = record
+        for vm_name, record in last_records.items():
+            latency_metrics = self.probe_latencies.to_dict(vm_name)
+            if latency_metrics is not None:
+                record.latency_metrics = latency_metrics
+
     def gather_post_virt_checks(self, kubevirt_check_telem):
         """
         Gather final post-run VM health check status.
@@ -511,6 +632,10 @@ class VirtHealthCheckPlugin(AbstractHealthCheckPlugin):
         if self.exit_on_failure and len(kubevirt_check_telem) > 0:
             self.ret_value = 3
 
+        if self.vmi_tracker is not None:
+            self.vmi_tracker.stop()
+        if self.ssh_pool is not None:
+            self.ssh_pool.close_all()
         return kubevirt_check_telem
 
     def _run_post_virt_check(
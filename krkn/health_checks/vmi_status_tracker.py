@@ -0,0 +1,241 @@
+# Copyright 2026 The Krkn Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+List/watch based status of the VMIs monitored by the virt health check.
+
+The VMIs of the namespace selector are listed once and then watched, the
+phase, IP and node of every VMI are kept in memory so the health checker
+reads them without any per-VM request, and every Ready transition is
+timestamped when its watch event is received instead of at the next poll.
+"""
+import logging
+import re
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+from krkn_lib.k8s import KrknKubernetes
+
+from krkn.cache import lookups
+from krkn.cache.informer_cache import VMIS, informer_cache
+from krkn.cache.shared_informer import (
+    DEFAULT_WATCH_TIMEOUT,
+    SharedInformer,
+    is_equality_selector,
+    labels_match,
+    object_key,
+    parse_label_selector,
+)
+
+# Ready transitions kept per VMI
+MAX_TRANSITIONS = 100
+
+
+def is_vmi_ready(vmi: dict) -> bool:
+    """
+    Returns True if the VMI is in Running phase with a Ready=True condition.
+    """
+    status = vmi.get("status") or {}
+    if status.get("phase", "") != "Running":
+        return False
+    for cond in status.get("conditions") or []:
+        if cond.get("type") == "Ready" and cond.get("status") == "True":
+            return True
+    return False
+
+
+@dataclass
+class VmiState:
+    """Last known status of a VMI."""
+    name: str
+    namespace: str
+    phase: str = ""
+    ip_address: Optional[str] = None
+    node_name: Optional[str] = None
+    ready: bool = False
+    deleted: bool = False
+    # (timestamp, ready) of every Ready transition seen by the watch
+    transitions: deque = field(default_factory=lambda: deque(maxlen=MAX_TRANSITIONS))
+
+    @property
+    def last_transition(self) -> Optional[datetime]:
+        return self.transitions[-1][0] if self.transitions else None
+
+
+class VmiStatusTracker:
+    """
+    Tracks the VMIs matching a namespace regex, a name regex and a label
+    selector. The shared VMI informer is reused when the informer cache is
+    enabled, otherwise the tracker lists and watches the VMIs of its own
+    namespace selector (namespaced when the selector resolves to a single
+    namespace). The namespaces are matched from the start of their names,
+    like `KrknKubernetes.get_vmis` does.
+    """
+
+    def __init__(
+        self,
+        kubecli: KrknKubernetes,
+        namespace: str,
+        name_pattern: str = ".*",
+        label_selector: str = None,
+        watch_timeout: int = DEFAULT_WATCH_TIMEOUT,
+    ):
+        """
+        :param kubecli: the client of the cluster
+        :param namespace: namespace regex of the VMIs
+        :param name_pattern: regex matched against the VMI names
+        :param label_selector: label selector of the VMIs (optional)
+        :param watch_timeout: server side timeout of every watch request
+        """
+        self.kubecli = kubecli
+        self.namespace = namespace
+        self.name_pattern = name_pattern or ".*"
+        self.label_selector = label_selector or None
+        self.watch_timeout = watch_timeout
+        self._namespace_re = re.compile(namespace)
+        self._name_re = re.compile(self.name_pattern)
+        self._requirements = parse_label_selector(self.label_selector)
+        self._states: dict[str, VmiState] = {}
+        self._lock = threading.Lock()
+        self._informer: Optional[SharedInformer] = None
+        self._owned = False
+
+    def _build_informer(self) -> SharedInformer:
+        list_kwargs = {}
+        if self.label_selector:
+            list_kwargs["label_selector"] = self.label_selector
+        client = self.kubecli.custom_object_client
+        namespaces = lookups.resolve_namespaces(self.kubecli, self.namespace)
+        if len(namespaces) == 1:
+            return SharedInformer(
+                VMIS,
+                client.list_namespaced_custom_object,
+                list_args=("kubevirt.io", "v1", namespaces[0], "virtualmachineinstances"),
+                list_kwargs=list_kwargs,
+                watch_timeout=self.watch_timeout,
+            )
+        return SharedInformer(
+            VMIS,
+            client.list_cluster_custom_object,
+            list_args=("kubevirt.io", "v1", "virtualmachineinstances"),
+            list_kwargs=list_kwargs,
+            watch_timeout=self.watch_timeout,
+        )
+
+    def start(self):
+        """
+        Loads the VMIs and starts watching them, the errors of the initial
+        LIST are raised.
+        """
+        informer = None
+        if is_equality_selector(self.label_selector):
+            informer = informer_cache.get(VMIS, self.kubecli)
+        if informer is not None:
+            self._informer = informer
+            informer.add_listener(self._on_event)
+            for vmi in informer.list(label_selector=self.label_selector):
+                self._on_event("ADDED", vmi)
+            return
+        informer = self._build_informer()
+        informer.add_listener(self._on_event)
+        informer.sync()
+        informer.start()
+        self._informer = informer
+        self._owned = True
+
+    def stop(self):
+        if self._informer is None:
+            return
+        self._informer.remove_listener(self._on_event)
+        if self._owned:
+            self._informer.stop()
+        self._informer = None
+
+    def _matches(self, vmi: dict) -> bool:
+        metadata = vmi.get("metadata") or {}
+        return bool(
+            self._namespace_re.match(metadata.get("namespace", ""))
+            and self._name_re.match(metadata.get("name", ""))
+            and labels_match(metadata.get("labels") or {}, self._requirements)
+        )
+
+    def _on_event(self, event_type: str, vmi: dict):
+        if not self._matches(vmi):
+            return
+        metadata = vmi.get("metadata") or {}
+        status = vmi.get("status") or {}
+        interfaces = status.get("interfaces") or []
+        key = object_key(vmi)
+        now = datetime.now()
+        with self._lock:
+            state = self._states.get(key)
+            first_seen = state is None
+            if first_seen:
+                state = VmiState(metadata.get("name"), metadata.get("namespace"))
+                self._states[key] = state
+            ready = event_type != "DELETED" and is_vmi_ready(vmi)
+            state.deleted = event_type == "DELETED"
+            state.phase = "Deleted" if state.deleted else status.get("phase", "")
+            if interfaces:
+                state.ip_address = interfaces[0].get("ipAddress")
+            state.node_name = status.get("nodeName") or state.node_name
+            changed = not first_seen and ready != state.ready
+            state.ready = ready
+            if changed:
+                state.transitions.append((now, ready))
+        if changed:
+            logging.info(
+                f"VMI {key} Ready transitioned to {ready} at {now.isoformat()}"
+            )
+
+    def list(self) -> list[dict]:
+        """
+        Returns the tracked VMIs as stored by the informer.
+        """
+        if self._informer is None:
+            return []
+        return [
+            vmi
+            for vmi in self._informer.list(label_selector=self.label_selector)
+            if self._matches(vmi)
+        ]
+
+    def get(self, name: str, namespace: str = None) -> Optional[VmiState]:
+        """
+        Returns the state of a VMI, looked up by name only when no VMI of
+        that name is tracked in the namespace.
+        """
+        with self._lock:
+            state = self._states.get(f"{namespace}/{name}") if namespace else None
+            if state is not None:
+                return state
+            for state in self._states.values():
+                if state.name == name:
+                    return state
+        return None
+
+    def get_vmi(self, name: str, namespace: str = None) -> Optional[dict]:
+        """
+        Same as `KrknKubernetes.get_vmi` served by the informer.
+        """
+        state = self.get(name, namespace)
+        if state is None or state.deleted or self._informer is None:
+            return None
+        return self._informer.get(state.name, state.namespace)
+
+    def is_ready(self, name: str, namespace: str) -> bool:
+        state = self.get(name, namespace)
+        return state is not None and state.ready
@@ -0,0 +1,309 @@
+# Copyright 2026 The Krkn Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Manifest based plugin registry of the scenario and health check factories.
+
+Each plugin package ships a `plugin_manifest.json` listing the module, the
+class, the types (and the config key of the health checks) and the source
+digest of every plugin. The factories read it instead of importing and
+instantiating all the plugins, and a plugin module, with its SDKs, is only
+imported the first time one of its types is requested.
+
+A manifest whose modules or digests don't match the sources is ignored and
+the plugins are all imported. The manifests are generated from the sources
+without importing them:
+
+    python scripts/generate_plugin_manifest.py
+"""
+import ast
+import hashlib
+import importlib
+import importlib.util
+import json
+import logging
+import os
+import threading
+from collections.abc import Mapping
+from typing import Any, Iterable, Iterator, Optional, Tuple
+
+MANIFEST_FILE = "plugin_manifest.json"
+
+
+class ManifestError(Exception):
+    pass
+
+
+def package_path(package_name: str) -> Optional[str]:
+    """
+    Returns the directory of a package without importing its modules.
+    """
+    try:
+        spec = importlib.util.find_spec(package_name)
+    except ImportError:
+        return None
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    return list(spec.submodule_search_locations)[0]
+
+
+def find_plugin_modules(
+    package_name: str, module_suffix: str, exclude: Iterable[str] = ()
+) -> list[str]:
+    """
+    Lists the plugin modules of a package from its files.
+
+    :param package_name: the plugin package, e.g. `krkn.scenario_plugins`
+    :param module_suffix: suffix of the plugin module names,
+        e.g. `_scenario_plugin`
+    :param exclude: modules that aren't plugins (e.g. the abstract class)
+    :return: the fully qualified module names, sorted
+    """
+    root = package_path(package_name)
+    if root is None:
+        return []
+    modules = []
+    for directory, dirs, files in os.walk(root):
+        # only packages are walked, as pkgutil.walk_packages does
+        dirs[:] = sorted(
+            d for d in dirs if os.path.isfile(os.path.join(directory, d, "__init__.py"))
+        )
+        relative = os.path.relpath(directory, root)
+        prefix = package_name if relative == "." else (
+            package_name + "." + relative.replace(os.sep, ".")
+        )
+        for file_name in files:
+            module_name = f"{prefix}.{file_name[:-3]}"
+            if file_name.endswith(module_suffix + ".py") and module_name not in exclude:
+                modules.append(module_name)
+    return sorted(modules)
+
+
+def _snake_to_capital_camel(snake_string: str) -> str:
+    return snake_string.title().replace("_", "")
+
+
+def _literal_return(class_node: ast.ClassDef, method_name: str) -> Any:
+    for node in class_node.body:
+        if isinstance(node, ast.FunctionDef) and node.name == method_name:
+            returns = [n for n in ast.walk(node) if isinstance(n, ast.Return)]
+            if len(returns) != 1 or returns[0].value is None:
+                break
+            try:
+                return ast.literal_eval(returns[0].value)
+            except ValueError:
+                break
+    raise ManifestError(
+        f"{class_node.name}.{method_name} must return a literal to be listed "
+        f"in the plugin manifest"
+    )
+
+
+def generate_manifest(
+    package_name: str,
+    module_suffix: str,
+    base_class_name: str,
+    types_method: str,
+    config_key_method: str = None,
+    exclude: Iterable[str] = (),
+) -> dict:
+    """
+    Builds the manifest of a plugin package by parsing the plugin modules,
+    the class of a module must be named after the module and subclass the
+    base class, and its types (and config key) must be returned as
+    literals.
+
+    :param package_name: the plugin package, e.g. `krkn.scenario_plugins`
+    :param module_suffix: suffix of the plugin module names
+    :param base_class_name: name of the abstract plugin class
+    :param types_method: method returning the types of a plugin
+    :param config_key_method: method returning the config key of a plugin
+        (optional)
+    :param exclude: modules that aren't plugins (e.g. the abstract class)
+    :return: the manifest
+    :raises ManifestError: if a plugin can't be listed or two plugins
+        declare the same type
+    """
+    root = package_path(package_name)
+    plugins = []
+    owners = {}
+    for module_name in find_plugin_modules(package_name, module_suffix, exclude):
+        relative = module_name[len(package_name) + 1:].replace(".", os.sep)
+        with open(os.path.join(root, relative + ".py"), "rb") as f:
+            source = f.read()
+        tree = ast.parse(source, filename=relative + ".py")
+        class_name = _snake_to_capital_camel(module_name.split(".")[-1])
+        class_node = next(
+            (
+                node for node in tree.body
+                if isinstance(node, ast.ClassDef) and node.name == class_name
+            ),
+            None,
+        )
+        if class_node is None or base_class_name not in [
+            ast.unparse(base).split(".")[-1] for base in class_node.bases
+        ]:
+            raise ManifestError(
+                f"{module_name} must define {class_name} subclassing {base_class_name}"
+            )
+        types = _literal_return(class_node, types_method)
+        for plugin_type in types:
+            if plugin_type in owners:
+                raise ManifestError(
+                    f"type {plugin_type} defined by {owners[plugin_type]} "
+                    f"and {class_name} and this is not allowed."
+                )
+            owners[plugin_type] = class_name
+        plugin = {
+            "module": module_name,
+            "class": class_name,
+            "types": list(types),
+            "sha256": hashlib.sha256(source).hexdigest(),
+        }
+        if config_key_method:
+            config_key = _literal_return(class_node, config_key_method)
+            if config_key and config_key in owners:
+                raise ManifestError(
+                    f"config key '{config_key}' is already registered by "
+                    f"{owners[config_key]} and this is not allowed."
+                )
+            owners[config_key] = class_name
+            plugin["config_key"] = config_key
+        plugins.append(plugin)
+    return {"plugins": plugins}
+
+
+def _module_digest(root: str, package_name: str, module_name: str) -> Optional[str]:
+    relative = module_name[len(package_name) + 1:].replace(".", os.sep)
+    try:
+        with open(os.path.join(root, relative + ".py"), "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def manifest_path(package_name: str) -> Optional[str]:
+    root = package_path(package_name)
+    return os.path.join(root, MANIFEST_FILE) if root else None
+
+
+def write_manifest(package_name: str, manifest: dict):
+    with open(manifest_path(package_name), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+
+
+def load_manifest(
+    package_name: str, module_suffix: str, exclude: Iterable[str] = ()
+) -> Optional[dict]:
+    """
+    Reads the manifest of a plugin package.
+
+    :param package_name: the plugin package
+    :param module_suffix: suffix of the plugin module names
+    :param exclude: modules that aren't plugins (e.g. the abstract class)
+    :return: the manifest, None if the package has none, if it doesn't
+        list exactly the plugin modules of the package or if the source of
+        a module changed since it was generated
+    """
+    path = manifest_path(package_name)
+    if path is None or not os.path.isfile(path):
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+        listed = sorted(plugin["module"] for plugin in manifest["plugins"])
+        digests = {plugin["module"]: plugin["sha256"] for plugin in manifest["plugins"]}
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logging.warning(f"Invalid plugin manifest {path}: {e}")
+        return None
+    root = os.path.dirname(path)
+    if listed != find_plugin_modules(package_name, module_suffix, exclude) or any(
+        _module_digest(root, package_name, module) != digest
+        for module, digest in digests.items()
+    ):
+        logging.warning(
+            f"Plugin manifest {path} is outdated, run "
+            f"scripts/generate_plugin_manifest.py to update it"
+        )
+        return None
+    return manifest
+
+
+class LazyPluginRegistry(Mapping):
+    """
+    Read-only mapping of the plugin types to their classes, a plugin module
+    is imported on the first lookup of one of its types. A plugin that
+    can't be imported is recorded into `failed_plugins` and its types are
+    removed from the registry.
+    """
+
+    def __init__(
+        self,
+        manifest: dict,
+        base_class: type,
+        failed_plugins: list[Tuple[str, str, str]],
+    ):
+        """
+        :param manifest: the manifest of the plugin package
+        :param base_class: the abstract plugin class
+        :param failed_plugins: where the import failures are recorded
+        """
+        self.base_class = base_class
+        self.failed_plugins = failed_plugins
+        self._entries: dict[str, Tuple[str, str]] = {}
+        for plugin in manifest["plugins"]:
+            for plugin_type in plugin["types"]:
+                self._entries[plugin_type] = (plugin["module"], plugin["class"])
+        self._classes: dict[str, type] = {}
+        # the scheduler may create plugins from several threads
+        self._lock = threading.Lock()
+
+    def __getitem__(self, plugin_type: str) -> type:
+        with self._lock:
+            if plugin_type in self._classes:
+                return self._classes[plugin_type]
+            module_name, class_name = self._entries[plugin_type]
+            siblings = [t for t, e in self._entries.items() if e == (module_name, class_name)]
+            try:
+                cls = getattr(importlib.import_module(module_name), class_name)
+                if not issubclass(cls, self.base_class):
+                    raise TypeError(f"{class_name} is not a {self.base_class.__name__}")
+            except Exception as e:
+                logging.error(
+                    f"Failed to import plugin {class_name} from {module_name}: {e}"
+                )
+                self.failed_plugins.append(
+                    (module_name, class_name, f"Failed to import module: {str(e)}")
+                )
+                for sibling in siblings:
+                    del self._entries[sibling]
+                raise KeyError(plugin_type) from e
+            for sibling in siblings:
+                self._classes[sibling] = cls
+            return cls
+
+    def __contains__(self, plugin_type: object) -> bool:
+        return plugin_type in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def class_name(self, plugin_type: str) -> str:
+        """
+        Returns the class name of a type without importing the plugin.
+        """
+        return self._entries[plugin_type][1]
@@ -14,9 +14,13 @@
 from __future__ import annotations
 
 import datetime
+import gzip
+import itertools
 import os.path
 import math
-from typing import Optional, List, Dict, Any
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Iterable, Iterator
 
 import logging
 import urllib3
@@ -191,148 +195,285 @@ def critical_alerts(
 
 
 
-def metrics(
+# Defaults of the streaming metrics export
+DEFAULT_METRICS_BATCH_SIZE = 1000
+DEFAULT_METRICS_MAX_IN_FLIGHT = 4
+
+
+def _run_metric_query(prom_cli: KrknPrometheus, query: str, metric_query: dict, start_time, end_time):
+    if "instant" in list(metric_query.keys()) and metric_query['instant']:
+        return prom_cli.process_query(
+           query
+        )
+    return prom_cli.process_prom_query_in_range(
+        query,
+        start_time=datetime.datetime.fromtimestamp(start_time),
+        end_time=datetime.datetime.fromtimestamp(end_time), granularity=30
+    )
+
+
+def _prometheus_samples(
     prom_cli: KrknPrometheus,
-    elastic: KrknElastic,
-    run_uuid,
+    metric_queries: list[dict],
     start_time,
     end_time,
-    metrics_profile,
-    elastic_metrics_index,
-    telemetry_json
-) -> list[dict[str, list[(int, float)] | str]]:
-   
-    if metrics_profile is None or os.path.exists(metrics_profile) is False:
-        logging.error(f"{metrics_profile} alert profile does not exist")
-        sys.exit(1)
-    with open(metrics_profile) as profile:
-        profile_yaml = yaml.safe_load(profile)
+    max_in_flight: int,
+) -> Iterator[dict[str, int | float | str]]:
+    """
+    Runs the profile queries concurrently, at most max_in_flight at a time,
+    and yields one record per sample in the order of the profile. Only the
+    results of the in flight queries are held in memory.
+    """
+    elapsed_ceil = math.ceil((end_time - start_time)/ 60 )
+    elapsed_time = str(elapsed_ceil) + "m"
+    queries = []
+    for metric_query in metric_queries:
+        query = metric_query['query']
+        # calculate elapsed time
+        if ".elapsed" in metric_query["query"]:
+            query = metric_query['query'].replace(".elapsed", elapsed_time)
+        if not ("instant" in list(metric_query.keys()) and metric_query['instant']) and (
+            sorted(metric_query.keys()) != sorted(["query", "metricName"])
+        ):
+            logging.info("didn't match keys")
+            continue
+        queries.append((query, metric_query))
+    if not queries:
+        return
 
-        if not profile_yaml["metrics"] or not isinstance(profile_yaml["metrics"], list):
-            logging.error(
-                f"{metrics_profile} wrong file format, alert profile must be "
-                f"a valid yaml file containing a list of items with 3 properties: "
-                f"expr, description, severity"
-            )
-            sys.exit(1)
-        elapsed_ceil = math.ceil((end_time - start_time)/ 60 )
-        elapsed_time = str(elapsed_ceil) + "m"
-        metrics_list: list[dict[str, int | float | str]] = []
-        for metric_query in profile_yaml["metrics"]:
-            query = metric_query['query']
-            
-            # calculate elapsed time
-            if ".elapsed" in metric_query["query"]:
-                query = metric_query['query'].replace(".elapsed", elapsed_time)
-            if "instant" in list(metric_query.keys()) and metric_query['instant']:
-                metrics_result = prom_cli.process_query(
-                   query
-                )
-            elif (
-                sorted(metric_query.keys())
-                == sorted(["query", "metricName"])
-            ):
-                metrics_result = prom_cli.process_prom_query_in_range(
-                    query,
-                    start_time=datetime.datetime.fromtimestamp(start_time),
-                    end_time=datetime.datetime.fromtimestamp(end_time), granularity=30
-                )
-            else: 
-                logging.info("didn't match keys")
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(max_in_flight, len(queries))),
+        thread_name_prefix="krkn-metrics",
+    ) as executor:
+        pending = deque()
+        queue_iter = iter(queries)
+        for query, metric_query in itertools.islice(queue_iter, max(1, max_in_flight)):
+            pending.append((query, metric_query, executor.submit(
+                _run_metric_query, prom_cli, query, metric_query, start_time, end_time
+            )))
+        while pending:
+            query, metric_query, future = pending.popleft()
+            for next_query, next_metric_query in itertools.islice(queue_iter, 1):
+                pending.append((next_query, next_metric_query, executor.submit(
+                    _run_metric_query, prom_cli, next_query, next_metric_query, start_time, end_time
+                )))
+            try:
+                metrics_result = future.result()
+            except Exception as e:
+                logging.error(f"failed to query metric {metric_query['metricName']}: {e}")
                 continue
-            
+
             for returned_metric in metrics_result:
                 metric = {"query": query, "metricName": metric_query['metricName']}
                 for k,v in returned_metric['metric'].items():
                     metric[k] = v
-                
-                if "values" in returned_metric: 
-                    for value in returned_metric["values"]:
-                        try:
-                            metric['timestamp'] = str(datetime.datetime.fromtimestamp(value[0]))
-                            metric["value"] = float(value[1])
-                            # want double array of the known details and the metrics specific to each call                    
-                            metrics_list.append(metric.copy())
-                        except ValueError:
-                            pass
+
+                if "values" in returned_metric:
+                    values = returned_metric["values"]
                 elif "value" in returned_metric:
+                    values = [returned_metric["value"]]
+                else:
+                    continue
+                for value in values:
                     try:
-                        value = returned_metric["value"]
-                        metric['timestamp'] = str(datetime.datetime.fromtimestamp(value[0]))
-                        metric["value"] = float(value[1])
-
                         # want double array of the known details and the metrics specific to each call
-                        metrics_list.append(metric.copy())
+                        yield {
+                            **metric,
+                            "timestamp": str(datetime.datetime.fromtimestamp(value[0])),
+                            "value": float(value[1]),
+                        }
                     except ValueError:
                         pass
-        telemetry_json = json.loads(telemetry_json)
-        for scenario in telemetry_json['scenarios']:
-            for k,v in scenario["affected_pods"].items():
-                metric_name = "affected_pods_recovery"
-                metric = {"metricName": metric_name, "type": k}
-                if type(v) is list:
-                    for pod in v:
-                        for k,v in pod.items():
-                            metric[k] = v
-                            metric['timestamp'] = str(datetime.datetime.now())
-                        logging.debug("adding pod %s", metric)
-                        metrics_list.append(metric.copy())
-            for k,v in scenario.get("affected_vmis", {}).items():
-                metric_name = "affected_vmis_recovery"
-                metric = {"metricName": metric_name, "type": k}
-                if type(v) is list:
-                    for vmi in v:
-                        for k,v in vmi.items():
-                            metric[k] = v
-                            metric['timestamp'] = str(datetime.datetime.now())
-                        logging.debug("adding vmi %s", metric)
-                        metrics_list.append(metric.copy())
-            for affected_node in scenario["affected_nodes"]:
-                metric_name = "affected_nodes_recovery"
-                metric = {"metricName": metric_name}
-                for k,v in affected_node.items():
-                    metric[k] = v
-                    metric['timestamp'] = str(datetime.datetime.now())
-                metrics_list.append(metric.copy())
-        if telemetry_json['health_checks']:
-            for health_check in telemetry_json["health_checks"]:
-                    metric_name = "health_check_recovery"
-                    metric = {"metricName": metric_name}
-                    for k,v in health_check.items():
+
+
+def _telemetry_samples(telemetry_json) -> Iterator[dict[str, int | float | str]]:
+    """
+    Yields the recovery records of the affected pods, vmis and nodes and of
+    the health checks found in the run telemetry.
+    """
+    telemetry_json = json.loads(telemetry_json)
+    for scenario in telemetry_json['scenarios']:
+        for k,v in scenario["affected_pods"].items():
+            metric_name = "affected_pods_recovery"
+            metric = {"metricName": metric_name, "type": k}
+            if type(v) is list:
+                for pod in v:
+                    for k,v in pod.items():
                         metric[k] = v
                         metric['timestamp'] = str(datetime.datetime.now())
-                    metrics_list.append(metric.copy())
-        if telemetry_json['virt_checks']:
-            for virt_check in telemetry_json["virt_checks"]:
-                    metric_name = "virt_check_recovery"
-                    metric = {"metricName": metric_name}
-                    for k,v in virt_check.items():
+                    logging.debug("adding pod %s", metric)
+                    yield metric.copy()
+        for k,v in scenario.get("affected_vmis", {}).items():
+            metric_name = "affected_vmis_recovery"
+            metric = {"metricName": metric_name, "type": k}
+            if type(v) is list:
+                for vmi in v:
+                    for k,v in vmi.items():
                         metric[k] = v
                         metric['timestamp'] = str(datetime.datetime.now())
-                    metrics_list.append(metric.copy())
+                    logging.debug("adding vmi %s", metric)
+                    yield metric.copy()
+        for affected_node in scenario["affected_nodes"]:
+            metric_name = "affected_nodes_recovery"
+            metric = {"metricName": metric_name}
+            for k,v in affected_node.items():
+                metric[k] = v
+                metric['timestamp'] = str(datetime.datetime.now())
+            yield metric.copy()
+    if telemetry_json['health_checks']:
+        for health_check in telemetry_json["health_checks"]:
+                metric_name = "health_check_recovery"
+                metric = {"metricName": metric_name}
+                for k,v in health_check.items():
+                    metric[k] = v
+                    metric['timestamp'] = str(datetime.datetime.now())
+                yield metric.copy()
+    if telemetry_json['virt_checks']:
+        for virt_check in telemetry_json["virt_checks"]:
+                metric_name = "virt_check_recovery"
+                metric = {"metricName": metric_name}
+                for k,v in virt_check.items():
+                    metric[k] = v
+                    metric['timestamp'] = str(datetime.datetime.now())
+                yield metric.copy()
+
+
+def _batches(records: Iterable[dict], batch_size: int) -> Iterator[list[dict]]:
+    records = iter(records)
+    while True:
+        batch = list(itertools.islice(records, max(1, batch_size)))
+        if not batch:
+            return
+        yield batch
+
+
+def _discard_spool(spool, spool_file: str) -> None:
+    """
+    Closes and removes a local metrics file that can't be written.
+    """
+    try:
+        if spool is not None:
+            spool.close()
+        if os.path.exists(spool_file):
+            os.remove(spool_file)
+    except OSError as e:
+        logging.warning(f"Failed to remove {spool_file}: {e}")
+    return None
+
+
+def metrics(
+    prom_cli: KrknPrometheus,
+    elastic: KrknElastic,
+    run_uuid,
+    start_time,
+    end_time,
+    metrics_profile,
+    elastic_metrics_index,
+    telemetry_json,
+    batch_size: int = DEFAULT_METRICS_BATCH_SIZE,
+    max_in_flight: int = DEFAULT_METRICS_MAX_IN_FLIGHT,
+    compress: bool = False,
+) -> int:
+    """
+    Queries the metrics of the profile and streams the samples, together
+    with the recovery records of the telemetry, to ElasticSearch in bulks
+    of batch_size records, so the memory used does not grow with the
+    length of the run.
 
-        save_metrics = False
-        if elastic is not None and elastic_metrics_index is not None:
+    The records are also spooled to
+    <tmp>/krkn_metrics/{elastic_metrics_index}_{run_uuid}.json (.json.gz if
+    compress is set) in the {"run_uuid": ..., "metrics": [...]} format. The
+    file is kept, with every record of the run, if elastic is not
+    configured or an upload fails, and removed otherwise. If the file can't
+    be written the records are only uploaded.
+
+    :return: the number of exported records. The records are no longer
+        held in memory, so the list of the records isn't returned anymore.
+    """
+    if metrics_profile is None or os.path.exists(metrics_profile) is False:
+        logging.error(f"{metrics_profile} alert profile does not exist")
+        sys.exit(1)
+    with open(metrics_profile) as profile:
+        profile_yaml = yaml.safe_load(profile)
+
+    if not profile_yaml["metrics"] or not isinstance(profile_yaml["metrics"], list):
+        logging.error(
+            f"{metrics_profile} wrong file format, alert profile must be "
+            f"a valid yaml file containing a list of items with 3 properties: "
+            f"expr, description, severity"
+        )
+        sys.exit(1)
+
+    records = itertools.chain(
+        _prometheus_samples(
+            prom_cli, profile_yaml["metrics"], start_time, end_time, max_in_flight
+        ),
+        _telemetry_samples(telemetry_json),
+    )
+
+    save_metrics = elastic is None or elastic_metrics_index is None
+    local_dir = os.path.join(tempfile.gettempdir(), "krkn_metrics")
+    local_file = os.path.join(
+        local_dir, f"{elastic_metrics_index}_{run_uuid}.json" + (".gz" if compress else "")
+    )
+    spool_file = local_file + ".part"
+    spool = None
+    try:
+        os.makedirs(local_dir, exist_ok=True)
+        spool = (
+            gzip.open(spool_file, "wt", encoding="utf-8")
+            if compress
+            else open(spool_file, "w", encoding="utf-8")
+        )
+        spool.write(f'{{"run_uuid": {json.dumps(run_uuid)}, "metrics": [')
+    except OSError as e:
+        logging.error(f"Failed to save metrics to {local_file}: {e}")
+        spool = _discard_spool(spool, spool_file)
+        if save_metrics:
+            return 0
+
+    spooled = uploaded = 0
+    try:
+        for batch in _batches(records, batch_size):
+            if spool is not None:
+                try:
+                    for metric in batch:
+                        spool.write(("," if spooled else "") + "\n  " + json.dumps(metric))
+                        spooled += 1
+                except OSError as e:
+                    logging.error(f"Failed to save metrics to {local_file}: {e}")
+                    spool = _discard_spool(spool, spool_file)
+                    if save_metrics:
+                        break
+            if save_metrics:
+                continue
             result = elastic.upload_metrics_to_elasticsearch(
-                run_uuid=run_uuid, index=elastic_metrics_index, raw_data=metrics_list
+                run_uuid=run_uuid, index=elastic_metrics_index, raw_data=batch
             )
             if result == -1:
-                logging.error("failed to save metrics on ElasticSearch")
+                logging.error(
+                    "failed to save metrics on ElasticSearch"
+                    + (f", saving the metrics to {local_file}" if spool is not None else "")
+                )
                 save_metrics = True
-        else:
-            save_metrics = True
-        if save_metrics:
-            local_dir = os.path.join(tempfile.gettempdir(), "krkn_metrics")
-            os.makedirs(local_dir, exist_ok=True)
-            local_file = os.path.join(local_dir, f"{elastic_metrics_index}_{run_uuid}.json")
-
+                if spool is None:
+                    break
+            else:
+                uploaded += len(batch)
+    except Exception as e:
+        logging.error(f"Failed to export metrics: {e}")
+        save_metrics = True
+    finally:
+        if spool is not None:
             try:
-                with open(local_file, "w") as f:
-                    json.dump({
-                        "run_uuid": run_uuid,
-                        "metrics": metrics_list
-                }, f, indent=2)
-                logging.info(f"Metrics saved to {local_file}")
-            except Exception as e:
+                spool.write("\n]}\n")
+                spool.close()
+                if save_metrics:
+                    os.replace(spool_file, local_file)
+                    logging.info(f"Metrics saved to {local_file}")
+                else:
+                    os.remove(spool_file)
+            except OSError as e:
                 logging.error(f"Failed to save metrics to {local_file}: {e}")
-    return metrics_list
+                spool = _discard_spool(spool, spool_file)
+    return spooled if save_metrics and spool is not None else uploaded
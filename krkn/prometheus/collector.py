@@ -18,9 +18,13 @@ from __future__ import annotations
 
 import datetime
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 
+import numpy as np
 from krkn_lib.prometheus.krkn_prometheus import KrknPrometheus
+from prometheus_api_client import PrometheusApiClientException, PrometheusConnect
 
 
 # -----------------------------------------------------------------------------
@@ -52,44 +56,282 @@ def slo_passed(prometheus_result: List[Any]) -> Optional[bool]:
     return None if not has_samples else True
 
 
+# Defaults of the concurrent SLO evaluation engine
+DEFAULT_MAX_IN_FLIGHT = 8
+DEFAULT_QUERY_RETRIES = 0
+DEFAULT_RETRY_BACKOFF = 1.0
+# Step of the range queries, same default as KrknPrometheus
+DEFAULT_GRANULARITY = 10
+# Prometheus rejects the range queries returning more points per series
+MAX_POINTS_PER_SERIES = 11000
+
+
+def _is_client_error(exc: Exception) -> bool:
+    # prometheus_api_client only exposes the status code in the message,
+    # a 4xx (e.g. bad PromQL) will fail again so it is not retried
+    return isinstance(exc, PrometheusApiClientException) and str(exc).startswith(
+        "HTTP Status Code 4"
+    )
+
+
+def _query_slo_chunk(
+    prom_cli: KrknPrometheus,
+    expr: str,
+    start_time: datetime.datetime,
+    end_time: datetime.datetime,
+    query_timeout: Optional[float],
+) -> List[Any]:
+    connect = getattr(prom_cli, "prom_cli", None)
+    if query_timeout is not None and isinstance(connect, PrometheusConnect):
+        # KrknPrometheus does not expose a per request timeout
+        return connect.custom_query_range(
+            query=expr,
+            start_time=start_time,
+            end_time=end_time,
+            step=f"{DEFAULT_GRANULARITY}s",
+            timeout=query_timeout,
+        )
+    return prom_cli.process_prom_query_in_range(
+        expr,
+        start_time=start_time,
+        end_time=end_time,
+    )
+
+
+def _query_slo_range(
+    prom_cli: KrknPrometheus,
+    expr: str,
+    start_time: datetime.datetime,
+    end_time: datetime.datetime,
+    query_timeout: Optional[float],
+) -> List[Any]:
+    """Run a range query split in chunks below the points per series limit
+    of Prometheus, the series of all the chunks are concatenated."""
+    chunk = datetime.timedelta(seconds=DEFAULT_GRANULARITY * (MAX_POINTS_PER_SERIES - 1))
+    result: List[Any] = []
+    chunk_start = start_time
+    while True:
+        chunk_end = min(chunk_start + chunk, end_time)
+        result.extend(
+            _query_slo_chunk(prom_cli, expr, chunk_start, chunk_end, query_timeout) or []
+        )
+        if chunk_end >= end_time:
+            return result
+        # the next chunk starts on the next step, no sample is fetched twice
+        chunk_start = chunk_end + datetime.timedelta(seconds=DEFAULT_GRANULARITY)
+
+
+def _fetch_slo(
+    prom_cli: KrknPrometheus,
+    slo: Dict[str, Any],
+    start_time: datetime.datetime,
+    end_time: datetime.datetime,
+    query_timeout: Optional[float],
+    retries: int,
+    retry_backoff: float,
+) -> Optional[List[Any]]:
+    """Run the range query of an SLO with retries, None if it failed."""
+    name = slo["name"]
+    attempt = 0
+    while True:
+        try:
+            return _query_slo_range(
+                prom_cli, slo["expr"], start_time, end_time, query_timeout
+            )
+        except Exception as exc:
+            if attempt >= retries or _is_client_error(exc):
+                logging.error("PromQL query failed for SLO '%s': %s", name, exc)
+                return None
+            delay = retry_backoff * (2**attempt)
+            attempt += 1
+            logging.warning(
+                "PromQL query failed for SLO '%s' (attempt %d/%d), retrying in %.1fs: %s",
+                name, attempt, retries + 1, delay, exc,
+            )
+            time.sleep(delay)
+
+
+def _evaluate_slo(
+    prom_cli: KrknPrometheus,
+    slo: Dict[str, Any],
+    start_time: datetime.datetime,
+    end_time: datetime.datetime,
+    query_timeout: Optional[float],
+    retries: int,
+    retry_backoff: float,
+) -> bool:
+    response = _fetch_slo(
+        prom_cli, slo, start_time, end_time, query_timeout, retries, retry_backoff
+    )
+    if response is None:
+        return False
+    passed = slo_passed(response)
+    if passed is None:
+        # Absence of data indicates the condition did not trigger; treat as pass.
+        logging.debug("SLO '%s' query returned no data; assuming pass.", slo["name"])
+        return True
+    return passed
+
+
+def _run_concurrently(
+    func, prom_cli, slo_list, start_time, end_time, max_in_flight, *args
+) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    if not slo_list:
+        return results
+    workers = max(1, min(int(max_in_flight), len(slo_list)))
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="krkn-slo"
+    ) as executor:
+        futures = [
+            executor.submit(func, prom_cli, slo, start_time, end_time, *args)
+            for slo in slo_list
+        ]
+        # results keep the order of the SLO list
+        for slo, future in zip(slo_list, futures):
+            results[slo["name"]] = future.result()
+    return results
+
+
 def evaluate_slos(
     prom_cli: KrknPrometheus,
     slo_list: List[Dict[str, Any]],
     start_time: datetime.datetime,
     end_time: datetime.datetime,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    query_timeout: Optional[float] = None,
+    retries: int = DEFAULT_QUERY_RETRIES,
+    retry_backoff: float = DEFAULT_RETRY_BACKOFF,
 ) -> Dict[str, bool]:
     """Evaluate a list of SLO expressions against Prometheus.
 
+    The range queries are issued concurrently, at most ``max_in_flight``
+    at a time.
+
     Args:
         prom_cli: Configured Prometheus client.
         slo_list: List of dicts with keys ``name``, ``expr``.
         start_time: Start timestamp.
         end_time: End timestamp.
-        granularity: Step in seconds for range queries.
+        max_in_flight: Maximum number of concurrent range queries.
+        query_timeout: Timeout in seconds of every range query, None keeps
+            the timeout of the client.
+        retries: Number of retries of a failed query (4xx are not retried).
+        retry_backoff: Delay in seconds before the first retry, doubled at
+            every further attempt.
     Returns:
         Mapping name -> bool indicating pass status.
         True means good we passed the SLO test otherwise failed the SLO
     """
-    results: Dict[str, bool] = {}
     logging.info("Evaluating %d SLOs over window %s – %s", len(slo_list), start_time, end_time)
-    for slo in slo_list:
-        expr = slo["expr"]
-        name = slo["name"]
-        try:
-            response = prom_cli.process_prom_query_in_range(
-                expr,
-                start_time=start_time,
-                end_time=end_time,
-            )
+    return _run_concurrently(
+        _evaluate_slo,
+        prom_cli,
+        slo_list,
+        start_time,
+        end_time,
+        max_in_flight,
+        query_timeout,
+        retries,
+        retry_backoff,
+    )
 
-            passed = slo_passed(response)
-            if passed is None:
-                # Absence of data indicates the condition did not trigger; treat as pass.
-                logging.debug("SLO '%s' query returned no data; assuming pass.", name)
-                results[name] = True
-            else:
-                results[name] = passed
-        except Exception as exc:  
-            logging.error("PromQL query failed for SLO '%s': %s", name, exc)
-            results[name] = False  
-    return results
+
+class SloSampleStore:
+    """Samples of every SLO over a whole run, fetched once.
+
+    The samples of each SLO are kept as two sorted NumPy arrays (timestamps
+    and the highest value of all the series at that timestamp) so the
+    pass/fail status of any window inside the fetched range is computed
+    locally, with the same semantics of :func:`slo_passed`.
+    """
+
+    def __init__(self, start_time: datetime.datetime, end_time: datetime.datetime):
+        self.start_time = start_time
+        self.end_time = end_time
+        self._samples: Dict[str, Optional[tuple]] = {}
+
+    def add(self, name: str, prometheus_result: Optional[List[Any]]) -> None:
+        """Store the range query result of an SLO, None marks a failed query."""
+        if prometheus_result is None:
+            self._samples[name] = None
+            return
+        timestamps: List[float] = []
+        values: List[float] = []
+        for series in prometheus_result:
+            for ts, val in series.get("values", []):
+                try:
+                    value = float(val)
+                except (TypeError, ValueError):
+                    # non numeric samples never fail the SLO
+                    value = np.nan
+                timestamps.append(float(ts))
+                values.append(value)
+        ts_array = np.asarray(timestamps, dtype=np.float64)
+        val_array = np.nan_to_num(
+            np.asarray(values, dtype=np.float64), nan=-np.inf
+        )
+        order = np.argsort(ts_array, kind="stable")
+        ts_array = ts_array[order]
+        val_array = val_array[order]
+        if ts_array.size:
+            # a single sample per timestamp, the highest of all the series
+            unique_ts, first = np.unique(ts_array, return_index=True)
+            val_array = np.maximum.reduceat(val_array, first)
+            ts_array = unique_ts
+        self._samples[name] = (ts_array, val_array)
+
+    def covers(self, start_time: datetime.datetime, end_time: datetime.datetime) -> bool:
+        return self.start_time <= start_time and end_time <= self.end_time
+
+    def evaluate(
+        self, start_time: datetime.datetime, end_time: datetime.datetime
+    ) -> Dict[str, bool]:
+        """Return the pass status of every stored SLO in the given window."""
+        start_ts = start_time.timestamp()
+        end_ts = end_time.timestamp()
+        results: Dict[str, bool] = {}
+        for name, samples in self._samples.items():
+            if samples is None:
+                results[name] = False
+                continue
+            ts_array, val_array = samples
+            low = np.searchsorted(ts_array, start_ts, side="left")
+            high = np.searchsorted(ts_array, end_ts, side="right")
+            # no samples in the window means the condition did not trigger
+            results[name] = not bool(np.any(val_array[low:high] > 0))
+        return results
+
+
+def fetch_slo_samples(
+    prom_cli: KrknPrometheus,
+    slo_list: List[Dict[str, Any]],
+    start_time: datetime.datetime,
+    end_time: datetime.datetime,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    query_timeout: Optional[float] = None,
+    retries: int = DEFAULT_QUERY_RETRIES,
+    retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+) -> SloSampleStore:
+    """Fetch every SLO expression once over a whole run.
+
+    Takes the same arguments of :func:`evaluate_slos`, the windows of the
+    single scenarios are then evaluated locally with
+    :meth:`SloSampleStore.evaluate`.
+    """
+    logging.info("Fetching %d SLOs over window %s – %s", len(slo_list), start_time, end_time)
+    responses = _run_concurrently(
+        _fetch_slo,
+        prom_cli,
+        slo_list,
+        start_time,
+        end_time,
+        max_in_flight,
+        query_timeout,
+        retries,
+        retry_backoff,
+    )
+    store = SloSampleStore(start_time, end_time)
+    for name, response in responses.items():
+        store.add(name, response)
+    return store
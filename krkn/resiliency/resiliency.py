@@ -36,15 +36,34 @@ import dataclasses
 from krkn_lib.models.telemetry import ChaosRunTelemetry
 
 from krkn_lib.prometheus.krkn_prometheus import KrknPrometheus
-from krkn.prometheus.collector import evaluate_slos
+from krkn.prometheus.collector import (
+    DEFAULT_MAX_IN_FLIGHT,
+    DEFAULT_QUERY_RETRIES,
+    DEFAULT_RETRY_BACKOFF,
+    SloSampleStore,
+    evaluate_slos,
+    fetch_slo_samples,
+)
 from krkn.resiliency.score import calculate_resiliency_score
 
 
 class Resiliency:  
     """Central orchestrator for resiliency scoring."""
 
-    def __init__(self, alerts_yaml_path: str):
-       
+    def __init__(
+        self,
+        alerts_yaml_path: str,
+        slo_evaluation: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Args:
+            alerts_yaml_path: Path to the SLO definitions.
+            slo_evaluation: Optional ``resiliency.slo_evaluation`` config
+                with ``max_in_flight``, ``query_timeout``, ``retries`` and
+                ``retry_backoff`` of the concurrent SLO evaluation and
+                ``single_pass`` to fetch every SLO once over the whole run
+                and evaluate the scenario windows locally.
+        """
         if not os.path.exists(alerts_yaml_path):
             raise FileNotFoundError(f"alerts file not found: {alerts_yaml_path}")
         with open(alerts_yaml_path, "r", encoding="utf-8") as fp:
@@ -59,6 +78,17 @@ class Resiliency:
         self.scenario_reports: List[Dict[str, Any]] = []
         self.summary: Optional[Dict[str, Any]] = None
         self.detailed_report: Optional[Dict[str, Any]] = None
+        slo_evaluation = slo_evaluation or {}
+        self._evaluation_options: Dict[str, Any] = {
+            "max_in_flight": int(slo_evaluation.get("max_in_flight") or DEFAULT_MAX_IN_FLIGHT),
+            "query_timeout": slo_evaluation.get("query_timeout"),
+            "retries": int(slo_evaluation.get("retries") or DEFAULT_QUERY_RETRIES),
+            "retry_backoff": float(slo_evaluation.get("retry_backoff") or DEFAULT_RETRY_BACKOFF),
+        }
+        self._single_pass = bool(slo_evaluation.get("single_pass", False))
+        # scenario windows waiting for the single pass evaluation
+        self._pending_reports: List[Dict[str, Any]] = []
+        self._sample_store: Optional[SloSampleStore] = None
 
     # ---------------------------------------------------------------------
     # Public API
@@ -123,7 +153,77 @@ class Resiliency:
             slo_list=self._slos,
             start_time=start_time,
             end_time=end_time,
+            **self._evaluation_options,
+        )
+        return self._record_scenario_report(
+            scenario_name=scenario_name,
+            start_time=start_time,
+            end_time=end_time,
+            weight=weight,
+            slo_results=slo_results,
+            health_check_results=health_check_results,
+        )
+
+    def evaluate_pending_reports(
+        self,
+        *,
+        prom_cli: KrknPrometheus,
+        total_start_time: datetime.datetime,
+        total_end_time: datetime.datetime,
+    ) -> None:
+        """
+        Evaluate the scenario windows deferred by ``single_pass`` mode.
+
+        Every SLO expression is fetched once over the whole run and each
+        scenario window is sliced locally from the fetched samples, the
+        telemetry items of the scenarios are enriched with their compact
+        resiliency breakdown. Does nothing if no window is pending.
+
+        Args:
+            prom_cli: Pre-configured KrknPrometheus instance.
+            total_start_time: Start time for the full test window.
+            total_end_time: End time for the full test window.
+        """
+        if not self._pending_reports:
+            return
+        fetch_start = min([total_start_time] + [p["start_time"] for p in self._pending_reports])
+        fetch_end = max([total_end_time] + [p["end_time"] for p in self._pending_reports])
+        self._sample_store = fetch_slo_samples(
+            prom_cli=prom_cli,
+            slo_list=self._slos,
+            start_time=fetch_start,
+            end_time=fetch_end,
+            **self._evaluation_options,
         )
+        pending, self._pending_reports = self._pending_reports, []
+        for item in pending:
+            try:
+                self._record_scenario_report(
+                    scenario_name=item["name"],
+                    start_time=item["start_time"],
+                    end_time=item["end_time"],
+                    weight=item["weight"],
+                    slo_results=self._sample_store.evaluate(
+                        item["start_time"], item["end_time"]
+                    ),
+                    health_check_results=None,
+                )
+                self._set_compact_report(
+                    item["telemetry"], self.compact_breakdown(self.scenario_reports[-1])
+                )
+            except Exception as exc:
+                logging.error("Resiliency per-scenario evaluation failed: %s", exc)
+
+    def _record_scenario_report(
+        self,
+        *,
+        scenario_name: str,
+        start_time: datetime.datetime,
+        end_time: datetime.datetime,
+        weight: float | int,
+        slo_results: Dict[str, bool],
+        health_check_results: Optional[Dict[str, bool]],
+    ) -> int:
         slo_defs = {slo["name"]: {"severity": slo["severity"], "weight": slo.get("weight")} for slo in self._slos}
         score, breakdown = calculate_resiliency_score(
             slo_definitions=slo_defs,
@@ -153,6 +253,11 @@ class Resiliency:
         total_start_time: datetime.datetime,
         total_end_time: datetime.datetime,
     ) -> None:
+        self.evaluate_pending_reports(
+            prom_cli=prom_cli,
+            total_start_time=total_start_time,
+            total_end_time=total_end_time,
+        )
         if not self.scenario_reports:
             raise RuntimeError("No scenario reports added – nothing to finalize")
 
@@ -163,12 +268,16 @@ class Resiliency:
         )
 
         # ---------------- Overall SLO evaluation across full test window -----------------------------
-        full_slo_results = evaluate_slos(
-            prom_cli=prom_cli,
-            slo_list=self._slos,
-            start_time=total_start_time,
-            end_time=total_end_time,
-        )
+        if self._sample_store is not None and self._sample_store.covers(total_start_time, total_end_time):
+            full_slo_results = self._sample_store.evaluate(total_start_time, total_end_time)
+        else:
+            full_slo_results = evaluate_slos(
+                prom_cli=prom_cli,
+                slo_list=self._slos,
+                start_time=total_start_time,
+                end_time=total_end_time,
+                **self._evaluation_options,
+            )
         slo_defs = {slo["name"]: {"severity": slo["severity"], "weight": slo.get("weight")} for slo in self._slos}
         _overall_score, full_breakdown = calculate_resiliency_score(
             slo_definitions=slo_defs,
@@ -283,6 +392,9 @@ class Resiliency:
             weight: Weight to assign to every scenario when calculating the final
                 weighted average.
             logger: Optional custom logger.
+
+        In ``single_pass`` mode the windows are only recorded here and are
+        evaluated by :meth:`evaluate_pending_reports`.
         """
 
         for tel in scenario_telemetries:
@@ -304,6 +416,18 @@ class Resiliency:
                     st_dt = batch_start_dt
                     en_dt = batch_end_dt
 
+                if self._single_pass:
+                    self._pending_reports.append(
+                        {
+                            "name": str(scen_name),
+                            "start_time": st_dt,
+                            "end_time": en_dt,
+                            "weight": weight,
+                            "telemetry": tel,
+                        }
+                    )
+                    continue
+
                 # -------- Calculate resiliency score for the scenario -----------
                 self.add_scenario_report(
                     scenario_name=str(scen_name),
@@ -314,11 +438,7 @@ class Resiliency:
                     health_check_results=None,
                 )
 
-                compact = self.compact_breakdown(self.scenario_reports[-1])
-                if isinstance(tel, dict):
-                    tel["resiliency_report"] = compact
-                else:
-                    setattr(tel, "resiliency_report", compact)
+                self._set_compact_report(tel, self.compact_breakdown(self.scenario_reports[-1]))
             except Exception as exc:
                 logging.error("Resiliency per-scenario evaluation failed: %s", exc)
 
@@ -374,6 +494,13 @@ class Resiliency:
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    @staticmethod
+    def _set_compact_report(tel: Any, compact: Dict[str, int]) -> None:
+        if isinstance(tel, dict):
+            tel["resiliency_report"] = compact
+        else:
+            setattr(tel, "resiliency_report", compact)
+
     @staticmethod
     def _normalise_alerts(raw_alerts: Any) -> List[Dict[str, Any]]:
         """Convert raw YAML alerts data into internal SLO list structure."""
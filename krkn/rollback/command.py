@@ -13,6 +13,7 @@
 # limitations under the License.
 import os
 import logging
+import sqlite3
 from typing import Optional, TYPE_CHECKING
 
 from krkn.rollback.config import RollbackConfig
@@ -22,6 +23,7 @@ from krkn.rollback.handler import execute_rollback_version_files
 
 if TYPE_CHECKING:
     from krkn_lib.telemetry.ocp import KrknTelemetryOpenshift
+    from krkn.rollback.store import RollbackStore
     
 
 def list_rollback(run_uuid: Optional[str]=None, scenario_type: Optional[str]=None):
@@ -43,7 +45,59 @@ def list_rollback(run_uuid: Optional[str]=None, scenario_type: Optional[str]=Non
     if not os.path.exists(versions_directory):
         logging.info(f"Rollback versions directory does not exist: {versions_directory}")
         return 0
-    
+
+    try:
+        store = RollbackConfig.get_store()
+    except (sqlite3.Error, OSError) as e:
+        logging.warning(f"Rollback index unavailable, listing {versions_directory}: {e}")
+        store = None
+    if store is not None:
+        return _list_rollback_index(store, run_uuid, scenario_type)
+    return _list_rollback_directory(versions_directory, run_uuid, scenario_type)
+
+
+def _list_rollback_index(store: "RollbackStore", run_uuid: Optional[str], scenario_type: Optional[str]):
+    """
+    List the rollback version files recorded in the index with their state.
+    """
+    try:
+        entries = store.entries(run_uuid, scenario_type)
+    except sqlite3.Error as e:
+        logging.error(f"Error reading rollback index: {e}")
+        return 1
+
+    if not entries:
+        if run_uuid:
+            logging.info(f"No rollback version files found for run_uuid: {run_uuid}")
+        else:
+            logging.info("No rollback version files found")
+        return 0
+
+    contexts: dict[str, list] = {}
+    for entry in entries:
+        contexts.setdefault(os.path.basename(entry.rollback_context), []).append(entry)
+
+    print(f"\n{store.versions_directory}/")
+    run_dirs = sorted(contexts)
+    for i, run_dir in enumerate(run_dirs):
+        is_last_dir = (i == len(run_dirs) - 1)
+        dir_prefix = "└── " if is_last_dir else "├── "
+        print(f"{dir_prefix}{run_dir}/")
+
+        files = sorted(contexts[run_dir], key=lambda e: os.path.basename(e.current_file))
+        for j, entry in enumerate(files):
+            is_last_file = (j == len(files) - 1)
+            dir_pad = "    " if is_last_dir else "│   "
+            file_pad = "└── " if is_last_file else "├── "
+            print(f"{dir_pad}{file_pad}{os.path.basename(entry.current_file)} [{entry.state}]")
+
+    return 0
+
+
+def _list_rollback_directory(versions_directory: str, run_uuid: Optional[str], scenario_type: Optional[str]):
+    """
+    List the rollback version files by walking the versions directory.
+    """
     # List all directories and files
     try:
         # Get all run directories
@@ -19,9 +19,13 @@ from typing_extensions import TypeAlias
 import time
 import os
 import logging
+import sqlite3
+import threading
 
 from krkn_lib.utils import get_random_string
 
+from krkn.rollback.store import EXECUTED_SUFFIX, RollbackStore
+
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
@@ -40,6 +44,11 @@ RollbackCallable: TypeAlias = Callable[
 ]
 
 
+# rollback stores by versions directory
+_stores: dict[str, RollbackStore] = {}
+_stores_lock = threading.Lock()
+
+
 class SingletonMeta(type):
     _instances = {}
 
@@ -95,6 +104,7 @@ class RollbackConfig(metaclass=SingletonMeta):
     def __init__(self):
         self._auto = False
         self._versions_directory = ""
+        self._retention_days = 0
         self._registered = False
 
     @property
@@ -116,15 +126,71 @@ class RollbackConfig(metaclass=SingletonMeta):
         if self._registered:
             raise AttributeError("Can't modify 'versions_directory' after registration")
         self._versions_directory = value
+
+    @property
+    def retention_days(self):
+        return self._retention_days
+
+    @retention_days.setter
+    def retention_days(self, value):
+        if self._registered:
+            raise AttributeError("Can't modify 'retention_days' after registration")
+        self._retention_days = value
+
     @classmethod
-    def register(cls, auto=False, versions_directory=""):
+    def register(cls, auto=False, versions_directory="", retention_days=0):
         """Initialize and return the singleton instance with given configuration."""
         instance = cls()
         instance.auto = auto
         instance.versions_directory = versions_directory
+        instance.retention_days = retention_days
         instance._registered = True
         return instance
 
+    @classmethod
+    def get_store(cls) -> RollbackStore | None:
+        """
+        Get the index of the rollback versions directory, created on first
+        use and populated with the version files already in the directory.
+
+        :return: The rollback store, None if no versions directory is set.
+        :raises sqlite3.Error, OSError: If the index can't be opened.
+        """
+        versions_directory = cls().versions_directory
+        if not versions_directory:
+            return None
+        with _stores_lock:
+            store = _stores.get(versions_directory)
+            if store is None:
+                store = RollbackStore(versions_directory)
+                if store.initialize():
+                    imported = store.import_files(
+                        cls._scan_rollback_version_files(include_executed=True)
+                    )
+                    logger.info(
+                        f"Indexed {imported} existing rollback version files in {store.index_path}"
+                    )
+                _stores[versions_directory] = store
+            return store
+
+    @classmethod
+    def compact_rollback_versions(cls) -> int:
+        """
+        Delete the executed rollback version files older than the retention.
+
+        :return: The number of version files deleted.
+        """
+        if not cls().retention_days:
+            return 0
+        try:
+            store = cls.get_store()
+            if store is None:
+                return 0
+            return store.compact(cls().retention_days * 86400)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Failed to compact the rollback versions: {e}")
+            return 0
+
     @classmethod
     def get_rollback_versions_directory(cls, rollback_context: RollbackContext) -> str:
         """
@@ -207,13 +273,44 @@ class RollbackConfig(metaclass=SingletonMeta):
     @classmethod
     def search_rollback_version_files(cls, run_uuid: str | None = None, scenario_type: str | None = None) -> list[str]:
         """
-        Search for rollback version files based on run_uuid and scenario_type.
+        Search for the rollback version files still to execute based on run_uuid and scenario_type.
+
+        The version files are looked up in the index of the versions directory, the
+        directory is only scanned when the index can't be opened.
+
+        :param run_uuid: Unique identifier for the run.
+        :param scenario_type: Type of the scenario.
+        :return: List of version file paths, most recent first.
+        """
+        try:
+            store = cls.get_store()
+            if store is None:
+                return []
+            version_files = []
+            for entry in store.pending(run_uuid, scenario_type):
+                if store.reconcile(entry) is not None:
+                    version_files.append(entry.version_file)
+            return version_files
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Rollback index unavailable, scanning {cls().versions_directory}: {e}")
+            return cls._scan_rollback_version_files(run_uuid, scenario_type)
+
+    @classmethod
+    def _scan_rollback_version_files(
+        cls,
+        run_uuid: str | None = None,
+        scenario_type: str | None = None,
+        include_executed: bool = False,
+    ) -> list[str]:
+        """
+        Search for rollback version files by listing the versions directory.
 
         1. Search directories with "run_uuid" in name under "cls.versions_directory".
         2. Search files in those directories that start with "scenario_type" in matched directories in step 1.
 
         :param run_uuid: Unique identifier for the run.
         :param scenario_type: Type of the scenario.
+        :param include_executed: Also return the executed version files (`.executed` suffix).
         :return: List of version file paths.
         """
 
@@ -223,6 +320,8 @@ class RollbackConfig(metaclass=SingletonMeta):
         rollback_context_directories = []
         skipped_count = 0
         for dir in os.listdir(cls().versions_directory):
+            if not os.path.isdir(os.path.join(cls().versions_directory, dir)):
+                continue
             if cls.is_rollback_context_directory_format(dir, run_uuid):
                 rollback_context_directories.append(dir)
             else:
@@ -243,10 +342,16 @@ class RollbackConfig(metaclass=SingletonMeta):
 
             for file in os.listdir(rollback_context_dir):
                 # Skip known non-rollback files/directories
-                if file == "__pycache__" or file.endswith(".executed"):
+                if file == "__pycache__":
                     continue
+                if file.endswith(EXECUTED_SUFFIX):
+                    if not include_executed:
+                        continue
+                    file_name = file[: -len(EXECUTED_SUFFIX)]
+                else:
+                    file_name = file
 
-                if cls.is_rollback_version_file_format(file, scenario_type):
+                if cls.is_rollback_version_file_format(file_name, scenario_type):
                     version_files.append(
                         os.path.join(rollback_context_dir, file)
                     )
@@ -255,7 +360,7 @@ class RollbackConfig(metaclass=SingletonMeta):
                         f"File {file} does not match expected pattern of <{scenario_type or '*'}>_<timestamp>_<hash_suffix>.py"
                     )
         def get_rollback_timestamp(filepath: str) -> int:
-            filename = os.path.basename(filepath)
+            filename = os.path.basename(filepath).removesuffix(EXECUTED_SUFFIX)
             parts = filename.rsplit("_", 2)
             try:
                 return int(parts[-2])
@@ -298,4 +403,6 @@ class Version:
         return Version(
             scenario_type=scenario_type,
             rollback_context=rollback_context,
+            timestamp=time.time_ns(),
+            hash_suffix=get_random_string(8),
         )
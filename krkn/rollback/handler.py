@@ -21,8 +21,10 @@ from typing import cast, TYPE_CHECKING
 import os
 import importlib.util
 import inspect
+import sqlite3
 
 from krkn.rollback.config import RollbackConfig, RollbackContext, Version
+from krkn.rollback.store import parse_version_file
 
 
 logger = logging.getLogger(__name__)
@@ -134,6 +136,23 @@ def _parse_rollback_module(version_file_path: str) -> tuple[RollbackCallable, Ro
     return rollback_callable, rollback_content
 
 
+def _update_rollback_index(method: str, *args):
+    """
+    Record a state transition of rollback version files in the index of the versions
+    directory. A failure to update the index is logged and doesn't fail the rollback
+    operation itself.
+
+    :param method: The RollbackStore method recording the transition.
+    :param args: The arguments of the method.
+    """
+    try:
+        store = RollbackConfig.get_store()
+        if store is not None:
+            getattr(store, method)(*args)
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"Failed to update the rollback index ({method}): {e}")
+
+
 def execute_rollback_version_files(
     telemetry_ocp: "KrknTelemetryOpenshift",
     run_uuid: str | None = None,
@@ -182,6 +201,7 @@ def execute_rollback_version_files(
         except Exception as e:
             success = False
             logger.error(f"Failed to execute rollback version file {version_file}: {e}")
+            _update_rollback_index("mark_failed", version_file, str(e))
             raise
 
         # Rename the version file with .executed suffix if successful
@@ -193,6 +213,7 @@ def execute_rollback_version_files(
             except Exception as e:
                 logger.error(f"Failed to rename rollback version file {version_file}: {e}")
                 raise
+            _update_rollback_index("mark_executed", version_file)
 
 def cleanup_rollback_version_files(run_uuid: str, scenario_type: str):
     """
@@ -218,6 +239,7 @@ def cleanup_rollback_version_files(run_uuid: str, scenario_type: str):
         except Exception as e:
             logger.error(f"Failed to remove rollback version file {version_file}: {e}")
             raise
+        _update_rollback_index("remove", [version_file])
 
 class RollbackHandler:
     def __init__(
@@ -278,3 +300,18 @@ class RollbackHandler:
             logger.info(f"Rollback callable serialized to {version_file}")
         except Exception as e:
             logger.error(f"Failed to serialize rollback callable: {e}")
+            return
+
+        # Index the version file once it is completely written
+        try:
+            run_uuid, _, _ = parse_version_file(version_file)
+        except Exception as e:
+            logger.warning(f"Failed to index rollback version file {version_file}: {e}")
+            return
+        _update_rollback_index(
+            "add",
+            version_file,
+            run_uuid,
+            self.scenario_type,
+            version.timestamp,
+        )
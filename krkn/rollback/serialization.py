@@ -129,8 +129,13 @@ class Serializer:
 
         logger.debug("Creating version file at %s", version.version_file_full_path)
         logger.debug("Version file content:\n%s", file_content)
-        with open(version.version_file_full_path, "w") as f:
+        # Write to a temporary file first so the version file is never read half written
+        temporary_file = f"{version.version_file_full_path}.tmp"
+        with open(temporary_file, "w") as f:
             f.write(file_content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary_file, version.version_file_full_path)
         logger.info(f"Serialized callable written to {version.version_file_full_path}")
 
         return version.version_file_full_path
@@ -0,0 +1,380 @@
+# Copyright 2026 The Krkn Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+SQLite index of the rollback version files.
+
+Every version file written under the rollback versions directory is recorded
+with its run UUID, scenario type, timestamp and state, so the pending
+rollbacks of a run are looked up with an indexed query instead of listing
+the directory and parsing the file names. Every state transition
+(pending -> executed, pending -> failed) is a single transaction, a crash
+leaves an entry either in its previous or in its new state.
+"""
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = "rollback_index.db"
+EXECUTED_SUFFIX = ".executed"
+
+PENDING = "pending"
+EXECUTED = "executed"
+FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS versions (
+    version_file TEXT PRIMARY KEY,
+    run_uuid TEXT NOT NULL,
+    scenario_type TEXT NOT NULL,
+    timestamp INTEGER NOT NULL,
+    state TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    updated_at INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS versions_run
+    ON versions (run_uuid, scenario_type, state, timestamp);
+CREATE INDEX IF NOT EXISTS versions_state
+    ON versions (state, updated_at);
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+@dataclass(frozen=True)
+class RollbackEntry:
+    """A rollback version file recorded in the index."""
+    version_file: str
+    run_uuid: str
+    scenario_type: str
+    timestamp: int
+    state: str
+    attempts: int = 0
+    error: Optional[str] = None
+    updated_at: int = 0
+
+    @property
+    def rollback_context(self) -> str:
+        return os.path.dirname(self.version_file)
+
+    @property
+    def current_file(self) -> str:
+        """The version file path on disk, renamed once executed."""
+        if self.state == EXECUTED:
+            return self.version_file + EXECUTED_SUFFIX
+        return self.version_file
+
+
+def parse_version_file(version_file: str) -> tuple[str, str, int]:
+    """
+    Returns the run UUID, scenario type and timestamp of a version file
+    path formatted as `<timestamp>-<run_uuid>/<scenario_type>_<timestamp>_<hash_suffix>.py`.
+    """
+    context, file_name = os.path.split(version_file)
+    run_uuid = os.path.basename(context).split("-", 1)[1]
+    scenario_type, timestamp, _ = file_name.rsplit("_", 2)
+    return run_uuid, scenario_type, int(timestamp)
+
+
+class RollbackStore:
+    """
+    Index of the version files of a rollback versions directory, stored in
+    `<versions_directory>/rollback_index.db`. The version files are
+    recorded by their path relative to the versions directory and the
+    methods take and return absolute paths.
+
+    Safe to use from several threads and processes: every operation opens
+    its own connection.
+    """
+
+    def __init__(self, versions_directory: str, timeout: float = 30.0):
+        """
+        :param versions_directory: the rollback versions directory
+        :param timeout: seconds to wait for a lock held by another writer
+        """
+        self.versions_directory = os.path.abspath(versions_directory)
+        self.index_path = os.path.join(self.versions_directory, INDEX_FILE)
+        self.timeout = timeout
+        self._initialized = False
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        connection = sqlite3.connect(self.index_path, timeout=self.timeout)
+        try:
+            connection.row_factory = sqlite3.Row
+            # a committed transition survives a crash of the process or host
+            connection.execute("PRAGMA synchronous=FULL")
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def initialize(self) -> bool:
+        """
+        Creates the index if it doesn't exist.
+
+        :return: True if the index has never been populated from the
+            version files already in the directory (see `import_files`)
+        """
+        with self._lock:
+            os.makedirs(self.versions_directory, mode=0o700, exist_ok=True)
+            with self._connect() as connection:
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.executescript(_SCHEMA)
+                imported = connection.execute(
+                    "SELECT value FROM metadata WHERE key = 'imported'"
+                ).fetchone()
+            self._initialized = True
+            return imported is None
+
+    def _relative(self, version_file: str) -> str:
+        return os.path.relpath(os.path.abspath(version_file), self.versions_directory)
+
+    def _absolute(self, version_file: str) -> str:
+        return os.path.join(self.versions_directory, version_file)
+
+    def _entry(self, row: sqlite3.Row) -> RollbackEntry:
+        return RollbackEntry(
+            version_file=self._absolute(row["version_file"]),
+            run_uuid=row["run_uuid"],
+            scenario_type=row["scenario_type"],
+            timestamp=row["timestamp"],
+            state=row["state"],
+            attempts=row["attempts"],
+            error=row["error"],
+            updated_at=row["updated_at"],
+        )
+
+    def import_files(self, version_files: Iterable[str]) -> int:
+        """
+        Records the version files written before the index existed, the
+        files renamed with the `.executed` suffix are recorded as executed.
+        Marks the index as populated.
+
+        :param version_files: paths of the version files
+        :return: the number of files recorded
+        """
+        now = time.time_ns()
+        rows = []
+        for path in version_files:
+            state = PENDING
+            if path.endswith(EXECUTED_SUFFIX):
+                path, state = path[: -len(EXECUTED_SUFFIX)], EXECUTED
+            relative = self._relative(path)
+            try:
+                run_uuid, scenario_type, timestamp = parse_version_file(relative)
+            except (IndexError, ValueError):
+                logger.warning(f"Skipping rollback version file with unexpected name {path}")
+                continue
+            rows.append((relative, run_uuid, scenario_type, timestamp, state, now))
+        with self._connect() as connection:
+            connection.executemany(
+                "INSERT OR IGNORE INTO versions "
+                "(version_file, run_uuid, scenario_type, timestamp, state, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO metadata (key, value) VALUES ('imported', ?)",
+                (str(now),),
+            )
+        return len(rows)
+
+    def add(self, version_file: str, run_uuid: str, scenario_type: str, timestamp: int):
+        """
+        Records a pending version file, call it once the file is written.
+        """
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO versions "
+                "(version_file, run_uuid, scenario_type, timestamp, state, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    self._relative(version_file),
+                    run_uuid,
+                    scenario_type,
+                    timestamp,
+                    PENDING,
+                    time.time_ns(),
+                ),
+            )
+
+    def entries(
+        self,
+        run_uuid: str | None = None,
+        scenario_type: str | None = None,
+        states: Iterable[str] | None = None,
+    ) -> list[RollbackEntry]:
+        """
+        Returns the recorded version files, the most recent first (the order
+        of execution of the rollbacks).
+
+        :param run_uuid: only the entries of this run (optional)
+        :param scenario_type: only the entries of this scenario type (optional)
+        :param states: only the entries in these states (optional)
+        :return: the matching entries
+        """
+        query = "SELECT * FROM versions"
+        conditions, parameters = [], []
+        if run_uuid is not None:
+            conditions.append("run_uuid = ?")
+            parameters.append(run_uuid)
+        if scenario_type is not None:
+            conditions.append("scenario_type = ?")
+            parameters.append(scenario_type)
+        if states is not None:
+            states = list(states)
+            conditions.append(f"state IN ({', '.join('?' * len(states))})")
+            parameters.extend(states)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY timestamp DESC, version_file DESC"
+        with self._connect() as connection:
+            rows = connection.execute(query, parameters).fetchall()
+        return [self._entry(row) for row in rows]
+
+    def pending(
+        self, run_uuid: str | None = None, scenario_type: str | None = None
+    ) -> list[RollbackEntry]:
+        """
+        Returns the version files still to execute: the pending ones and
+        the failed ones, which are retried.
+        """
+        return self.entries(run_uuid, scenario_type, states=(PENDING, FAILED))
+
+    def _transition(
+        self, version_file: str, state: str, error: str | None = None, attempted: bool = True
+    ) -> bool:
+        with self._connect() as connection:
+            cursor = connection.execute(
+                "UPDATE versions SET state = ?, error = ?, updated_at = ?, "
+                "attempts = attempts + ? WHERE version_file = ?",
+                (
+                    state,
+                    error,
+                    time.time_ns(),
+                    1 if attempted else 0,
+                    self._relative(version_file),
+                ),
+            )
+            return cursor.rowcount > 0
+
+    def mark_executed(self, version_file: str) -> bool:
+        """
+        Records that the rollback of a version file succeeded, call it once
+        the file is renamed with the `.executed` suffix.
+
+        :return: False if the version file isn't recorded
+        """
+        return self._transition(version_file, EXECUTED)
+
+    def mark_failed(self, version_file: str, error: str) -> bool:
+        """
+        Records that the rollback of a version file failed, it is retried
+        by the next execution.
+
+        :return: False if the version file isn't recorded
+        """
+        return self._transition(version_file, FAILED, error)
+
+    def remove(self, version_files: Iterable[str]):
+        """
+        Removes version files from the index, call it once they are deleted.
+        """
+        with self._connect() as connection:
+            connection.executemany(
+                "DELETE FROM versions WHERE version_file = ?",
+                [(self._relative(path),) for path in version_files],
+            )
+
+    def reconcile(self, entry: RollbackEntry) -> Optional[RollbackEntry]:
+        """
+        Checks a pending entry against the files, for the executions
+        interrupted between the rename of the file and the update of the
+        index.
+
+        :return: the entry if its version file is still to execute, None
+            if it was executed or deleted
+        """
+        if os.path.isfile(entry.version_file):
+            return entry
+        if os.path.isfile(entry.version_file + EXECUTED_SUFFIX):
+            logger.info(f"Rollback version file {entry.version_file} was already executed")
+            self.mark_executed(entry.version_file)
+        else:
+            logger.warning(
+                f"Rollback version file {entry.version_file} no longer exists, "
+                f"removing it from the index"
+            )
+            self.remove([entry.version_file])
+        return None
+
+    def compact(self, retention: float) -> int:
+        """
+        Deletes the executed version files, and their index entries, older
+        than the retention, then the rollback context directories left
+        empty. Pending and failed entries are kept.
+
+        :param retention: seconds an executed version file is kept
+        :return: the number of entries deleted
+        """
+        threshold = time.time_ns() - int(retention * 1e9)
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT version_file FROM versions WHERE state = ? AND updated_at < ?",
+                (EXECUTED, threshold),
+            ).fetchall()
+        if not rows:
+            return 0
+        removed = []
+        contexts = set()
+        for row in rows:
+            path = self._absolute(row["version_file"]) + EXECUTED_SUFFIX
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Failed to remove executed rollback version file {path}: {e}")
+                continue
+            removed.append(row["version_file"])
+            contexts.add(os.path.dirname(self._absolute(row["version_file"])))
+        with self._connect() as connection:
+            connection.executemany(
+                "DELETE FROM versions WHERE version_file = ?",
+                [(version_file,) for version_file in removed],
+            )
+        for context in contexts:
+            cache = os.path.join(context, "__pycache__")
+            try:
+                if set(os.listdir(context)) <= {"__pycache__"}:
+                    shutil.rmtree(cache, ignore_errors=True)
+                    os.rmdir(context)
+            except OSError:
+                pass
+        logger.info(f"Compacted {len(removed)} executed rollback version files")
+        return len(removed)
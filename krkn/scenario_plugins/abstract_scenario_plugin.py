@@ -17,6 +17,7 @@ import time
 from abc import ABC, abstractmethod
 from krkn_lib.models.telemetry import ScenarioTelemetry
 from krkn_lib.telemetry.ocp import KrknTelemetryOpenshift
+from krkn_lib.utils.functions import get_yaml_item_value
 
 from krkn import utils, cerberus
 from krkn.rollback.handler import (
@@ -26,6 +27,7 @@ from krkn.rollback.handler import (
 )
 from krkn.rollback.signal import signal_handler
 from krkn.rollback.serialization import Serializer
+from krkn.stability import StabilityDetector
 
 class AbstractScenarioPlugin(ABC):
 
@@ -81,12 +83,57 @@ class AbstractScenarioPlugin(ABC):
         scenarios_list: list[str],
         krkn_config: dict[str, any],
         telemetry: KrknTelemetryOpenshift,
+        collector: utils.PostScenarioCollector = None,
+    ) -> tuple[list[str], list[ScenarioTelemetry]]:
+        """
+        Runs the scenarios of the plugin one after the other.
+
+        :param collector: the collector of the run, draining it is up to the
+            caller. If not set a collector is created and drained before
+            returning.
+        :return: the failed scenarios and the telemetry of all the scenarios
+        """
+        if collector is not None:
+            return self._run_scenarios(
+                run_uuid, scenarios_list, krkn_config, telemetry, collector
+            )
+        collector = utils.PostScenarioCollector(
+            background=get_yaml_item_value(
+                krkn_config["tunings"], "async_collection", True
+            )
+        )
+        try:
+            return self._run_scenarios(
+                run_uuid, scenarios_list, krkn_config, telemetry, collector
+            )
+        finally:
+            collector.drain()
+
+    def _run_scenarios(
+        self,
+        run_uuid: str,
+        scenarios_list: list[str],
+        krkn_config: dict[str, any],
+        telemetry: KrknTelemetryOpenshift,
+        collector: utils.PostScenarioCollector,
     ) -> tuple[list[str], list[ScenarioTelemetry]]:
 
         scenario_telemetries: list[ScenarioTelemetry] = []
         failed_scenarios = []
         wait_duration = krkn_config["tunings"]["wait_duration"]
         events_backup = krkn_config["telemetry"]["events_backup"]
+        stability_detector = None
+        try:
+            stability_detector = StabilityDetector.from_config(
+                krkn_config["tunings"].get("stability_gate"),
+                telemetry.get_lib_kubernetes(),
+                krkn_config.get("performance_monitoring"),
+            )
+        except ValueError as e:
+            logging.error(
+                f"invalid stability_gate configuration, falling back to "
+                f"the wait_duration timer: {e}"
+            )
         for scenario_config in scenarios_list:
             if isinstance(scenario_config, list):
                 logging.error(
@@ -113,6 +160,8 @@ class AbstractScenarioPlugin(ABC):
             parsed_scenario_config = telemetry.set_parameters_base64(
                 scenario_telemetry, scenario_config
             )
+            if stability_detector:
+                stability_detector.snapshot(parsed_scenario_config)
 
             with signal_handler.signal_context(
                 run_uuid=run_uuid,
@@ -146,48 +195,97 @@ class AbstractScenarioPlugin(ABC):
                 )
             scenario_telemetry.exit_status = return_value
 
-            logging.info(
-                f"waiting {wait_duration}s for cluster to stabilize "
-                f"before collecting metrics"
+            self.wait_for_cluster_stable(
+                wait_duration, scenario_telemetry, stability_detector
             )
-            time.sleep(wait_duration)
             scenario_telemetry.end_timestamp = time.time()
             start_time = int(scenario_telemetry.start_timestamp)
             end_time = int(scenario_telemetry.end_timestamp)
-            try:
-                utils.collect_and_put_ocp_logs(
-                    telemetry,
+            # logs and events of a scenario are collected in background while
+            # the next one runs, only the stability gate holds it back
+            collector.submit(
+                f"collect OCP logs for scenario '{scenario_config}'",
+                utils.collect_and_put_ocp_logs,
+                telemetry,
+                parsed_scenario_config,
+                telemetry.get_telemetry_request_id(),
+                start_time,
+                end_time,
+            )
+
+            if events_backup:
+                collector.submit(
+                    f"collect cluster events for scenario '{scenario_config}'",
+                    utils.populate_cluster_events,
+                    krkn_config,
                     parsed_scenario_config,
-                    telemetry.get_telemetry_request_id(),
+                    telemetry.get_lib_kubernetes(),
                     start_time,
-                    end_time
-                )
-            except Exception as e:
-                logging.error(
-                    f"failed to collect OCP logs for scenario "
-                    f"'{scenario_config}': {e}"
+                    end_time,
                 )
 
-            if events_backup:
-                try:
-                    utils.populate_cluster_events(
-                        krkn_config,
-                        parsed_scenario_config,
-                        telemetry.get_lib_kubernetes(),
-                        start_time,
-                        end_time
-                    )
-                except Exception as e:
-                    logging.error(
-                        f"failed to collect cluster events for scenario "
-                        f"'{scenario_config}': {e}"
-                    )
-
             if scenario_telemetry.exit_status != 0:
                 failed_scenarios.append(scenario_config)
             scenario_telemetries.append(scenario_telemetry)
+            # the cerberus go/no-go signal can stop the run so it stays
+            # part of the gate instead of the background collection
             cerberus.publish_kraken_status(start_time, end_time)
 
         return failed_scenarios, scenario_telemetries
 
-    
+    def wait_for_cluster_stable(
+        self,
+        wait_duration: int,
+        scenario_telemetry: ScenarioTelemetry,
+        stability_detector: StabilityDetector = None,
+    ):
+        """
+        Gate executed after each scenario, before its telemetry window is
+        closed and the next scenario is started. Without a stability
+        detector it sleeps `wait_duration`, otherwise it returns as soon as
+        the cluster is stable, `wait_duration` being the upper bound, and
+        records the measured `time_to_stable` in the `additional_telemetry`
+        of the scenario (None if the cluster did not become stable).
+
+        :param wait_duration: the `tunings.wait_duration` in seconds
+        :param scenario_telemetry: the `ScenarioTelemetry` of the scenario
+            that has just been executed
+        :param stability_detector: the detector built from
+            `tunings.stability_gate` if enabled
+        """
+        if stability_detector is None:
+            logging.info(
+                f"waiting {wait_duration}s for cluster to stabilize "
+                f"before collecting metrics"
+            )
+            time.sleep(wait_duration)
+            return
+
+        logging.info(
+            f"waiting up to {wait_duration}s for cluster to stabilize "
+            f"before collecting metrics"
+        )
+        time_to_stable = stability_detector.wait_for_stable(
+            wait_duration, scenario_telemetry
+        )
+        self.get_additional_telemetry(scenario_telemetry)["time_to_stable"] = (
+            round(time_to_stable, 3) if time_to_stable is not None else None
+        )
+
+    @staticmethod
+    def get_additional_telemetry(scenario_telemetry: ScenarioTelemetry) -> dict:
+        """
+        Returns the `additional_telemetry` dict of the scenario, the metrics
+        added to it are published with the scenario telemetry. The dict is
+        created if the scenario has none yet.
+
+        :param scenario_telemetry: the `ScenarioTelemetry` of the scenario
+        :return: the `additional_telemetry` dict
+        """
+        additional_telemetry = getattr(
+            scenario_telemetry, "additional_telemetry", None
+        )
+        if not isinstance(additional_telemetry, dict):
+            additional_telemetry = {}
+            scenario_telemetry.additional_telemetry = additional_telemetry
+        return additional_telemetry
@@ -24,11 +24,16 @@ import yaml
 from krkn_lib.models.telemetry import ScenarioTelemetry
 from krkn_lib.telemetry.ocp import KrknTelemetryOpenshift
 from krkn_lib.models.krkn import  HogConfig, HogType
-from krkn_lib.models.k8s import NodeResources
 from krkn_lib.k8s import KrknKubernetes
 from krkn_lib.utils import get_random_string
 
 from krkn.scenario_plugins.abstract_scenario_plugin import AbstractScenarioPlugin
+from krkn.scenario_plugins.hogs.resource_sampler import (
+    DEFAULT_SAMPLING_INTERVAL,
+    DEFAULT_SAMPLING_RATE_LIMIT,
+    NodeResourceSampler,
+    RateLimiter,
+)
 from krkn.rollback.config import RollbackContent
 from krkn.rollback.handler import set_rollback_context_decorator
 
@@ -45,6 +50,8 @@ class HogsScenarioPlugin(AbstractScenarioPlugin):
             
             # Get node-name if provided
             node_name = scenario.get('node-name')
+            sampling_interval = scenario.get('sampling-interval', DEFAULT_SAMPLING_INTERVAL)
+            sampling_rate_limit = scenario.get('sampling-rate-limit', DEFAULT_SAMPLING_RATE_LIMIT)
             
             has_selector = True
             if not scenario_config.node_selector or not re.match("^.+=.*$", scenario_config.node_selector):
@@ -72,7 +79,12 @@ class HogsScenarioPlugin(AbstractScenarioPlugin):
                 available_nodes = random.sample(available_nodes, scenario_config.number_of_nodes)
 
             exception_queue = queue.Queue()
-            self.run_scenario(scenario_config, lib_telemetry.get_lib_kubernetes(), available_nodes, exception_queue)
+            node_resources = {}
+            try:
+                self.run_scenario(scenario_config, lib_telemetry.get_lib_kubernetes(), available_nodes,
+                                  exception_queue, sampling_interval, sampling_rate_limit, node_resources)
+            finally:
+                self.record_node_resources(scenario_telemetry, node_resources)
             return 0
         except Exception as e:
             logging.error(f"scenario exception: {e}")
@@ -83,8 +95,11 @@ class HogsScenarioPlugin(AbstractScenarioPlugin):
 
     def run_scenario_worker(self, config: HogConfig,
                             lib_k8s: KrknKubernetes, node: str,
-                            exception_queue: queue.Queue):
+                            exception_queue: queue.Queue,
+                            sampler: NodeResourceSampler = None):
         try:
+            if sampler is None:
+                sampler = NodeResourceSampler(node, lambda: lib_k8s.get_node_resources_info(node))
             if not config.workers:
                 config.workers = lib_k8s.get_node_cpu_count(node)
                 logging.info(f"[{node}] detected {config.workers} cpus for node {node}")
@@ -107,13 +122,8 @@ class HogsScenarioPlugin(AbstractScenarioPlugin):
             start = time.time()
             # waiting 3 seconds before starting sample collection
             time.sleep(3)
-            node_resources_end = lib_k8s.get_node_resources_info(node)
-
-            samples: list[NodeResources] = []
-            avg_node_resources = NodeResources()
-
-            while time.time() - start < config.duration-1:
-                samples.append(lib_k8s.get_node_resources_info(node))
+            logging.info(f"[{node}] sampling node resources every {sampler.interval} seconds")
+            sampler.run(until=start + config.duration - 1)
 
             max_wait = 30
             wait = 0
@@ -129,14 +139,10 @@ class HogsScenarioPlugin(AbstractScenarioPlugin):
             logging.info(f"[{node}] deleting pod: {pod_name} namespace: {config.namespace}")
             lib_k8s.delete_pod(pod_name, config.namespace)
 
-            for resource in samples:
-                avg_node_resources.cpu += resource.cpu
-                avg_node_resources.memory += resource.memory
-                avg_node_resources.disk_space += resource.disk_space
-
-            avg_node_resources.cpu = avg_node_resources.cpu/len(samples)
-            avg_node_resources.memory = avg_node_resources.memory / len(samples)
-            avg_node_resources.disk_space = avg_node_resources.disk_space / len(samples)
+            if sampler.stats.count == 0:
+                logging.warning(f"[{node}] no node resources sampled during the hog run")
+                return
+            avg_node_resources = sampler.stats.mean
 
             if config.type == HogType.cpu:
                 logging.info(f"[{node}] detected cpu consumption: "
@@ -153,14 +159,39 @@ class HogsScenarioPlugin(AbstractScenarioPlugin):
     def run_scenario(self, config: HogConfig,
                      lib_k8s: KrknKubernetes,
                      available_nodes: list[str],
-                     exception_queue: queue.Queue):
+                     exception_queue: queue.Queue,
+                     sampling_interval: float = DEFAULT_SAMPLING_INTERVAL,
+                     sampling_rate_limit: float = DEFAULT_SAMPLING_RATE_LIMIT,
+                     node_resources: dict = None):
+        """
+        Runs the hog workload on every node and samples the node resources
+        meanwhile.
+
+        :param config: the hog configuration
+        :param lib_k8s: the client of the cluster
+        :param available_nodes: the targeted nodes
+        :param exception_queue: the queue collecting the worker errors
+        :param sampling_interval: seconds between two samples of a node
+        :param sampling_rate_limit: maximum number of metrics requests per
+            second, all the nodes together (0 means unbounded)
+        :param node_resources: filled with the resources sampled on every
+            node (optional)
+        """
         workers = []
+        samplers: dict[str, NodeResourceSampler] = {}
+        rate_limiter = RateLimiter(sampling_rate_limit)
         logging.info(f"running {config.type.value} hog scenario")
         logging.info(f"targeting nodes: [{','.join(available_nodes)}]")
         for node in available_nodes:
             config_copy = copy.deepcopy(config)
+            samplers[node] = NodeResourceSampler(
+                node,
+                lambda node=node: lib_k8s.get_node_resources_info(node),
+                interval=sampling_interval,
+                rate_limiter=rate_limiter,
+            )
             worker = threading.Thread(target=self.run_scenario_worker,
-                                      args=(config_copy, lib_k8s, node, exception_queue))
+                                      args=(config_copy, lib_k8s, node, exception_queue, samplers[node]))
             worker.daemon = True
             worker.start()
             workers.append(worker)
@@ -168,6 +199,10 @@ class HogsScenarioPlugin(AbstractScenarioPlugin):
         for worker in workers:
             worker.join()
 
+        if node_resources is not None:
+            for node, sampler in samplers.items():
+                node_resources[node] = sampler.to_dict()
+
         try:
             while True:
                 exception = exception_queue.get_nowait()
@@ -175,6 +210,21 @@ class HogsScenarioPlugin(AbstractScenarioPlugin):
         except queue.Empty:
             pass
 
+    @staticmethod
+    def record_node_resources(scenario_telemetry: ScenarioTelemetry, node_resources: dict):
+        """
+        Publishes the resources sampled on every node (aggregates and time
+        series) in the `additional_telemetry` of the scenario.
+
+        :param scenario_telemetry: the telemetry of the scenario
+        :param node_resources: the sampled resources by node
+        """
+        if not node_resources:
+            return
+        AbstractScenarioPlugin.get_additional_telemetry(scenario_telemetry).setdefault(
+            "node_resources", {}
+        ).update(node_resources)
+
     @staticmethod
     def rollback_hog_pod(rollback_content: RollbackContent, lib_telemetry: KrknTelemetryOpenshift):
         """
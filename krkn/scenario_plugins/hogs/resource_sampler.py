@@ -0,0 +1,189 @@
+# Copyright 2025 The Krkn Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+from krkn_lib.models.k8s import NodeResources
+
+# seconds between two samples of the same node
+DEFAULT_SAMPLING_INTERVAL = 5
+# maximum number of metrics requests per second, all the nodes together
+DEFAULT_SAMPLING_RATE_LIMIT = 10
+# maximum number of points of the time series published per node
+DEFAULT_MAX_SERIES_POINTS = 120
+
+RESOURCES = ("cpu", "memory", "disk_space")
+
+
+class RateLimiter:
+    """
+    Token bucket shared by the samplers of a scenario, bounds the number
+    of requests sent to the metrics API whatever the number of nodes.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        :param rate: maximum number of requests per second, 0 means unbounded
+        :param burst: number of requests that can be sent at once
+        """
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """
+        Takes a token, returns how long the caller must wait for it.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._last) * self.rate
+            )
+            self._last = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0
+            return -self._tokens / self.rate
+
+    def acquire(self, stop: Optional[threading.Event] = None) -> bool:
+        """
+        Waits for the next request slot.
+
+        :param stop: event interrupting the wait (optional)
+        :return: False if the wait was interrupted
+        """
+        if not self.rate:
+            return True
+        delay = self._reserve()
+        if delay <= 0:
+            return True
+        if stop is not None:
+            return not stop.wait(delay)
+        time.sleep(delay)
+        return True
+
+
+class ResourceStats:
+    """
+    Running mean and max of the resources of a node, computed without
+    keeping the samples.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = NodeResources()
+        self.max = NodeResources()
+
+    def add(self, resources: NodeResources):
+        self.count += 1
+        for resource in RESOURCES:
+            value = getattr(resources, resource)
+            mean = getattr(self.mean, resource)
+            setattr(self.mean, resource, mean + (value - mean) / self.count)
+            if self.count == 1 or value > getattr(self.max, resource):
+                setattr(self.max, resource, value)
+
+    def to_dict(self) -> dict:
+        return {
+            "samples": self.count,
+            "mean": {r: getattr(self.mean, r) for r in RESOURCES},
+            "max": {r: getattr(self.max, r) for r in RESOURCES},
+        }
+
+
+class NodeResourceSampler:
+    """
+    Samples the resources of a node every `interval` seconds during a hog
+    run, keeping the running aggregates and a time series bounded to
+    `max_points` (the series is decimated by two when full, so it always
+    spans the whole run).
+    """
+
+    def __init__(
+        self,
+        node: str,
+        sample_func: Callable[[], NodeResources],
+        interval: float = DEFAULT_SAMPLING_INTERVAL,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_points: int = DEFAULT_MAX_SERIES_POINTS,
+    ):
+        """
+        :param node: the sampled node
+        :param sample_func: returns the current resources of the node
+        :param interval: seconds between two samples
+        :param rate_limiter: limiter shared by all the samplers (optional)
+        :param max_points: maximum number of points of the time series
+        """
+        self.node = node
+        self.sample_func = sample_func
+        self.interval = interval
+        self.rate_limiter = rate_limiter
+        self.max_points = max(max_points, 2)
+        self.stats = ResourceStats()
+        self.series: list[dict] = []
+        self.errors = 0
+        self._stride = 1
+        self._skipped = 0
+        self._stop = threading.Event()
+
+    def stop(self):
+        self._stop.set()
+
+    def _append(self, timestamp: float, resources: NodeResources):
+        self._skipped += 1
+        if self._skipped < self._stride:
+            return
+        self._skipped = 0
+        point = {"timestamp": timestamp}
+        point.update({r: getattr(resources, r) for r in RESOURCES})
+        self.series.append(point)
+        if len(self.series) >= self.max_points:
+            self.series = self.series[::2]
+            self._stride *= 2
+
+    def sample(self):
+        if self.rate_limiter and not self.rate_limiter.acquire(self._stop):
+            return
+        try:
+            resources = self.sample_func()
+        except Exception as e:
+            self.errors += 1
+            logging.warning(f"[{self.node}] failed to sample node resources: {e}")
+            return
+        self.stats.add(resources)
+        self._append(time.time(), resources)
+
+    def run(self, until: float):
+        """
+        Samples the node until `until` (epoch seconds) or `stop`.
+
+        :param until: end of the sampling
+        """
+        while not self._stop.is_set() and time.time() < until:
+            self.sample()
+            remaining = until - time.time()
+            if remaining <= 0:
+                break
+            self._stop.wait(min(self.interval, remaining))
+
+    def to_dict(self) -> dict:
+        result = self.stats.to_dict()
+        result["interval"] = self.interval * self._stride
+        result["errors"] = self.errors
+        result["series"] = list(self.series)
+        return result
@@ -14,15 +14,20 @@
 import base64
 import json
 import logging
-import time
-from typing import Dict, List, Any
+import os
+from typing import Dict, List, Any, Optional, Tuple
 
 import yaml
+from jinja2 import Environment, FileSystemLoader
+from krkn_lib.k8s import KrknKubernetes
 from krkn_lib.models.telemetry import ScenarioTelemetry
 from krkn_lib.telemetry.ocp import KrknTelemetryOpenshift
 from krkn_lib.utils import get_random_string
 
 from krkn.scenario_plugins.abstract_scenario_plugin import AbstractScenarioPlugin
+from krkn.utils.latency_histogram import LatencyHistogram, QUANTILES, log_buckets
+from krkn.scenario_plugins.http_load.live_metrics import LiveMetrics
+from krkn.scenario_plugins.http_load.result_collector import ResultCollector, parse_report_line
 from krkn.rollback.config import RollbackContent
 from krkn.rollback.handler import set_rollback_context_decorator
 
@@ -147,6 +152,13 @@ class HttpLoadScenarioPlugin(AbstractScenarioPlugin):
                 logging.error("rate must be a string (e.g., '200/1s') or integer")
                 return False
 
+        # Validate live metrics window
+        if "metrics-window" in config:
+            window = config["metrics-window"]
+            if isinstance(window, bool) or not isinstance(window, (int, float)) or window <= 0:
+                logging.error("metrics-window must be a positive number of seconds")
+                return False
+
         # Validate duration format
         if "duration" in config:
             duration = config["duration"]
@@ -204,8 +216,11 @@ class HttpLoadScenarioPlugin(AbstractScenarioPlugin):
                 
                 logging.info(f"Deploying pod {i+1}/{number_of_pods}: {pod_name}")
                 
-                # Deploy pod using krkn-lib
-                lib_telemetry.get_lib_kubernetes().deploy_http_load(
+                # Deploy the pod template reporting the latency histogram,
+                # and the live reports when the metrics window is set
+                self._deploy_reporting_http_load(
+                    lib_telemetry.get_lib_kubernetes(),
+                    config.get("metrics-window"),
                     name=pod_name,
                     namespace=namespace,
                     image=image,
@@ -237,12 +252,9 @@ class HttpLoadScenarioPlugin(AbstractScenarioPlugin):
             
             logging.info(f"Successfully deployed {len(pod_names)} HTTP load pod(s)")
             
-            # Wait for all pods to complete
+            # Stream the results of the pods as they complete and aggregate them
             logging.info("Waiting for all HTTP load pods to complete...")
-            self._wait_for_pods_completion(pod_names, namespace, lib_telemetry, config)
-            
-            # Collect and aggregate results from all pods
-            metrics = self._collect_and_aggregate_results(pod_names, namespace, lib_telemetry)
+            metrics = self._collect_and_aggregate_results(pod_names, namespace, lib_telemetry, config)
             
             if metrics:
                 # Log metrics summary
@@ -260,6 +272,52 @@ class HttpLoadScenarioPlugin(AbstractScenarioPlugin):
             logging.error(traceback.format_exc())
             return 1
 
+    def _deploy_reporting_http_load(
+        self,
+        kubecli: KrknKubernetes,
+        report_every: Optional[float],
+        namespace: str,
+        timeout_sec: int = 500,
+        **params,
+    ):
+        """
+        Deploy an HTTP load pod whose Vegeta report includes its latency
+        histogram, so the percentiles of several pods can be merged, and
+        that prints a cumulative report every `report_every` seconds while
+        the attack runs if set. Takes the parameters of
+        `KrknKubernetes.deploy_http_load`, whose pod doesn't print them.
+
+        :param kubecli: the client of the cluster
+        :param report_every: interval between two reports in seconds,
+            None for the final report only
+        :param namespace: Namespace to deploy pod
+        :param timeout_sec: Pod creation timeout in seconds
+        """
+        env = Environment(
+            loader=FileSystemLoader(os.path.abspath(os.path.dirname(__file__))),
+            autoescape=False,
+        )
+        node_selectors = params.pop("node_selectors", None)
+        has_node_selectors = node_selectors is not None and len(node_selectors) > 0
+        for flag in ("keepalive", "http2", "insecure"):
+            params[flag] = "true" if params[flag] else "false"
+        pod_body = yaml.safe_load(
+            env.get_template("http_load_pod.j2").render(
+                namespace=namespace,
+                report_every=f"{report_every}s" if report_every else None,
+                buckets="[" + ",".join(f"{bound}ns" for bound in log_buckets()) + "]",
+                has_node_selectors=has_node_selectors,
+                node_selectors=node_selectors if has_node_selectors else {},
+                **params,
+            )
+        )
+        logging.info(
+            f"Deploying HTTP load pod {params['name']} for {params['duration']} "
+            f"at {params['rate']}"
+            + (f", reporting every {report_every}s" if report_every else "")
+        )
+        kubecli.create_pod(pod_body, namespace, timeout_sec)
+
     def _build_vegeta_json_targets(self, endpoints: List[Dict[str, Any]]) -> str:
         """
         Build newline-delimited Vegeta JSON targets from all endpoints.
@@ -289,93 +347,51 @@ class HttpLoadScenarioPlugin(AbstractScenarioPlugin):
         
         return "\n".join(lines)
     
-    def _wait_for_pods_completion(
+    def _collect_and_aggregate_results(
         self,
         pod_names: List[str],
         namespace: str,
         lib_telemetry: KrknTelemetryOpenshift,
         config: Dict[str, Any]
-    ):
-        """
-        Wait for all HTTP load pods to complete.
-        
-        :param pod_names: List of pod names to wait for
-        :param namespace: Namespace where pods are running
-        :param lib_telemetry: Telemetry object for Kubernetes operations
-        :param config: Scenario configuration
-        """
-        lib_k8s = lib_telemetry.get_lib_kubernetes()
-        finished_pods = []
-        did_finish = False
-        
-        # Calculate max wait time (duration + buffer)
-        duration_str = config.get("duration", "30s")
-        max_wait = self._parse_duration_to_seconds(duration_str) + 60  # Add 60s buffer
-        start_time = time.time()
-        
-        while not did_finish:
-            for pod_name in pod_names:
-                if pod_name not in finished_pods:
-                    if not lib_k8s.is_pod_running(pod_name, namespace):
-                        finished_pods.append(pod_name)
-                        logging.info(f"Pod {pod_name} has completed")
-            
-            if set(pod_names) == set(finished_pods):
-                did_finish = True
-                break
-            
-            # Check timeout
-            if time.time() - start_time > max_wait:
-                logging.warning(f"Timeout waiting for pods to complete (waited {max_wait}s)")
-                break
-            
-            time.sleep(5)
-        
-        logging.info(f"All {len(finished_pods)}/{len(pod_names)} pods have completed")
-    
-    def _collect_and_aggregate_results(
-        self,
-        pod_names: List[str],
-        namespace: str,
-        lib_telemetry: KrknTelemetryOpenshift
     ) -> Dict[str, Any]:
         """
         Collect results from all pods and aggregate metrics.
         
+        The logs of the pods are followed concurrently and each report is
+        parsed as soon as its pod completes. The reports printed by the pods
+        while the attack runs are bucketed into windows of `metrics-window`
+        seconds, giving the time series of the load and the time to recover
+        seen by the clients. The pods only print them when `metrics-window`
+        is set, otherwise the logs are scanned up to the final report.
+        
         :param pod_names: List of pod names
         :param namespace: Namespace where pods ran
         :param lib_telemetry: Telemetry object for Kubernetes operations
+        :param config: Scenario configuration
         :return: Aggregated metrics dictionary
         """
-        lib_k8s = lib_telemetry.get_lib_kubernetes()
-        all_metrics = []
+        # Calculate max wait time (duration + buffer)
+        duration_str = config.get("duration", "30s")
+        max_wait = self._parse_duration_to_seconds(duration_str) + 60  # Add 60s buffer
         
         logging.info("Collecting results from HTTP load pods...")
+        live_metrics = None
+        if "metrics-window" in config:
+            live_metrics = LiveMetrics(config["metrics-window"])
+        collector = ResultCollector(
+            lib_telemetry.get_lib_kubernetes(),
+            namespace,
+            on_report=live_metrics.add if live_metrics is not None else None,
+        )
+        reports = collector.collect(pod_names, max_wait)
         
-        for pod_name in pod_names:
-            try:
-                # Read pod logs to get results
-                log_response = lib_k8s.get_pod_log(pod_name, namespace)
-                
-                # Handle HTTPResponse object from kubernetes client
-                if hasattr(log_response, 'data'):
-                    logs = log_response.data.decode('utf-8') if isinstance(log_response.data, bytes) else str(log_response.data)
-                elif hasattr(log_response, 'read'):
-                    logs = log_response.read().decode('utf-8')
-                else:
-                    logs = str(log_response)
-                
-                # Parse JSON report from logs
-                metrics = self._parse_metrics_from_logs(logs)
-                
-                if metrics:
-                    all_metrics.append(metrics)
-                    logging.info(f"Collected metrics from pod: {pod_name}")
-                else:
-                    logging.warning(f"No metrics found in logs for pod: {pod_name}")
-            
-            except Exception as e:
-                logging.warning(f"Failed to collect results from pod {pod_name}: {e}")
+        all_metrics = []
+        for pod_name, metrics in reports.items():
+            if metrics:
+                all_metrics.append(metrics)
+                logging.info(f"Collected metrics from pod: {pod_name}")
+            else:
+                logging.warning(f"No metrics found in logs for pod: {pod_name}")
         
         if not all_metrics:
             logging.warning("No metrics collected from any pods")
@@ -385,6 +401,11 @@ class HttpLoadScenarioPlugin(AbstractScenarioPlugin):
         aggregated = self._aggregate_metrics(all_metrics)
         logging.info(f"Aggregated metrics from {len(all_metrics)} pod(s)")
         
+        # Time series of the load while the attack ran
+        if live_metrics is not None and len(live_metrics) > 1:
+            aggregated["timeseries"] = live_metrics.to_dict()
+            aggregated["time_to_recover"] = live_metrics.time_to_recover()
+        
         return aggregated
     
     def _parse_metrics_from_logs(self, logs: str) -> Dict[str, Any]:
@@ -397,9 +418,9 @@ class HttpLoadScenarioPlugin(AbstractScenarioPlugin):
         try:
             # Look for JSON report section in logs
             for line in logs.split('\n'):
-                line = line.strip()
-                if line.startswith('{') and '"latencies"' in line:
-                    return json.loads(line)
+                metrics = parse_report_line(line)
+                if metrics:
+                    return metrics
             return None
         except Exception as e:
             logging.warning(f"Failed to parse metrics from logs: {e}")
@@ -420,15 +441,7 @@ class HttpLoadScenarioPlugin(AbstractScenarioPlugin):
         total_rate = sum(m.get("rate", 0) for m in metrics_list)
         total_throughput = sum(m.get("throughput", 0) for m in metrics_list)
         
-        # Average latencies (weighted by request count)
-        latencies = {}
-        if total_requests > 0:
-            for percentile in ["mean", "50th", "95th", "99th", "max", "min"]:
-                weighted_sum = sum(
-                    m.get("latencies", {}).get(percentile, 0) * m.get("requests", 0)
-                    for m in metrics_list
-                )
-                latencies[percentile] = weighted_sum / total_requests if total_requests > 0 else 0
+        latencies, histogram = self._aggregate_latencies(metrics_list, total_requests)
         
         # Average success rate (weighted by request count)
         total_success = sum(
@@ -452,7 +465,7 @@ class HttpLoadScenarioPlugin(AbstractScenarioPlugin):
         for metrics in metrics_list:
             all_errors.extend(metrics.get("errors", []))
         
-        return {
+        metrics = {
             "requests": total_requests,
             "rate": total_rate,
             "throughput": total_throughput,
@@ -462,8 +475,81 @@ class HttpLoadScenarioPlugin(AbstractScenarioPlugin):
             "bytes_in": {"total": bytes_in_total},
             "bytes_out": {"total": bytes_out_total},
             "errors": all_errors[:10],  # First 10 errors only
-            "pod_count": len(metrics_list)
+            "pod_count": len(metrics_list),
         }
+        # only the pods deployed with a metrics window report a histogram
+        if histogram:
+            metrics["latency_histogram"] = histogram.to_dict()
+        return metrics
+
+    def _aggregate_latencies(
+        self,
+        metrics_list: List[Dict[str, Any]],
+        total_requests: int
+    ) -> Tuple[Dict[str, Any], Optional[LatencyHistogram]]:
+        """
+        Aggregate the latencies of multiple pods.
+
+        The mean is weighted by request count, the min and max are the
+        extremes of the pods. The percentiles of a single pod are kept as
+        reported, otherwise they are computed from the sum of
+        the latency histograms of the pods (the `buckets` of their Vegeta
+        report); if a pod didn't report its histogram they are approximated
+        by weighting the percentiles of the pods by request count.
+
+        :param metrics_list: List of metrics dictionaries from each pod
+        :param total_requests: Total number of requests of the pods
+        :return: Aggregated latencies and merged histogram (None if a pod
+            didn't report its histogram)
+        """
+        if total_requests <= 0:
+            return {}, None
+
+        pod_latencies = [m.get("latencies", {}) for m in metrics_list]
+        requests = [m.get("requests", 0) for m in metrics_list]
+        latencies = {
+            "mean": sum(l.get("mean", 0) * r for l, r in zip(pod_latencies, requests)) / total_requests,
+            "max": max(l.get("max", 0) for l in pod_latencies),
+            "min": min(
+                (l.get("min", 0) for l, r in zip(pod_latencies, requests) if r > 0),
+                default=0
+            ),
+        }
+
+        reporting = [m for m in metrics_list if m.get("requests", 0) > 0]
+        histogram = None
+        if reporting and all(m.get("buckets") for m in reporting):
+            histogram = LatencyHistogram.merge(
+                [LatencyHistogram.from_vegeta(m["buckets"]) for m in reporting]
+            )
+
+        if len(reporting) == 1:
+            # the percentiles of a single pod are exact
+            latencies.update(
+                {p: v for p, v in reporting[0].get("latencies", {}).items() if p in QUANTILES}
+            )
+            latencies["percentiles"] = "exact"
+            return latencies, histogram
+
+        if histogram is not None:
+            values = histogram.quantiles(list(QUANTILES.values()), max_latency=latencies["max"])
+            for name, value in zip(QUANTILES, values):
+                latencies[name] = float(min(max(value, latencies["min"]), latencies["max"]))
+            latencies["percentiles"] = "histogram"
+            return latencies, histogram
+
+        logging.warning(
+            "Latency histogram missing from the results of some pods, "
+            "percentiles approximated by request weighting"
+        )
+        for percentile in QUANTILES:
+            if not any(percentile in l for l in pod_latencies):
+                continue
+            latencies[percentile] = sum(
+                l.get(percentile, 0) * r for l, r in zip(pod_latencies, requests)
+            ) / total_requests
+        latencies["percentiles"] = "weighted"
+        return latencies, None
     
     def _parse_duration_to_seconds(self, duration: str) -> int:
         """
@@ -547,6 +633,17 @@ class HttpLoadScenarioPlugin(AbstractScenarioPlugin):
             logging.info(f"Latency P99: {latencies.get('99th', 0) / 1e6:.2f} ms")
             logging.info(f"Latency Max: {latencies.get('max', 0) / 1e6:.2f} ms")
         
+        # Disruption seen by the clients
+        if "time_to_recover" in metrics:
+            recovery = metrics["time_to_recover"]
+            if recovery:
+                logging.info(
+                    f"Time To Recover: {recovery['time_to_recover']:.2f} s "
+                    f"({recovery['degraded_windows']} degraded window(s))"
+                )
+            else:
+                logging.info("Time To Recover: no errors observed")
+        
         # Throughput
         throughput = metrics.get("throughput", 0.0)
         logging.info(f"Total Throughput: {throughput:.2f} req/s")
@@ -0,0 +1,176 @@
+# Copyright 2026 The Krkn Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Time-windowed metrics of the HTTP load pods while the attack runs.
+
+The pods print a cumulative Vegeta JSON report at a regular interval
+(`vegeta report -type=json -every <interval>`); the difference between
+two consecutive reports of a pod gives the requests, errors, latency and
+histogram of that interval, which are summed across the pods into fixed
+windows of `window` seconds.
+"""
+import re
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from krkn.utils.latency_histogram import LatencyHistogram
+
+# default width of the windows in seconds
+DEFAULT_METRICS_WINDOW = 1
+
+_FRACTION = re.compile(r"(\.\d{6})\d+")
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[float]:
+    """
+    Parses the RFC 3339 timestamps (nanosecond precision) of a Vegeta
+    report.
+
+    :return: the epoch timestamp, None if it can't be parsed
+    """
+    if not value or not isinstance(value, str):
+        return None
+    value = _FRACTION.sub(r"\1", value.replace("Z", "+00:00"))
+    try:
+        timestamp = datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        return None
+    # zero value of a go time.Time
+    return timestamp if timestamp > 0 else None
+
+
+class _Window:
+    __slots__ = ("requests", "errors", "latency_total", "buckets")
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0.0
+        self.latency_total = 0
+        self.buckets: Dict[int, int] = {}
+
+
+class LiveMetrics:
+    """
+    Sums the interval deltas of the cumulative reports of the pods into
+    windows, thread-safe so the logs of all the pods can feed it. A report
+    that doesn't add requests to the previous one of its pod is ignored,
+    so feeding the same log twice doesn't count it twice.
+    """
+
+    def __init__(self, window: float = DEFAULT_METRICS_WINDOW):
+        """
+        :param window: width of the windows in seconds
+        """
+        if window <= 0:
+            raise ValueError("the metrics window must be positive")
+        self.window = window
+        self._windows: Dict[int, _Window] = {}
+        self._previous: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, pod_name: str, report: Dict[str, Any], timestamp: float = None):
+        """
+        Adds a cumulative report of a pod.
+
+        :param pod_name: the pod printing the report
+        :param report: the Vegeta JSON report
+        :param timestamp: when the report was received, used when the
+            report has no `latest` timestamp
+        """
+        report_time = parse_timestamp(report.get("latest"))
+        if report_time is None:
+            report_time = timestamp if timestamp is not None else time.time()
+        latencies = report.get("latencies", {})
+        requests = report.get("requests", 0)
+        current = {
+            "requests": requests,
+            "errors": requests * (1 - report.get("success", 1.0)),
+            "latency_total": latencies.get("total", latencies.get("mean", 0) * requests),
+            "buckets": {int(b): c for b, c in (report.get("buckets") or {}).items()},
+        }
+        with self._lock:
+            previous = self._previous.get(
+                pod_name, {"requests": 0, "errors": 0, "latency_total": 0, "buckets": {}}
+            )
+            # reports already counted (e.g. the log scanned again) are skipped
+            if requests <= previous["requests"]:
+                return
+            self._previous[pod_name] = current
+            window = self._windows.setdefault(int(report_time // self.window), _Window())
+            window.requests += current["requests"] - previous["requests"]
+            window.errors += max(current["errors"] - previous["errors"], 0)
+            window.latency_total += max(current["latency_total"] - previous["latency_total"], 0)
+            for bound, count in current["buckets"].items():
+                delta = count - previous["buckets"].get(bound, 0)
+                if delta > 0:
+                    window.buckets[bound] = window.buckets.get(bound, 0) + delta
+
+    def __len__(self):
+        return len(self._windows)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns the compact (columnar) time series of the windows, the
+        empty windows included.
+        """
+        with self._lock:
+            if not self._windows:
+                return {}
+            first, last = min(self._windows), max(self._windows)
+            windows = [self._windows.get(i) or _Window() for i in range(first, last + 1)]
+        requests = np.array([w.requests for w in windows], dtype=float)
+        errors = np.array([w.errors for w in windows], dtype=float)
+        latency_total = np.array([w.latency_total for w in windows], dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            error_rate = np.where(requests > 0, errors / requests, 0.0)
+            mean_latency = np.where(requests > 0, latency_total / requests, 0.0)
+        series = {
+            "window": self.window,
+            "start": first * self.window,
+            "requests": [int(r) for r in requests],
+            "error_rate": [round(float(e), 4) for e in error_rate],
+            "mean_latency": [int(m) for m in mean_latency],
+        }
+        if any(w.buckets for w in windows):
+            series["p99_latency"] = [
+                int(LatencyHistogram(list(w.buckets), list(w.buckets.values())).quantiles([0.99])[0])
+                for w in windows
+            ]
+        return series
+
+    def time_to_recover(self, error_threshold: float = 0.0) -> Optional[Dict[str, Any]]:
+        """
+        Measures the disruption seen by the clients: from the first window
+        whose error rate exceeds `error_threshold` to the end of the last
+        one.
+
+        :param error_threshold: error rate tolerated in a window
+        :return: the start of the disruption, its duration and the number
+            of degraded windows, None if no window was degraded
+        """
+        series = self.to_dict()
+        if not series:
+            return None
+        degraded = np.flatnonzero(np.array(series["error_rate"]) > error_threshold)
+        if len(degraded) == 0:
+            return None
+        return {
+            "start": series["start"] + int(degraded[0]) * self.window,
+            "time_to_recover": float((degraded[-1] - degraded[0] + 1) * self.window),
+            "degraded_windows": int(len(degraded)),
+        }
@@ -0,0 +1,288 @@
+# Copyright 2026 The Krkn Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Streaming collection of the results of the HTTP load pods.
+
+The log of every pod is followed concurrently while the attack runs and
+scanned line by line as it arrives, so each report is parsed as soon as
+its pod completes. Only the candidate report line is buffered, up to
+`max_buffered_bytes`, whatever the verbosity of the pods.
+"""
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from krkn_lib.k8s import KrknKubernetes
+
+# maximum size of the report line buffered per pod
+DEFAULT_MAX_BUFFERED_BYTES = 4 * 1024 * 1024
+# size of the chunks read from the log streams
+DEFAULT_CHUNK_SIZE = 64 * 1024
+# interval between two checks of a pod whose log can't be followed
+DEFAULT_POLL_INTERVAL = 5
+
+
+def parse_report_line(line: str) -> Optional[Dict[str, Any]]:
+    """
+    Parses a log line if it is the Vegeta JSON report.
+
+    :param line: the log line
+    :return: the report or None
+    """
+    line = line.strip()
+    if not line.startswith("{") or '"latencies"' not in line:
+        return None
+    return json.loads(line)
+
+
+def iter_chunks(response, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Iterates over a pod log response (urllib3 response not preloaded,
+    kubernetes client response or plain string) chunk by chunk.
+    """
+    if isinstance(response, str):
+        yield response.encode("utf-8")
+    elif isinstance(response, bytes):
+        yield response
+    elif hasattr(response, "stream"):
+        yield from response.stream(chunk_size)
+    elif hasattr(response, "read"):
+        while True:
+            chunk = response.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    elif hasattr(response, "data"):
+        data = response.data
+        yield data if isinstance(data, bytes) else str(data).encode("utf-8")
+    else:
+        yield str(response).encode("utf-8")
+
+
+class ReportScanner:
+    """
+    Incremental scanner of a pod log looking for the Vegeta JSON report.
+    The lines that can't be the report are skipped without being
+    buffered. With `on_report` every report is passed to the callback
+    (e.g. the interim reports of a live attack) and the last one is kept,
+    otherwise the scan stops at the first report.
+    """
+
+    def __init__(
+        self,
+        max_buffered_bytes: int = DEFAULT_MAX_BUFFERED_BYTES,
+        on_report: Callable[[Dict[str, Any]], None] = None,
+    ):
+        self.max_buffered_bytes = max_buffered_bytes
+        self.on_report = on_report
+        self.report: Optional[Dict[str, Any]] = None
+        self.bytes_read = 0
+        self.overflow = False
+        self._line = bytearray()
+        self._skipping = False
+
+    @property
+    def done(self) -> bool:
+        return self.report is not None and self.on_report is None
+
+    def _parse_line(self):
+        try:
+            report = parse_report_line(self._line.decode("utf-8", "replace"))
+        except ValueError as e:
+            logging.warning(f"Failed to parse metrics from logs: {e}")
+            return
+        if report is None:
+            return
+        self.report = report
+        if self.on_report is not None:
+            self.on_report(report)
+
+    def _buffer(self, part: bytes):
+        if self._skipping:
+            return
+        if not self._line and part.lstrip()[:1] not in (b"", b"{"):
+            self._skipping = True
+            return
+        if len(self._line) + len(part) > self.max_buffered_bytes:
+            self.overflow = True
+            self._skipping = True
+            self._line.clear()
+            return
+        self._line += part
+
+    def feed(self, chunk: bytes) -> bool:
+        """
+        Scans a chunk of the log.
+
+        :param chunk: the next bytes of the log
+        :return: True once the scan is done
+        """
+        self.bytes_read += len(chunk)
+        start = 0
+        while not self.done:
+            end = chunk.find(b"\n", start)
+            if end < 0:
+                self._buffer(chunk[start:])
+                break
+            self._buffer(chunk[start:end])
+            if not self._skipping:
+                self._parse_line()
+            self._line.clear()
+            self._skipping = False
+            start = end + 1
+        return self.done
+
+    def close(self) -> Optional[Dict[str, Any]]:
+        """
+        Ends the scan (the last line may have no line feed).
+
+        :return: the report or None
+        """
+        if not self.done and not self._skipping and self._line:
+            self._parse_line()
+        self._line.clear()
+        return self.report
+
+
+class ResultCollector:
+    """
+    Follows the logs of the HTTP load pods concurrently and parses their
+    report as soon as they complete. A pod whose log can't be followed is
+    polled until it completes and its log is then scanned once. The
+    reports printed while the attack runs are passed to `on_report`.
+    """
+
+    def __init__(
+        self,
+        lib_k8s: KrknKubernetes,
+        namespace: str,
+        max_workers: Optional[int] = None,
+        max_buffered_bytes: int = DEFAULT_MAX_BUFFERED_BYTES,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        poll_interval: int = DEFAULT_POLL_INTERVAL,
+        on_report: Callable[[str, Dict[str, Any]], None] = None,
+    ):
+        """
+        :param lib_k8s: the client of the cluster
+        :param namespace: the namespace of the pods
+        :param max_workers: maximum number of logs followed at the same
+            time, one per pod if not set. The followed streams are mostly
+            idle, while a limit lower than the number of pods delays the
+            logs of the remaining pods until other pods complete, so their
+            live reports are read late
+        :param max_buffered_bytes: maximum size of the report line buffered
+            per pod
+        :param chunk_size: size of the chunks read from the log streams
+        :param poll_interval: interval between two checks of a pod whose
+            log can't be followed
+        :param on_report: called with the pod name and every report of the
+            pod (optional)
+        """
+        self.lib_k8s = lib_k8s
+        self.namespace = namespace
+        self.max_workers = max_workers
+        self.max_buffered_bytes = max_buffered_bytes
+        self.chunk_size = chunk_size
+        self.poll_interval = poll_interval
+        self.on_report = on_report
+
+    def collect(
+        self, pod_names: List[str], timeout: float
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Collects the reports of the pods.
+
+        :param pod_names: the pods
+        :param timeout: maximum time to wait for the pods to complete
+        :return: the report of every pod, None if it couldn't be found
+        """
+        if not pod_names:
+            return {}
+        deadline = time.monotonic() + timeout
+        workers = len(pod_names)
+        if self.max_workers is not None:
+            workers = max(1, min(self.max_workers, workers))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                pod_name: executor.submit(self._collect_pod, pod_name, deadline)
+                for pod_name in pod_names
+            }
+            return {pod_name: future.result() for pod_name, future in futures.items()}
+
+    def _scan(self, pod_name: str, response, deadline: float) -> ReportScanner:
+        on_report = None
+        if self.on_report is not None:
+            on_report = lambda report: self.on_report(pod_name, report)  # noqa: E731
+        scanner = ReportScanner(self.max_buffered_bytes, on_report)
+        try:
+            for chunk in iter_chunks(response, self.chunk_size):
+                if scanner.feed(chunk) or time.monotonic() > deadline:
+                    break
+        finally:
+            for release in ("release_conn", "close"):
+                if callable(getattr(response, release, None)):
+                    getattr(response, release)()
+        scanner.close()
+        if scanner.overflow:
+            logging.warning(
+                f"Skipped log lines longer than {self.max_buffered_bytes} bytes"
+            )
+        return scanner
+
+    def _follow(self, pod_name: str, deadline: float) -> Optional[Dict[str, Any]]:
+        response = self.lib_k8s.cli.read_namespaced_pod_log(
+            name=pod_name,
+            namespace=self.namespace,
+            follow=True,
+            _preload_content=False,
+            _request_timeout=max(deadline - time.monotonic(), 1),
+        )
+        return self._scan(pod_name, response, deadline).report
+
+    def _wait_for_completion(self, pod_name: str, deadline: float) -> bool:
+        while self.lib_k8s.is_pod_running(pod_name, self.namespace):
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(self.poll_interval)
+        return True
+
+    def _collect_pod(
+        self, pod_name: str, deadline: float
+    ) -> Optional[Dict[str, Any]]:
+        try:
+            report = self._follow(pod_name, deadline)
+            # with live reports the last one is final only if the pod is done
+            if report is not None and (
+                self.on_report is None
+                or not self.lib_k8s.is_pod_running(pod_name, self.namespace)
+            ):
+                logging.info(f"Pod {pod_name} has completed")
+                return report
+        except Exception as e:
+            logging.warning(f"Failed to follow the logs of pod {pod_name}: {e}")
+        # the stream ended before the report (e.g. the connection was
+        # closed), wait for the pod and scan its whole log once
+        try:
+            if not self._wait_for_completion(pod_name, deadline):
+                logging.warning(f"Timeout waiting for pod {pod_name} to complete")
+            else:
+                logging.info(f"Pod {pod_name} has completed")
+            return self._scan(
+                pod_name, self.lib_k8s.get_pod_log(pod_name, self.namespace), float("inf")
+            ).report
+        except Exception as e:
+            logging.warning(f"Failed to collect results from pod {pod_name}: {e}")
+            return None
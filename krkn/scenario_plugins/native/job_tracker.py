@@ -0,0 +1,242 @@
+# Copyright 2025 The Krkn Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import datetime
+import logging
+import threading
+import time
+import typing
+from concurrent.futures import ThreadPoolExecutor
+
+from krkn_lib.k8s import KrknKubernetes
+
+from krkn.cache.shared_informer import SharedInformer
+
+# interval between two sweeps of the polling fallback
+DEFAULT_POLL_INTERVAL = 5
+# maximum time to wait for the initial LIST of the jobs before polling
+DEFAULT_SYNC_TIMEOUT = 30
+# maximum number of jobs inspected at the same time
+DEFAULT_MAX_WORKERS = 10
+
+
+def job_selector(job_names: typing.List[str]) -> str:
+    """
+    Returns the label selector matching a set of jobs, the `job-name`
+    label is added to the jobs by the job controller
+    """
+    return "job-name in ({0})".format(",".join(sorted(set(job_names))))
+
+
+def job_result(succeeded, failed) -> typing.Optional[str]:
+    """
+    Returns `succeeded` or `failed` once a job has completed, None while
+    it is still running
+    """
+    if succeeded is not None:
+        return "succeeded"
+    if failed is not None:
+        return "failed"
+    return None
+
+
+def job_timestamp(value) -> typing.Optional[float]:
+    """
+    Returns the epoch seconds of a job timestamp, either a datetime of the
+    Kubernetes models or the RFC 3339 string of the raw watched objects
+    """
+    if isinstance(value, str):
+        try:
+            value = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=datetime.timezone.utc)
+        return value.timestamp()
+    return None
+
+
+def for_each_job(
+    func: typing.Callable[[str], None],
+    job_names: typing.List[str],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+):
+    """
+    Calls `func` on every job concurrently (e.g. to fetch the logs of the
+    failed jobs before deleting them), raising the first error
+    """
+    if not job_names:
+        return
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(job_names))) as executor:
+        for future in [executor.submit(func, job_name) for job_name in job_names]:
+            future.result()
+
+
+class JobTracker:
+    """
+    Follows the jobs of a scenario with a single watch filtered by label
+    selector, instead of polling the status of every job, and records the
+    completion latency of every job, from its creationTimestamp to its
+    completionTime (or to the time its completion was seen). Falls back on
+    polling if the jobs can't be watched.
+    """
+
+    def __init__(
+        self,
+        kubecli: KrknKubernetes,
+        job_names: typing.List[str],
+        namespace: str = "default",
+        poll_interval: int = DEFAULT_POLL_INTERVAL,
+        sync_timeout: int = DEFAULT_SYNC_TIMEOUT,
+    ):
+        """
+        Args:
+            kubecli (KrknKubernetes)
+                - Object to interact with Kubernetes Python client
+
+            job_names (List of strings)
+                - The jobs to follow
+
+            namespace (string)
+                - Namespace of the jobs
+
+            poll_interval (int)
+                - Interval between two sweeps of the polling fallback
+
+            sync_timeout (int)
+                - Max duration to wait for the watch before polling
+        """
+        self.kubecli = kubecli
+        self.job_names = list(dict.fromkeys(job_names))
+        self.namespace = namespace
+        self.poll_interval = poll_interval
+        self.sync_timeout = sync_timeout
+        # job name -> succeeded or failed
+        self.results: typing.Dict[str, str] = {}
+        # job name -> seconds from the creation of the job to its completion
+        self.completion_times: typing.Dict[str, float] = {}
+        # creation time of the jobs without a creationTimestamp
+        self._start = time.time()
+        self._condition = threading.Condition()
+
+    @property
+    def pending(self) -> typing.List[str]:
+        return [job for job in self.job_names if job not in self.results]
+
+    @property
+    def failed(self) -> typing.List[str]:
+        return [job for job, result in self.results.items() if result == "failed"]
+
+    def _record(
+        self,
+        job_name: str,
+        result: typing.Optional[str],
+        created=None,
+        completed=None,
+    ):
+        if result is None or job_name in self.results:
+            return
+        self.results[job_name] = result
+        created = job_timestamp(created)
+        completed = job_timestamp(completed)
+        start = created if created is not None else self._start
+        end = completed if completed is not None else time.time()
+        self.completion_times[job_name] = max(0.0, end - start)
+
+    def _on_event(self, event_type: str, job: dict):
+        metadata = job.get("metadata") or {}
+        job_name = metadata.get("name")
+        if job_name not in self.job_names or event_type == "DELETED":
+            return
+        status = job.get("status") or {}
+        with self._condition:
+            self._record(
+                job_name,
+                job_result(status.get("succeeded"), status.get("failed")),
+                metadata.get("creationTimestamp"),
+                status.get("completionTime"),
+            )
+            self._condition.notify_all()
+
+    def wait(self, timeout: int = 300):
+        """
+        Waits for all the jobs to complete, successfully or not
+
+        Args:
+            timeout (int)
+                - Max duration to wait for the jobs
+
+        Raises:
+            Exception if the jobs did not complete within the timeout
+        """
+        deadline = time.monotonic() + timeout
+        if self.job_names:
+            informer = SharedInformer(
+                "jobs",
+                self.kubecli.batch_cli.list_namespaced_job,
+                list_args=(self.namespace,),
+                list_kwargs={"label_selector": job_selector(self.job_names)},
+            )
+            informer.add_listener(self._on_event)
+            informer.start()
+            try:
+                if informer.wait_for_sync(min(self.sync_timeout, timeout)):
+                    self._wait_for_events(deadline)
+                else:
+                    logging.info(
+                        "Jobs watch not available, polling the jobs every %ss"
+                        % self.poll_interval
+                    )
+                    self._poll(deadline)
+            finally:
+                informer.stop()
+        if self.pending:
+            raise Exception(
+                "Jobs did not complete within "
+                "the {0}s timeout period".format(timeout)
+            )
+        for job_name in self.job_names:
+            logging.info(
+                "Job %s %s in %.2f seconds"
+                % (job_name, self.results[job_name], self.completion_times[job_name])
+            )
+
+    def _wait_for_events(self, deadline: float):
+        with self._condition:
+            while self.pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                self._condition.wait(remaining)
+
+    def _poll(self, deadline: float):
+        while True:
+            for job_name in self.pending:
+                try:
+                    api_response = self.kubecli.get_job_status(
+                        job_name, namespace=self.namespace
+                    )
+                    status = api_response.status
+                    with self._condition:
+                        self._record(
+                            job_name,
+                            job_result(status.succeeded, status.failed),
+                            api_response.metadata.creation_timestamp,
+                            status.completion_time,
+                        )
+                except Exception:
+                    logging.warning("Exception in getting job status")
+            if not self.pending or time.monotonic() > deadline:
+                return
+            time.sleep(self.poll_interval)
@@ -14,17 +14,18 @@
 from dataclasses import dataclass, field
 import yaml
 import logging
-import time
 import sys
 import os
 import re
-import random
 from traceback import format_exc
 from jinja2 import Environment, FileSystemLoader
 from krkn_lib.k8s import KrknKubernetes
 import typing
 from arcaflow_plugin_sdk import validation, plugin
 
+from krkn.scenario_plugins.native.job_tracker import JobTracker, for_each_job
+from krkn.scenario_plugins.native.node_agent import NodeAgentPool, node_agents
+
 
 @dataclass
 class NetworkScenarioConfig:
@@ -161,7 +162,13 @@ class NetworkScenarioErrorOutput:
     )
 
 
-def get_default_interface(node: str, pod_template, kubecli: KrknKubernetes, image: str) -> str:
+def get_default_interface(
+    node: str,
+    pod_template,
+    kubecli: KrknKubernetes,
+    image: str,
+    agents: NodeAgentPool = None,
+) -> str:
     """
     Function that returns a random interface from a node
 
@@ -176,17 +183,16 @@ def get_default_interface(node: str, pod_template, kubecli: KrknKubernetes, imag
         kubecli (KrknKubernetes)
             - Object to interact with Kubernetes Python client
 
+        agents (NodeAgentPool)
+            - Agent pods of the scenario, a pod is created and deleted
+              on the node if not set (optional)
+
     Returns:
         Default interface (string) belonging to the node
     """
-    pod_name_regex = str(random.randint(0, 10000))
-    pod_body = yaml.safe_load(pod_template.render(regex_name=pod_name_regex, nodename=node, image=image))
-    logging.info("Creating pod to query interface on node %s" % node)
-    kubecli.create_pod(pod_body, "default", 300)
-    pod_name = f"fedtools-{pod_name_regex}"
-    try:
+    with node_agents(agents, kubecli, pod_template, image) as pool:
         cmd = ["ip r"]
-        output = kubecli.exec_cmd_in_pod(cmd, pod_name, "default")
+        output = pool.exec(node, cmd)
 
         if not output:
             logging.error("Exception occurred while executing command in pod")
@@ -200,15 +206,16 @@ def get_default_interface(node: str, pod_template, kubecli: KrknKubernetes, imag
 
         interfaces = [default_route.split()[4]]
 
-    finally:
-        logging.info("Deleting pod to query interface on node")
-        kubecli.delete_pod(pod_name, "default")
-
     return interfaces
 
 
 def verify_interface(
-    input_interface_list: typing.List[str], node: str, pod_template, kubecli: KrknKubernetes, image: str
+    input_interface_list: typing.List[str],
+    node: str,
+    pod_template,
+    kubecli: KrknKubernetes,
+    image: str,
+    agents: NodeAgentPool = None,
 ) -> typing.List[str]:
     """
     Function that verifies whether a list of interfaces is present in the node.
@@ -228,18 +235,17 @@ def verify_interface(
         kubecli (KrknKubernetes)
             - Object to interact with Kubernetes Python client
 
+        agents (NodeAgentPool)
+            - Agent pods of the scenario, a pod is created and deleted
+              on the node if not set (optional)
+
     Returns:
         The interface list for the node
     """
-    pod_name_regex = str(random.randint(0, 10000))
-    pod_body = yaml.safe_load(pod_template.render(regex_name=pod_name_regex, nodename=node, image=image))
-    logging.info("Creating pod to query interface on node %s" % node)
-    kubecli.create_pod(pod_body, "default", 300)
-    pod_name = f"fedtools-{pod_name_regex}"
-    try:
+    with node_agents(agents, kubecli, pod_template, image) as pool:
         if input_interface_list == []:
             cmd = ["ip r"]
-            output = kubecli.exec_cmd_in_pod(cmd, pod_name, "default")
+            output = pool.exec(node, cmd)
 
             if not output:
                 logging.error("Exception occurred while executing command in pod")
@@ -255,7 +261,7 @@ def verify_interface(
 
         else:
             cmd = ["ip -br addr show"]
-            output = kubecli.exec_cmd_in_pod(cmd, pod_name, "default")
+            output = pool.exec(node, cmd)
 
             if not output:
                 logging.error("Exception occurred while executing command in pod")
@@ -276,9 +282,6 @@ def verify_interface(
                         "Interface %s not found in node %s interface list %s"
                         % (interface, node, node_interface_list)
                     )
-    finally:
-        logging.info("Deleting pod to query interface on node")
-        kubecli.delete_pod(pod_name, "default")
 
     return input_interface_list
 
@@ -289,7 +292,8 @@ def get_node_interfaces(
     instance_count: int,
     pod_template,
     kubecli: KrknKubernetes,
-    image: str
+    image: str,
+    agents: NodeAgentPool = None,
 ) -> typing.Dict[str, typing.List[str]]:
     """
     Function that is used to process the input dictionary with the nodes and
@@ -319,6 +323,9 @@ def get_node_interfaces(
         kubecli (KrknKubernetes)
             - Object to interact with Kubernetes Python client
 
+        agents (NodeAgentPool)
+            - Agent pods of the scenario used to query the nodes (optional)
+
     Returns:
         Filtered dictionary containing the test nodes and their test interfaces
     """
@@ -331,7 +338,9 @@ def get_node_interfaces(
         nodes = kubecli.get_node(None, label_selector, instance_count)
         node_interface_dict = {}
         for node in nodes:
-            node_interface_dict[node] = get_default_interface(node, pod_template, kubecli, image)
+            node_interface_dict[node] = get_default_interface(
+                node, pod_template, kubecli, image, agents
+            )
     else:
         node_name_list = node_interface_dict.keys()
         filtered_node_list = []
@@ -343,7 +352,7 @@ def get_node_interfaces(
 
         for node in filtered_node_list:
             node_interface_dict[node] = verify_interface(
-                node_interface_dict[node], node, pod_template, kubecli, image
+                node_interface_dict[node], node, pod_template, kubecli, image, agents
             )
 
     return node_interface_dict
@@ -359,6 +368,7 @@ def apply_ingress_filter(
     create_interfaces: bool = True,
     param_selector: str = "all",
     image: str = "quay.io/krkn-chaos/krkn:tools",
+    agents: NodeAgentPool = None,
 ) -> str:
     """
     Function that applies the filters to shape incoming traffic to
@@ -391,6 +401,10 @@ def apply_ingress_filter(
             - Used to specify what kind of filter to apply. Useful during
               serial execution mode. Default value is 'all'
 
+        agents (NodeAgentPool)
+            - Agent pods of the scenario used to create the virtual
+              interfaces (optional)
+
     Returns:
         The name of the job created that executes the commands on a node
         for ingress chaos scenario
@@ -401,7 +415,9 @@ def apply_ingress_filter(
         network_params = {param_selector: cfg.network_params[param_selector]}
 
     if create_interfaces:
-        create_virtual_interfaces(kubecli, interface_list, node, pod_template, image)
+        create_virtual_interfaces(
+            kubecli, interface_list, node, pod_template, image, agents
+        )
 
     exec_cmd = get_ingress_cmd(
         interface_list, network_params, duration=cfg.test_duration
@@ -419,10 +435,15 @@ def apply_ingress_filter(
 
 
 def create_virtual_interfaces(
-    kubecli: KrknKubernetes, interface_list: typing.List[str], node: str, pod_template, image: str
+    kubecli: KrknKubernetes,
+    interface_list: typing.List[str],
+    node: str,
+    pod_template,
+    image: str,
+    agents: NodeAgentPool = None,
 ) -> None:
     """
-    Function that creates a privileged pod and uses it to create
+    Function that uses the agent pod of the node to create
     virtual interfaces on the node
 
     Args:
@@ -439,26 +460,29 @@ def create_virtual_interfaces(
         pod_template (jinja2.environment.Template))
             - The YAML template used to instantiate a pod to create
               virtual interfaces on the node
+
+        agents (NodeAgentPool)
+            - Agent pods of the scenario, a pod is created and deleted
+              on the node if not set (optional)
     """
-    pod_name_regex = str(random.randint(0, 10000))
-    pod_body = yaml.safe_load(pod_template.render(regex_name=pod_name_regex, nodename=node, image=image))
-    kubecli.create_pod(pod_body, "default", 300)
-    logging.info(
-        "Creating {0} virtual interfaces on node {1} using a pod".format(
-            len(interface_list), node
+    with node_agents(agents, kubecli, pod_template, image) as pool:
+        logging.info(
+            "Creating {0} virtual interfaces on node {1} using a pod".format(
+                len(interface_list), node
+            )
         )
-    )
-    pod_name = f"modtools-{pod_name_regex}"
-    create_ifb(kubecli, len(interface_list), pod_name)
-    logging.info("Deleting pod used to create virtual interfaces")
-    kubecli.delete_pod(pod_name, "default")
+        create_ifb(kubecli, len(interface_list), pool.get(node))
 
 
 def delete_virtual_interfaces(
-    kubecli: KrknKubernetes, node_list: typing.List[str], pod_template, image: str
+    kubecli: KrknKubernetes,
+    node_list: typing.List[str],
+    pod_template,
+    image: str,
+    agents: NodeAgentPool = None,
 ):
     """
-    Function that creates a privileged pod and uses it to delete all
+    Function that uses the agent pods of the nodes to delete all
     virtual interfaces on the specified nodes
 
     Args:
@@ -472,16 +496,16 @@ def delete_virtual_interfaces(
         pod_template (jinja2.environment.Template))
             - The YAML template used to instantiate a pod to delete
               virtual interfaces on the node
+
+        agents (NodeAgentPool)
+            - Agent pods of the scenario, a pod is created and deleted
+              on every node if not set (optional)
     """
 
-    for node in node_list:
-        pod_name_regex = str(random.randint(0, 10000))
-        pod_body = yaml.safe_load(pod_template.render(regex_name=pod_name_regex, nodename=node, image=image))
-        kubecli.create_pod(pod_body, "default", 300)
-        logging.info("Deleting all virtual interfaces on node {0}".format(node))
-        pod_name = f"modtools-{pod_name_regex}"
-        delete_ifb(kubecli, pod_name)
-        kubecli.delete_pod(pod_name, "default")
+    with node_agents(agents, kubecli, pod_template, image) as pool:
+        for node in node_list:
+            logging.info("Deleting all virtual interfaces on node {0}".format(node))
+            delete_ifb(kubecli, pool.get(node))
 
 
 def create_ifb(kubecli: KrknKubernetes, number: int, pod_name: str):
@@ -536,7 +560,8 @@ def wait_for_job(
     kubecli: KrknKubernetes, job_list: typing.List[str], timeout: int = 300
 ) -> None:
     """
-    Function that waits for a list of jobs to finish within a time period
+    Function that waits for a list of jobs to finish within a time period, the
+    result and completion time of every job are logged
 
     Args:
         kubecli (KrknKubernetes)
@@ -549,27 +574,7 @@ def wait_for_job(
             - Max duration to wait for checking whether the jobs are completed
     """
 
-    wait_time = time.time() + timeout
-    count = 0
-    job_len = len(job_list)
-    while count != job_len:
-        for job_name in job_list:
-            try:
-                api_response = kubecli.get_job_status(job_name, namespace="default")
-                if (
-                    api_response.status.succeeded is not None
-                    or api_response.status.failed is not None
-                ):
-                    count += 1
-                    job_list.remove(job_name)
-            except Exception:
-                logging.warning("Exception in getting job status")
-            if time.time() > wait_time:
-                raise Exception(
-                    "Jobs did not complete within "
-                    "the {0}s timeout period".format(timeout)
-                )
-            time.sleep(5)
+    JobTracker(kubecli, job_list).wait(timeout)
 
 
 def delete_jobs(kubecli: KrknKubernetes, job_list: typing.List[str]):
@@ -581,10 +586,11 @@ def delete_jobs(kubecli: KrknKubernetes, job_list: typing.List[str]):
             - Object to interact with Kubernetes Python client
 
         job_list (List of strings)
-            - The list of jobs to delete
+            - The list of jobs to delete, the logs of the failed ones are
+              fetched concurrently
     """
 
-    for job_name in job_list:
+    def delete_job(job_name: str):
         try:
             api_response = kubecli.get_job_status(job_name, namespace="default")
             if api_response.status.failed is not None:
@@ -600,6 +606,8 @@ def delete_jobs(kubecli: KrknKubernetes, job_list: typing.List[str]):
             logging.warning("Exception in getting job status: %s" % str(e))
         kubecli.delete_job(name=job_name, namespace="default")
 
+    for_each_job(delete_job, job_list)
+
 
 def get_ingress_cmd(
     interface_list: typing.List[str],
@@ -711,6 +719,9 @@ def network_chaos(
     pod_module_template = env.get_template("pod_module.j2")
     kubecli = KrknKubernetes(kubeconfig_path=cfg.kubeconfig_path)
     test_image = cfg.image
+    # one privileged agent per node serves the interface queries and the
+    # virtual interfaces setup and cleanup of the whole scenario
+    agents = NodeAgentPool(kubecli, pod_module_template, test_image)
     logging.info("Starting Ingress Network Chaos")
     try:
         node_interface_dict = get_node_interfaces(
@@ -719,9 +730,11 @@ def network_chaos(
             cfg.instance_count,
             pod_interface_template,
             kubecli,
-            test_image
+            test_image,
+            agents,
         )
     except Exception:
+        agents.close()
         return "error", NetworkScenarioErrorOutput(format_exc())
     job_list = []
 
@@ -736,7 +749,8 @@ def network_chaos(
                         pod_module_template,
                         job_template,
                         kubecli,
-                        image=test_image
+                        image=test_image,
+                        agents=agents,
                     )
                 )
             logging.info("Waiting for parallel job to finish")
@@ -756,7 +770,8 @@ def network_chaos(
                             kubecli,
                             create_interfaces=create_interfaces,
                             param_selector=param,
-                            image=test_image
+                            image=test_image,
+                            agents=agents,
                         )
                     )
                 logging.info("Waiting for serial job to finish")
@@ -781,6 +796,9 @@ def network_chaos(
         logging.error("Ingress Network Chaos exiting due to Exception - %s" % e)
         return "error", NetworkScenarioErrorOutput(format_exc())
     finally:
-        delete_virtual_interfaces(kubecli, node_interface_dict.keys(), pod_module_template, test_image)
+        delete_virtual_interfaces(
+            kubecli, node_interface_dict.keys(), pod_module_template, test_image, agents
+        )
+        agents.close()
         logging.info("Deleting jobs(if any)")
         delete_jobs(kubecli, job_list[:])
@@ -0,0 +1,205 @@
+# Copyright 2025 The Krkn Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+import random
+import shlex
+import threading
+import typing
+from concurrent.futures import Future
+from contextlib import contextmanager
+
+import yaml
+from krkn_lib.k8s import KrknKubernetes
+
+# printed before the output of every command of a batched exec
+SECTION_MARKER = "### krkn-node-agent"
+
+
+class NodeAgentPool:
+    """
+    Privileged agent pods shared by all the node probes of a scenario
+    (interface lookups, bridge and flow queries, ifb setup). The agent of
+    a node is created on first use and kept until `close`, instead of
+    creating and deleting a pod for every single probe.
+    """
+
+    def __init__(
+        self,
+        kubecli: KrknKubernetes,
+        pod_template,
+        image: str,
+        namespace: str = "default",
+        timeout: int = 300,
+    ):
+        """
+        Args:
+            kubecli (KrknKubernetes)
+                - Object to interact with Kubernetes Python client
+
+            pod_template (jinja2.environment.Template)
+                - The YAML template used to instantiate the agent pods
+
+            image (string)
+                - Image of network chaos tool
+
+            namespace (string)
+                - Namespace in which the agents are created
+
+            timeout (int)
+                - Max duration to wait for an agent to be running
+        """
+        self.kubecli = kubecli
+        self.pod_template = pod_template
+        self.image = image
+        self.namespace = namespace
+        self.timeout = timeout
+        self._agents: typing.Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get(self, node: str) -> str:
+        """
+        Returns the name of the agent pod of a node, creating it on first use.
+        The agents of different nodes are created concurrently, the callers
+        asking for a node whose agent is being created wait for it.
+        """
+        with self._lock:
+            agent = self._agents.get(node)
+            create = agent is None
+            if create:
+                agent = self._agents[node] = Future()
+        if create:
+            try:
+                agent.set_result(self._create(node))
+            except Exception as e:
+                # the next caller retries the creation
+                with self._lock:
+                    del self._agents[node]
+                agent.set_exception(e)
+        return agent.result()
+
+    def _create(self, node: str) -> str:
+        pod_body = yaml.safe_load(
+            self.pod_template.render(
+                regex_name=str(random.randint(0, 10000)),
+                nodename=node,
+                image=self.image,
+            )
+        )
+        pod_name = pod_body["metadata"]["name"]
+        logging.info("Creating agent pod %s on node %s" % (pod_name, node))
+        self.kubecli.create_pod(pod_body, self.namespace, self.timeout)
+        return pod_name
+
+    def exec(
+        self, node: str, command: typing.List[str], base_command: str = None
+    ) -> str:
+        """
+        Executes a command in the agent pod of a node
+
+        Args:
+            node (string)
+                - Node on which the command is executed
+
+            command (List of strings)
+                - The command, see `KrknKubernetes.exec_cmd_in_pod`
+
+            base_command (string)
+                - The base command of the command (optional)
+
+        Returns:
+            The output of the command
+        """
+        return self.kubecli.exec_cmd_in_pod(
+            command, self.get(node), self.namespace, base_command=base_command
+        )
+
+    def exec_sections(
+        self, node: str, commands: typing.Dict[str, str]
+    ) -> typing.Dict[str, str]:
+        """
+        Executes several shell commands in the agent pod of a node with a
+        single exec, a failing command doesn't prevent the others to run
+
+        Args:
+            node (string)
+                - Node on which the commands are executed
+
+            commands (Dictionary with key and value as string)
+                - The shell commands by key
+
+        Returns:
+            The output of every command by key
+        """
+        script = "; ".join(
+            "echo {0}; {1}".format(shlex.quote(f"{SECTION_MARKER} {key}"), command)
+            for key, command in commands.items()
+        )
+        output = self.exec(node, [script]) or ""
+        sections = {key: [] for key in commands}
+        key = None
+        for line in output.split("\n"):
+            if line.startswith(SECTION_MARKER + " "):
+                key = line[len(SECTION_MARKER) + 1 :].strip()
+                sections.setdefault(key, [])
+            elif key is not None:
+                sections[key].append(line)
+        return {key: "\n".join(lines).strip() for key, lines in sections.items()}
+
+    def close(self):
+        """
+        Deletes all the agent pods
+        """
+        with self._lock:
+            agents = list(self._agents.items())
+            self._agents.clear()
+        for node, agent in agents:
+            try:
+                pod_name = agent.result()
+            except Exception:
+                continue
+            logging.info("Deleting agent pod %s on node %s" % (pod_name, node))
+            try:
+                self.kubecli.delete_pod(pod_name, self.namespace)
+            except Exception as e:
+                logging.error(
+                    "Failed to delete agent pod %s on node %s: %s"
+                    % (pod_name, node, e)
+                )
+
+
+@contextmanager
+def node_agents(
+    agents: typing.Optional[NodeAgentPool],
+    kubecli: KrknKubernetes,
+    pod_template,
+    image: str,
+) -> typing.Iterator[NodeAgentPool]:
+    """
+    Yields the agent pool of the scenario, or a pool scoped to the caller
+    (whose agents are deleted on exit) if the scenario has none
+    """
+    if agents is not None:
+        yield agents
+        return
+    pool = NodeAgentPool(kubecli, pod_template, image)
+    try:
+        yield pool
+    finally:
+        pool.close()
@@ -29,6 +29,9 @@ from kubernetes import client
 from kubernetes.client.api.apiextensions_v1_api import ApiextensionsV1Api
 from kubernetes.client.api.custom_objects_api import CustomObjectsApi
 
+from krkn.scenario_plugins.native.job_tracker import JobTracker, for_each_job
+from krkn.scenario_plugins.native.node_agent import NodeAgentPool, node_agents
+
 
 def get_test_pods(
     pod_name: str,
@@ -107,10 +110,11 @@ def delete_jobs(kubecli: KrknKubernetes, job_list: typing.List[str]):
             - Object to interact with Kubernetes Python client
 
         job_list (List of strings)
-            - The list of jobs to delete
+            - The list of jobs to delete, the logs of the failed ones are
+              fetched concurrently
     """
 
-    for job_name in job_list:
+    def delete_job(job_name: str):
         try:
             api_response = kubecli.get_job_status(job_name, namespace="default")
             if api_response.status.failed is not None:
@@ -124,14 +128,17 @@ def delete_jobs(kubecli: KrknKubernetes, job_list: typing.List[str]):
                 logging.error(pod_log)
         except Exception as e:
             logging.warning("Exception in getting job status: %s" % str(e))
-        api_response = kubecli.delete_job(name=job_name, namespace="default")
+        kubecli.delete_job(name=job_name, namespace="default")
+
+    for_each_job(delete_job, job_list)
 
 
 def wait_for_job(
     job_list: typing.List[str], kubecli: KrknKubernetes, timeout: int = 300
 ) -> None:
     """
-    Function that waits for a list of jobs to finish within a time period
+    Function that waits for a list of jobs to finish within a time period, the
+    result and completion time of every job are logged
 
     Args:
         job_list (List of strings)
@@ -144,27 +151,7 @@ def wait_for_job(
             - Max duration to wait for checking whether the jobs are completed
     """
 
-    wait_time = time.time() + timeout
-    count = 0
-    job_len = len(job_list)
-    while count != job_len:
-        for job_name in job_list:
-            try:
-                api_response = kubecli.get_job_status(job_name, namespace="default")
-                if (
-                    api_response.status.succeeded is not None
-                    or api_response.status.failed is not None
-                ):
-                    count += 1
-                    job_list.remove(job_name)
-            except Exception:
-                logging.warning("Exception in getting job status")
-            if time.time() > wait_time:
-                raise Exception(
-                    "Jobs did not complete within "
-                    "the {0}s timeout period".format(timeout)
-                )
-            time.sleep(5)
+    JobTracker(kubecli, job_list).wait(timeout)
 
 
 def get_bridge_name(cli: ApiextensionsV1Api, custom_obj: CustomObjectsApi) -> str:
@@ -213,7 +200,8 @@ def apply_outage_policy(
     duration: str,
     bridge_name: str,
     kubecli: KrknKubernetes,
-    image: str
+    image: str,
+    agents: NodeAgentPool = None,
 ) -> typing.List[str]:
     """
     Function that applies filters(ingress or egress) to block traffic.
@@ -247,9 +235,9 @@ def apply_outage_policy(
 
         image (string)
             - Image of network chaos tool
-            
-        exclude_label (string)
-            - pods matching this label will be excluded from the outage
+
+        agents (NodeAgentPool)
+            - Agent pods of the scenario used to query the nodes (optional)
 
     Returns:
         The name of the job created that executes the commands on a node
@@ -267,7 +255,11 @@ def apply_outage_policy(
         br = "br-int"
         table = 8
     for node, ips in node_dict.items():
-        while len(check_cookie(node, pod_template, br, cookie, kubecli, image)) > 2 or cookie in cookie_list:
+        while (
+            len(check_cookie(node, pod_template, br, cookie, kubecli, image, agents))
+            > 2
+            or cookie in cookie_list
+        ):
             cookie = random.randint(100, 10000)
         exec_cmd = ""
         for ip in ips:
@@ -311,6 +303,7 @@ def apply_ingress_policy(
     kubecli: KrknKubernetes,
     test_execution: str,
     image: str,
+    agents: NodeAgentPool = None,
 ) -> typing.List[str]:
     """
     Function that applies ingress traffic shaping to pod interface.
@@ -349,8 +342,8 @@ def apply_ingress_policy(
         test_execution (String)
             - The order in which the filters are applied
 
-        exclude_label (string)
-            - pods matching this label will be excluded from the outage
+        agents (NodeAgentPool)
+            - Agent pods of the scenario used to query the nodes (optional)
 
     Returns:
         The name of the job created that executes the traffic shaping
@@ -359,11 +352,15 @@ def apply_ingress_policy(
 
     job_list = []
     yml_list = []
+    pod_ips = list(set(ips))
 
-    create_virtual_interfaces(kubecli, len(ips), node, pod_template, image)
+    create_virtual_interfaces(kubecli, len(ips), node, pod_template, image, agents)
+    pod_interfaces = get_pod_interfaces(
+        node, pod_ips, pod_template, bridge_name, kubecli, image, agents
+    )
 
-    for count, pod_ip in enumerate(set(ips)):
-        pod_inf = get_pod_interface(node, pod_ip, pod_template, bridge_name, kubecli, image)
+    for count, pod_ip in enumerate(pod_ips):
+        pod_inf = pod_interfaces[pod_ip]
         exec_cmd = get_ingress_cmd(
             test_execution, pod_inf, mod, count, network_params, duration
         )
@@ -396,7 +393,8 @@ def apply_net_policy(
     bridge_name: str,
     kubecli: KrknKubernetes,
     test_execution: str,
-    image: str, 
+    image: str,
+    agents: NodeAgentPool = None,
 ) -> typing.List[str]:
     """
     Function that applies egress traffic shaping to pod interface.
@@ -435,8 +433,8 @@ def apply_net_policy(
         test_execution (String)
             - The order in which the filters are applied
 
-        exclude_label (string)
-            - pods matching this label will be excluded from the outage
+        agents (NodeAgentPool)
+            - Agent pods of the scenario used to query the nodes (optional)
 
     Returns:
         The name of the job created that executes the traffic shaping
@@ -445,9 +443,13 @@ def apply_net_policy(
 
     job_list = []
     yml_list = []
+    pod_ips = list(set(ips))
+    pod_interfaces = get_pod_interfaces(
+        node, pod_ips, pod_template, bridge_name, kubecli, image, agents
+    )
 
-    for pod_ip in set(ips):
-        pod_inf = get_pod_interface(node, pod_ip, pod_template, bridge_name, kubecli)
+    for pod_ip in pod_ips:
+        pod_inf = pod_interfaces[pod_ip]
         exec_cmd = get_egress_cmd(
             test_execution, pod_inf, mod, network_params, duration
         )
@@ -574,19 +576,23 @@ def get_egress_cmd(
 
 
 def create_virtual_interfaces(
-    kubecli: KrknKubernetes, number: int, node: str, pod_template, image: str, 
+    kubecli: KrknKubernetes,
+    number: int,
+    node: str,
+    pod_template,
+    image: str,
+    agents: NodeAgentPool = None,
 ) -> None:
     """
-    Function that creates a privileged pod and uses it to create
-    virtual interfaces on the node
+    Function that uses the agent pod of the node to create virtual
+    interfaces on the node
 
     Args:
-        cli (CoreV1Api)
-            - Object to interact with Kubernetes Python client's CoreV1 API
+        kubecli (KrknKubernetes)
+            - Object to interact with Kubernetes Python client
 
-        interface_list (List of strings)
-            - The list of interfaces on the node for which virtual interfaces
-              are to be created
+        number (int)
+            - The number of virtual interfaces to create
 
         node (string)
             - The node on which the virtual interfaces are created
@@ -597,52 +603,55 @@ def create_virtual_interfaces(
 
         image (string)
             - Image of network chaos tool
+
+        agents (NodeAgentPool)
+            - Agent pods of the scenario, a pod is created and deleted
+              on the node if not set (optional)
     """
-    pod_name_regex = str(random.randint(0, 10000))
-    pod_body = yaml.safe_load(pod_template.render(regex_name=pod_name_regex, nodename=node, image=image))
-    kubecli.create_pod(pod_body, "default", 300)
-    pod_name = f"modtools-{pod_name_regex}"
-    logging.info(
-        "Creating {0} virtual interfaces on node {1} using a pod".format(number, node)
-    )
-    create_ifb(kubecli, number, pod_name)
-    logging.info("Deleting pod used to create virtual interfaces")
-    kubecli.delete_pod(pod_name, "default")
+    with node_agents(agents, kubecli, pod_template, image) as pool:
+        logging.info(
+            "Creating {0} virtual interfaces on node {1} using a pod".format(
+                number, node
+            )
+        )
+        create_ifb(kubecli, number, pool.get(node))
 
 
 def delete_virtual_interfaces(
-    kubecli: KrknKubernetes, node_list: typing.List[str], pod_template, image: str, 
+    kubecli: KrknKubernetes,
+    node_list: typing.List[str],
+    pod_template,
+    image: str,
+    agents: NodeAgentPool = None,
 ):
     """
-    Function that creates a privileged pod and uses it to delete all
+    Function that uses the agent pods of the nodes to delete all
     virtual interfaces on the specified nodes
 
     Args:
-        cli (CoreV1Api)
-            - Object to interact with Kubernetes Python client's CoreV1 API
+        kubecli (KrknKubernetes)
+            - Object to interact with Kubernetes Python client
 
         node_list (List of strings)
             - The list of nodes on which the list of virtual interfaces are
               to be deleted
 
-        node (string)
-            - The node on which the virtual interfaces are created
-
         pod_template (jinja2.environment.Template))
             - The YAML template used to instantiate a pod to delete
               virtual interfaces on the node
-        
+
         image (string)
             - Image of network chaos tool
+
+        agents (NodeAgentPool)
+            - Agent pods of the scenario, a pod is created and deleted
+              on every node if not set (optional)
     """
 
-    for node in node_list:
-        pod_name_regex = str(random.randint(0, 10000))
-        pod_body = yaml.safe_load(pod_template.render(regex_name=pod_name_regex, nodename=node, image=image))
-        kubecli.create_pod(pod_body, "default", 300)
-        logging.info("Deleting all virtual interfaces on node {0}".format(node))
-        delete_ifb(kubecli, "modtools-" + pod_name_regex)
-        kubecli.delete_pod("modtools-" + pod_name_regex, "default")
+    with node_agents(agents, kubecli, pod_template, image) as pool:
+        for node in node_list:
+            logging.info("Deleting all virtual interfaces on node {0}".format(node))
+            delete_ifb(kubecli, pool.get(node))
 
 
 def create_ifb(kubecli: KrknKubernetes, number: int, pod_name: str):
@@ -672,7 +681,13 @@ def delete_ifb(kubecli: KrknKubernetes, pod_name: str):
     kubecli.exec_cmd_in_pod(exec_command, pod_name, "default", base_command="chroot")
 
 
-def list_bridges(node: str, pod_template, kubecli: KrknKubernetes, image: str) -> typing.List[str]:
+def list_bridges(
+    node: str,
+    pod_template,
+    kubecli: KrknKubernetes,
+    image: str,
+    agents: NodeAgentPool = None,
+) -> typing.List[str]:
     """
     Function that returns a list of bridges on the node
 
@@ -689,23 +704,17 @@ def list_bridges(node: str, pod_template, kubecli: KrknKubernetes, image: str) -
 
         image (string)
             - Image of network chaos tool
-            
-        exclude_label (string)
-            - pods matching this label will be excluded from the outage
+
+        agents (NodeAgentPool)
+            - Agent pods of the scenario, a pod is created and deleted
+              on the node if not set (optional)
 
     Returns:
         List of bridges on the node.
     """
-    pod_name_regex = str(random.randint(0, 10000))
-    pod_body = yaml.safe_load(pod_template.render(regex_name=pod_name_regex, nodename=node, image=image))
-    logging.info("Creating pod to query bridge on node %s" % node)
-    kubecli.create_pod(pod_body, "default", 300)
-    pod_name = f"modtools-{pod_name_regex}"
-    try:
+    with node_agents(agents, kubecli, pod_template, image) as pool:
         cmd = ["/host", "ovs-vsctl", "list-br"]
-        output = kubecli.exec_cmd_in_pod(
-            cmd, pod_name, "default", base_command="chroot"
-        )
+        output = pool.exec(node, cmd, base_command="chroot")
 
         if not output:
             logging.error(f"Exception occurred while executing command {cmd} in pod")
@@ -713,15 +722,17 @@ def list_bridges(node: str, pod_template, kubecli: KrknKubernetes, image: str) -
 
         bridges = output.split("\n")
 
-    finally:
-        logging.info("Deleting pod to query interface on node")
-        kubecli.delete_pod(pod_name, "default")
-
     return bridges
 
 
 def check_cookie(
-    node: str, pod_template, br_name, cookie, kubecli: KrknKubernetes, image: str
+    node: str,
+    pod_template,
+    br_name,
+    cookie,
+    kubecli: KrknKubernetes,
+    image: str,
+    agents: NodeAgentPool = None,
 ) -> str:
     """
     Function to check for matching flow rules
@@ -738,24 +749,23 @@ def check_cookie(
             - bridge against which the flows rules need to be checked
 
         cookie (string):
-            - flows matching the cookexec_cmd_in_podie are listed
+            - flows matching the cookie are listed
 
-        cli (CoreV1Api)
-            - Object to interact with Kubernetes Python client's CoreV1 API
+        kubecli (KrknKubernetes)
+            - Object to interact with Kubernetes Python client
 
         image (string)
             - Image of network chaos tool
+
+        agents (NodeAgentPool)
+            - Agent pods of the scenario, a pod is created and deleted
+              on the node if not set (optional)
+
     Returns
         Returns the matching flow rules
     """
-    pod_name_regex = str(random.randint(0, 10000))
-    pod_body = yaml.safe_load(pod_template.render(regex_name = pod_name_regex,nodename=node, image=image))
-    logging.info("Creating pod to query duplicate rules on node %s" % node)
-    kubecli.create_pod(pod_body, "default", 300)
-    pod_name = f"modtools-{pod_name_regex}"
-    try:
+    with node_agents(agents, kubecli, pod_template, image) as pool:
         cmd = [
-            "chroot",
             "/host",
             "ovs-ofctl",
             "-O",
@@ -764,9 +774,7 @@ def check_cookie(
             br_name,
             f"cookie={cookie}/-1",
         ]
-        output = kubecli.exec_cmd_in_pod(
-            cmd, pod_name, "default", base_command="chroot"
-        )
+        output = pool.exec(node, cmd, base_command="chroot")
 
         if not output:
             logging.error(f"Exception occurred while executing command {cmd} in pod")
@@ -774,25 +782,28 @@ def check_cookie(
 
         flow_list = output.split("\n")
 
-    finally:
-        logging.info("Deleting pod to query interface on node")
-        kubecli.delete_pod(pod_name, "default")
-
     return flow_list
 
 
-def get_pod_interface(
-    node: str, ip: str, pod_template, br_name, kubecli: KrknKubernetes, image: str = "quay.io/krkn-chaos/krkn:tools"
-) -> str:
+def get_pod_interfaces(
+    node: str,
+    ips: typing.List[str],
+    pod_template,
+    br_name,
+    kubecli: KrknKubernetes,
+    image: str = "quay.io/krkn-chaos/krkn:tools",
+    agents: NodeAgentPool = None,
+) -> typing.Dict[str, str]:
     """
-    Function to query the pod interface on a node
+    Function to query the interfaces of several pods of a node with a
+    single exec in the agent pod of the node
 
     Args:
         node (string):
             - node in which to check for the flow rules
 
-        ip (string):
-            - Pod IP
+        ips (List of strings):
+            - IPs of the pods scheduled on the node
 
         pod_template (jinja2.environment.Template)
             - The YAML template used to instantiate a pod to query
@@ -804,53 +815,89 @@ def get_pod_interface(
         kubecli (KrknKubernetes)
             - Object to interact with Kubernetes Python client
 
+        image (string)
+            - Image of network chaos tool
+
+        agents (NodeAgentPool)
+            - Agent pods of the scenario, a pod is created and deleted
+              on the node if not set (optional)
+
     Returns
-        Returns the pod interface name
+        Returns the interface name of every pod IP
     """
-    pod_name_regex = str(random.randint(0, 10000))
-    pod_body = yaml.safe_load(pod_template.render(regex_name=pod_name_regex, nodename=node, image=image))
-    logging.info("Creating pod to query pod interface on node %s" % node)
-    kubecli.create_pod(pod_body, "default", 300)
-    inf = ""
-    pod_name = f"modtools-{pod_name_regex}"
-    try:
+    commands = {}
+    for ip in ips:
         if br_name == "br-int":
             find_ip = f"external-ids:ip_addresses={ip}/23"
         else:
             find_ip = f"external-ids:ip={ip}"
-
-        cmd = [
-            "/host",
-            "ovs-vsctl",
-            "--bare",
-            "--columns=name",
-            "find",
-            "interface",
-            find_ip,
-        ]
-
-        output = kubecli.exec_cmd_in_pod(
-            cmd, pod_name, "default", base_command="chroot"
+        commands[ip] = (
+            f"chroot /host ovs-vsctl --bare --columns=name find interface "
+            f"{find_ip} 2>/dev/null"
         )
-        if not output:
-            cmd = ["/host", "ip", "addr", "show"]
-            output = kubecli.exec_cmd_in_pod(
-                cmd, pod_name, "default", base_command="chroot"
-            )
-            for if_str in output.split("\n"):
+    # fallback for the pods whose interface is not found in OVS
+    commands["ip-addr"] = "chroot /host ip addr show"
+
+    with node_agents(agents, kubecli, pod_template, image) as pool:
+        logging.info("Querying the interfaces of %s pods on node %s" % (len(ips), node))
+        output = pool.exec_sections(node, commands)
+
+    interfaces = {}
+    for ip in ips:
+        inf = output.get(ip, "")
+        if not inf:
+            for if_str in output.get("ip-addr", "").split("\n"):
                 if re.search(ip, if_str):
                     inf = if_str.split(" ")[-1]
-        else:
-            inf = output
-    finally:
-        logging.info("Deleting pod to query interface on node")
-        kubecli.delete_pod(pod_name, "default")
-    return inf
+        interfaces[ip] = inf
+    return interfaces
+
+
+def get_pod_interface(
+    node: str,
+    ip: str,
+    pod_template,
+    br_name,
+    kubecli: KrknKubernetes,
+    image: str = "quay.io/krkn-chaos/krkn:tools",
+    agents: NodeAgentPool = None,
+) -> str:
+    """
+    Function to query the pod interface on a node
+
+    Args:
+        node (string):
+            - node in which to check for the flow rules
+
+        ip (string):
+            - Pod IP
+
+        pod_template (jinja2.environment.Template)
+            - The YAML template used to instantiate a pod to query
+              the node's interfaces
+
+        br_name (string):
+            - bridge against which the flows rules need to be checked
+
+        kubecli (KrknKubernetes)
+            - Object to interact with Kubernetes Python client
+
+        agents (NodeAgentPool)
+            - Agent pods of the scenario, a pod is created and deleted
+              on the node if not set (optional)
+
+    Returns
+        Returns the pod interface name
+    """
+    return get_pod_interfaces(
+        node, [ip], pod_template, br_name, kubecli, image, agents
+    )[ip]
 
 
 def check_bridge_interface(
     node_name: str, pod_template, bridge_name: str, kubecli: KrknKubernetes,
-    image: str = "quay.io/krkn-chaos/krkn:tools"
+    image: str = "quay.io/krkn-chaos/krkn:tools",
+    agents: NodeAgentPool = None,
 ) -> bool:
     """
     Function  is used to check if the required OVS or OVN bridge is found in
@@ -870,8 +917,8 @@ def check_bridge_interface(
         kubecli (KrknKubernetes)
             - Object to interact with Kubernetes Python client
 
-        exclude_label (string)
-            - pods matching this label will be excluded from the outage
+        agents (NodeAgentPool)
+            - Agent pods of the scenario used to query the nodes (optional)
 
     Returns:
         Returns True if the bridge is found in the  node.
@@ -879,7 +926,9 @@ def check_bridge_interface(
     nodes = kubecli.get_node(node_name, None, 1)
     node_bridge = []
     for node in nodes:
-        node_bridge = list_bridges(node, pod_template, kubecli, image=image)
+        node_bridge = list_bridges(
+            node, pod_template, kubecli, image=image, agents=agents
+        )
     if bridge_name not in node_bridge:
         raise Exception(f"OVS bridge {bridge_name} not found on the node ")
 
@@ -1089,6 +1138,7 @@ def pod_outage(
     test_image = params.image
     filter_dict = {}
     job_list = []
+    agents = None
     publish = False
 
     for i in params.direction:
@@ -1100,6 +1150,7 @@ def pod_outage(
         label_set = set()
 
         kubecli = KrknKubernetes(kubeconfig_path=params.kubeconfig_path)
+        agents = NodeAgentPool(kubecli, pod_module_template, test_image)
         api_ext = client.ApiextensionsV1Api(kubecli.api_client)
         custom_obj = client.CustomObjectsApi(kubecli.api_client)
 
@@ -1124,7 +1175,12 @@ def pod_outage(
                 label_set.add("%s=%s" % (key, value))
 
         check_bridge_interface(
-            list(node_dict.keys())[0], pod_module_template, br_name, kubecli, test_image
+            list(node_dict.keys())[0],
+            pod_module_template,
+            br_name,
+            kubecli,
+            test_image,
+            agents,
         )
 
         for direction, ports in filter_dict.items():
@@ -1139,7 +1195,8 @@ def pod_outage(
                     params.test_duration,
                     br_name,
                     kubecli,
-                    test_image
+                    test_image,
+                    agents,
                 )
             )
 
@@ -1159,6 +1216,8 @@ def pod_outage(
     finally:
         logging.info("Deleting jobs(if any)")
         delete_jobs(kubecli, job_list[:])
+        if agents:
+            agents.close()
 
 
 @dataclass
@@ -1354,6 +1413,7 @@ def pod_egress_shaping(
     test_pod_name = params.pod_name
     test_image = params.image
     job_list = []
+    agents = None
     publish = False
 
     if params.kraken_config:
@@ -1367,6 +1427,7 @@ def pod_egress_shaping(
         mod_lst = [i for i in param_lst if i in params.network_params]
 
         kubecli = KrknKubernetes(kubeconfig_path=params.kubeconfig_path)
+        agents = NodeAgentPool(kubecli, pod_module_template, test_image)
         api_ext = client.ApiextensionsV1Api(kubecli.api_client)
         custom_obj = client.CustomObjectsApi(kubecli.api_client)
 
@@ -1390,7 +1451,12 @@ def pod_egress_shaping(
                 label_set.add("%s=%s" % (key, value))
 
         check_bridge_interface(
-            list(node_dict.keys())[0], pod_module_template, br_name, kubecli, test_image
+            list(node_dict.keys())[0],
+            pod_module_template,
+            br_name,
+            kubecli,
+            test_image,
+            agents,
         )
 
         for mod in mod_lst:
@@ -1407,7 +1473,8 @@ def pod_egress_shaping(
                         br_name,
                         kubecli,
                         params.execution_type,
-                        test_image
+                        test_image,
+                        agents,
                     )
                 )
             if params.execution_type == "serial":
@@ -1435,6 +1502,8 @@ def pod_egress_shaping(
     finally:
         logging.info("Deleting jobs(if any)")
         delete_jobs(kubecli, job_list[:])
+        if agents:
+            agents.close()
 
 
 @dataclass
@@ -1631,6 +1700,7 @@ def pod_ingress_shaping(
     test_pod_name = params.pod_name
     test_image = params.image
     job_list = []
+    agents = None
     publish = False
 
     if params.kraken_config:
@@ -1644,6 +1714,7 @@ def pod_ingress_shaping(
         mod_lst = [i for i in param_lst if i in params.network_params]
 
         kubecli = KrknKubernetes(kubeconfig_path=params.kubeconfig_path)
+        agents = NodeAgentPool(kubecli, pod_module_template, test_image)
         api_ext = client.ApiextensionsV1Api(kubecli.api_client)
         custom_obj = client.CustomObjectsApi(kubecli.api_client)
 
@@ -1667,7 +1738,12 @@ def pod_ingress_shaping(
                 label_set.add("%s=%s" % (key, value))
 
         check_bridge_interface(
-            list(node_dict.keys())[0], pod_module_template, br_name, kubecli, test_image
+            list(node_dict.keys())[0],
+            pod_module_template,
+            br_name,
+            kubecli,
+            test_image,
+            agents,
         )
 
         for mod in mod_lst:
@@ -1684,7 +1760,8 @@ def pod_ingress_shaping(
                         br_name,
                         kubecli,
                         params.execution_type,
-                        image=test_image
+                        image=test_image,
+                        agents=agents,
                     )
                 )
             if params.execution_type == "serial":
@@ -1713,6 +1790,10 @@ def pod_ingress_shaping(
         logging.error("Pod network Shaping scenario exiting due to Exception - %s" % e)
         return "error", PodIngressNetShapingErrorOutput(format_exc())
     finally:
-        delete_virtual_interfaces(kubecli, node_dict.keys(), pod_module_template, test_image)
+        delete_virtual_interfaces(
+            kubecli, node_dict.keys(), pod_module_template, test_image, agents
+        )
         logging.info("Deleting jobs(if any)")
         delete_jobs(kubecli, job_list[:])
+        if agents:
+            agents.close()
@@ -40,6 +40,11 @@ class BaseNetworkChaosConfig:
     target: str
     ingress: bool
     egress: bool
+    # parallel execution: maximum number of targets running at the same time
+    # (0 means unbounded), targets started together and seconds between batches
+    max_parallelism: int = 0
+    batch_size: int = 0
+    batch_delay: int = 0
 
     def validate(self) -> list[str]:
         errors = []
@@ -61,6 +66,10 @@ class BaseNetworkChaosConfig:
             errors.append("instance_count must be an int")
         elif self.instance_count < 0:
             errors.append("instance_count must be >= 0")
+        for name in ["max_parallelism", "batch_size", "batch_delay"]:
+            value = getattr(self, name)
+            if not isinstance(value, int) or value < 0:
+                errors.append(f"{name} must be an int >= 0")
         return errors
 
 
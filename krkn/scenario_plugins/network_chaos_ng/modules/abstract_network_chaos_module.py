@@ -17,6 +17,7 @@ import queue
 from typing import Tuple
 
 from krkn_lib.telemetry.ocp import KrknTelemetryOpenshift
+from krkn.cache import lookups
 from krkn.scenario_plugins.network_chaos_ng.models import (
     BaseNetworkChaosConfig,
     NetworkChaosScenarioType,
@@ -55,17 +56,32 @@ class AbstractNetworkChaosModule(abc.ABC):
 
         pass
 
+    def setup(self):
+        """
+        called by the plugin before the module runs on its targets, to prepare
+        resources shared by all the targets
+        """
+        pass
+
+    def teardown(self):
+        """
+        called by the plugin once the module ran on all its targets (even on failure),
+        to release the resources prepared by `setup`
+        """
+        pass
+
     def get_node_targets(self, config: BaseNetworkChaosConfig):
         if self.base_network_config.label_selector:
-            return self.kubecli.get_lib_kubernetes().list_ready_nodes(
-                self.base_network_config.label_selector
+            return lookups.list_ready_nodes(
+                self.kubecli.get_lib_kubernetes(),
+                self.base_network_config.label_selector,
             )
         else:
             if not config.target:
                 raise Exception(
                     "neither node selector nor node_name (target) specified, aborting."
                 )
-            ready_nodes = self.kubecli.get_lib_kubernetes().list_ready_nodes()
+            ready_nodes = lookups.list_ready_nodes(self.kubecli.get_lib_kubernetes())
             if config.target not in ready_nodes:
                 raise Exception(f"node {config.target} not found or not Ready, aborting")
 
@@ -0,0 +1,165 @@
+# Copyright 2025 The Krkn Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+from dataclasses import dataclass, field
+
+from krkn_lib.k8s import KrknKubernetes
+from krkn_lib.utils import get_random_string
+
+from krkn.scenario_plugins.network_chaos_ng.models import BaseNetworkChaosConfig
+from krkn.scenario_plugins.network_chaos_ng.modules.utils import (
+    deploy_network_chaos_ng_pod,
+    get_pod_default_interface,
+    log_error,
+    log_info,
+)
+
+
+@dataclass
+class HelperPod:
+    name: str
+    container_name: str
+    node_name: str
+    interfaces: list[str] = field(default_factory=list)
+    users: int = 0
+
+
+class HelperPodPool:
+    """
+    Pool of the privileged helper pods of a network chaos module, one per
+    node. All the targets scheduled on the same node share its helper,
+    so the scheduling and the image pull are paid once per node instead
+    of once per target.
+
+    The helpers are reference counted: while the pool is held (see `hold`)
+    they are kept until `close`, otherwise a helper is deleted as soon as
+    its last user releases it.
+    """
+
+    def __init__(
+        self,
+        config: BaseNetworkChaosConfig,
+        kubecli: KrknKubernetes,
+        prefix: str,
+        host_network: bool = False,
+    ):
+        """
+        :param config: the network chaos config of the module
+        :param kubecli: the client of the cluster
+        :param prefix: prefix of the helper pod names
+        :param host_network: deploys the helpers on the host network
+        """
+        self.config = config
+        self.kubecli = kubecli
+        self.prefix = prefix
+        self.host_network = host_network
+        self._lock = threading.Lock()
+        self._node_locks: dict[str, threading.Lock] = {}
+        self._helpers: dict[str, HelperPod] = {}
+        self._held = False
+
+    def hold(self):
+        """
+        Keeps the idle helpers alive until `close`.
+        """
+        with self._lock:
+            self._held = True
+
+    def acquire(self, node_name: str, parallel: bool = False) -> HelperPod:
+        """
+        Returns the helper pod of a node, deploying it on first use. The
+        callers targeting the same node wait for a single deployment.
+
+        :param node_name: the node the helper must run on
+        :param parallel: True if called from a parallel execution (logging)
+        :return: the helper pod, to be given back with `release`
+        """
+        with self._lock:
+            node_lock = self._node_locks.setdefault(node_name, threading.Lock())
+        with node_lock:
+            with self._lock:
+                helper = self._helpers.get(node_name)
+                if helper is not None:
+                    helper.users += 1
+                    return helper
+            helper = HelperPod(
+                name=f"{self.prefix}-{get_random_string(5)}",
+                container_name=f"fedora-container-{get_random_string(5)}",
+                node_name=node_name,
+            )
+            log_info(
+                f"deploying helper pod on node {node_name}", parallel, helper.name
+            )
+            deploy_network_chaos_ng_pod(
+                self.config,
+                node_name,
+                helper.name,
+                self.kubecli,
+                helper.container_name,
+                host_network=self.host_network,
+            )
+            try:
+                if len(self.config.interfaces) == 0:
+                    interface = get_pod_default_interface(
+                        helper.name, self.config.namespace, self.kubecli
+                    )
+                    helper.interfaces = [interface] if interface else []
+                    log_info(
+                        f"detected default interface {interface}",
+                        parallel,
+                        helper.name,
+                    )
+                else:
+                    helper.interfaces = self.config.interfaces
+            except Exception:
+                self._delete(helper)
+                raise
+            with self._lock:
+                helper.users = 1
+                self._helpers[node_name] = helper
+            return helper
+
+    def release(self, helper: HelperPod):
+        """
+        Gives back a helper pod, deleting it if it is no longer used and
+        the pool is not held.
+        """
+        with self._lock:
+            helper.users -= 1
+            if helper.users > 0 or self._held:
+                return
+            self._helpers.pop(helper.node_name, None)
+        self._delete(helper)
+
+    def close(self):
+        """
+        Deletes all the helper pods, must be called once all the targets
+        have released them.
+        """
+        with self._lock:
+            self._held = False
+            helpers = list(self._helpers.values())
+            self._helpers.clear()
+        for helper in helpers:
+            self._delete(helper)
+
+    def _delete(self, helper: HelperPod):
+        try:
+            self.kubecli.delete_pod(helper.name, self.config.namespace)
+        except Exception as e:
+            log_error(
+                f"failed to delete helper pod on node {helper.node_name}: {e}",
+                True,
+                helper.name,
+            )
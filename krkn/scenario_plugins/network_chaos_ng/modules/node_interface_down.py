@@ -18,6 +18,7 @@ from typing import Tuple
 
 from krkn_lib.telemetry.ocp import KrknTelemetryOpenshift
 from krkn_lib.utils import get_random_string
+from krkn.cache import lookups
 
 from krkn.scenario_plugins.network_chaos_ng.models import (
     NetworkChaosScenarioType,
@@ -33,6 +34,7 @@ from krkn.scenario_plugins.network_chaos_ng.modules.utils import (
     deploy_network_chaos_ng_pod,
     get_pod_default_interface,
 )
+from krkn.scenario_plugins.network_chaos_ng.parallel_execution import sync_batch
 
 
 class NodeInterfaceDownModule(AbstractNetworkChaosModule):
@@ -104,6 +106,7 @@ class NodeInterfaceDownModule(AbstractNetworkChaosModule):
             down_cmds = " && ".join(
                 [f"ip link set {iface} down" for iface in interfaces]
             )
+            sync_batch()
             cmd = f"(sleep {self.config.test_duration} && {recovery_cmds}) & {down_cmds}"
             self.kubecli.get_lib_kubernetes().exec_cmd_in_pod(
                 [cmd], pod_name, self.config.namespace
@@ -123,7 +126,9 @@ class NodeInterfaceDownModule(AbstractNetworkChaosModule):
             node_ready = False
             for _ in range(60):
                 time.sleep(5)
-                ready_nodes = self.kubecli.get_lib_kubernetes().list_ready_nodes()
+                ready_nodes = lookups.list_ready_nodes(
+                    self.kubecli.get_lib_kubernetes()
+                )
                 if target in ready_nodes:
                     node_ready = True
                     break
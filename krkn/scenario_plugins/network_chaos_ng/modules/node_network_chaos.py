@@ -37,6 +37,7 @@ from krkn.scenario_plugins.network_chaos_ng.modules.utils_network_chaos import (
     common_delete_limit_rules,
     node_qdisc_is_simple,
 )
+from krkn.scenario_plugins.network_chaos_ng.parallel_execution import sync_batch
 
 
 class NodeNetworkChaosModule(AbstractNetworkChaosModule):
@@ -121,6 +122,7 @@ class NodeNetworkChaosModule(AbstractNetworkChaosModule):
                         "waiting 10 seconds before continuing"
                     )
                     time.sleep(10)
+                sync_batch()
                 common_set_limit_rules(
                     self.config.egress,
                     self.config.ingress,
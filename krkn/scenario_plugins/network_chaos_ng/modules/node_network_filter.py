@@ -36,6 +36,7 @@ from krkn.scenario_plugins.network_chaos_ng.modules.utils_network_filter import
     clean_network_rules,
     generate_rules,
 )
+from krkn.scenario_plugins.network_chaos_ng.parallel_execution import sync_batch
 
 
 class NodeNetworkFilterModule(AbstractNetworkChaosModule):
@@ -82,6 +83,7 @@ class NodeNetworkFilterModule(AbstractNetworkChaosModule):
 
             input_rules, output_rules = generate_rules(interfaces, self.config)
 
+            sync_batch()
             apply_network_rules(
                 self.kubecli.get_lib_kubernetes(),
                 input_rules,
@@ -16,7 +16,6 @@ import time
 from typing import Tuple
 
 from krkn_lib.telemetry.ocp import KrknTelemetryOpenshift
-from krkn_lib.utils import get_random_string
 
 from krkn.scenario_plugins.network_chaos_ng.models import (
     NetworkChaosScenarioType,
@@ -26,15 +25,19 @@ from krkn.scenario_plugins.network_chaos_ng.models import (
 from krkn.scenario_plugins.network_chaos_ng.modules.abstract_network_chaos_module import (
     AbstractNetworkChaosModule,
 )
+from krkn.scenario_plugins.network_chaos_ng.modules.helper_pod_pool import (
+    HelperPod,
+    HelperPodPool,
+)
 from krkn.scenario_plugins.network_chaos_ng.modules.utils import (
     log_info,
-    setup_network_chaos_ng_scenario,
     log_error,
 )
 from krkn.scenario_plugins.network_chaos_ng.modules.utils_network_chaos import (
     common_set_limit_rules,
     common_delete_limit_rules,
 )
+from krkn.scenario_plugins.network_chaos_ng.parallel_execution import sync_batch
 
 
 class PodNetworkChaosModule(AbstractNetworkChaosModule):
@@ -42,128 +45,134 @@ class PodNetworkChaosModule(AbstractNetworkChaosModule):
     def __init__(self, config: NetworkChaosConfig, kubecli: KrknTelemetryOpenshift):
         super().__init__(config, kubecli)
         self.config = config
+        self.helper_pods = HelperPodPool(
+            config, kubecli.get_lib_kubernetes(), "pod-network-chaos"
+        )
+
+    def setup(self):
+        # the targets sharing a node share its helper pod until teardown
+        self.helper_pods.hold()
+
+    def teardown(self):
+        self.helper_pods.close()
 
     def run(self, target: str, error_queue: queue.Queue = None):
         parallel = False
         if error_queue:
             parallel = True
         try:
-            network_chaos_pod_name = f"pod-network-chaos-{get_random_string(5)}"
-            container_name = f"fedora-container-{get_random_string(5)}"
             pod_info = self.kubecli.get_lib_kubernetes().get_pod_info(
                 target, self.config.namespace
             )
 
+            if not pod_info:
+                raise Exception(
+                    f"impossible to retrieve infos for pod {target} namespace {self.config.namespace}"
+                )
+
             log_info(
-                f"creating workload to inject network chaos in pod {target} network"
+                f"injecting network chaos in pod {target} network "
                 f"latency:{str(self.config.latency) if self.config.latency else '0'}, "
                 f"packet drop:{str(self.config.loss) if self.config.loss else '0'} "
                 f"bandwidth restriction:{str(self.config.bandwidth) if self.config.bandwidth else '0'} ",
                 parallel,
-                network_chaos_pod_name,
+                target,
             )
 
-            if not pod_info:
-                raise Exception(
-                    f"impossible to retrieve infos for pod {target} namespace {self.config.namespace}"
-                )
+            helper = self.helper_pods.acquire(pod_info.nodeName, parallel)
+            try:
+                self._run_with_helper(target, pod_info.nodeName, helper, parallel)
+            finally:
+                self.helper_pods.release(helper)
 
-            container_ids, interfaces = setup_network_chaos_ng_scenario(
-                self.config,
-                pod_info.nodeName,
-                network_chaos_pod_name,
-                container_name,
-                self.kubecli.get_lib_kubernetes(),
-                target,
-                parallel,
-                False,
-            )
+        except Exception as e:
+            if error_queue is None:
+                raise e
+            else:
+                error_queue.put(str(e))
 
-            if len(self.config.interfaces) == 0:
-                if len(interfaces) == 0:
-                    log_error(
-                        "no network interface found in pod, impossible to execute the network chaos scenario",
-                        parallel,
-                        network_chaos_pod_name,
-                    )
-                    return
-                log_info(
-                    f"detected network interfaces: {','.join(interfaces)}",
+    def _run_with_helper(
+        self, target: str, node_name: str, helper: HelperPod, parallel: bool
+    ):
+        network_chaos_pod_name = helper.name
+        interfaces = helper.interfaces
+        if len(self.config.interfaces) == 0:
+            if len(interfaces) == 0:
+                log_error(
+                    "no network interface found in pod, impossible to execute the network chaos scenario",
                     parallel,
                     network_chaos_pod_name,
                 )
-            else:
-                interfaces = self.config.interfaces
-
-            if len(container_ids) == 0:
-                raise Exception(
-                    f"impossible to resolve container id for pod {target} namespace {self.config.namespace}"
-                )
-
+                return
             log_info(
-                f"targeting container {container_ids[0]}",
-                parallel,
-                network_chaos_pod_name,
-            )
-
-            pids = self.kubecli.get_lib_kubernetes().get_pod_pids(
-                base_pod_name=network_chaos_pod_name,
-                base_pod_namespace=self.config.namespace,
-                base_pod_container_name=container_name,
-                pod_name=target,
-                pod_namespace=self.config.namespace,
-                pod_container_id=container_ids[0],
-            )
-
-            if not pids:
-                raise Exception(f"impossible to resolve pid for pod {target}")
-
-            log_info(
-                f"resolved pids {pids} in node {pod_info.nodeName} for pod {target}",
-                parallel,
-                network_chaos_pod_name,
-            )
-
-            common_set_limit_rules(
-                self.config.egress,
-                self.config.ingress,
-                interfaces,
-                self.config.bandwidth,
-                self.config.latency,
-                self.config.loss,
+                f"detected network interfaces: {','.join(interfaces)}",
                 parallel,
                 network_chaos_pod_name,
-                self.kubecli.get_lib_kubernetes(),
-                network_chaos_pod_name,
-                self.config.namespace,
-                pids,
             )
 
-            time.sleep(self.config.test_duration)
-
-            log_info("removing tc rules", parallel, network_chaos_pod_name)
-
-            common_delete_limit_rules(
-                self.config.egress,
-                self.config.ingress,
-                interfaces,
-                network_chaos_pod_name,
-                self.config.namespace,
-                self.kubecli.get_lib_kubernetes(),
-                pids,
-                parallel,
-                network_chaos_pod_name,
+        container_ids = self.kubecli.get_lib_kubernetes().get_container_ids(
+            target, self.config.namespace
+        )
+        if len(container_ids) == 0:
+            raise Exception(
+                f"impossible to resolve container id for pod {target} namespace {self.config.namespace}"
             )
 
-            self.kubecli.get_lib_kubernetes().delete_pod(
-                network_chaos_pod_name, self.config.namespace
-            )
-
-        except Exception as e:
-            if error_queue is None:
-                raise e
-            else:
-                error_queue.put(str(e))
+        log_info(
+            f"targeting container {container_ids[0]}",
+            parallel,
+            network_chaos_pod_name,
+        )
+
+        pids = self.kubecli.get_lib_kubernetes().get_pod_pids(
+            base_pod_name=network_chaos_pod_name,
+            base_pod_namespace=self.config.namespace,
+            base_pod_container_name=helper.container_name,
+            pod_name=target,
+            pod_namespace=self.config.namespace,
+            pod_container_id=container_ids[0],
+        )
+
+        if not pids:
+            raise Exception(f"impossible to resolve pid for pod {target}")
+
+        log_info(
+            f"resolved pids {pids} in node {node_name} for pod {target}",
+            parallel,
+            network_chaos_pod_name,
+        )
+
+        sync_batch()
+        common_set_limit_rules(
+            self.config.egress,
+            self.config.ingress,
+            interfaces,
+            self.config.bandwidth,
+            self.config.latency,
+            self.config.loss,
+            parallel,
+            network_chaos_pod_name,
+            self.kubecli.get_lib_kubernetes(),
+            network_chaos_pod_name,
+            self.config.namespace,
+            pids,
+        )
+
+        time.sleep(self.config.test_duration)
+
+        log_info("removing tc rules", parallel, network_chaos_pod_name)
+
+        common_delete_limit_rules(
+            self.config.egress,
+            self.config.ingress,
+            interfaces,
+            network_chaos_pod_name,
+            self.config.namespace,
+            self.kubecli.get_lib_kubernetes(),
+            pids,
+            parallel,
+            network_chaos_pod_name,
+        )
 
     def get_config(self) -> Tuple[NetworkChaosScenarioType, BaseNetworkChaosConfig]:
         return NetworkChaosScenarioType.Pod, self.config
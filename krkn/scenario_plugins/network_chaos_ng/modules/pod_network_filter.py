@@ -16,7 +16,6 @@ import time
 from typing import Tuple
 
 from krkn_lib.telemetry.ocp import KrknTelemetryOpenshift
-from krkn_lib.utils import get_random_string
 
 from krkn.scenario_plugins.network_chaos_ng.models import (
     NetworkChaosScenarioType,
@@ -26,18 +25,20 @@ from krkn.scenario_plugins.network_chaos_ng.models import (
 from krkn.scenario_plugins.network_chaos_ng.modules.abstract_network_chaos_module import (
     AbstractNetworkChaosModule,
 )
+from krkn.scenario_plugins.network_chaos_ng.modules.helper_pod_pool import (
+    HelperPod,
+    HelperPodPool,
+)
 from krkn.scenario_plugins.network_chaos_ng.modules.utils import (
     log_info,
     log_error,
-    deploy_network_chaos_ng_pod,
-    get_pod_default_interface,
-    setup_network_chaos_ng_scenario,
 )
 from krkn.scenario_plugins.network_chaos_ng.modules.utils_network_filter import (
     apply_network_rules,
     clean_network_rules_namespaced,
     generate_namespaced_rules,
 )
+from krkn.scenario_plugins.network_chaos_ng.parallel_execution import sync_batch
 
 
 class PodNetworkFilterModule(AbstractNetworkChaosModule):
@@ -48,128 +49,131 @@ class PodNetworkFilterModule(AbstractNetworkChaosModule):
         if error_queue:
             parallel = True
         try:
-            pod_name = f"pod-filter-{get_random_string(5)}"
-            container_name = f"fedora-container-{get_random_string(5)}"
             pod_info = self.kubecli.get_lib_kubernetes().get_pod_info(
                 target, self.config.namespace
             )
 
+            if not pod_info:
+                raise Exception(
+                    f"impossible to retrieve infos for pod {self.config.target} namespace {self.config.namespace}"
+                )
+
             log_info(
-                f"creating workload to filter pod {self.config.target} network"
+                f"filtering pod {target} network "
                 f"ports {','.join([str(port) for port in self.config.ports])}, "
                 f"ingress:{str(self.config.ingress)}, "
                 f"egress:{str(self.config.egress)}",
                 parallel,
-                pod_name,
+                target,
             )
 
-            if not pod_info:
-                raise Exception(
-                    f"impossible to retrieve infos for pod {self.config.target} namespace {self.config.namespace}"
-                )
+            helper = self.helper_pods.acquire(pod_info.nodeName, parallel)
+            try:
+                self._run_with_helper(target, pod_info.nodeName, helper, parallel)
+            finally:
+                self.helper_pods.release(helper)
 
-            container_ids, interfaces = setup_network_chaos_ng_scenario(
-                self.config,
-                pod_info.nodeName,
-                pod_name,
-                container_name,
-                self.kubecli.get_lib_kubernetes(),
-                target,
-                parallel,
-                False,
-            )
+        except Exception as e:
+            if error_queue is None:
+                raise e
+            else:
+                error_queue.put(str(e))
 
-            if len(self.config.interfaces) == 0:
-                if len(interfaces) == 0:
-                    log_error(
-                        "no network interface found in pod, impossible to execute the network filter scenario",
-                        parallel,
-                        pod_name,
-                    )
-                    return
-                log_info(
-                    f"detected network interfaces: {','.join(interfaces)}",
+    def _run_with_helper(
+        self, target: str, node_name: str, helper: HelperPod, parallel: bool
+    ):
+        pod_name = helper.name
+        interfaces = helper.interfaces
+        if len(self.config.interfaces) == 0:
+            if len(interfaces) == 0:
+                log_error(
+                    "no network interface found in pod, impossible to execute the network filter scenario",
                     parallel,
                     pod_name,
                 )
-            else:
-                interfaces = self.config.interfaces
-
-            container_ids = self.kubecli.get_lib_kubernetes().get_container_ids(
-                target, self.config.namespace
-            )
-
-            if len(container_ids) == 0:
-                raise Exception(
-                    f"impossible to resolve container id for pod {target} namespace {self.config.namespace}"
-                )
-
-            log_info(f"targeting container {container_ids[0]}", parallel, pod_name)
-
-            pids = self.kubecli.get_lib_kubernetes().get_pod_pids(
-                base_pod_name=pod_name,
-                base_pod_namespace=self.config.namespace,
-                base_pod_container_name=container_name,
-                pod_name=target,
-                pod_namespace=self.config.namespace,
-                pod_container_id=container_ids[0],
-            )
-
-            if not pids:
-                raise Exception(f"impossible to resolve pid for pod {target}")
-
-            log_info(
-                f"resolved pids {pids} in node {pod_info.nodeName} for pod {target}",
-                parallel,
-                pod_name,
-            )
-
-            input_rules, output_rules = generate_namespaced_rules(
-                interfaces, self.config, pids
-            )
-
-            apply_network_rules(
-                self.kubecli.get_lib_kubernetes(),
-                input_rules,
-                output_rules,
-                pod_name,
-                self.config.namespace,
-                parallel,
-                target,
-            )
-
+                return
             log_info(
-                f"waiting {self.config.test_duration} seconds before removing the iptables rules",
+                f"detected network interfaces: {','.join(interfaces)}",
                 parallel,
                 pod_name,
             )
 
-            time.sleep(self.config.test_duration)
-
-            log_info("removing iptables rules", parallel, pod_name)
-
-            clean_network_rules_namespaced(
-                self.kubecli.get_lib_kubernetes(),
-                input_rules,
-                output_rules,
-                pod_name,
-                self.config.namespace,
-                pids,
-            )
+        container_ids = self.kubecli.get_lib_kubernetes().get_container_ids(
+            target, self.config.namespace
+        )
 
-            self.kubecli.get_lib_kubernetes().delete_pod(
-                pod_name, self.config.namespace
+        if len(container_ids) == 0:
+            raise Exception(
+                f"impossible to resolve container id for pod {target} namespace {self.config.namespace}"
             )
 
-        except Exception as e:
-            if error_queue is None:
-                raise e
-            else:
-                error_queue.put(str(e))
+        log_info(f"targeting container {container_ids[0]}", parallel, pod_name)
+
+        pids = self.kubecli.get_lib_kubernetes().get_pod_pids(
+            base_pod_name=pod_name,
+            base_pod_namespace=self.config.namespace,
+            base_pod_container_name=helper.container_name,
+            pod_name=target,
+            pod_namespace=self.config.namespace,
+            pod_container_id=container_ids[0],
+        )
+
+        if not pids:
+            raise Exception(f"impossible to resolve pid for pod {target}")
+
+        log_info(
+            f"resolved pids {pids} in node {node_name} for pod {target}",
+            parallel,
+            pod_name,
+        )
+
+        input_rules, output_rules = generate_namespaced_rules(
+            interfaces, self.config, pids
+        )
+
+        sync_batch()
+        apply_network_rules(
+            self.kubecli.get_lib_kubernetes(),
+            input_rules,
+            output_rules,
+            pod_name,
+            self.config.namespace,
+            parallel,
+            target,
+        )
+
+        log_info(
+            f"waiting {self.config.test_duration} seconds before removing the iptables rules",
+            parallel,
+            pod_name,
+        )
+
+        time.sleep(self.config.test_duration)
+
+        log_info("removing iptables rules", parallel, pod_name)
+
+        clean_network_rules_namespaced(
+            self.kubecli.get_lib_kubernetes(),
+            input_rules,
+            output_rules,
+            pod_name,
+            self.config.namespace,
+            pids,
+        )
 
     def __init__(self, config: NetworkFilterConfig, kubecli: KrknTelemetryOpenshift):
         super().__init__(config, kubecli)
         self.config = config
+        self.helper_pods = HelperPodPool(
+            config, kubecli.get_lib_kubernetes(), "pod-filter"
+        )
+
+    def setup(self):
+        # the targets sharing a node share its helper pod until teardown
+        self.helper_pods.hold()
+
+    def teardown(self):
+        self.helper_pods.close()
 
     def get_config(self) -> Tuple[NetworkChaosScenarioType, BaseNetworkChaosConfig]:
         return NetworkChaosScenarioType.Pod, self.config
@@ -0,0 +1,170 @@
+# Copyright 2025 The Krkn Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Batching of the iptables and tc commands of the network chaos modules:
+the commands targeting the same network namespace are rendered into a
+single script and executed with one exec in the helper pod, instead of
+one exec per command.
+"""
+import re
+import shlex
+from typing import Optional, Tuple
+
+from krkn_lib.k8s import KrknKubernetes
+
+# printed by the batch script when all its commands succeeded
+BATCH_OK = "krkn-batch-ok"
+
+_NETNS_PREFIX = re.compile(r"^(nsenter --target \S+ --net -- )(.*)$", re.DOTALL)
+_IPTABLES_INSERT = re.compile(r"^iptables -I (\S+) \d+ (.*)$", re.DOTALL)
+
+
+def split_netns(command: str) -> Tuple[str, str]:
+    """
+    Splits the `nsenter --target <pid> --net -- ` prefix of a command.
+
+    :param command: the command, namespaced or not
+    :return: the prefix (empty for the host network namespace) and the
+        command to run in the namespace
+    """
+    match = _NETNS_PREFIX.match(command)
+    if not match:
+        return "", command
+    return match.group(1), match.group(2)
+
+
+def group_by_netns(commands: list[str]) -> dict[str, list[str]]:
+    """
+    Groups the commands by network namespace, preserving their order.
+    """
+    groups: dict[str, list[str]] = {}
+    for command in commands:
+        prefix, command = split_netns(command)
+        groups.setdefault(prefix, []).append(command)
+    return groups
+
+
+def iptables_restore_script(rules: list[str]) -> str:
+    """
+    Renders `iptables` commands of the filter table into a single
+    `iptables-restore --noflush` transaction, either all the rules are
+    applied or none.
+
+    :param rules: the `iptables <args>` commands
+    :return: the shell script piping the ruleset to iptables-restore
+    """
+    lines = ["*filter"]
+    for rule in rules:
+        lines.append(rule[len("iptables "):] if rule.startswith("iptables ") else rule)
+    lines.append("COMMIT")
+    return "printf '%s\\n' {} | iptables-restore --noflush".format(
+        " ".join(shlex.quote(line) for line in lines)
+    )
+
+
+def iptables_delete_rule(rule: str) -> str:
+    """
+    Turns an `iptables -I <chain> <position> <spec>` command into the
+    `iptables -D <chain> <spec>` command deleting exactly that rule.
+    """
+    prefix, command = split_netns(rule)
+    match = _IPTABLES_INSERT.match(command)
+    if not match:
+        return rule
+    return f"{prefix}iptables -D {match.group(1)} {match.group(2)}"
+
+
+def transaction_script(commands: list[str], rollback: list[str] = None) -> str:
+    """
+    Renders commands into a script that stops at the first failure and
+    then runs the rollback commands, so a failed batch leaves no half
+    applied state.
+
+    :param commands: the commands, in order
+    :param rollback: the commands reverting them (optional)
+    :return: the shell script
+    """
+    script = " && ".join(f"{{ {command}; }}" for command in commands)
+    if rollback:
+        undo = "; ".join(f"{{ {command}; }} >/dev/null 2>&1" for command in rollback)
+        script = f"{{ {script}; }} || {{ {undo}; exit 1; }}"
+    return script
+
+
+def sequence_script(commands: list[str]) -> str:
+    """
+    Renders commands into a script running all of them whatever their
+    result (e.g. a cleanup), failing if any of them failed.
+    """
+    return "rc=0; " + " ".join(f"{{ {command}; }} || rc=1;" for command in commands) + " exit $rc"
+
+
+def exec_batch(
+    kubecli: KrknKubernetes,
+    prefix: str,
+    script: str,
+    pod_name: str,
+    namespace: str,
+) -> Tuple[bool, str]:
+    """
+    Runs a script in a network namespace with a single exec in the helper
+    pod.
+
+    :param kubecli: the client of the cluster
+    :param prefix: the `nsenter` prefix of the namespace, empty for the
+        network namespace of the helper pod
+    :param script: the shell script
+    :param pod_name: the helper pod
+    :param namespace: the namespace of the helper pod
+    :return: True if the script succeeded and its output
+    """
+    command = f"{prefix}sh -c {shlex.quote(script)} && echo {BATCH_OK}"
+    output = kubecli.exec_cmd_in_pod([command], pod_name, namespace) or ""
+    output = output.strip()
+    if output.endswith(BATCH_OK):
+        return True, output[: -len(BATCH_OK)].strip()
+    return False, output
+
+
+def exec_grouped(
+    kubecli: KrknKubernetes,
+    commands: list[str],
+    pod_name: str,
+    namespace: str,
+    rollback: Optional[list[str]] = None,
+    stop_on_error: bool = True,
+) -> list[Tuple[str, bool, str]]:
+    """
+    Runs the commands with one exec per network namespace.
+
+    :param kubecli: the client of the cluster
+    :param commands: the commands, optionally namespaced with nsenter
+    :param pod_name: the helper pod
+    :param namespace: the namespace of the helper pod
+    :param rollback: the commands reverting `commands`, run in the same
+        exec for the namespaces whose batch failed (optional)
+    :param stop_on_error: stops each batch at the first failed command,
+        otherwise all the commands are run
+    :return: the prefix, the result and the output of every batch
+    """
+    rollback_groups = group_by_netns(rollback or [])
+    results = []
+    for prefix, group in group_by_netns(commands).items():
+        if stop_on_error:
+            script = transaction_script(group, rollback_groups.get(prefix))
+        else:
+            script = sequence_script(group)
+        success, output = exec_batch(kubecli, prefix, script, pod_name, namespace)
+        results.append((prefix, success, output))
+    return results
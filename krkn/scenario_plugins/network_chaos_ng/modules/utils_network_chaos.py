@@ -22,6 +22,7 @@ from krkn.scenario_plugins.network_chaos_ng.modules.utils import (
     log_warning,
     log_error,
 )
+from krkn.scenario_plugins.network_chaos_ng.modules.utils_batch import exec_grouped
 
 ROOT_HANDLE = "100:"
 CLASS_ID = "100:1"
@@ -169,6 +170,12 @@ def node_qdisc_is_simple(
     return True
 
 
+def _netns_label(prefix: str) -> str:
+    if not prefix:
+        return "the helper pod network namespace"
+    return f"the network namespace of pid {prefix.split()[2]}"
+
+
 def common_set_limit_rules(
     egress: bool,
     ingress: bool,
@@ -183,21 +190,39 @@ def common_set_limit_rules(
     namespace: str,
     pids: Optional[list[str]] = None,
 ):
+    """
+    Applies the shaping rules with one exec per network namespace and
+    direction, a namespace whose rules fail is rolled back.
+    """
     if egress:
         build_tree_commands = get_build_tc_tree_commands(
             interfaces, rate=bandwidth, delay=latency, loss=loss,
         )
+        rollback_commands = get_clear_egress_shaping_commands(interfaces)
         if pids:
             build_tree_commands = namespaced_tc_commands(pids, build_tree_commands)
-        error_counter = 0
-        for rule in build_tree_commands:
-            result = kubecli.exec_cmd_in_pod([rule], network_chaos_pod_name, namespace)
-            if not result:
-                log_info(f"created tc tree in pod: {rule}", parallel, target)
+            rollback_commands = namespaced_tc_commands(pids, rollback_commands)
+        results = exec_grouped(
+            kubecli,
+            build_tree_commands,
+            network_chaos_pod_name,
+            namespace,
+            rollback=rollback_commands,
+        )
+        for prefix, success, output in results:
+            if success:
+                log_info(
+                    f"created tc tree in {_netns_label(prefix)}", parallel, target
+                )
+                if output:
+                    log_warning(f"tc returned output (may be a warning): {output}", parallel, target)
             else:
-                error_counter += 1
-                log_warning(f"tc command returned output (may be a warning): {rule} — {result}", parallel, target)
-        if len(build_tree_commands) == error_counter:
+                log_warning(
+                    f"tc tree rolled back in {_netns_label(prefix)}: {output}",
+                    parallel,
+                    target,
+                )
+        if not any(success for _, success, _ in results):
             log_error(
                 "failed to apply egress shaping rules on cluster", parallel, target
             )
@@ -209,24 +234,28 @@ def common_set_limit_rules(
             latency,
             loss,
         )
+        rollback_commands = get_clear_ingress_shaping_commands(interfaces)
         if pids:
             ingress_shaping_commands = namespaced_tc_commands(
                 pids, ingress_shaping_commands
             )
-        error_counter = 0
-        for rule in ingress_shaping_commands:
-
-            result = kubecli.exec_cmd_in_pod([rule], network_chaos_pod_name, namespace)
-            if not result:
+            rollback_commands = namespaced_tc_commands(pids, rollback_commands)
+        results = exec_grouped(
+            kubecli,
+            ingress_shaping_commands,
+            network_chaos_pod_name,
+            namespace,
+            rollback=rollback_commands,
+        )
+        for prefix, success, output in results:
+            if success:
                 log_info(
-                    f"applied ingress shaping rule: {rule}",
+                    f"applied ingress shaping rules in {_netns_label(prefix)}",
                     parallel,
                     network_chaos_pod_name,
                 )
-            else:
-                error_counter += 1
 
-        if len(ingress_shaping_commands) == error_counter:
+        if not any(success for _, success, _ in results):
             log_error(
                 "failed to apply ingress shaping rules on cluster", parallel, target
             )
@@ -243,20 +272,29 @@ def common_delete_limit_rules(
     parallel: bool,
     target: str,
 ):
+    """
+    Removes the shaping rules with one exec per network namespace and
+    direction, every rule removal is attempted even if one fails.
+    """
     if egress:
         clear_commands = get_clear_egress_shaping_commands(interfaces)
         if pids:
             clear_commands = namespaced_tc_commands(pids, clear_commands)
-        error_counter = 0
-        for rule in clear_commands:
-            result = kubecli.exec_cmd_in_pod(
-                [rule], network_chaos_pod_name, network_chaos_namespace
-            )
-            if not result:
-                log_info(f"removed egress shaping rule : {rule}", parallel, target)
-            else:
-                error_counter += 1
-        if len(clear_commands) == error_counter:
+        results = exec_grouped(
+            kubecli,
+            clear_commands,
+            network_chaos_pod_name,
+            network_chaos_namespace,
+            stop_on_error=False,
+        )
+        for prefix, success, output in results:
+            if success:
+                log_info(
+                    f"removed egress shaping rules in {_netns_label(prefix)}",
+                    parallel,
+                    target,
+                )
+        if not any(success for _, success, _ in results):
             log_error(
                 "failed to remove egress shaping rules on cluster", parallel, target
             )
@@ -265,16 +303,21 @@ def common_delete_limit_rules(
         clear_commands = get_clear_ingress_shaping_commands(interfaces)
         if pids:
             clear_commands = namespaced_tc_commands(pids, clear_commands)
-        error_counter = 0
-        for rule in clear_commands:
-            result = kubecli.exec_cmd_in_pod(
-                [rule], network_chaos_pod_name, network_chaos_namespace
-            )
-            if not result:
-                log_info(f"removed ingress shaping rule: {rule}", parallel, target)
-            else:
-                error_counter += 1
-        if len(clear_commands) == error_counter:
+        results = exec_grouped(
+            kubecli,
+            clear_commands,
+            network_chaos_pod_name,
+            network_chaos_namespace,
+            stop_on_error=False,
+        )
+        for prefix, success, output in results:
+            if success:
+                log_info(
+                    f"removed ingress shaping rules in {_netns_label(prefix)}",
+                    parallel,
+                    target,
+                )
+        if not any(success for _, success, _ in results):
             log_error(
                 "failed to remove ingress shaping rules on cluster", parallel, target
             )
@@ -11,12 +11,20 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import logging
 from typing import Tuple
 
 from krkn_lib.k8s import KrknKubernetes
 
 from krkn.scenario_plugins.network_chaos_ng.models import NetworkFilterConfig
-from krkn.scenario_plugins.network_chaos_ng.modules.utils import log_info
+from krkn.scenario_plugins.network_chaos_ng.modules.utils import log_info, log_warning
+from krkn.scenario_plugins.network_chaos_ng.modules.utils_batch import (
+    exec_batch,
+    exec_grouped,
+    group_by_netns,
+    iptables_delete_rule,
+    iptables_restore_script,
+)
 
 
 def generate_rules(
@@ -61,12 +69,61 @@ def apply_network_rules(
     parallel: bool,
     node_name: str,
 ):
-    for rule in input_rules:
-        log_info(f"applying iptables INPUT rule: {rule}", parallel, node_name)
-        kubecli.exec_cmd_in_pod([rule], pod_name, namespace)
-    for rule in output_rules:
-        log_info(f"applying iptables OUTPUT rule: {rule}", parallel, node_name)
-        kubecli.exec_cmd_in_pod([rule], pod_name, namespace)
+    """
+    Applies the rules of every network namespace atomically with a single
+    `iptables-restore` exec, falling back on one exec per rule if the
+    ruleset can't be restored (e.g. iptables-restore missing in the image).
+    """
+    for prefix, rules in group_by_netns(input_rules + output_rules).items():
+        success, output = exec_batch(
+            kubecli, prefix, iptables_restore_script(rules), pod_name, namespace
+        )
+        if success:
+            log_info(
+                f"applied {len(rules)} iptables rules: {'; '.join(rules)}",
+                parallel,
+                node_name,
+            )
+            continue
+        log_warning(
+            f"iptables-restore failed ({output}), applying the rules one by one",
+            parallel,
+            node_name,
+        )
+        for rule in rules:
+            log_info(f"applying iptables rule: {rule}", parallel, node_name)
+            kubecli.exec_cmd_in_pod([f"{prefix}{rule}"], pod_name, namespace)
+
+
+def _delete_network_rules(
+    kubecli: KrknKubernetes,
+    rules: list[str],
+    pod_name: str,
+    namespace: str,
+):
+    """
+    Deletes the inserted rules by specification with a single
+    `iptables-restore` exec per network namespace, falling back on one
+    exec per rule (ignoring the missing ones) if the ruleset can't be
+    restored.
+    """
+    delete_rules = [iptables_delete_rule(rule) for rule in rules]
+    for prefix, group in group_by_netns(delete_rules).items():
+        success, output = exec_batch(
+            kubecli, prefix, iptables_restore_script(group), pod_name, namespace
+        )
+        if success:
+            continue
+        logging.warning(
+            f"iptables-restore failed ({output}), deleting the rules one by one"
+        )
+        exec_grouped(
+            kubecli,
+            [f"{prefix}{rule}" for rule in group],
+            pod_name,
+            namespace,
+            stop_on_error=False,
+        )
 
 
 def clean_network_rules(
@@ -76,12 +133,7 @@ def clean_network_rules(
     pod_name: str,
     namespace: str,
 ):
-    for _ in input_rules:
-        # always deleting the first rule since has been inserted from the top
-        kubecli.exec_cmd_in_pod([f"iptables -D INPUT 1"], pod_name, namespace)
-    for _ in output_rules:
-        # always deleting the first rule since has been inserted from the top
-        kubecli.exec_cmd_in_pod([f"iptables -D OUTPUT 1"], pod_name, namespace)
+    _delete_network_rules(kubecli, input_rules + output_rules, pod_name, namespace)
 
 
 def clean_network_rules_namespaced(
@@ -92,22 +144,8 @@ def clean_network_rules_namespaced(
     namespace: str,
     pids: list[str],
 ):
-    for _ in input_rules:
-        for pid in pids:
-            # always deleting the first rule since has been inserted from the top
-            kubecli.exec_cmd_in_pod(
-                [f"nsenter --target {pid} --net -- iptables -D INPUT 1"],
-                pod_name,
-                namespace,
-            )
-    for _ in output_rules:
-        for pid in pids:
-            # always deleting the first rule since has been inserted from the top
-            kubecli.exec_cmd_in_pod(
-                [f"nsenter --target {pid} --net -- iptables -D OUTPUT 1"],
-                pod_name,
-                namespace,
-            )
+    # the rules are already namespaced by `generate_namespaced_rules`
+    _delete_network_rules(kubecli, input_rules + output_rules, pod_name, namespace)
 
 
 def generate_namespaced_rules(
@@ -39,6 +39,7 @@ from krkn.scenario_plugins.network_chaos_ng.modules.utils_network_chaos import (
     common_set_limit_rules,
     common_delete_limit_rules,
 )
+from krkn.scenario_plugins.network_chaos_ng.parallel_execution import sync_batch
 
 
 class VmiNetworkChaosModule(AbstractNetworkChaosModule):
@@ -245,6 +246,7 @@ class VmiNetworkChaosModule(AbstractNetworkChaosModule):
             # Apply tc-based shaping (HTB + netem) inside the virt-launcher netns.
             # Passing pids=[netns_pid] wraps each tc command with nsenter so it
             # targets the VMI's network namespace, not the host or chaos pod netns.
+            sync_batch()
             common_set_limit_rules(
                 self.config.egress,
                 self.config.ingress,
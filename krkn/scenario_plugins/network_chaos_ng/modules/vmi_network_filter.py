@@ -40,6 +40,7 @@ from krkn.scenario_plugins.network_chaos_ng.modules.utils_network_filter import
     apply_tc_vmi_chaos,
     clean_tc_vmi_chaos,
 )
+from krkn.scenario_plugins.network_chaos_ng.parallel_execution import sync_batch
 
 _UNSUPPORTED_MODES = frozenset({"sriov", "macvtap"})
 _KNOWN_BINDING_KEYS = frozenset({"bridge", "masquerade", "sriov", "macvtap", "slirp", "passt"})
@@ -284,6 +285,7 @@ class VmiNetworkFilterModule(AbstractNetworkChaosModule):
                 network_chaos_pod_name,
             )
 
+            sync_batch()
             input_rules, output_rules = apply_tc_vmi_chaos(
                 self.kubecli.get_lib_kubernetes(),
                 network_chaos_pod_name,
@@ -17,7 +17,6 @@
 import logging
 import queue
 import random
-import threading
 import time
 
 import yaml
@@ -31,6 +30,10 @@ from krkn.scenario_plugins.network_chaos_ng.modules.abstract_network_chaos_modul
 from krkn.scenario_plugins.network_chaos_ng.network_chaos_factory import (
     NetworkChaosFactory,
 )
+from krkn.scenario_plugins.network_chaos_ng.parallel_execution import (
+    ParallelExecutor,
+    TargetTiming,
+)
 
 
 class NetworkChaosNgScenarioPlugin(AbstractScenarioPlugin):
@@ -75,10 +78,16 @@ class NetworkChaosNgScenarioPlugin(AbstractScenarioPlugin):
                             targets, network_chaos_config.instance_count
                         )
 
-                    if network_chaos_config.execution == "parallel":
-                        self.run_parallel(targets, network_chaos)
-                    else:
-                        self.run_serial(targets, network_chaos)
+                    network_chaos.setup()
+                    try:
+                        if network_chaos_config.execution == "parallel":
+                            self.run_parallel(
+                                targets, network_chaos, scenario_telemetry
+                            )
+                        else:
+                            self.run_serial(targets, network_chaos)
+                    finally:
+                        network_chaos.teardown()
                     if len(scenario_config) > 1:
                         logging.info(
                             f"waiting {network_chaos_config.wait_duration} seconds before running the next "
@@ -90,16 +99,23 @@ class NetworkChaosNgScenarioPlugin(AbstractScenarioPlugin):
             return 1
         return 0
 
-    def run_parallel(self, targets: list[str], module: AbstractNetworkChaosModule):
+    def run_parallel(
+        self,
+        targets: list[str],
+        module: AbstractNetworkChaosModule,
+        scenario_telemetry: ScenarioTelemetry = None,
+    ):
+        config = module.get_config()[1]
+        executor = ParallelExecutor(
+            max_parallelism=config.max_parallelism,
+            batch_size=config.batch_size,
+            batch_delay=config.batch_delay,
+        )
         error_queue = queue.Queue()
-        threads = []
         errors = []
-        for target in targets:
-            thread = threading.Thread(target=module.run, args=[target, error_queue])
-            thread.start()
-            threads.append(thread)
-        for thread in threads:
-            thread.join()
+        timings = executor.run(targets, module.run, error_queue)
+        if scenario_telemetry is not None:
+            self.record_target_timings(scenario_telemetry, config.id, timings)
         while True:
             try:
                 errors.append(error_queue.get_nowait())
@@ -107,9 +123,26 @@ class NetworkChaosNgScenarioPlugin(AbstractScenarioPlugin):
                 break
         if len(errors) > 0:
             raise Exception(
-                f"module {module.get_config()[1].id} execution failed: [{';'.join(errors)}]"
+                f"module {config.id} execution failed: [{';'.join(errors)}]"
             )
 
+    @staticmethod
+    def record_target_timings(
+        scenario_telemetry: ScenarioTelemetry,
+        module_id: str,
+        timings: list[TargetTiming],
+    ):
+        """
+        Adds the per target timings of a parallel execution to the
+        `additional_telemetry` of the scenario, grouped by module id.
+        """
+        module_timings = AbstractScenarioPlugin.get_additional_telemetry(
+            scenario_telemetry
+        ).setdefault("target_timings", {})
+        module_timings.setdefault(module_id, []).extend(
+            timing.to_dict() for timing in timings
+        )
+
     def run_serial(self, targets: list[str], module: AbstractNetworkChaosModule):
         for target in targets:
             module.run(target)
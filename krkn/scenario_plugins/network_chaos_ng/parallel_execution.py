@@ -0,0 +1,210 @@
+# Copyright 2025 The Krkn Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Callable, Optional
+
+# maximum time a target waits for the rest of its batch before injecting
+# the chaos anyway, matches the helper pod creation timeout
+DEFAULT_BARRIER_TIMEOUT = 300
+
+_current = threading.local()
+
+
+class BatchBarrier:
+    """
+    Rendezvous of the targets of a batch right before the chaos injection,
+    so all of them are degraded during the same window. Unlike
+    `threading.Barrier` a target that fails (or has nothing to inject)
+    leaves the batch instead of breaking it for the others.
+    """
+
+    def __init__(self, parties: int, timeout: float = DEFAULT_BARRIER_TIMEOUT):
+        self.parties = parties
+        self.timeout = timeout
+        self._arrived = 0
+        self._left = 0
+        self._condition = threading.Condition()
+
+    def _released(self) -> bool:
+        return self._arrived + self._left >= self.parties
+
+    def arrive(self) -> bool:
+        """
+        Waits for all the other targets of the batch to arrive or leave.
+
+        :return: False if the wait timed out
+        """
+        with self._condition:
+            self._arrived += 1
+            self._condition.notify_all()
+            return self._condition.wait_for(self._released, self.timeout)
+
+    def leave(self):
+        with self._condition:
+            self._left += 1
+            self._condition.notify_all()
+
+
+def sync_batch():
+    """
+    Called by the network chaos modules right before injecting the chaos,
+    blocks until the other targets of the same batch are ready. It is a
+    no-op outside of a batched parallel execution.
+    """
+    state = getattr(_current, "state", None)
+    if state is None or state["arrived"]:
+        return
+    state["arrived"] = True
+    if not state["barrier"].arrive():
+        logging.warning(
+            f"[{state['target']}]: timeout waiting for the other targets of the "
+            f"batch, injecting the chaos anyway"
+        )
+    state["timing"].injection_timestamp = time.time()
+
+
+@dataclass
+class TargetTiming:
+    target: str
+    batch: int
+    start_timestamp: float = 0.0
+    injection_timestamp: Optional[float] = None
+    end_timestamp: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def duration(self) -> float:
+        return self.end_timestamp - self.start_timestamp
+
+    def to_dict(self) -> dict:
+        result = asdict(self)
+        result["duration"] = self.duration
+        return result
+
+
+class ParallelExecutor:
+    """
+    Runs a network chaos module on its targets in batches: at most
+    `max_parallelism` targets run at the same time, the batches are
+    started `batch_delay` seconds apart (ramp-up) and the targets of a
+    batch inject the chaos together.
+    """
+
+    def __init__(
+        self,
+        max_parallelism: int = 0,
+        batch_size: int = 0,
+        batch_delay: float = 0,
+        barrier_timeout: float = DEFAULT_BARRIER_TIMEOUT,
+    ):
+        """
+        :param max_parallelism: maximum number of targets running at the
+            same time, 0 means unbounded
+        :param batch_size: number of targets started together, 0 means
+            `max_parallelism` (or all the targets if unbounded)
+        :param batch_delay: seconds between the start of two batches
+        :param barrier_timeout: maximum time a target waits for its batch
+        """
+        self.max_parallelism = max_parallelism
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.barrier_timeout = barrier_timeout
+
+    def batches(self, targets: list[str]) -> list[list[str]]:
+        size = self.batch_size or self.max_parallelism or len(targets)
+        if self.max_parallelism:
+            # a batch must fit in the workers to meet at the barrier
+            size = min(size, self.max_parallelism)
+        size = max(size, 1)
+        return [targets[i : i + size] for i in range(0, len(targets), size)]
+
+    def run(
+        self,
+        targets: list[str],
+        func: Callable[[str, queue.Queue], None],
+        error_queue: queue.Queue,
+    ) -> list[TargetTiming]:
+        """
+        Runs `func(target, error_queue)` on every target.
+
+        :param targets: the targets
+        :param func: the module entrypoint, reporting its errors in the queue
+        :param error_queue: the queue collecting the errors
+        :return: the timings of every target
+        """
+        slots = threading.Semaphore(self.max_parallelism or max(len(targets), 1))
+        timings: list[TargetTiming] = []
+        threads = []
+        for index, batch in enumerate(self.batches(targets)):
+            if index > 0 and self.batch_delay > 0:
+                time.sleep(self.batch_delay)
+            # the whole batch is started at once, the workers give back
+            # their slot when done
+            for _ in batch:
+                slots.acquire()
+            barrier = BatchBarrier(len(batch), self.barrier_timeout)
+            logging.info(f"starting batch {index} with {len(batch)} targets")
+            for target in batch:
+                timing = TargetTiming(target=target, batch=index)
+                timings.append(timing)
+                thread = threading.Thread(
+                    target=self._run_target,
+                    args=(func, target, error_queue, barrier, timing, slots),
+                )
+                thread.start()
+                threads.append(thread)
+        for thread in threads:
+            thread.join()
+        return timings
+
+    @staticmethod
+    def _run_target(
+        func: Callable[[str, queue.Queue], None],
+        target: str,
+        error_queue: queue.Queue,
+        barrier: BatchBarrier,
+        timing: TargetTiming,
+        slots: threading.Semaphore,
+    ):
+        # errors are reported by the module through its own queue so they
+        # can be attributed to the target
+        target_errors = queue.Queue()
+        _current.state = {
+            "barrier": barrier,
+            "arrived": False,
+            "target": target,
+            "timing": timing,
+        }
+        timing.start_timestamp = time.time()
+        try:
+            func(target, target_errors)
+        except Exception as e:
+            target_errors.put(str(e))
+        finally:
+            if not _current.state["arrived"]:
+                barrier.leave()
+            _current.state = None
+            timing.end_timestamp = time.time()
+            slots.release()
+        errors = []
+        while not target_errors.empty():
+            errors.append(target_errors.get_nowait())
+        if errors:
+            timing.error = ";".join(errors)
+            for error in errors:
+                error_queue.put(error)
@@ -18,9 +18,11 @@ import paramiko
 from krkn_lib.k8s import KrknKubernetes
 from krkn_lib.models.k8s import AffectedNode
 
+from krkn.cache import lookups
+
 
 def get_node_by_name(node_name_list, kubecli: KrknKubernetes):
-    killable_nodes = kubecli.list_killable_nodes()
+    killable_nodes = lookups.list_killable_nodes(kubecli)
     for node_name in node_name_list:
         if node_name not in killable_nodes:
             logging.info(
@@ -37,7 +39,7 @@ def get_node(label_selector, instance_kill_count, kubecli: KrknKubernetes):
     label_selector_list = label_selector.split(",")
     nodes = []
     for label_selector in label_selector_list:
-        nodes.extend(kubecli.list_killable_nodes(label_selector))
+        nodes.extend(lookups.list_killable_nodes(kubecli, label_selector))
     if not nodes:
         raise Exception("Ready nodes with the provided label selector do not exist")
     logging.info(
@@ -30,7 +30,10 @@ from krkn_lib.models.telemetry import ScenarioTelemetry
 from krkn_lib.telemetry.ocp import KrknTelemetryOpenshift
 from krkn_lib.models.pod_monitor.models import PodsSnapshot
 
+from krkn.cache import SharedInformer, lookups
+from krkn.scenario_plugins.pod_disruption import pod_selection
 from krkn.scenario_plugins.pod_disruption.models.models import InputParams
+from krkn.scenario_plugins.pod_disruption.pod_recovery_waiter import PodRecoveryWaiter, pod_matcher
 from krkn.scenario_plugins.abstract_scenario_plugin import AbstractScenarioPlugin
 
 @dataclass
@@ -141,30 +144,29 @@ class PodDisruptionScenarioPlugin(AbstractScenarioPlugin):
                 f"impossible to determine monitor parameters, check {kill_scenario} configuration"
             )
     
-    def _select_pods_with_field_selector(self, name_pattern, label_selector, namespace, kubecli: KrknKubernetes, field_selector: str, node_name: str = None):
-        """Helper function to select pods using either label_selector or name_pattern with field_selector, optionally filtered by node"""
-        # Combine field selectors if node targeting is specified
-        if node_name:
-            node_field_selector = f"spec.nodeName={node_name}"
-            if field_selector:
-                combined_field_selector = f"{field_selector},{node_field_selector}"
-            else:
-                combined_field_selector = node_field_selector
-        else:
-            combined_field_selector = field_selector
-        
-        if label_selector:
-            return kubecli.select_pods_by_namespace_pattern_and_label(
-                label_selector=label_selector, 
-                namespace_pattern=namespace, 
-                field_selector=combined_field_selector
-            )
-        else:  # name_pattern
-            return kubecli.select_pods_by_name_pattern_and_namespace_pattern(
-                pod_name_pattern=name_pattern, 
-                namespace_pattern=namespace, 
-                field_selector=combined_field_selector
-            )
+    def _get_cached_pods(self, name_pattern, label_selector, namespace, kubecli: KrknKubernetes, field_selector: str = None, node_label_selector: str = None, node_names: list = None):
+        """Selects the pods from the shared informer cache, returns None if the cache can't serve the selection"""
+        phase = None
+        if field_selector:
+            if not field_selector.startswith("status.phase=") or "," in field_selector:
+                return None
+            phase = field_selector[len("status.phase="):]
+        informer = lookups.pods_informer(kubecli, label_selector)
+        if informer is None:
+            return None
+        if not node_names and node_label_selector:
+            node_names = lookups.list_nodes(kubecli, node_label_selector)
+            if not node_names:
+                logging.debug(f"No nodes found with label selector: {node_label_selector}")
+                return []
+        return lookups.select_pods(
+            informer,
+            namespace,
+            label_selector=label_selector,
+            name_pattern=None if label_selector else name_pattern,
+            phase=phase,
+            node_names=node_names or None,
+        )
 
     def get_pods(self, name_pattern, label_selector, namespace, kubecli: KrknKubernetes, field_selector: str = None, node_label_selector: str = None, node_names: list = None): 
         if label_selector and name_pattern: 
@@ -174,49 +176,54 @@ class PodDisruptionScenarioPlugin(AbstractScenarioPlugin):
         if not label_selector and not name_pattern:
             logging.error('Name pattern or label pattern must be specified ')
             return []
-        
-        # If specific node names are provided, make multiple calls with field selector
-        if node_names:
-            logging.debug(f"Targeting pods on {len(node_names)} specific nodes")
-            all_pods = []
-            for node_name in node_names:
-                pods = self._select_pods_with_field_selector(
-                    name_pattern, label_selector, namespace, kubecli, field_selector, node_name
-                )
-                
-                if pods:
-                    all_pods.extend(pods)
-            
-            logging.debug(f"Found {len(all_pods)} target pods across {len(node_names)} nodes")
-            return all_pods
-        
-        #  Node label selector approach - use field selectors
-        if node_label_selector:
+
+        cached_pods = self._get_cached_pods(name_pattern, label_selector, namespace, kubecli, field_selector, node_label_selector, node_names)
+        if cached_pods is not None:
+            return cached_pods
+
+        pods, _ = self._select_pods(name_pattern, label_selector, namespace, kubecli, field_selector, node_label_selector, node_names)
+        return pods
+
+    def _select_pods(self, name_pattern, label_selector, namespace, kubecli: KrknKubernetes, field_selector: str = None, node_label_selector: str = None, node_names: list = None, exclude_label: str = None):
+        """Selects the pods and the excluded ones with a single LIST, filtering the nodes in memory"""
+        if not node_names and node_label_selector:
             # Get nodes matching the label selector first
-            nodes_with_label = kubecli.list_nodes(label_selector=node_label_selector)
-            if not nodes_with_label:
+            node_names = lookups.list_nodes(kubecli, node_label_selector)
+            if not node_names:
                 logging.debug(f"No nodes found with label selector: {node_label_selector}")
-                return []
-            
-            logging.debug(f"Targeting pods on {len(nodes_with_label)} nodes with label: {node_label_selector}")
-            # Use field selector for each node
-            all_pods = []
-            for node_name in nodes_with_label:
-                pods = self._select_pods_with_field_selector(
-                    name_pattern, label_selector, namespace, kubecli, field_selector, node_name
-                )
-                
-                if pods:
-                    all_pods.extend(pods)
-            
-            logging.debug(f"Found {len(all_pods)} target pods across {len(nodes_with_label)} nodes")
-            return all_pods
-        
-        # Standard pod selection (no node targeting)
-        return self._select_pods_with_field_selector(
-            name_pattern, label_selector, namespace, kubecli, field_selector
+                return [], set()
+        if node_names:
+            logging.debug(f"Targeting pods on {len(node_names)} nodes")
+        return pod_selection.select_pods(
+            kubecli,
+            namespace,
+            label_selector=label_selector,
+            name_pattern=name_pattern,
+            field_selector=field_selector,
+            node_names=node_names,
+            exclude_label=exclude_label,
         )
-    
+
+    def select_target_pods(self, config: InputParams, kubecli: KrknKubernetes):
+        """Returns the Running pods targeted by the scenario and the (name, namespace) of the excluded ones"""
+        if config.label_selector and config.name_pattern:
+            logging.error('Only, one of name pattern or label pattern can be specified')
+            return [], set()
+        if not config.label_selector and not config.name_pattern:
+            logging.error('Name pattern or label pattern must be specified ')
+            return [], set()
+
+        cached_pods = self._get_cached_pods(config.name_pattern, config.label_selector, config.namespace_pattern, kubecli, "status.phase=Running", config.node_label_selector, config.node_names)
+        if cached_pods is not None:
+            excluded = set()
+            if config.exclude_label:
+                excluded = self._get_cached_pods("", config.exclude_label, config.namespace_pattern, kubecli, "status.phase=Running", config.node_label_selector, config.node_names)
+                if excluded is None:
+                    _, excluded = self._select_pods(config.name_pattern, config.label_selector, config.namespace_pattern, kubecli, "status.phase=Running", config.node_label_selector, config.node_names, config.exclude_label)
+            return cached_pods, set(excluded)
+
+        return self._select_pods(config.name_pattern, config.label_selector, config.namespace_pattern, kubecli, "status.phase=Running", config.node_label_selector, config.node_names, config.exclude_label)
+
     def killing_pods(self, config: InputParams, kubecli: KrknKubernetes):
         # region Select target pods
         try:
@@ -224,12 +231,7 @@ class PodDisruptionScenarioPlugin(AbstractScenarioPlugin):
             if not namespace: 
                 logging.error('Namespace pattern must be specified')
 
-            pods = self.get_pods(config.name_pattern,config.label_selector,config.namespace_pattern, kubecli, field_selector="status.phase=Running", node_label_selector=config.node_label_selector, node_names=config.node_names)
-            exclude_pods = set()
-            if config.exclude_label:
-                _exclude_pods = self.get_pods("",config.exclude_label,config.namespace_pattern, kubecli, field_selector="status.phase=Running", node_label_selector=config.node_label_selector, node_names=config.node_names)
-                for pod in _exclude_pods:
-                    exclude_pods.add(pod[0])
+            pods, exclude_pods = self.select_target_pods(config, kubecli)
 
 
             pods_count = len(pods)
@@ -239,12 +241,13 @@ class PodDisruptionScenarioPlugin(AbstractScenarioPlugin):
                 return 1
             
             random.shuffle(pods)
+            disruption_start = time.time()
             
             pods_to_kill = []
             for i in range(config.kill):
                 pod = pods[i]
                 logging.info(pod)
-                if pod[0] in exclude_pods:
+                if tuple(pod) in exclude_pods:
                     logging.info(f"Excluding {pod[0]} from chaos")
                 else:
                     pods_to_kill.append(pod)
@@ -260,13 +263,85 @@ class PodDisruptionScenarioPlugin(AbstractScenarioPlugin):
                         logging.info(f'Gracefully deleting pod {pod[0]}')
                         kubecli.delete_pod(pod[0], pod[1])
             
-            return_val = self.wait_for_pods(config.label_selector,config.name_pattern,config.namespace_pattern, pods_count, config.duration, config.timeout, kubecli, config.node_label_selector, config.node_names)
+            return_val = self.wait_for_pods(config.label_selector,config.name_pattern,config.namespace_pattern, pods_count, config.duration, config.timeout, kubecli, config.node_label_selector, config.node_names, disruption_start=disruption_start)
         except Exception as e:
             raise(e)
 
         return return_val
 
     def wait_for_pods(
+        self, label_selector, pod_name, namespace, pod_count, duration, wait_timeout, kubecli: KrknKubernetes, node_label_selector, node_names, disruption_start: float = None
+    ):
+        start_time = time.monotonic()
+        if not node_names and node_label_selector:
+            node_names = lookups.list_nodes(kubecli, node_label_selector)
+        informers, scoped = self._get_pods_informers(label_selector, namespace, node_names, kubecli, wait_timeout)
+        if informers is None:
+            logging.info("pods watch not available, polling the pods every %s seconds" % duration)
+            return self._poll_for_pods(label_selector, pod_name, namespace, pod_count, duration, wait_timeout, kubecli, node_label_selector, node_names)
+
+        try:
+            waiter = PodRecoveryWaiter(
+                informers,
+                pod_matcher(namespace, None if label_selector else pod_name, node_names),
+                label_selector=label_selector,
+                start_time=disruption_start,
+            )
+            recovered = waiter.wait(pod_count, wait_timeout - (time.monotonic() - start_time))
+        finally:
+            if scoped:
+                for informer in informers:
+                    informer.stop()
+
+        for pod, recovery_time in sorted(waiter.recovery_times.items()):
+            logging.info(f"pod {pod} recovered in {recovery_time:.2f} seconds")
+        if not recovered:
+            logging.error("timeout while waiting for pods to come up")
+            return 1
+        return 0
+
+    def _get_pods_informers(self, label_selector, namespace, node_names, kubecli: KrknKubernetes, wait_timeout):
+        """Returns the shared pods informer if it can serve the selector, otherwise starts informers
+        watching the pods of the same namespaces as the selection: a single cluster-wide one
+        filtered by the label selector, or one per target namespace. Returns None, to poll the
+        pods, if the informers can't sync or no namespace matches. The second value is True if
+        the caller must stop them."""
+        informer = lookups.pods_informer(kubecli, label_selector)
+        if informer is not None:
+            return [informer], False
+
+        list_kwargs = {"field_selector": "status.phase=Running"}
+        if node_names and len(set(node_names)) == 1:
+            list_kwargs["field_selector"] += f",spec.nodeName={node_names[0]}"
+        if label_selector:
+            list_kwargs["label_selector"] = label_selector
+        if label_selector:
+            informers = [
+                SharedInformer("pods", kubecli.cli.list_pod_for_all_namespaces, list_kwargs=list_kwargs)
+            ]
+        else:
+            informers = [
+                SharedInformer(
+                    f"pods-{target_namespace}",
+                    kubecli.cli.list_namespaced_pod,
+                    list_args=(target_namespace,),
+                    list_kwargs=list_kwargs,
+                )
+                for target_namespace in lookups.resolve_namespaces(kubecli, namespace)
+            ]
+            if not informers:
+                return None, False
+        deadline = time.monotonic() + wait_timeout
+        for informer in informers:
+            informer.start()
+        for informer in informers:
+            if not informer.wait_for_sync(max(deadline - time.monotonic(), 0)):
+                for started in informers:
+                    started.stop()
+                return None, False
+        return informers, True
+
+    def _poll_for_pods(
         self, label_selector, pod_name, namespace, pod_count, duration, wait_timeout, kubecli: KrknKubernetes, node_label_selector, node_names
     ):
         timeout = False
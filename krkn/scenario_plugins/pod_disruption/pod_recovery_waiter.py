@@ -0,0 +1,180 @@
+# Copyright 2025 The Krkn Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Optional, Union
+
+from krkn.cache.shared_informer import SharedInformer, object_key
+
+
+def is_pod_running(pod: dict) -> bool:
+    """
+    A pod counts as recovered when it is Running and not terminating, a
+    gracefully deleted pod stays Running until its containers exit.
+    """
+    return (pod.get("status") or {}).get("phase") == "Running" and not (
+        pod.get("metadata") or {}
+    ).get("deletionTimestamp")
+
+
+def pod_matcher(
+    namespace_pattern: str,
+    name_pattern: str = None,
+    node_names: list[str] = None,
+) -> Callable[[dict], bool]:
+    """
+    Builds the predicate selecting the pods of a disruption scenario, the
+    label selector is applied by the informer.
+
+    :param namespace_pattern: regex matched against the namespace
+    :param name_pattern: regex matched against the pod name (optional)
+    :param node_names: nodes the pods must be scheduled on (optional)
+    :return: the predicate
+    """
+    namespace_re = re.compile(namespace_pattern)
+    name_re = re.compile(name_pattern) if name_pattern else None
+    nodes = set(node_names) if node_names else None
+
+    def _match(pod: dict) -> bool:
+        metadata = pod.get("metadata") or {}
+        if not namespace_re.match(metadata.get("namespace", "")):
+            return False
+        if name_re and not name_re.match(metadata.get("name", "")):
+            return False
+        if nodes is not None and (pod.get("spec") or {}).get("nodeName") not in nodes:
+            return False
+        return True
+
+    return _match
+
+
+def running_since(pod: dict) -> Optional[float]:
+    """
+    Returns the epoch of the last transition of the pod to Ready, None if
+    the pod doesn't report it.
+    """
+    for condition in (pod.get("status") or {}).get("conditions") or []:
+        if condition.get("type") == "Ready" and condition.get("status") == "True":
+            transition = condition.get("lastTransitionTime")
+            if not transition:
+                return None
+            return datetime.strptime(transition, "%Y-%m-%dT%H:%M:%SZ").replace(
+                tzinfo=timezone.utc
+            ).timestamp()
+    return None
+
+
+class PodRecoveryWaiter:
+    """
+    Waits for the pods selected by a disruption scenario to be Running
+    again by following the informer events instead of polling the
+    apiserver, and records the recovery latency of every pod that became
+    Running after the disruption. Pods that recovered before the waiter
+    was attached are timed from their Ready condition transition. The
+    pods can be followed by several informers (e.g. one per namespace).
+    """
+
+    def __init__(
+        self,
+        informer: Union[SharedInformer, list[SharedInformer]],
+        match: Callable[[dict], bool],
+        label_selector: str = None,
+        start_time: float = None,
+    ):
+        """
+        :param informer: the pods informer, or the informers of the
+            target namespaces, already started
+        :param match: predicate selecting the scenario pods
+        :param label_selector: label selector of the pods (optional)
+        :param start_time: epoch of the disruption, the recovery
+            latencies are measured from it (default: now)
+        """
+        self.informers = informer if isinstance(informer, list) else [informer]
+        self.match = match
+        self.label_selector = label_selector
+        self.start_time = start_time if start_time is not None else time.time()
+        # pod key -> seconds from the disruption to Running
+        self.recovery_times: dict[str, float] = {}
+        self._running: set[str] = set()
+        self._condition = threading.Condition()
+
+    def _on_event(self, event_type: str, pod: dict):
+        if not self.match(pod):
+            return
+        key = object_key(pod)
+        with self._condition:
+            if event_type != "DELETED" and is_pod_running(pod):
+                if key not in self._running:
+                    self._running.add(key)
+                    self.recovery_times.setdefault(
+                        key, max(time.time() - self.start_time, 0.0)
+                    )
+            else:
+                self._running.discard(key)
+            self._condition.notify_all()
+
+    def _running_pods(self) -> list[dict]:
+        return [
+            pod
+            for informer in self.informers
+            for pod in informer.list(
+                label_selector=self.label_selector,
+                predicate=lambda pod: self.match(pod) and is_pod_running(pod),
+            )
+        ]
+
+    def _seed(self):
+        for pod in self._running_pods():
+            key = object_key(pod)
+            self._running.add(key)
+            since = running_since(pod)
+            if since is not None and since >= self.start_time:
+                self.recovery_times.setdefault(key, since - self.start_time)
+
+    def wait(self, pod_count: int, timeout: float) -> bool:
+        """
+        Waits until exactly `pod_count` selected pods are Running.
+
+        :param pod_count: the expected number of Running pods
+        :param timeout: maximum time to wait in seconds
+        :return: True if the pods recovered before the timeout
+        """
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            # the listener blocks on the condition until the running pods
+            # are seeded, so no transition is timed twice or missed
+            for informer in self.informers:
+                informer.add_listener(self._on_event)
+            self._seed()
+        try:
+            with self._condition:
+                # the store is the source of truth for the count, the
+                # events only wake up the waiter and time the recoveries
+                while True:
+                    running = len(self._running_pods())
+                    if running == pod_count:
+                        return True
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        logging.debug(
+                            f"{running}/{pod_count} pods Running at timeout"
+                        )
+                        return False
+                    self._condition.wait(remaining)
+        finally:
+            for informer in self.informers:
+                informer.remove_listener(self._on_event)
@@ -0,0 +1,164 @@
+# Copyright 2025 The Krkn Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Pod selection for the pod disruption scenarios. The pods selected by label
+are listed with a single cluster-wide LIST, the pods selected by name are
+listed with one LIST per namespace matching the namespace pattern. The label
+and field selectors are applied by the apiserver, while the namespace, name,
+node and exclusion filters are applied in memory.
+"""
+import json
+import logging
+import re
+
+from krkn_lib.k8s import KrknKubernetes
+
+from krkn.cache.lookups import resolve_namespaces
+from krkn.cache.shared_informer import (
+    is_equality_selector,
+    labels_match,
+    parse_label_selector,
+)
+
+DEFAULT_PAGE_SIZE = 500
+
+
+def list_pods(
+    kubecli: KrknKubernetes,
+    label_selector: str = None,
+    field_selector: str = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    namespace: str = None,
+) -> list[dict]:
+    """
+    Lists the pods of a namespace, or of all the namespaces, with one
+    paginated LIST, keeping the raw dicts returned by the apiserver.
+
+    :param kubecli: the client of the cluster
+    :param label_selector: label selector applied by the apiserver
+    :param field_selector: field selector applied by the apiserver
+    :param page_size: limit of every page
+    :param namespace: the namespace of the pods, all the namespaces if
+        not set
+    :return: the pods
+    """
+    pods = []
+    continue_token = None
+    while True:
+        kwargs = {"limit": page_size, "_preload_content": False}
+        if label_selector:
+            kwargs["label_selector"] = label_selector
+        if field_selector:
+            kwargs["field_selector"] = field_selector
+        if continue_token:
+            kwargs["_continue"] = continue_token
+        if namespace:
+            response = kubecli.cli.list_namespaced_pod(namespace, **kwargs)
+        else:
+            response = kubecli.cli.list_pod_for_all_namespaces(**kwargs)
+        page = json.loads(response.data)
+        pods.extend(page.get("items") or [])
+        continue_token = (page.get("metadata") or {}).get("continue")
+        if not continue_token:
+            return pods
+
+
+def _pod_key(pod: dict) -> tuple[str, str]:
+    return pod["metadata"]["name"], pod["metadata"]["namespace"]
+
+
+def select_pods(
+    kubecli: KrknKubernetes,
+    namespace_pattern: str,
+    label_selector: str = None,
+    name_pattern: str = None,
+    field_selector: str = None,
+    node_names: list[str] = None,
+    exclude_label: str = None,
+) -> tuple[list[tuple[str, str]], set[tuple[str, str]]]:
+    """
+    Selects the pods matching the patterns, like the
+    `KrknKubernetes.select_pods_by_*` methods, whatever the number of
+    target nodes with one LIST when a label selector is set and one LIST
+    per target namespace otherwise.
+
+    :param kubecli: the client of the cluster
+    :param namespace_pattern: regex matched against the namespace
+    :param label_selector: label selector of the pods (optional)
+    :param name_pattern: regex matched against the pod name, used when
+        no label selector is set (optional)
+    :param field_selector: field selector of the pods
+        (optional, e.g. `status.phase=Running`)
+    :param node_names: nodes the pods must be scheduled on (optional)
+    :param exclude_label: label selector of the selected pods that must
+        be spared (optional)
+    :return: the `(name, namespace)` tuples of the selected pods and the
+        set of those matching `exclude_label`
+    """
+    namespace_re = re.compile(namespace_pattern)
+    name_re = re.compile(name_pattern) if name_pattern and not label_selector else None
+    nodes = set(node_names) if node_names else None
+    if nodes is not None and len(nodes) == 1:
+        # a single node is cheaper to filter on the apiserver side
+        node_selector = f"spec.nodeName={next(iter(nodes))}"
+        field_selector = f"{field_selector},{node_selector}" if field_selector else node_selector
+
+    if label_selector:
+        namespaces = None
+        candidates = list_pods(kubecli, label_selector, field_selector)
+    else:
+        namespaces = resolve_namespaces(kubecli, namespace_pattern)
+        candidates = [
+            pod
+            for namespace in namespaces
+            for pod in list_pods(kubecli, None, field_selector, namespace=namespace)
+        ]
+
+    pods = []
+    for pod in candidates:
+        metadata = pod["metadata"]
+        if not namespace_re.match(metadata["namespace"]):
+            continue
+        if name_re and not name_re.match(metadata["name"]):
+            continue
+        if nodes is not None and (pod.get("spec") or {}).get("nodeName") not in nodes:
+            continue
+        pods.append(pod)
+    logging.debug(
+        f"Selected {len(pods)} pods with "
+        f"{'a single LIST' if namespaces is None else f'{len(namespaces)} namespaced LISTs'}"
+    )
+
+    excluded = set()
+    if exclude_label:
+        if is_equality_selector(exclude_label):
+            requirements = parse_label_selector(exclude_label)
+            excluded = {
+                _pod_key(pod)
+                for pod in pods
+                if labels_match(pod["metadata"].get("labels") or {}, requirements)
+            }
+        else:
+            # set based selectors are only evaluated by the apiserver
+            selected = {_pod_key(pod) for pod in pods}
+            if namespaces is None:
+                candidates = list_pods(kubecli, exclude_label, field_selector)
+            else:
+                candidates = [
+                    pod
+                    for namespace in {namespace for _, namespace in selected}
+                    for pod in list_pods(kubecli, exclude_label, field_selector, namespace=namespace)
+                ]
+            excluded = {_pod_key(pod) for pod in candidates} & selected
+    return [_pod_key(pod) for pod in pods], excluded
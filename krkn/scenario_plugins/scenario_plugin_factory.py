@@ -15,6 +15,7 @@ import importlib
 import inspect
 import pkgutil
 from typing import Type, Tuple, Optional, Any
+from krkn.plugin_registry import LazyPluginRegistry, load_manifest
 from krkn.scenario_plugins.abstract_scenario_plugin import AbstractScenarioPlugin
 
 
@@ -28,9 +29,29 @@ class ScenarioPluginFactory:
     failed_plugins: list[Tuple[str, str, str]] = []
     package_name = None
 
-    def __init__(self, package_name: str = "krkn.scenario_plugins"):
+    def __init__(self, package_name: str = "krkn.scenario_plugins", lazy: bool = True):
+        """
+        :param package_name: the package the plugins are loaded from
+        :param lazy: if the package has an up to date plugin manifest, the
+            plugins are registered from it and imported only when created,
+            otherwise all the plugins are imported
+        """
         self.package_name = package_name
-        self.__load_plugins(AbstractScenarioPlugin)
+        self.loaded_plugins = {}
+        self.failed_plugins = []
+        manifest = None
+        if lazy:
+            manifest = load_manifest(
+                package_name,
+                "_scenario_plugin",
+                exclude=[AbstractScenarioPlugin.__module__],
+            )
+        if manifest is not None:
+            self.loaded_plugins = LazyPluginRegistry(
+                manifest, AbstractScenarioPlugin, self.failed_plugins
+            )
+        else:
+            self.__load_plugins(AbstractScenarioPlugin)
 
     def create_plugin(self, scenario_type: str) -> AbstractScenarioPlugin:
         """
@@ -45,14 +66,26 @@ class ScenarioPluginFactory:
         :return: an instance of the class that implements this scenario and
             inherits from the AbstractScenarioPlugin abstract class
         """
-        if scenario_type in self.loaded_plugins:
-            return self.loaded_plugins[scenario_type](scenario_type)
+        plugin_class = self.loaded_plugins.get(scenario_type)
+        if plugin_class is not None:
+            return plugin_class(scenario_type)
         else:
             raise ScenarioPluginNotFound(
                 f"Failed to load the {scenario_type} scenario plugin. "
                 f"Please verify the logs to ensure it was loaded correctly."
             )
 
+    def get_class_names(self) -> dict[str, str]:
+        """
+        Returns the class name of every scenario type without importing
+        the plugins.
+
+        :return: scenario type -> plugin class name
+        """
+        if isinstance(self.loaded_plugins, LazyPluginRegistry):
+            return {t: self.loaded_plugins.class_name(t) for t in self.loaded_plugins}
+        return {t: cls.__name__ for t, cls in self.loaded_plugins.items()}
+
     def __load_plugins(self, base_class: Type):
         base_package = importlib.import_module(self.package_name)
         for _, module_name, is_pkg in pkgutil.walk_packages(
@@ -18,7 +18,7 @@ import random
 import time
 import traceback
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, List, Optional
 
 import yaml
 from krkn_lib.k8s import KrknKubernetes
@@ -37,6 +37,15 @@ from krkn.scenario_plugins.storage_throttle.storage_throttle_utils import (
     validate_maj_min,
     validate_mount_path,
 )
+from krkn.scenario_plugins.storage_throttle.storage_throttle_targets import (
+    ThrottleTarget,
+    apply_script,
+    group_by_node,
+    parse_proc_cgroup,
+    parse_readback,
+    proc_cgroup_command,
+    reset_script,
+)
 
 # Backward-compatible aliases so existing imports of the underscore-prefixed
 # names from this module continue to work (e.g. in tests).
@@ -62,6 +71,12 @@ class ThrottleParams:
     duration: int
     mount_path: str
     image: str
+    label_selector: str = ""
+    pvc_names: tuple = ()
+
+    @property
+    def multi_target(self) -> bool:
+        return bool(self.label_selector or self.pvc_names)
 
 
 class StorageThrottleScenarioPlugin(AbstractScenarioPlugin):
@@ -125,12 +140,26 @@ class StorageThrottleScenarioPlugin(AbstractScenarioPlugin):
         image = get_yaml_item_value(
             scenario_config, "image", self.DEFAULT_IMAGE
         )
+        label_selector = get_yaml_item_value(
+            scenario_config, "label_selector", ""
+        )
+        pvc_names = get_yaml_item_value(scenario_config, "pvc_names", [])
+        if isinstance(pvc_names, str):
+            pvc_names = [pvc_names]
+        if not isinstance(pvc_names, list) or not all(
+            isinstance(name, str) and name for name in pvc_names
+        ):
+            logging.error("pvc_names must be a list of PVC names")
+            return None
 
         if not namespace:
             logging.error("You must specify the namespace")
             return None
-        if not pvc_name and not pod_name:
-            logging.error("You must specify pvc_name or pod_name")
+        if not pvc_name and not pod_name and not label_selector and not pvc_names:
+            logging.error(
+                "You must specify pvc_name, pod_name, label_selector "
+                "or pvc_names"
+            )
             return None
         if throttle_type not in ("iops", "bandwidth", "both"):
             logging.error(
@@ -168,6 +197,8 @@ class StorageThrottleScenarioPlugin(AbstractScenarioPlugin):
             duration=duration,
             mount_path=mount_path,
             image=image,
+            label_selector=label_selector,
+            pvc_names=tuple(pvc_names),
         )
 
     # ------------------------------------------------------------------
@@ -189,6 +220,9 @@ class StorageThrottleScenarioPlugin(AbstractScenarioPlugin):
 
             lib_k8s = lib_telemetry.get_lib_kubernetes()
 
+            if params.multi_target:
+                return self._run_multi_target(lib_k8s, params)
+
             pod_name = self._resolve_pod_name(
                 lib_k8s, params.pvc_name, params.pod_name, params.namespace
             )
@@ -360,6 +394,304 @@ class StorageThrottleScenarioPlugin(AbstractScenarioPlugin):
     def get_scenario_types(self) -> list[str]:
         return ["storage_throttle_scenarios"]
 
+    # ------------------------------------------------------------------
+    # Multi-target mode
+    # ------------------------------------------------------------------
+
+    def _run_multi_target(
+        self, lib_k8s: KrknKubernetes, params: ThrottleParams
+    ) -> int:
+        """Throttle every pod matching the label selector or using one of the
+        PVCs, with one privileged pod per node shared by its targets."""
+        targets = self._resolve_targets(lib_k8s, params)
+        if not targets:
+            logging.error(
+                "No pod with a PVC mount to throttle in namespace '%s'"
+                % params.namespace
+            )
+            return 1
+
+        nodes = group_by_node(targets)
+        logging.info(
+            "Throttling %d pod(s) on %d node(s)" % (len(targets), len(nodes))
+        )
+        priv_pods: Dict[str, str] = {}
+        cgroup_versions: Dict[str, str] = {}
+        applied: List[str] = []
+        try:
+            for node_name, node_targets in nodes.items():
+                priv_pod_name = lib_k8s.deploy_io_throttle_pod(
+                    node_name=node_name,
+                    image=params.image,
+                    namespace=params.namespace,
+                )
+                priv_pods[node_name] = priv_pod_name
+                logging.info(
+                    "Privileged pod deployed on %s: %s"
+                    % (node_name, priv_pod_name)
+                )
+                cgroup_version = self._detect_cgroup_version(
+                    lib_k8s, priv_pod_name, params.namespace
+                )
+                cgroup_versions[node_name] = cgroup_version
+                if not self._resolve_cgroup_paths(
+                    lib_k8s, priv_pod_name, node_targets,
+                    cgroup_version, params.namespace,
+                ):
+                    return 1
+                self._register_rollback_targets(
+                    priv_pod_name, node_targets, cgroup_version,
+                    params.namespace,
+                )
+
+            for node_name, node_targets in nodes.items():
+                self._apply_throttle_batch(
+                    lib_k8s, priv_pods[node_name], node_targets,
+                    cgroup_versions[node_name], params,
+                )
+                applied.append(node_name)
+            logging.info(
+                "I/O throttle applied (type=%s) on %d pod(s) for %ds"
+                % (params.throttle_type, len(targets), params.duration)
+            )
+
+            self._wait_with_progress(params.duration)
+
+            for node_name in list(applied):
+                self._remove_throttle_batch(
+                    lib_k8s, priv_pods[node_name], nodes[node_name],
+                    cgroup_versions[node_name], params.namespace,
+                )
+                applied.remove(node_name)
+            logging.info("I/O throttle removed")
+            return 0
+        finally:
+            for node_name in applied:
+                try:
+                    self._remove_throttle_batch(
+                        lib_k8s, priv_pods[node_name], nodes[node_name],
+                        cgroup_versions[node_name], params.namespace,
+                    )
+                    logging.info(
+                        "I/O throttle removed during cleanup on %s" % node_name
+                    )
+                except Exception as e:
+                    logging.warning(
+                        "Best-effort throttle removal failed on %s: %s. "
+                        "I/O limits may persist on: %s"
+                        % (
+                            node_name, e,
+                            ", ".join(
+                                "%s (%s)" % (t.cgroup_path, t.maj_min)
+                                for t in nodes[node_name]
+                            ),
+                        )
+                    )
+            for priv_pod_name in priv_pods.values():
+                self._cleanup_privileged_pod(
+                    lib_k8s, priv_pod_name, params.namespace
+                )
+            if priv_pods:
+                logging.info("Privileged pods cleaned up")
+
+    def _resolve_targets(
+        self, lib_k8s: KrknKubernetes, params: ThrottleParams
+    ) -> List[ThrottleTarget]:
+        """Resolve the pods matching the label selector and the pods using
+        the PVCs, skipping (with a warning) the ones that can't be
+        throttled."""
+        candidates: Dict[str, str] = {}
+        if params.label_selector:
+            for pod_name in lib_k8s.list_pods(
+                params.namespace, label_selector=params.label_selector
+            ):
+                candidates.setdefault(pod_name, "")
+        for pvc_name in params.pvc_names:
+            pvc = lib_k8s.get_pvc_info(pvc_name, params.namespace)
+            if pvc is None or not pvc.podNames:
+                logging.warning(
+                    "No pod associated with PVC '%s' in namespace '%s'"
+                    % (pvc_name, params.namespace)
+                )
+                continue
+            for pod_name in pvc.podNames:
+                candidates[pod_name] = pvc_name
+
+        targets = []
+        for pod_name, pvc_name in candidates.items():
+            target = self._resolve_target(
+                lib_k8s, pod_name, pvc_name, params
+            )
+            if target:
+                logging.info(
+                    "Target: pod=%s container=%s mount=%s device=%s node=%s"
+                    % (
+                        target.pod_name, target.container_name,
+                        target.mount_path, target.maj_min, target.node_name,
+                    )
+                )
+                targets.append(target)
+        return targets
+
+    def _resolve_target(
+        self,
+        lib_k8s: KrknKubernetes,
+        pod_name: str,
+        pvc_name: str,
+        params: ThrottleParams,
+    ) -> Optional[ThrottleTarget]:
+        pod = lib_k8s.get_pod_info(name=pod_name, namespace=params.namespace)
+        if pod is None:
+            logging.warning("Pod '%s' doesn't exist, skipping" % pod_name)
+            return None
+        container_name, vol_mount_path = self._find_pvc_mount(
+            pod, params.mount_path, pvc_name
+        )
+        if not container_name or not validate_mount_path(vol_mount_path):
+            logging.warning(
+                "Pod '%s' has no valid PVC volume mount, skipping" % pod_name
+            )
+            return None
+        if not pod.nodeName:
+            logging.warning(
+                "Pod '%s' has no nodeName yet (still pending?), skipping"
+                % pod_name
+            )
+            return None
+        container_id = self._get_container_id(pod, container_name)
+        if not container_id:
+            logging.warning(
+                "Could not get container ID for %s, skipping" % pod_name
+            )
+            return None
+        maj_min = self._get_device_maj_min(
+            lib_k8s, pod_name, params.namespace,
+            container_name, vol_mount_path,
+        )
+        if not validate_maj_min(maj_min):
+            logging.warning(
+                "Could not determine major:minor for mount %s of %s, skipping"
+                % (vol_mount_path, pod_name)
+            )
+            return None
+        return ThrottleTarget(
+            pod_name=pod_name,
+            container_name=container_name,
+            container_id=container_id,
+            node_name=pod.nodeName,
+            mount_path=vol_mount_path,
+            maj_min=maj_min,
+        )
+
+    def _resolve_cgroup_paths(
+        self,
+        lib_k8s: KrknKubernetes,
+        priv_pod_name: str,
+        targets: List[ThrottleTarget],
+        cgroup_version: str,
+        namespace: str,
+    ) -> bool:
+        """Resolve the host cgroup path of all the targets of a node with a
+        single read of the /proc/<pid>/cgroup files of their processes,
+        falling back on the cgroupfs search for the missing ones."""
+        container_ids = [t.container_id for t in targets]
+        output = self._chroot_exec(
+            lib_k8s, priv_pod_name,
+            proc_cgroup_command(container_ids), namespace,
+        )
+        paths = parse_proc_cgroup(output, container_ids, cgroup_version)
+        for target in targets:
+            cgroup_path = paths.get(target.container_id)
+            if not cgroup_path:
+                cgroup_path = self._find_host_cgroup_path(
+                    lib_k8s, priv_pod_name, target.container_id,
+                    cgroup_version, namespace,
+                )
+            if not cgroup_path or not validate_cgroup_path(cgroup_path):
+                logging.error(
+                    "Could not find a valid host cgroup path for container "
+                    "%s of pod %s: %r"
+                    % (target.container_id, target.pod_name, cgroup_path)
+                )
+                return False
+            target.cgroup_path = cgroup_path
+            logging.info(
+                "Host cgroup path of %s: %s" % (target.pod_name, cgroup_path)
+            )
+        return True
+
+    @staticmethod
+    def _throttle_values(params: ThrottleParams) -> Dict[str, int]:
+        values = {}
+        if params.throttle_type in ("bandwidth", "both"):
+            values.update(rbps=params.read_bps, wbps=params.write_bps)
+        if params.throttle_type in ("iops", "both"):
+            values.update(riops=params.read_iops, wiops=params.write_iops)
+        return values
+
+    def _apply_throttle_batch(
+        self,
+        lib_k8s: KrknKubernetes,
+        priv_pod_name: str,
+        targets: List[ThrottleTarget],
+        cgroup_version: str,
+        params: ThrottleParams,
+    ):
+        """Throttle all the targets of a node with a single exec."""
+        output = self._chroot_exec(
+            lib_k8s, priv_pod_name,
+            apply_script(targets, cgroup_version, self._throttle_values(params)),
+            params.namespace,
+        )
+        readback = parse_readback(output)
+        for target in targets:
+            result = readback.get(target.pod_name, "")
+            logging.info("Verified limits of %s: %s" % (target.pod_name, result))
+            if target.maj_min not in result:
+                logging.warning(
+                    "Throttle may not have been applied to %s; readback: %s"
+                    % (target.pod_name, result)
+                )
+
+    @staticmethod
+    def _remove_throttle_batch(
+        lib_k8s: KrknKubernetes,
+        priv_pod_name: str,
+        targets: List[ThrottleTarget],
+        cgroup_version: str,
+        namespace: str,
+    ):
+        """Remove the throttle of all the targets of a node with a single
+        exec."""
+        StorageThrottleScenarioPlugin._chroot_exec(
+            lib_k8s, priv_pod_name,
+            reset_script(targets, cgroup_version), namespace,
+        )
+
+    def _register_rollback_targets(
+        self,
+        priv_pod_name: str,
+        targets: List[ThrottleTarget],
+        cgroup_version: str,
+        namespace: str,
+    ):
+        """Register the rollback of all the targets of a node."""
+        rollback_data = {
+            "priv_pod_name": priv_pod_name,
+            "cgroup_version": cgroup_version,
+            "targets": [t.to_dict() for t in targets],
+        }
+        encoded_data = base64.b64encode(
+            json.dumps(rollback_data).encode("utf-8")
+        ).decode("utf-8")
+        self.rollback_handler.set_rollback_callable(
+            self.rollback_throttle,
+            RollbackContent(
+                namespace=namespace,
+                resource_identifier=encoded_data,
+            ),
+        )
+
     def _resolve_pod_name(
         self,
         lib_k8s: KrknKubernetes,
@@ -731,7 +1063,6 @@ class StorageThrottleScenarioPlugin(AbstractScenarioPlugin):
             ).decode("utf-8")
             data = json.loads(decoded)
             priv_pod_name = data["priv_pod_name"]
-            maj_min = data["maj_min"]
 
             lib_k8s = lib_telemetry.get_lib_kubernetes()
             logging.info(
@@ -739,6 +1070,15 @@ class StorageThrottleScenarioPlugin(AbstractScenarioPlugin):
                 "deleting pod %s" % priv_pod_name
             )
 
+            if "targets" in data:
+                StorageThrottleScenarioPlugin._rollback_targets(
+                    lib_k8s, priv_pod_name, data, namespace
+                )
+                lib_k8s.delete_pod(priv_pod_name, namespace)
+                logging.info("Privileged pod deleted during rollback")
+                return
+
+            maj_min = data["maj_min"]
             if not _validate_maj_min(maj_min):
                 logging.warning(
                     "Invalid maj_min during rollback, skipping throttle removal"
@@ -772,3 +1112,40 @@ class StorageThrottleScenarioPlugin(AbstractScenarioPlugin):
 
         except Exception as e:
             logging.error("Failed to rollback storage throttle: %s" % e)
+
+    @staticmethod
+    def _rollback_targets(
+        lib_k8s: KrknKubernetes, priv_pod_name: str, data: dict, namespace: str
+    ):
+        """Remove the throttle of the targets of a multi-target rollback."""
+        cgroup_version = data.get("cgroup_version")
+        targets = [
+            ThrottleTarget(
+                pod_name=t.get("pod_name", ""),
+                container_name="",
+                container_id="",
+                node_name="",
+                mount_path="",
+                maj_min=t.get("maj_min", ""),
+                cgroup_path=t.get("cgroup_path", ""),
+            )
+            for t in data["targets"]
+        ]
+        valid = [
+            t for t in targets
+            if validate_maj_min(t.maj_min) and validate_cgroup_path(t.cgroup_path)
+        ]
+        if len(valid) < len(targets):
+            logging.warning(
+                "Invalid target data during rollback, skipping throttle "
+                "removal for %d target(s)" % (len(targets) - len(valid))
+            )
+        if not valid or cgroup_version not in ("v1", "v2"):
+            return
+        try:
+            StorageThrottleScenarioPlugin._remove_throttle_batch(
+                lib_k8s, priv_pod_name, valid, cgroup_version, namespace
+            )
+            logging.info("Throttle limits removed during rollback")
+        except Exception as rem_exc:
+            logging.warning("Rollback throttle removal failed: %s" % rem_exc)
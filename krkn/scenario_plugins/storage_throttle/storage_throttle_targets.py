@@ -0,0 +1,200 @@
+# Copyright 2026 The Krkn Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Multi-target helpers for the storage throttle scenario plugin.
+
+All the targets scheduled on the same node share one privileged pod: their
+host cgroup paths are resolved with a single read of the `/proc/<pid>/cgroup`
+files of the container processes (instead of walking /sys/fs/cgroup with
+`find`), and their throttles are applied and removed with a single batched
+exec.
+"""
+
+import re
+import shlex
+from dataclasses import dataclass
+from typing import Dict, List
+
+# printed before the readback of every target in the batched apply
+SECTION_MARKER = "### krkn-throttle"
+
+V1_BLKIO_FILES = [
+    "blkio.throttle.read_bps_device",
+    "blkio.throttle.write_bps_device",
+    "blkio.throttle.read_iops_device",
+    "blkio.throttle.write_iops_device",
+]
+
+_PROC_CGROUP_LINE = re.compile(r"^/proc/\d+/cgroup:\d+:([^:]*):(/\S*)$")
+
+
+@dataclass
+class ThrottleTarget:
+    """A container whose PVC mount is throttled."""
+    pod_name: str
+    container_name: str
+    container_id: str
+    node_name: str
+    mount_path: str
+    maj_min: str
+    cgroup_path: str = ""
+
+    def to_dict(self) -> dict:
+        return {
+            "pod_name": self.pod_name,
+            "maj_min": self.maj_min,
+            "cgroup_path": self.cgroup_path,
+        }
+
+
+def group_by_node(targets: List[ThrottleTarget]) -> Dict[str, List[ThrottleTarget]]:
+    """Group the targets by node, preserving their order."""
+    groups: Dict[str, List[ThrottleTarget]] = {}
+    for target in targets:
+        groups.setdefault(target.node_name, []).append(target)
+    return groups
+
+
+def proc_cgroup_command(container_ids: List[str]) -> str:
+    """Command listing the cgroup of every process of the containers.
+
+    The privileged pod runs in a private cgroup namespace (the default of
+    containerd on cgroup v2 nodes), where the host cgroups read as
+    ``/../../kubepods.slice/...``: the files are read from the cgroup
+    namespace of the host init process, with ``nsenter`` when available.
+
+    Every output line is ``/proc/<pid>/cgroup:<hierarchy>:<controllers>:<path>``.
+    """
+    patterns = " ".join("-e %s" % shlex.quote(cid) for cid in container_ids)
+    grep = "grep -H -F %s /proc/[0-9]*/cgroup 2>/dev/null" % patterns
+    return (
+        "if command -v nsenter >/dev/null 2>&1; "
+        "then nsenter --cgroup=/proc/1/ns/cgroup %s; else %s; fi" % (grep, grep)
+    )
+
+
+def parse_proc_cgroup(
+    output: str, container_ids: List[str], cgroup_version: str
+) -> Dict[str, str]:
+    """Extract the cgroup path of every container from `proc_cgroup_command`.
+
+    The path is cut after the component holding the container ID (runtimes
+    like crun move the processes to a sub-cgroup of the container scope) and
+    the conmon (CRI-O container monitor) cgroups are ignored. Paths outside
+    of the cgroup namespace of the reader (``/../..``, when the host cgroup
+    namespace could not be entered) can't be resolved and are ignored too,
+    the caller falls back on searching the cgroupfs.
+
+    Returns a dict container ID -> cgroup path relative to the hierarchy.
+    """
+    paths: Dict[str, str] = {}
+    for line in (output or "").splitlines():
+        match = _PROC_CGROUP_LINE.match(line.strip())
+        if not match:
+            continue
+        controllers, path = match.groups()
+        if cgroup_version == "v2" and controllers:
+            continue
+        if cgroup_version == "v1" and "blkio" not in controllers.split(","):
+            continue
+        components = path.split("/")
+        if ".." in components:
+            continue
+        for cid in container_ids:
+            if cid in paths:
+                continue
+            for index, component in enumerate(components):
+                if cid in component and "conmon" not in component:
+                    paths[cid] = "/".join(components[: index + 1])
+                    break
+    return paths
+
+
+def _throttle_writes(
+    target: ThrottleTarget, cgroup_version: str, values: Dict[str, int]
+) -> List[str]:
+    if cgroup_version == "v2":
+        value = " ".join(
+            "%s=%s" % (key, values[key])
+            for key in ("rbps", "wbps", "riops", "wiops")
+            if key in values
+        )
+        return [
+            "echo '%s %s' > /sys/fs/cgroup%s/io.max"
+            % (target.maj_min, value, target.cgroup_path)
+        ]
+    files = {
+        "rbps": "blkio.throttle.read_bps_device",
+        "wbps": "blkio.throttle.write_bps_device",
+        "riops": "blkio.throttle.read_iops_device",
+        "wiops": "blkio.throttle.write_iops_device",
+    }
+    return [
+        "echo '%s %s' > /sys/fs/cgroup/blkio%s/%s"
+        % (target.maj_min, values[key], target.cgroup_path, files[key])
+        for key in ("rbps", "wbps", "riops", "wiops")
+        if key in values
+    ]
+
+
+def _readback(target: ThrottleTarget, cgroup_version: str) -> str:
+    if cgroup_version == "v2":
+        return "cat /sys/fs/cgroup%s/io.max" % target.cgroup_path
+    return "cat %s 2>/dev/null" % " ".join(
+        "/sys/fs/cgroup/blkio%s/%s" % (target.cgroup_path, f)
+        for f in V1_BLKIO_FILES
+    )
+
+
+def apply_script(
+    targets: List[ThrottleTarget], cgroup_version: str, values: Dict[str, int]
+) -> str:
+    """Script throttling all the targets of a node and reading back the
+    limits, the readback of every target follows a `SECTION_MARKER` line.
+
+    *values* holds the limits to set among rbps, wbps, riops and wiops.
+    """
+    commands = []
+    for target in targets:
+        commands.extend(_throttle_writes(target, cgroup_version, values))
+        commands.append("echo '%s %s'" % (SECTION_MARKER, target.pod_name))
+        commands.append(_readback(target, cgroup_version))
+    return "; ".join(commands)
+
+
+def reset_script(targets: List[ThrottleTarget], cgroup_version: str) -> str:
+    """Script removing the throttle of all the targets of a node, every write
+    is attempted even if a previous one failed."""
+    if cgroup_version == "v2":
+        reset = {"rbps": "max", "wbps": "max", "riops": "max", "wiops": "max"}
+    else:
+        reset = {"rbps": 0, "wbps": 0, "riops": 0, "wiops": 0}
+    commands = []
+    for target in targets:
+        commands.extend(_throttle_writes(target, cgroup_version, reset))
+    return "; ".join(commands)
+
+
+def parse_readback(output: str) -> Dict[str, str]:
+    """Split the output of `apply_script` into the readback of every pod."""
+    sections: Dict[str, List[str]] = {}
+    pod_name = None
+    for line in (output or "").splitlines():
+        if line.startswith(SECTION_MARKER + " "):
+            pod_name = line[len(SECTION_MARKER) + 1:].strip()
+            sections.setdefault(pod_name, [])
+        elif pod_name is not None:
+            sections[pod_name].append(line)
+    return {name: "\n".join(lines).strip() for name, lines in sections.items()}
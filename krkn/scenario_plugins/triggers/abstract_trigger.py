@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from abc import ABC, abstractmethod
+from typing import Callable
 
 
 class AbstractTrigger(ABC):
@@ -26,3 +27,16 @@ class AbstractTrigger(ABC):
     def describe(self) -> str:
         """Human-readable description for logging."""
         pass
+
+    def start_watch(self, on_change: Callable[[bool], None]) -> bool:
+        """Starts pushing the condition state to ``on_change`` whenever it
+        changes, instead of being polled by TriggerManager.
+
+        Returns False if the trigger can't watch (the default), in which
+        case it keeps being polled through evaluate().
+        """
+        return False
+
+    def stop_watch(self):
+        """Stops the watch started by start_watch()."""
+        pass
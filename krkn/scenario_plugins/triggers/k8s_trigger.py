@@ -13,7 +13,10 @@
 # limitations under the License.
 import logging
 import re
+import threading
+from typing import Callable
 
+from kubernetes import watch
 from kubernetes.dynamic import DynamicClient
 from kubernetes.dynamic.exceptions import (
     NotFoundError,
@@ -25,6 +28,11 @@ from krkn.scenario_plugins.triggers.abstract_trigger import AbstractTrigger
 OPERATORS = ("==", "!=", ">=", "<=", ">", "<")
 OPERATOR_RE = re.compile(r"\s*(==|!=|>=|<=|>|<)\s*")
 
+# Server-side timeout of a watch request, the watch is restarted after it
+WATCH_TIMEOUT_SECONDS = 60
+# Wait before restarting a watch that failed
+WATCH_RETRY_SECONDS = 5
+
 
 def _resolve_path(obj, path: str):
     """Walk a dot-separated path on a dict/ResourceInstance.
@@ -118,7 +126,9 @@ class K8sTrigger(AbstractTrigger):
     """Trigger that waits for a Kubernetes resource to match a condition.
 
     Kind-agnostic: works with built-in resources and CRDs through the
-    same code path using the Kubernetes dynamic client.
+    same code path using the Kubernetes dynamic client. Unless ``watch``
+    is false in the config, the resource is watched and the condition
+    state pushed to TriggerManager instead of being polled.
     """
 
     def __init__(self, trigger_config: dict, kubecli):
@@ -147,24 +157,47 @@ class K8sTrigger(AbstractTrigger):
         )
         self._raw_condition = raw_condition
 
+        self._watch = bool(trigger_config.get("watch", True))
+
         self._kubecli = kubecli
         self._last_result: bool | None = None
+        self._watch_stop = threading.Event()
+        self._watcher: watch.Watch | None = None
 
     def _get_client(self) -> DynamicClient:
         return self._kubecli.dyn_client
 
-    def evaluate(self) -> bool:
-        try:
-            dyn = self._get_client()
-            resource_api = dyn.resources.get(
-                api_version=self._api_version, kind=self._kind
+    def _get_resource_api(self):
+        resource_api = self._get_client().resources.get(
+            api_version=self._api_version, kind=self._kind
+        )
+        if resource_api.namespaced and not self._namespace:
+            raise ValueError(
+                f"{self._api_version}/{self._kind} is namespaced "
+                f"but no namespace was specified"
             )
+        return resource_api
+
+    def _check(self, resource) -> bool:
+        """Evaluates the condition against a resource."""
+        actual = _resolve_path(resource, self._path)
+        met = _compare(actual, self._operator, self._expected)
+
+        logging.debug(
+            "k8s trigger: %s/%s %s.%s=%r (condition: %s) -> %s",
+            self._kind,
+            self._name,
+            self._path,
+            self._operator,
+            actual,
+            self._raw_condition,
+            met,
+        )
+        return met
 
-            if resource_api.namespaced and not self._namespace:
-                raise ValueError(
-                    f"{self._api_version}/{self._kind} is namespaced "
-                    f"but no namespace was specified"
-                )
+    def evaluate(self) -> bool:
+        try:
+            resource_api = self._get_resource_api()
 
             if self._namespace:
                 resource = resource_api.get(
@@ -173,19 +206,7 @@ class K8sTrigger(AbstractTrigger):
             else:
                 resource = resource_api.get(name=self._name)
 
-            actual = _resolve_path(resource, self._path)
-            met = _compare(actual, self._operator, self._expected)
-
-            logging.debug(
-                "k8s trigger: %s/%s %s.%s=%r (condition: %s) -> %s",
-                self._kind,
-                self._name,
-                self._path,
-                self._operator,
-                actual,
-                self._raw_condition,
-                met,
-            )
+            met = self._check(resource)
         except NotFoundError:
             logging.debug(
                 "k8s trigger: resource %s/%s not found yet",
@@ -213,6 +234,10 @@ class K8sTrigger(AbstractTrigger):
             logging.error("k8s trigger unexpected error: %s", e)
             met = False
 
+        return self._record(met)
+
+    def _record(self, met: bool) -> bool:
+        """Keeps the last result, logging only on state change."""
         if met != self._last_result:
             if met:
                 logging.info(
@@ -231,6 +256,76 @@ class K8sTrigger(AbstractTrigger):
         self._last_result = met
         return met
 
+    def _event_result(self, event: dict) -> bool:
+        if event.get("type") == "DELETED":
+            return False
+        try:
+            return self._check(event["object"])
+        except (KeyError, IndexError, AttributeError, ValueError) as e:
+            logging.debug(
+                "k8s trigger: field path '%s' not present on %s/%s: %s",
+                self._path,
+                self._kind,
+                self._name,
+                e,
+            )
+            return False
+
+    def _run_watch(self, on_change: Callable[[bool], None]):
+        while not self._watch_stop.is_set():
+            try:
+                # the current state first, the watch then reports the changes
+                on_change(self.evaluate())
+                resource_api = self._get_resource_api()
+                self._watcher = watch.Watch()
+                kwargs = {"namespace": self._namespace} if self._namespace else {}
+                for event in self._get_client().watch(
+                    resource_api,
+                    name=self._name,
+                    timeout=WATCH_TIMEOUT_SECONDS,
+                    watcher=self._watcher,
+                    **kwargs,
+                ):
+                    if self._watch_stop.is_set():
+                        break
+                    if event.get("type") == "ERROR":
+                        # e.g. 410 Gone, the watch is restarted
+                        logging.debug(
+                            "k8s trigger: watch error on %s/%s: %s",
+                            self._kind,
+                            self._name,
+                            event.get("raw_object"),
+                        )
+                        break
+                    on_change(self._record(self._event_result(event)))
+                continue
+            except Exception as e:
+                logging.warning(
+                    "k8s trigger: watch of %s/%s failed, retrying in %ss: %s",
+                    self._kind,
+                    self._name,
+                    WATCH_RETRY_SECONDS,
+                    e,
+                )
+            self._watch_stop.wait(WATCH_RETRY_SECONDS)
+
+    def start_watch(self, on_change: Callable[[bool], None]) -> bool:
+        if not self._watch:
+            return False
+        self._watch_stop.clear()
+        threading.Thread(
+            target=self._run_watch,
+            args=(on_change,),
+            name=f"k8s-trigger-{self._kind}-{self._name}",
+            daemon=True,
+        ).start()
+        return True
+
+    def stop_watch(self):
+        self._watch_stop.set()
+        if self._watcher is not None:
+            self._watcher.stop()
+
     def describe(self) -> str:
         ns_part = f" namespace={self._namespace}" if self._namespace else ""
         return (
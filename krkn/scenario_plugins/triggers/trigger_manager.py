@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import logging
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 
 from krkn.scenario_plugins.triggers.abstract_trigger import AbstractTrigger
 from krkn.scenario_plugins.triggers.command_trigger import CommandTrigger
@@ -27,10 +29,19 @@ DEFAULT_TIMEOUT = 300
 DEFAULT_INTERVAL = 5
 DEFAULT_MODE = "all_of"
 DEFAULT_ON_TIMEOUT = "skip"
+DEFAULT_MAX_WORKERS = 4
 
 
 class TriggerManager:
-    """Orchestrates polling across multiple triggers."""
+    """Orchestrates polling across multiple triggers.
+
+    The triggers are evaluated concurrently on a small pool, each poll
+    stops as soon as its outcome is known (the first satisfied trigger in
+    any_of mode, the first unsatisfied one in all_of mode) and a trigger
+    that doesn't answer before ``evaluation_timeout`` counts as not
+    satisfied for that poll. Triggers able to watch (e.g. K8sTrigger)
+    push their state instead of being polled.
+    """
 
     def __init__(self, trigger_config: dict, kubecli=None):
         conditions = trigger_config.get("conditions")
@@ -76,6 +87,30 @@ class TriggerManager:
         if self._interval <= 0:
             raise ValueError(f"interval must be positive, got {self._interval}")
 
+        self._evaluation_timeout = trigger_config.get(
+            "evaluation_timeout", self._interval
+        )
+        self._max_workers = trigger_config.get("max_workers", DEFAULT_MAX_WORKERS)
+        try:
+            self._evaluation_timeout = float(self._evaluation_timeout)
+            self._max_workers = int(self._max_workers)
+        except (TypeError, ValueError):
+            raise ValueError(
+                f"evaluation_timeout and max_workers must be numeric, "
+                f"got evaluation_timeout="
+                f"{trigger_config.get('evaluation_timeout')!r}, "
+                f"max_workers={trigger_config.get('max_workers')!r}"
+            )
+        if self._evaluation_timeout <= 0:
+            raise ValueError(
+                f"evaluation_timeout must be positive, "
+                f"got {self._evaluation_timeout}"
+            )
+        if self._max_workers <= 0:
+            raise ValueError(
+                f"max_workers must be positive, got {self._max_workers}"
+            )
+
         self._kubecli = kubecli
 
         self._triggers: list[AbstractTrigger] = []
@@ -86,6 +121,13 @@ class TriggerManager:
 
         # Track per-trigger satisfaction state for get_status
         self._trigger_states: list[bool | None] = [None] * len(self._triggers)
+        # Evaluations still running, kept across polls so a slow trigger
+        # is never evaluated twice at the same time
+        self._pending: dict[int, Future] = {}
+        self._watched: set[int] = set()
+        # Set when a watched trigger pushes a state change
+        self._changed = threading.Event()
+        self._lock = threading.Lock()
 
     @property
     def on_timeout(self) -> str:
@@ -114,6 +156,96 @@ class TriggerManager:
 
         raise ValueError(f"unknown trigger type: '{trigger_type}'")
 
+    def _on_change(self, index: int):
+        def on_change(result: bool):
+            with self._lock:
+                changed = self._trigger_states[index] != result
+                self._trigger_states[index] = result
+            if changed:
+                self._changed.set()
+
+        return on_change
+
+    def _start_watches(self):
+        for i, trigger in enumerate(self._triggers):
+            try:
+                if trigger.start_watch(self._on_change(i)):
+                    self._watched.add(i)
+            except Exception as e:
+                logging.warning(
+                    f"failed to watch {trigger.describe()}, polling it: {e}"
+                )
+
+    def _stop_watches(self):
+        for i in self._watched:
+            try:
+                self._triggers[i].stop_watch()
+            except Exception as e:
+                logging.warning(f"failed to stop watching trigger [{i}]: {e}")
+        self._watched.clear()
+
+    def _decided(self, result: bool | None) -> bool:
+        """Whether a single result decides the outcome of the poll."""
+        if self._mode == "any_of":
+            return result is True
+        return result is not True
+
+    def _poll(self, executor: ThreadPoolExecutor, deadline: float) -> bool:
+        """Evaluates the triggers once, returns whether the mode is satisfied.
+
+        The watched triggers are checked first since their state is already
+        known, the others are evaluated concurrently until one result
+        decides the poll or ``evaluation_timeout`` expires.
+        """
+        with self._lock:
+            watched = [self._trigger_states[i] for i in sorted(self._watched)]
+        for result in watched:
+            if self._decided(result):
+                return self._mode == "any_of"
+
+        futures = {}
+        for i, trigger in enumerate(self._triggers):
+            if i in self._watched:
+                continue
+            future = self._pending.get(i)
+            if future is None or future.done():
+                future = executor.submit(trigger.evaluate)
+                self._pending[i] = future
+            futures[future] = i
+
+        poll_deadline = min(time.monotonic() + self._evaluation_timeout, deadline)
+        not_done = set(futures)
+        while not_done:
+            done, not_done = wait(
+                not_done,
+                timeout=max(poll_deadline - time.monotonic(), 0),
+                return_when=FIRST_COMPLETED,
+            )
+            if not done:
+                break
+            for future in done:
+                i = futures[future]
+                del self._pending[i]
+                try:
+                    result = bool(future.result())
+                except Exception as e:
+                    logging.error(f"trigger [{i}] evaluation failed: {e}")
+                    result = False
+                with self._lock:
+                    self._trigger_states[i] = result
+                if self._decided(result):
+                    return self._mode == "any_of"
+
+        for future in not_done:
+            logging.warning(
+                f"trigger [{futures[future]}] did not answer within "
+                f"{self._evaluation_timeout}s, counted as not satisfied"
+            )
+        if not_done:
+            return False
+        # no result decided the poll: all satisfied (all_of) or none (any_of)
+        return self._mode == "all_of"
+
     def wait_for_triggers(self) -> bool:
         """Polls triggers until conditions are met or timeout expires.
 
@@ -125,27 +257,39 @@ class TriggerManager:
             f"on_timeout={self._on_timeout}"
         )
         deadline = time.monotonic() + self._timeout
+        self._changed.clear()
+        self._start_watches()
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(self._max_workers, len(self._triggers))),
+            thread_name_prefix="trigger",
+        )
+        try:
+            while time.monotonic() < deadline:
+                self._changed.clear()
+                satisfied = self._poll(executor, deadline)
 
-        while time.monotonic() < deadline:
-            results = []
-            for i, trigger in enumerate(self._triggers):
-                result = trigger.evaluate()
-                self._trigger_states[i] = result
-                results.append(result)
-
-            logging.debug(f"trigger poll: {[r for r in results]}")
+                logging.debug(f"trigger poll: {list(self._trigger_states)}")
 
-            if self._mode == "all_of" and all(results):
-                logging.info("all trigger conditions satisfied")
-                return True
-            elif self._mode == "any_of" and any(results):
-                logging.info("at least one trigger condition satisfied")
-                return True
+                if satisfied:
+                    if self._mode == "all_of":
+                        logging.info("all trigger conditions satisfied")
+                    else:
+                        logging.info("at least one trigger condition satisfied")
+                    return True
 
-            remaining = deadline - time.monotonic()
-            if remaining <= 0:
-                break
-            time.sleep(min(self._interval, remaining))
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                if self._watched:
+                    # a state pushed by a watched trigger starts the next poll
+                    self._changed.wait(min(self._interval, remaining))
+                else:
+                    time.sleep(min(self._interval, remaining))
+        finally:
+            self._stop_watches()
+            # evaluations still running are abandoned, not waited for
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._pending.clear()
 
         logging.warning(
             f"triggers timed out after {self._timeout}s "
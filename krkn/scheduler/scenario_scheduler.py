@@ -0,0 +1,389 @@
+# Copyright 2025 The Krkn Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from krkn_lib.models.telemetry import ScenarioTelemetry
+
+# keys of a `chaos_scenarios` entry that carry scheduling metadata
+# instead of a scenario type
+SCHEDULING_KEYS = {"name", "depends_on", "exclusive_with", "concurrency_group"}
+
+DEFAULT_MAX_PARALLEL = 4
+DEFAULT_GROUP_LIMIT = 1
+# seconds between two polls of the run signal while entries are running
+DEFAULT_POLL_INTERVAL = 5
+
+
+def get_scenario_entry_type(entry: dict) -> str:
+    """
+    Returns the scenario type of a `chaos_scenarios` entry, ignoring the
+    scheduling keys that may be set next to it.
+
+    :param entry: a single item of `kraken.chaos_scenarios`
+    :return: the scenario type (e.g. `pod_disruption_scenarios`)
+    """
+    scenario_types = [k for k in entry.keys() if k not in SCHEDULING_KEYS]
+    if len(scenario_types) != 1:
+        raise ValueError(
+            "each chaos_scenarios entry must define exactly one scenario "
+            f"type, got {scenario_types}"
+        )
+    return scenario_types[0]
+
+
+def _as_list(value, key: str, name: str) -> list[str]:
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [value]
+    if not isinstance(value, list):
+        raise ValueError(
+            f"'{key}' of scenario entry '{name}' must be a string or a list, "
+            f"got {type(value).__name__}"
+        )
+    return [str(v) for v in value]
+
+
+@dataclass
+class ScheduledScenario:
+    """A `chaos_scenarios` entry with its scheduling constraints."""
+
+    name: str
+    scenario_type: str
+    scenarios: list
+    depends_on: list[str] = field(default_factory=list)
+    exclusive_with: list[str] = field(default_factory=list)
+    concurrency_group: Optional[str] = None
+
+    @staticmethod
+    def from_config(chaos_scenarios: list) -> list["ScheduledScenario"]:
+        """
+        Builds the scheduled entries from the `kraken.chaos_scenarios`
+        config. Entries without a `name` are named after their scenario
+        type, suffixed with their position if the type is repeated.
+
+        :param chaos_scenarios: the `kraken.chaos_scenarios` list
+        :return: the list of scheduled entries in config order
+        """
+        types = [
+            get_scenario_entry_type(entry)
+            for entry in chaos_scenarios
+            if isinstance(entry, dict)
+        ]
+        entries = []
+        for index, entry in enumerate(chaos_scenarios):
+            if not isinstance(entry, dict):
+                raise ValueError(
+                    f"chaos_scenarios entry {index} must be a dict, "
+                    f"got {type(entry).__name__}"
+                )
+            scenario_type = get_scenario_entry_type(entry)
+            name = entry.get("name")
+            if not name:
+                name = (
+                    scenario_type
+                    if types.count(scenario_type) == 1
+                    else f"{scenario_type}-{index}"
+                )
+            name = str(name)
+            group = entry.get("concurrency_group")
+            entries.append(
+                ScheduledScenario(
+                    name=name,
+                    scenario_type=scenario_type,
+                    scenarios=entry[scenario_type] or [],
+                    depends_on=_as_list(
+                        entry.get("depends_on"), "depends_on", name
+                    ),
+                    exclusive_with=_as_list(
+                        entry.get("exclusive_with"), "exclusive_with", name
+                    ),
+                    concurrency_group=str(group) if group else None,
+                )
+            )
+        return entries
+
+
+@dataclass
+class ScheduledResult:
+    """Outcome of a scheduled entry."""
+
+    entry: ScheduledScenario
+    failed_scenarios: list = field(default_factory=list)
+    scenario_telemetries: list[ScenarioTelemetry] = field(
+        default_factory=list
+    )
+    start_timestamp: float = 0.0
+    end_timestamp: float = 0.0
+    error: Optional[str] = None
+
+
+class ScenarioScheduler:
+    """
+    Runs `chaos_scenarios` entries on a bounded worker pool honouring
+    their scheduling constraints:
+
+    - `depends_on`: the entry starts only after the listed entries ended
+    - `exclusive_with`: the entry never overlaps with the listed entries
+      (the relation is symmetric)
+    - `concurrency_group`: at most `group_limits[group]` entries of the
+      same group (default 1) run at the same time
+
+    Entries of the same scenario type never overlap because the rollback
+    version files are keyed by run uuid and scenario type. Among the
+    entries that can start, config order is preserved.
+    """
+
+    def __init__(
+        self,
+        entries: list[ScheduledScenario],
+        max_parallel: int = DEFAULT_MAX_PARALLEL,
+        group_limits: Optional[dict[str, int]] = None,
+    ):
+        try:
+            self._max_parallel = int(max_parallel)
+        except (TypeError, ValueError):
+            raise ValueError(
+                f"max_parallel must be an integer, got {max_parallel!r}"
+            )
+        if self._max_parallel < 1:
+            raise ValueError(
+                f"max_parallel must be at least 1, got {self._max_parallel}"
+            )
+
+        self._group_limits: dict[str, int] = {}
+        for group, limit in (group_limits or {}).items():
+            if not isinstance(limit, int) or limit < 1:
+                raise ValueError(
+                    f"concurrency group '{group}' limit must be a positive "
+                    f"integer, got {limit!r}"
+                )
+            self._group_limits[str(group)] = limit
+
+        self._entries = entries
+        self._validate()
+
+    @property
+    def entries(self) -> list[ScheduledScenario]:
+        return self._entries
+
+    def _validate(self):
+        names = set()
+        for entry in self._entries:
+            if entry.name in names:
+                raise ValueError(
+                    f"duplicate chaos_scenarios entry name '{entry.name}'"
+                )
+            names.add(entry.name)
+
+        for entry in self._entries:
+            for key, refs in (
+                ("depends_on", entry.depends_on),
+                ("exclusive_with", entry.exclusive_with),
+            ):
+                for ref in refs:
+                    if ref == entry.name:
+                        raise ValueError(
+                            f"scenario entry '{entry.name}' references "
+                            f"itself in '{key}'"
+                        )
+                    if ref not in names:
+                        raise ValueError(
+                            f"scenario entry '{entry.name}' references "
+                            f"unknown entry '{ref}' in '{key}'"
+                        )
+
+        # Kahn's algorithm, whatever is left unsorted is part of a cycle
+        in_degree = {e.name: len(set(e.depends_on)) for e in self._entries}
+        dependants: dict[str, list[str]] = {e.name: [] for e in self._entries}
+        for entry in self._entries:
+            for dependency in set(entry.depends_on):
+                dependants[dependency].append(entry.name)
+        ready = [name for name, degree in in_degree.items() if degree == 0]
+        sorted_count = 0
+        while ready:
+            name = ready.pop()
+            sorted_count += 1
+            for dependant in dependants[name]:
+                in_degree[dependant] -= 1
+                if in_degree[dependant] == 0:
+                    ready.append(dependant)
+        if sorted_count != len(self._entries):
+            cycle = sorted(n for n, d in in_degree.items() if d > 0)
+            raise ValueError(
+                f"dependency cycle between scenario entries: {cycle}"
+            )
+
+    def _can_start(
+        self,
+        entry: ScheduledScenario,
+        completed: set[str],
+        running: list[ScheduledScenario],
+    ) -> bool:
+        if any(dep not in completed for dep in entry.depends_on):
+            return False
+        for other in running:
+            if other.scenario_type == entry.scenario_type:
+                return False
+            if (
+                other.name in entry.exclusive_with
+                or entry.name in other.exclusive_with
+            ):
+                return False
+        if entry.concurrency_group:
+            limit = self._group_limits.get(
+                entry.concurrency_group, DEFAULT_GROUP_LIMIT
+            )
+            in_group = sum(
+                1
+                for other in running
+                if other.concurrency_group == entry.concurrency_group
+            )
+            if in_group >= limit:
+                return False
+        return True
+
+    @staticmethod
+    def _run_entry(
+        run_entry: Callable[[ScheduledScenario], tuple[list, list]],
+        entry: ScheduledScenario,
+    ) -> ScheduledResult:
+        # timed in the worker, the calling thread may see the completion late
+        result = ScheduledResult(entry=entry, start_timestamp=time.time())
+        try:
+            (
+                result.failed_scenarios,
+                result.scenario_telemetries,
+            ) = run_entry(entry)
+        except Exception as e:
+            logging.error(
+                f"scheduler: scenario entry '{entry.name}' "
+                f"raised an exception: {e}"
+            )
+            result.failed_scenarios = list(entry.scenarios)
+            result.error = str(e)
+        result.end_timestamp = time.time()
+        return result
+
+    def run(
+        self,
+        run_entry: Callable[[ScheduledScenario], tuple[list, list]],
+        on_complete: Optional[Callable[[ScheduledResult], bool]] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+        should_pause: Optional[Callable[[], bool]] = None,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ) -> list[ScheduledResult]:
+        """
+        Runs all the entries and blocks until they are completed.
+
+        :param run_entry: runs an entry in a worker thread and returns the
+            `(failed_scenarios, scenario_telemetries)` tuple of
+            `AbstractScenarioPlugin.run_scenarios`
+        :param on_complete: called from the calling thread every time an
+            entry ends; returning False stops the scheduling of new entries
+        :param should_stop: polled from the calling thread every
+            `poll_interval` seconds and when an entry ends; returning True
+            stops the scheduling of new entries
+        :param should_pause: polled after `should_stop`; while it returns
+            True no new entry is started, the running ones are still
+            completed and passed to `on_complete`. Must not block.
+        :param poll_interval: maximum time in seconds between two polls of
+            `should_stop` and `should_pause`
+        :return: the results of the entries that were run, in completion
+            order
+        """
+        pending = list(self._entries)
+        running: dict[Future, ScheduledScenario] = {}
+        completed: set[str] = set()
+        results: list[ScheduledResult] = []
+        stopped = False
+        paused = False
+        polling = should_stop is not None or should_pause is not None
+
+        with ThreadPoolExecutor(
+            max_workers=self._max_parallel,
+            thread_name_prefix="krkn-scenario",
+        ) as executor:
+            while pending or running:
+                if not stopped and should_stop is not None and should_stop():
+                    logging.info(
+                        "scheduler stopped, waiting for %d running scenario "
+                        "entries to complete",
+                        len(running),
+                    )
+                    stopped = True
+
+                if not stopped and should_pause is not None:
+                    if should_pause() != paused:
+                        paused = not paused
+                        logging.info(
+                            "scheduler %s",
+                            "paused, no new scenario entries will start"
+                            if paused
+                            else "resumed",
+                        )
+
+                if not stopped and not paused:
+                    for entry in list(pending):
+                        if len(running) >= self._max_parallel:
+                            break
+                        if not self._can_start(
+                            entry, completed, list(running.values())
+                        ):
+                            continue
+                        pending.remove(entry)
+                        logging.info(
+                            f"scheduler: starting '{entry.name}' "
+                            f"({entry.scenario_type}), "
+                            f"{len(running) + 1}/{self._max_parallel} slots used"
+                        )
+                        future = executor.submit(self._run_entry, run_entry, entry)
+                        running[future] = entry
+
+                if not running:
+                    if paused and not stopped:
+                        time.sleep(poll_interval)
+                        continue
+                    if pending and not stopped:
+                        # unreachable after validation, guards against
+                        # an endless loop
+                        logging.error(
+                            "scheduler: no runnable entries left, skipping "
+                            f"{[e.name for e in pending]}"
+                        )
+                    break
+
+                done, _ = wait(
+                    running.keys(),
+                    timeout=poll_interval if polling and not stopped else None,
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    entry = running.pop(future)
+                    result = future.result()
+                    completed.add(entry.name)
+                    results.append(result)
+                    logging.info(
+                        f"scheduler: '{entry.name}' completed in "
+                        f"{result.end_timestamp - result.start_timestamp:.1f}s "
+                        f"({len(result.failed_scenarios)} failed)"
+                    )
+                    if on_complete is not None and on_complete(result) is False:
+                        stopped = True
+
+        return results
@@ -0,0 +1,21 @@
+# Copyright 2025 The Krkn Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""krkn.stability package public interface."""
+
+from .abstract_stability_check import AbstractStabilityCheck  # noqa: F401
+from .node_readiness_check import NodeReadinessCheck  # noqa: F401
+from .pod_readiness_check import PodReadinessCheck  # noqa: F401
+from .prometheus_probe_check import PrometheusProbeCheck  # noqa: F401
+from .stability_detector import StabilityDetector  # noqa: F401
@@ -0,0 +1,46 @@
+# Copyright 2025 The Krkn Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from krkn_lib.models.telemetry import ScenarioTelemetry
+
+
+class AbstractStabilityCheck(ABC):
+    """Base class for the conditions of the cluster stability gate."""
+
+    def snapshot(self, scenario_config: Optional[dict] = None):
+        """
+        Records the pre-chaos state the check compares against, it is
+        called before the scenario is executed.
+
+        :param scenario_config: the parsed config of the scenario about
+            to be executed (optional)
+        """
+        pass
+
+    @abstractmethod
+    def is_stable(self, scenario_telemetry: ScenarioTelemetry) -> bool:
+        """
+        Returns True if the condition is recovered after the scenario.
+
+        :param scenario_telemetry: the `ScenarioTelemetry` of the scenario
+            that has just been executed
+        """
+        pass
+
+    @abstractmethod
+    def describe(self) -> str:
+        """Human-readable description for logging."""
+        pass
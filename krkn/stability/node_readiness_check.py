@@ -0,0 +1,70 @@
+# Copyright 2025 The Krkn Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+from typing import Optional
+
+from krkn_lib.k8s import KrknKubernetes
+from krkn_lib.models.telemetry import ScenarioTelemetry
+
+from krkn.stability.abstract_stability_check import AbstractStabilityCheck
+
+
+class NodeReadinessCheck(AbstractStabilityCheck):
+    """Stable when no node is NotReady, besides the ones that already
+    were before the scenario."""
+
+    def __init__(
+        self, kubecli: KrknKubernetes, label_selector: Optional[str] = None
+    ):
+        self._kubecli = kubecli
+        self._label_selector = label_selector
+        self._baseline: set[str] = set()
+
+    def _not_ready_nodes(self) -> set[str]:
+        kwargs = {"limit": self._kubecli.request_chunk_size}
+        if self._label_selector:
+            kwargs["label_selector"] = self._label_selector
+        pages = self._kubecli.list_continue_helper(
+            self._kubecli.cli.list_node, **kwargs
+        )
+        not_ready = set()
+        for page in pages:
+            for node in page.items:
+                ready = False
+                for condition in node.status.conditions or []:
+                    if condition.type == "Ready":
+                        ready = condition.status == "True"
+                        break
+                if not ready:
+                    not_ready.add(node.metadata.name)
+        return not_ready
+
+    def snapshot(self, scenario_config: Optional[dict] = None):
+        self._baseline = self._not_ready_nodes()
+        if self._baseline:
+            logging.warning(
+                f"nodes already NotReady before chaos: "
+                f"{sorted(self._baseline)}"
+            )
+
+    def is_stable(self, scenario_telemetry: ScenarioTelemetry) -> bool:
+        not_ready = self._not_ready_nodes() - self._baseline
+        if not_ready:
+            logging.debug(f"nodes NotReady: {sorted(not_ready)}")
+            return False
+        return True
+
+    def describe(self) -> str:
+        selector = self._label_selector or "all nodes"
+        return f"node readiness check ({selector})"
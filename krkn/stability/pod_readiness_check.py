@@ -0,0 +1,165 @@
+# Copyright 2025 The Krkn Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+import re
+from collections import Counter
+from typing import Optional
+
+from krkn_lib.k8s import KrknKubernetes
+from krkn_lib.models.telemetry import ScenarioTelemetry
+
+from krkn.cache.lookups import pods_informer
+from krkn.stability.abstract_stability_check import AbstractStabilityCheck
+
+# scenario config keys holding the namespaces (or namespace regexes) targeted
+NAMESPACE_KEYS = ("namespace", "namespaces", "namespace_pattern")
+
+
+def _is_pod_ready(pod) -> bool:
+    if not pod.status or pod.status.phase != "Running":
+        return False
+    for condition in pod.status.conditions or []:
+        if condition.type == "Ready":
+            return condition.status == "True"
+    return False
+
+
+def _is_cached_pod_ready(pod: dict) -> bool:
+    status = pod.get("status") or {}
+    if status.get("phase") != "Running":
+        return False
+    for condition in status.get("conditions") or []:
+        if condition.get("type") == "Ready":
+            return condition.get("status") == "True"
+    return False
+
+
+def _namespace_regex(pattern: str) -> re.Pattern:
+    try:
+        return re.compile(pattern)
+    except re.error:
+        return re.compile(re.escape(pattern))
+
+
+def _namespace_values(config) -> set[str]:
+    values = set()
+    if isinstance(config, dict):
+        for key, value in config.items():
+            if key in NAMESPACE_KEYS:
+                items = value if isinstance(value, list) else [value]
+                values.update(item for item in items if isinstance(item, str) and item)
+            else:
+                values.update(_namespace_values(value))
+    elif isinstance(config, list):
+        for item in config:
+            values.update(_namespace_values(item))
+    return values
+
+
+class PodReadinessCheck(AbstractStabilityCheck):
+    """Stable when every namespace has at least its pre-chaos ready pods.
+
+    The snapshot covers the configured ``namespaces``, or else the
+    namespaces targeted by the scenario config (``namespace``,
+    ``namespaces`` and ``namespace_pattern`` keys), or every namespace
+    when the pods are served by the informer cache. The namespaces checked
+    are the configured ones, or else the namespaces of the pods the
+    scenario reported as affected, or else the snapshot ones.
+    """
+
+    def __init__(
+        self, kubecli: KrknKubernetes, namespaces: Optional[list[str]] = None
+    ):
+        self._kubecli = kubecli
+        self._namespaces = namespaces or []
+        self._baseline: Optional[Counter] = None
+        self._snapshot_namespaces: list[str] = []
+
+    def _scenario_namespaces(self, scenario_config: Optional[dict]) -> list[str]:
+        patterns = [_namespace_regex(value) for value in _namespace_values(scenario_config)]
+        if not patterns:
+            return []
+        return sorted(
+            namespace
+            for namespace in self._kubecli.list_namespaces()
+            if any(pattern.fullmatch(namespace) for pattern in patterns)
+        )
+
+    def _ready_pods(self, namespaces: Optional[list[str]]) -> Counter:
+        """
+        Counts the ready pods per namespace, of every namespace if
+        namespaces is None (only served by the informer cache).
+        """
+        ready = Counter()
+        informer = pods_informer(self._kubecli)
+        if informer is not None:
+            scope = set(namespaces) if namespaces is not None else None
+            for pod in informer.list(predicate=_is_cached_pod_ready):
+                namespace = pod["metadata"].get("namespace")
+                if scope is None or namespace in scope:
+                    ready[namespace] += 1
+            return ready
+        for namespace in namespaces or []:
+            for page in self._kubecli.get_all_pod_info(namespace):
+                for pod in page.items:
+                    if _is_pod_ready(pod):
+                        ready[pod.metadata.namespace] += 1
+        return ready
+
+    def snapshot(self, scenario_config: Optional[dict] = None):
+        namespaces = self._namespaces or self._scenario_namespaces(scenario_config)
+        self._snapshot_namespaces = namespaces
+        if not namespaces and pods_informer(self._kubecli) is None:
+            logging.debug(
+                "pod readiness snapshot: no target namespace in the config "
+                "or the scenario, no pod is compared"
+            )
+            self._baseline = None
+            return
+        self._baseline = self._ready_pods(namespaces or None)
+        logging.debug(
+            f"pod readiness snapshot: {sum(self._baseline.values())} ready "
+            f"pods in {len(self._baseline)} namespaces"
+        )
+
+    def _target_namespaces(self, scenario_telemetry: ScenarioTelemetry):
+        if self._namespaces:
+            return self._namespaces
+        affected = getattr(scenario_telemetry, "affected_pods", None)
+        namespaces = set()
+        if affected:
+            for pod in affected.recovered + affected.unrecovered:
+                namespaces.add(pod.namespace)
+        if namespaces:
+            return sorted(namespaces)
+        return self._snapshot_namespaces or list(self._baseline.keys())
+
+    def is_stable(self, scenario_telemetry: ScenarioTelemetry) -> bool:
+        if self._baseline is None:
+            # nothing to compare with, the gate falls back to the timer
+            return False
+        namespaces = self._target_namespaces(scenario_telemetry)
+        current = self._ready_pods(namespaces)
+        for namespace in namespaces:
+            if current[namespace] < self._baseline[namespace]:
+                logging.debug(
+                    f"namespace {namespace}: {current[namespace]}/"
+                    f"{self._baseline[namespace]} pods ready"
+                )
+                return False
+        return True
+
+    def describe(self) -> str:
+        scope = ", ".join(self._namespaces) if self._namespaces else "affected"
+        return f"pod readiness check (namespaces: {scope})"
@@ -0,0 +1,73 @@
+# Copyright 2025 The Krkn Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+
+from krkn_lib.models.telemetry import ScenarioTelemetry
+
+from krkn.stability.abstract_stability_check import AbstractStabilityCheck
+
+PROM_REQUEST_TIMEOUT_SECONDS = 30
+
+
+class PrometheusProbeCheck(AbstractStabilityCheck):
+    """Stable when none of the PromQL probes returns a sample, e.g. a
+    query selecting the firing alerts or the unavailable replicas."""
+
+    def __init__(
+        self,
+        queries: list[str],
+        prometheus_url: str,
+        prometheus_bearer_token: str = None,
+    ):
+        if not queries:
+            raise ValueError("prometheus probe check requires queries")
+        if not prometheus_url:
+            raise ValueError(
+                "prometheus probe check requires a prometheus_url"
+            )
+        self._queries = queries
+        self._prometheus_url = prometheus_url
+        self._prometheus_bearer_token = prometheus_bearer_token or None
+        self._prom_client = None
+
+    def _get_prom_client(self):
+        if self._prom_client is None:
+            # Lazy import: avoid pulling prometheus_api_client/pandas at
+            # module import time.
+            from krkn_lib.prometheus.krkn_prometheus import KrknPrometheus
+
+            self._prom_client = KrknPrometheus(
+                self._prometheus_url,
+                self._prometheus_bearer_token,
+                timeout=PROM_REQUEST_TIMEOUT_SECONDS,
+            )
+        return self._prom_client
+
+    def is_stable(self, scenario_telemetry: ScenarioTelemetry) -> bool:
+        for query in self._queries:
+            try:
+                result = self._get_prom_client().process_query(query)
+            except Exception as e:
+                logging.warning(f"prometheus probe query failed: {e}")
+                return False
+            if result:
+                logging.debug(
+                    f"prometheus probe not quiet: query={query!r} "
+                    f"result_count={len(result)}"
+                )
+                return False
+        return True
+
+    def describe(self) -> str:
+        return f"prometheus probe check ({len(self._queries)} queries)"
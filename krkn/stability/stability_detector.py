@@ -0,0 +1,193 @@
+# Copyright 2025 The Krkn Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+import time
+from typing import Optional
+
+from krkn_lib.k8s import KrknKubernetes
+from krkn_lib.models.telemetry import ScenarioTelemetry
+from krkn_lib.utils.functions import get_yaml_item_value
+
+from krkn.stability.abstract_stability_check import AbstractStabilityCheck
+from krkn.stability.node_readiness_check import NodeReadinessCheck
+from krkn.stability.pod_readiness_check import PodReadinessCheck
+from krkn.stability.prometheus_probe_check import PrometheusProbeCheck
+
+DEFAULT_INTERVAL = 5
+DEFAULT_CONSECUTIVE_CHECKS = 2
+
+
+class StabilityDetector:
+    """
+    Adaptive replacement of the `wait_duration` soak: polls a set of
+    stability checks and returns as soon as all of them pass for
+    `consecutive_checks` polls in a row, `wait_duration` being the upper
+    bound.
+    """
+
+    def __init__(
+        self,
+        checks: list[AbstractStabilityCheck],
+        interval: float = DEFAULT_INTERVAL,
+        consecutive_checks: int = DEFAULT_CONSECUTIVE_CHECKS,
+    ):
+        if not checks:
+            raise ValueError("stability gate requires at least one check")
+        try:
+            self._interval = float(interval)
+            self._consecutive_checks = int(consecutive_checks)
+        except (TypeError, ValueError):
+            raise ValueError(
+                f"interval and consecutive_checks must be numeric, "
+                f"got interval={interval!r}, "
+                f"consecutive_checks={consecutive_checks!r}"
+            )
+        if self._interval <= 0:
+            raise ValueError(f"interval must be positive, got {interval}")
+        if self._consecutive_checks < 1:
+            raise ValueError(
+                f"consecutive_checks must be at least 1, "
+                f"got {consecutive_checks}"
+            )
+        self._checks = checks
+
+    @staticmethod
+    def from_config(
+        gate_config: dict,
+        kubecli: KrknKubernetes,
+        performance_monitoring: Optional[dict] = None,
+    ) -> Optional["StabilityDetector"]:
+        """
+        Builds the detector from the `tunings.stability_gate` config.
+
+        :param gate_config: the `tunings.stability_gate` section
+        :param kubecli: the krkn-lib kubernetes client
+        :param performance_monitoring: the `performance_monitoring`
+            section, used for the Prometheus connection details
+        :return: the detector, None if the gate is disabled
+        """
+        if not gate_config or not get_yaml_item_value(
+            gate_config, "enabled", False
+        ):
+            return None
+        checks: list[AbstractStabilityCheck] = []
+        if get_yaml_item_value(gate_config, "check_pods", True):
+            checks.append(
+                PodReadinessCheck(
+                    kubecli, get_yaml_item_value(gate_config, "namespaces", [])
+                )
+            )
+        if get_yaml_item_value(gate_config, "check_nodes", True):
+            checks.append(
+                NodeReadinessCheck(
+                    kubecli,
+                    get_yaml_item_value(
+                        gate_config, "node_label_selector", None
+                    ),
+                )
+            )
+        queries = get_yaml_item_value(gate_config, "prometheus_queries", [])
+        if queries:
+            performance_monitoring = performance_monitoring or {}
+            checks.append(
+                PrometheusProbeCheck(
+                    queries,
+                    performance_monitoring.get("prometheus_url"),
+                    performance_monitoring.get("prometheus_bearer_token"),
+                )
+            )
+        return StabilityDetector(
+            checks,
+            interval=get_yaml_item_value(
+                gate_config, "interval", DEFAULT_INTERVAL
+            ),
+            consecutive_checks=get_yaml_item_value(
+                gate_config, "consecutive_checks", DEFAULT_CONSECUTIVE_CHECKS
+            ),
+        )
+
+    def snapshot(self, scenario_config: Optional[dict] = None):
+        """
+        Records the pre-chaos state of all the checks.
+
+        :param scenario_config: the parsed config of the scenario about
+            to be executed, scopes the snapshot to its targets (optional)
+        """
+        for check in self._checks:
+            try:
+                check.snapshot(scenario_config)
+            except Exception as e:
+                logging.warning(
+                    f"failed to snapshot {check.describe()}: {e}"
+                )
+
+    def _is_stable(self, scenario_telemetry: ScenarioTelemetry) -> bool:
+        for check in self._checks:
+            try:
+                if not check.is_stable(scenario_telemetry):
+                    return False
+            except Exception as e:
+                logging.warning(f"{check.describe()} failed: {e}")
+                return False
+        return True
+
+    def wait_for_stable(
+        self, timeout: float, scenario_telemetry: ScenarioTelemetry
+    ) -> Optional[float]:
+        """
+        Blocks until the cluster is stable or the timeout expires.
+
+        :param timeout: the upper bound in seconds (`wait_duration`)
+        :param scenario_telemetry: the `ScenarioTelemetry` of the scenario
+            that has just been executed
+        :return: the seconds the cluster took to become stable, None if
+            it did not within the timeout
+        """
+        start = time.monotonic()
+        deadline = start + timeout
+        stable_since = None
+        passed = 0
+        while True:
+            now = time.monotonic()
+            if self._is_stable(scenario_telemetry):
+                if stable_since is None:
+                    stable_since = now
+                passed += 1
+                if passed >= self._consecutive_checks:
+                    time_to_stable = stable_since - start
+                    logging.info(
+                        f"cluster stable after {time_to_stable:.1f}s "
+                        f"(upper bound {timeout}s)"
+                    )
+                    return time_to_stable
+            else:
+                stable_since = None
+                passed = 0
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(self._interval, remaining))
+
+        logging.warning(
+            f"cluster not stable after {timeout}s: "
+            f"{'; '.join(c.describe() for c in self._checks)}"
+        )
+        return None
+
+    def describe(self) -> str:
+        return (
+            f"StabilityDetector(interval={self._interval}s, "
+            f"consecutive_checks={self._consecutive_checks}, "
+            f"checks=[{', '.join(c.describe() for c in self._checks)}])"
+        )
@@ -0,0 +1,100 @@
+# Copyright 2025 The Krkn Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable, Optional
+
+
+class PostScenarioCollector:
+    """
+    Runs the post scenario collection work (OCP logs, cluster events)
+    so that it overlaps with the next scenario instead of delaying it.
+
+    Tasks are executed by a single background worker in submission order,
+    because the collectors of consecutive scenarios write to the same
+    archive files. When `background` is False the tasks run inline, which
+    restores the sequential behaviour. Errors are logged and never
+    propagated, as it happens for the inline collection.
+
+    A single collector is owned by the whole run and drained once at
+    shutdown, tasks can be submitted from the scheduler worker threads.
+    """
+
+    def __init__(self, background: bool = True):
+        """
+        Initialize the collector.
+
+        Args:
+            background: run the tasks in a background worker (default: True)
+        """
+        self._executor: Optional[ThreadPoolExecutor] = None
+        if background:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="krkn-collector"
+            )
+        self._pending: list[Future] = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _run_task(description: str, task: Callable, *args, **kwargs):
+        start = time.monotonic()
+        try:
+            task(*args, **kwargs)
+        except Exception as e:
+            logging.error(f"failed to {description}: {e}")
+            return
+        logging.debug(
+            f"post scenario task '{description}' completed in "
+            f"{time.monotonic() - start:.1f}s"
+        )
+
+    def submit(self, description: str, task: Callable, *args, **kwargs):
+        """
+        Schedules a collection task.
+
+        Args:
+            description: what the task does, used in the error message
+                (e.g. "collect OCP logs for scenario 'etcd.yml'")
+            task: the callable to run with the given args and kwargs
+        """
+        if self._executor is None:
+            self._run_task(description, task, *args, **kwargs)
+            return
+        future = self._executor.submit(
+            self._run_task, description, task, *args, **kwargs
+        )
+        with self._lock:
+            # daemon mode runs submit tasks forever, only keep the pending ones
+            self._pending = [f for f in self._pending if not f.done()]
+            self._pending.append(future)
+
+    def drain(self):
+        """
+        Blocks until all the submitted tasks are completed and releases
+        the background worker. The collector cannot be reused afterwards.
+        """
+        if self._executor is None:
+            return
+        with self._lock:
+            pending, self._pending = self._pending, []
+        not_done = [f for f in pending if not f.done()]
+        if not_done:
+            logging.info(
+                f"waiting for {len(not_done)} post scenario collection "
+                f"tasks to complete"
+            )
+            wait(not_done)
+        self._executor.shutdown(wait=True)
@@ -15,6 +15,7 @@
 from .TeeLogHandler import TeeLogHandler
 from .ErrorLog import ErrorLog
 from .ErrorCollectionHandler import ErrorCollectionHandler
+from .PostScenarioCollector import PostScenarioCollector
 from .functions import (
     populate_cluster_events,
     collect_and_put_ocp_logs,
@@ -0,0 +1,147 @@
+# Copyright 2026 The Krkn Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Mergeable latency histograms, shared by the HTTP load scenario and the
+HTTP health checks.
+
+Percentiles of several load pods can't be combined from the percentiles
+of every pod, the pods report instead the latency histogram of Vegeta
+(the `buckets` field of the JSON report, bucket lower bound in
+nanoseconds -> count) which are summed into the cluster-wide histogram
+the quantiles are computed from.
+"""
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+# quantiles reported by Vegeta, with their name in the JSON report
+QUANTILES = {"50th": 0.5, "90th": 0.9, "95th": 0.95, "99th": 0.99}
+
+
+def log_buckets(
+    min_latency: float = 1e5, max_latency: float = 6e10, per_decade: int = 10
+) -> List[int]:
+    """
+    Log-spaced bucket lower bounds (relative error of 1/`per_decade`
+    decade) the load pods can be configured with, e.g. `vegeta report
+    -type=json -buckets [...]`.
+
+    :param min_latency: upper bound of the first bucket in nanoseconds
+    :param max_latency: lower bound of the last bucket in nanoseconds
+    :param per_decade: number of buckets per decade
+    :return: the bucket lower bounds in nanoseconds, starting with 0
+    """
+    decades = np.log10(max_latency) - np.log10(min_latency)
+    bounds = np.logspace(
+        np.log10(min_latency),
+        np.log10(max_latency),
+        int(round(decades * per_decade)) + 1,
+    )
+    return [0] + [int(b) for b in np.unique(np.round(bounds))]
+
+
+class LatencyHistogram:
+    """
+    Latency histogram with the bucket lower bounds in nanoseconds, the
+    last bucket being unbounded.
+    """
+
+    def __init__(self, bounds: Sequence[int], counts: Sequence[int]):
+        bounds = np.asarray(bounds, dtype=np.int64)
+        counts = np.asarray(counts, dtype=np.int64)
+        if bounds.shape != counts.shape:
+            raise ValueError("bounds and counts must have the same length")
+        order = np.argsort(bounds, kind="stable")
+        self.bounds = bounds[order]
+        self.counts = counts[order]
+
+    @classmethod
+    def empty(cls, bounds: Sequence[int]) -> "LatencyHistogram":
+        """
+        Builds a histogram without any sample, filled with `record`.
+        """
+        return cls(bounds, np.zeros(len(bounds), dtype=np.int64))
+
+    @classmethod
+    def from_vegeta(cls, buckets: Dict[str, int]) -> "LatencyHistogram":
+        """
+        Builds the histogram from the `buckets` of a Vegeta JSON report.
+        """
+        bounds = [int(bound) for bound in buckets]
+        return cls(bounds, list(buckets.values()))
+
+    @classmethod
+    def merge(cls, histograms: List["LatencyHistogram"]) -> "LatencyHistogram":
+        """
+        Sums the histograms, the result is exact when the histograms share
+        their buckets (otherwise the counts are kept in their bucket lower
+        bound).
+        """
+        if not histograms:
+            return cls([], [])
+        bounds = np.unique(np.concatenate([h.bounds for h in histograms]))
+        counts = np.zeros(len(bounds), dtype=np.int64)
+        for histogram in histograms:
+            np.add.at(counts, np.searchsorted(bounds, histogram.bounds), histogram.counts)
+        return cls(bounds, counts)
+
+    def record(self, latency: float) -> None:
+        """
+        Counts a sample in its bucket, the latencies under the first bound
+        are counted in the first bucket.
+
+        :param latency: the latency in nanoseconds
+        """
+        bucket = int(np.searchsorted(self.bounds, latency, side="right")) - 1
+        self.counts[max(bucket, 0)] += 1
+
+    @property
+    def total(self) -> int:
+        return int(self.counts.sum())
+
+    def quantiles(
+        self, quantiles: Sequence[float], max_latency: Optional[float] = None
+    ) -> np.ndarray:
+        """
+        Computes the quantiles, linearly interpolated inside their bucket.
+
+        :param quantiles: the quantiles, between 0 and 1
+        :param max_latency: maximum latency observed, upper bound of the
+            last bucket (its lower bound is used otherwise)
+        :return: the latencies in nanoseconds
+        """
+        quantiles = np.asarray(quantiles, dtype=float)
+        if self.total == 0:
+            return np.zeros(len(quantiles))
+        upper = np.append(self.bounds[1:], self.bounds[-1]).astype(float)
+        if max_latency is not None:
+            upper[-1] = max(max_latency, self.bounds[-1])
+        cumulative = np.cumsum(self.counts)
+        # a rank of 0 falls in the first non empty bucket
+        ranks = np.maximum(np.clip(quantiles, 0, 1) * self.total, np.nextafter(0, 1))
+        index = np.minimum(
+            np.searchsorted(cumulative, ranks, side="left"), len(cumulative) - 1
+        )
+        below = cumulative[index] - self.counts[index]
+        fraction = np.clip(
+            (ranks - below) / np.maximum(self.counts[index], 1), 0, 1
+        )
+        lower = self.bounds[index].astype(float)
+        return lower + fraction * (upper[index] - lower)
+
+    def to_dict(self) -> Dict[str, int]:
+        """
+        Returns the histogram in the format of the Vegeta JSON report.
+        """
+        return {str(b): int(c) for b, c in zip(self.bounds, self.counts)}
@@ -61,7 +61,7 @@ from krkn_lib.models.k8s import ResiliencyReport
 from krkn_lib.utils import SafeLogger
 from krkn_lib.utils.functions import get_yaml_item_value
 
-from krkn.utils import TeeLogHandler, ErrorCollectionHandler, validate_junit_options, write_junit_file
+from krkn.utils import TeeLogHandler, ErrorCollectionHandler, PostScenarioCollector, validate_junit_options, write_junit_file
 from krkn.health_checks import HealthCheckFactory
 from krkn.scenario_plugins.scenario_plugin_factory import (
     ScenarioPluginFactory,
@@ -74,6 +74,14 @@ from krkn.rollback.command import (
 )
 from krkn.summarized_reports.transform import build_chaos_report, build_chaos_report_pdf
 from krkn.scenario_plugins.triggers.trigger_manager import TriggerManager
+from krkn.scheduler import (
+    ScenarioScheduler,
+    ScheduledScenario,
+    get_scenario_entry_type,
+)
+from krkn.scheduler.scenario_scheduler import DEFAULT_MAX_PARALLEL
+from krkn.rollback.signal import signal_handler
+from krkn.cache import informer_cache
 
 # removes TripleDES warning
 import warnings
@@ -127,7 +135,13 @@ def main(options, command: Optional[str], out: Optional[dict] = None) -> int:
                 False
             ),
             versions_directory=rollback_versions_dir,
+            retention_days=get_yaml_item_value(
+                config["kraken"],
+                "rollback_retention_days",
+                0
+            ),
         )
+        RollbackConfig.compact_rollback_versions()
         signal_address = get_yaml_item_value(
             config["kraken"], "signal_address", "0.0.0.0"
         )
@@ -159,8 +173,16 @@ def main(options, command: Optional[str], out: Optional[dict] = None) -> int:
             )
             chaos_scenarios = []
         wait_duration = get_yaml_item_value(config["tunings"], "wait_duration", 60)
+        async_collection = get_yaml_item_value(
+            config["tunings"], "async_collection", True
+        )
         iterations = get_yaml_item_value(config["tunings"], "iterations", 1)
         daemon_mode = get_yaml_item_value(config["tunings"], "daemon_mode", False)
+        scheduler_config = get_yaml_item_value(config["tunings"], "scheduler", {})
+        scheduler_enabled = get_yaml_item_value(scheduler_config, "enabled", False)
+        informer_cache.configure(
+            get_yaml_item_value(config["tunings"], "informer_cache", {})
+        )
 
         prometheus_url = config["performance_monitoring"].get("prometheus_url")
         prometheus_bearer_token = config["performance_monitoring"].get("prometheus_bearer_token")
@@ -203,6 +225,9 @@ def main(options, command: Optional[str], out: Optional[dict] = None) -> int:
 
         alert_profile = config["performance_monitoring"].get("alert_profile")
         metrics_profile = config["performance_monitoring"].get("metrics_profile")
+        metrics_export = get_yaml_item_value(
+            config["performance_monitoring"], "metrics_export", {}
+        )
         check_critical_alerts = get_yaml_item_value(
             config["performance_monitoring"], "check_critical_alerts", False
         )
@@ -351,7 +376,10 @@ def main(options, command: Optional[str], out: Optional[dict] = None) -> int:
                 logging.error("Prometheus connectivity test failed: %s. Disabling resiliency features as Prometheus is required for SLO evaluation.", prom_exc)
                 run_mode = "disabled"
         resiliency_alerts = get_yaml_item_value(resiliency_config, "resiliency_file", get_yaml_item_value(config['performance_monitoring'],"alert_profile", "config/alerts.yaml"))
-        resiliency_obj = Resiliency(resiliency_alerts) if run_mode != "disabled" else None  # Initialize resiliency orchestrator
+        resiliency_obj = Resiliency(
+            resiliency_alerts,
+            slo_evaluation=get_yaml_item_value(resiliency_config, "slo_evaluation", {}),
+        ) if run_mode != "disabled" else None  # Initialize resiliency orchestrator
         logging.info("Server URL: %s" % kubecli.get_host())
 
         if command == "list-rollback":
@@ -405,9 +433,10 @@ def main(options, command: Optional[str], out: Optional[dict] = None) -> int:
         scenario_plugin_factory = ScenarioPluginFactory()
         health_check_factory = HealthCheckFactory()
 
-        # Log loaded/failed plugin counts (INFO)
+        # Log registered/failed plugin counts (INFO), the plugins of the
+        # manifest are only imported when the run uses them
         logging.info(
-            f"📣 `ScenarioPluginFactory`: {len(scenario_plugin_factory.loaded_plugins)} scenario types loaded"
+            f"📣 `ScenarioPluginFactory`: {len(scenario_plugin_factory.loaded_plugins)} scenario types registered"
             f" ({len(scenario_plugin_factory.failed_plugins)} failed)"
         )
         if len(scenario_plugin_factory.failed_plugins) > 0:
@@ -419,8 +448,7 @@ def main(options, command: Optional[str], out: Optional[dict] = None) -> int:
         # Full plugin registry at DEBUG for troubleshooting
         if logging.getLogger().isEnabledFor(logging.DEBUG):
             classes_and_types: dict[str, list[str]] = {}
-            for loaded in scenario_plugin_factory.loaded_plugins.keys():
-                cls_name = scenario_plugin_factory.loaded_plugins[loaded].__name__
+            for loaded, cls_name in scenario_plugin_factory.get_class_names().items():
                 if cls_name not in classes_and_types:
                     classes_and_types[cls_name] = []
                 classes_and_types[cls_name].append(loaded)
@@ -435,7 +463,7 @@ def main(options, command: Optional[str], out: Optional[dict] = None) -> int:
 
         # Log health check plugins
         logging.info(
-            f"📣 `HealthCheckFactory`: {len(health_check_factory.loaded_plugins)} health check plugins loaded"
+            f"📣 `HealthCheckFactory`: {len(health_check_factory.loaded_plugins)} health check plugins registered"
             f" ({len(health_check_factory.failed_plugins)} failed)"
         )
         if logging.getLogger().isEnabledFor(logging.DEBUG):
@@ -483,15 +511,23 @@ def main(options, command: Optional[str], out: Optional[dict] = None) -> int:
         configured_types: set[str] = set()
         for scenario in chaos_scenarios:
             if isinstance(scenario, dict):
-                configured_types.add(list(scenario.keys())[0])
+                configured_types.add(get_scenario_entry_type(scenario))
         if configured_types:
             logging.info("Scenario plugins for this run:")
+            class_names = scenario_plugin_factory.get_class_names()
+            failed_count = len(scenario_plugin_factory.failed_plugins)
             for stype in sorted(configured_types):
-                if stype in scenario_plugin_factory.loaded_plugins:
-                    cls_name = scenario_plugin_factory.loaded_plugins[stype].__name__
-                    logging.info(f"  ✅ {stype} ➡️ `{cls_name}`")
-                else:
+                if stype not in class_names:
                     logging.warning(f"  ⚠️ {stype} ➡️ no matching plugin found")
+                # imports the plugins of the run up front
+                elif scenario_plugin_factory.loaded_plugins.get(stype) is not None:
+                    logging.info(f"  ✅ {stype} ➡️ `{class_names[stype]}`")
+                else:
+                    logging.error(f"  ⛔ {stype} ➡️ `{class_names[stype]}` failed to import")
+            for failed in scenario_plugin_factory.failed_plugins[failed_count:]:
+                module_name, class_name, error = failed
+                logging.error(f"⛔ Class: {class_name} Module: {module_name}")
+                logging.error(f"⚠️ {error}")
 
         # Start all health check plugins discovered via config_key_map.
         # Returns list of (plugin, worker_thread, telemetry_queue);
@@ -500,27 +536,143 @@ def main(options, command: Optional[str], out: Optional[dict] = None) -> int:
             config, iterations=iterations, krkn_lib=kubecli
         )
 
+        def process_batch_result(
+            scenario_type,
+            failed_scenarios_current,
+            scenario_telemetries,
+            batch_window_start_dt,
+            batch_window_end_dt,
+        ) -> bool:
+            """
+            Records the outcome of a `chaos_scenarios` entry and checks the
+            critical alerts, returns False if post chaos critical alerts are
+            firing and the run must not schedule further scenarios.
+            """
+            nonlocal post_critical_alerts
+            failed_post_scenarios.extend(failed_scenarios_current)
+            chaos_telemetry.scenarios.extend(scenario_telemetries)
+            if resiliency_obj:
+                resiliency_obj.add_scenario_reports(
+                    scenario_telemetries=scenario_telemetries,
+                    prom_cli=prometheus,
+                    scenario_type=scenario_type,
+                    batch_start_dt=batch_window_start_dt,
+                    batch_end_dt=batch_window_end_dt,
+                )
+
+            post_critical_alerts = 0
+            if check_critical_alerts:
+                prometheus_plugin.critical_alerts(
+                    prometheus,
+                    summary,
+                    elastic_search,
+                    run_uuid,
+                    scenario_type,
+                    start_time,
+                    datetime.datetime.now(),
+                    elastic_alerts_index
+                )
+
+                chaos_output.critical_alerts = summary
+                post_critical_alerts = len(summary.post_chaos_alerts)
+                if post_critical_alerts > 0:
+                    logging.error(
+                        "Post chaos critical alerts firing please check, exiting"
+                    )
+                    return False
+            return True
+
+        def read_run_signal() -> str:
+            nonlocal run_signal
+            if publish_running_status:
+                run_signal = server.get_status(address)
+            return run_signal
+
+        def poll_run_signal() -> str:
+            nonlocal run_signal
+            if read_run_signal() == "PAUSE":
+                while publish_running_status and run_signal == "PAUSE":
+                    logging.info(
+                        "Pausing Kraken run, waiting for %s seconds"
+                        " and will re-poll signal" % str(wait_duration)
+                    )
+                    time.sleep(wait_duration)
+                    run_signal = server.get_status(address)
+            return run_signal
+
+        scenario_scheduler = None
+        if scheduler_enabled and chaos_scenarios:
+            try:
+                scenario_scheduler = ScenarioScheduler(
+                    ScheduledScenario.from_config(chaos_scenarios),
+                    max_parallel=get_yaml_item_value(
+                        scheduler_config, "max_parallel", DEFAULT_MAX_PARALLEL
+                    ),
+                    group_limits=get_yaml_item_value(
+                        scheduler_config, "concurrency_groups", {}
+                    ),
+                )
+            except ValueError as e:
+                logging.error("invalid scheduler configuration: %s", e)
+                return 1
+            for entry in scenario_scheduler.entries:
+                if entry.scenario_type not in scenario_plugin_factory.loaded_plugins:
+                    logging.error(
+                        f"impossible to find scenario {entry.scenario_type}, plugin not found. Exiting"
+                    )
+                    sys.exit(-1)
+            # signal handlers can only be installed from the main thread,
+            # the scenario entries will run in the scheduler worker threads
+            signal_handler._register_signal_handler()
+            logging.info(
+                "concurrent scenario scheduler enabled with %d entries",
+                len(scenario_scheduler.entries),
+            )
+
+        def run_scheduled_entry(entry):
+            scenario_plugin = scenario_plugin_factory.create_plugin(
+                entry.scenario_type
+            )
+            return scenario_plugin.run_scenarios(
+                run_uuid, entry.scenarios, config, telemetry_ocp, collector
+            )
+
+        def on_scheduled_entry_complete(result) -> bool:
+            return process_batch_result(
+                result.entry.scenario_type,
+                result.failed_scenarios,
+                result.scenario_telemetries,
+                datetime.datetime.utcfromtimestamp(result.start_timestamp),
+                datetime.datetime.utcfromtimestamp(result.end_timestamp),
+            )
+
+        # logs and events of the scenarios are collected in background for
+        # the whole run, the collector is drained once the loop is over
+        collector = PostScenarioCollector(background=async_collection)
+
         # Loop to run the chaos starts here
         while int(iteration) < iterations and run_signal != "STOP":
             # Inject chaos scenarios specified in the config
             logging.info("Executing scenarios for iteration " + str(iteration))
-            if chaos_scenarios:
+            if scenario_scheduler:
+                scenario_scheduler.run(
+                    run_scheduled_entry,
+                    on_complete=on_scheduled_entry_complete,
+                    # the signal is polled without blocking so that the
+                    # entries completing while paused are still processed
+                    should_stop=lambda: read_run_signal() == "STOP",
+                    should_pause=lambda: run_signal == "PAUSE",
+                    poll_interval=max(wait_duration, 1),
+                )
+                if run_signal == "STOP":
+                    logging.info("Received STOP signal; ending Kraken run")
+            elif chaos_scenarios:
 
                 for scenario in chaos_scenarios:
-                    if publish_running_status:
-                        run_signal = server.get_status(address)
-                    if run_signal == "PAUSE":
-                        while publish_running_status and run_signal == "PAUSE":
-                            logging.info(
-                                "Pausing Kraken run, waiting for %s seconds"
-                                " and will re-poll signal" % str(wait_duration)
-                            )
-                            time.sleep(wait_duration)
-                            run_signal = server.get_status(address)
-                    if run_signal == "STOP":
+                    if poll_run_signal() == "STOP":
                         logging.info("Received STOP signal; ending Kraken run")
                         break
-                    scenario_type = list(scenario.keys())[0]
+                    scenario_type = get_scenario_entry_type(scenario)
                     scenarios_list = scenario[scenario_type]
                     if scenarios_list:
                         try:
@@ -537,44 +689,25 @@ def main(options, command: Optional[str], out: Optional[dict] = None) -> int:
                         batch_window_start_dt = datetime.datetime.utcnow()
                         failed_scenarios_current, scenario_telemetries = (
                             scenario_plugin.run_scenarios(
-                                run_uuid, scenarios_list, config, telemetry_ocp
+                                run_uuid, scenarios_list, config, telemetry_ocp,
+                                collector,
                             )
                         )
-                        failed_post_scenarios.extend(failed_scenarios_current)
-                        chaos_telemetry.scenarios.extend(scenario_telemetries)
                         batch_window_end_dt = datetime.datetime.utcnow()
-                        if resiliency_obj:
-                            resiliency_obj.add_scenario_reports(
-                                scenario_telemetries=scenario_telemetries,
-                                prom_cli=prometheus,
-                                scenario_type=scenario_type,
-                                batch_start_dt=batch_window_start_dt,
-                                batch_end_dt=batch_window_end_dt,
-                            )
-
-                        post_critical_alerts = 0
-                        if check_critical_alerts:
-                            prometheus_plugin.critical_alerts(
-                                prometheus,
-                                summary,
-                                elastic_search,
-                                run_uuid,
-                                scenario_type,
-                                start_time,
-                                datetime.datetime.now(),
-                                elastic_alerts_index
-                            )
-
-                            chaos_output.critical_alerts = summary
-                            post_critical_alerts = len(summary.post_chaos_alerts)
-                            if post_critical_alerts > 0:
-                                logging.error(
-                                    "Post chaos critical alerts firing please check, exiting"
-                                )
-                                break
+                        if not process_batch_result(
+                            scenario_type,
+                            failed_scenarios_current,
+                            scenario_telemetries,
+                            batch_window_start_dt,
+                            batch_window_end_dt,
+                        ):
+                            break
 
             iteration += 1
             health_check_factory.increment_all_iterations()
+            # daemon mode runs keep writing rollback versions
+            RollbackConfig.compact_rollback_versions()
+        collector.drain()
         # telemetry
         # in order to print decoded telemetry data even if telemetry collection
         # is disabled, it's necessary to serialize the ChaosRunTelemetry object
@@ -606,6 +739,8 @@ def main(options, command: Optional[str], out: Optional[dict] = None) -> int:
                 except queue.Empty:
                     pass
         chaos_telemetry.health_checks = all_health_check_telemetry if all_health_check_telemetry else None
+        # no plugin reads the shared informers anymore
+        informer_cache.stop()
         # if platform is openshift will be collected
         # Cloud platform and network plugins metadata
         # through OCP specific APIs
@@ -625,9 +760,17 @@ def main(options, command: Optional[str], out: Optional[dict] = None) -> int:
         else:
             logging.debug("No error logs collected during chaos run")
             chaos_telemetry.error_logs = []
-        if resiliency_obj and hist_window is None:
+        if resiliency_obj:
             try:
-                resiliency_obj.attach_compact_to_telemetry(chaos_telemetry)
+                # single_pass mode evaluates all the scenario windows here,
+                # also when a historical window replaces the overall report
+                resiliency_obj.evaluate_pending_reports(
+                    prom_cli=prometheus,
+                    total_start_time=datetime.datetime.fromtimestamp(start_time),
+                    total_end_time=datetime.datetime.fromtimestamp(end_time),
+                )
+                if hist_window is None:
+                    resiliency_obj.attach_compact_to_telemetry(chaos_telemetry)
             except Exception as exc:
                 logging.error("Failed to embed per-scenario resiliency in telemetry: %s", exc)
 
@@ -792,7 +935,14 @@ def main(options, command: Optional[str], out: Optional[dict] = None) -> int:
                 end_time,
                 metrics_profile,
                 elastic_metrics_index,
-                telemetry_json
+                telemetry_json,
+                batch_size=get_yaml_item_value(
+                    metrics_export, "batch_size", prometheus_plugin.DEFAULT_METRICS_BATCH_SIZE
+                ),
+                max_in_flight=get_yaml_item_value(
+                    metrics_export, "max_in_flight", prometheus_plugin.DEFAULT_METRICS_MAX_IN_FLIGHT
+                ),
+                compress=get_yaml_item_value(metrics_export, "compress", False),
             )
 
         logging.info(
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# Copyright 2026 The Krkn Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Plugin factories startup benchmark.
+
+Measures, in fresh interpreters, the time to build the scenario and health
+check factories and to create the plugin of a scenario type, with the
+manifest based registry (lazy) and with the import of all the plugins
+(full scan).
+
+Usage:
+    python scripts/benchmark_plugin_startup.py
+    python scripts/benchmark_plugin_startup.py --runs 10 --scenario-type pod_disruption_scenarios
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from krkn.scenario_plugins.scenario_plugin_factory import ScenarioPluginFactory
+from krkn.health_checks import HealthCheckFactory
+scenario_factory = ScenarioPluginFactory(lazy={lazy})
+health_check_factory = HealthCheckFactory(lazy={lazy})
+factories = time.perf_counter()
+scenario_factory.create_plugin({scenario_type!r})
+end = time.perf_counter()
+print(json.dumps({{
+    "factories": factories - start,
+    "total": end - start,
+    "modules": len(sys.modules),
+    "scenario_types": len(scenario_factory.loaded_plugins),
+}}))
+"""
+
+
+def measure(lazy: bool, scenario_type: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(lazy=lazy, scenario_type=scenario_type)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        error = result.stderr.strip().splitlines()
+        raise RuntimeError(error[-1] if error else f"exit status {result.returncode}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="runs per mode")
+    parser.add_argument(
+        "--scenario-type",
+        default="pod_disruption_scenarios",
+        help="scenario type whose plugin is created after the factories",
+    )
+    args = parser.parse_args()
+
+    for name, lazy in (("lazy", True), ("full scan", False)):
+        try:
+            runs = [measure(lazy, args.scenario_type) for _ in range(args.runs)]
+        except RuntimeError as e:
+            print(f"{name:>10}: failed: {e}")
+            continue
+        factories = statistics.median(r["factories"] for r in runs)
+        total = statistics.median(r["total"] for r in runs)
+        print(
+            f"{name:>10}: factories {factories * 1000:8.1f}ms  "
+            f"with {args.scenario_type} {total * 1000:8.1f}ms  "
+            f"modules {runs[0]['modules']:5d}  "
+            f"scenario types {runs[0]['scenario_types']}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# Copyright 2026 The Krkn Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Plugin manifest generator.
+
+Regenerates the `plugin_manifest.json` of the scenario and health check
+plugin packages from the plugin sources (nothing is imported), to be run
+whenever a plugin module is added, renamed or modified: the manifest
+records the digest of every plugin module.
+
+Usage:
+    # Regenerate the manifests
+    python scripts/generate_plugin_manifest.py
+
+    # Check only (exit 1 if a manifest is outdated)
+    python scripts/generate_plugin_manifest.py --check
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from krkn.plugin_registry import (  # noqa: E402
+    ManifestError,
+    generate_manifest,
+    manifest_path,
+    write_manifest,
+)
+
+# package, module suffix, base class module and name, types method, config key method
+PLUGIN_PACKAGES = [
+    (
+        "krkn.scenario_plugins",
+        "_scenario_plugin",
+        "krkn.scenario_plugins.abstract_scenario_plugin",
+        "AbstractScenarioPlugin",
+        "get_scenario_types",
+        None,
+    ),
+    (
+        "krkn.health_checks",
+        "_health_check_plugin",
+        "krkn.health_checks.abstract_health_check_plugin",
+        "AbstractHealthCheckPlugin",
+        "get_health_check_types",
+        "get_config_key",
+    ),
+]
+
+
+def build_manifests() -> dict[str, dict]:
+    return {
+        package: generate_manifest(
+            package,
+            suffix,
+            base_class,
+            types_method,
+            config_key_method,
+            exclude=[base_module],
+        )
+        for package, suffix, base_module, base_class, types_method, config_key_method
+        in PLUGIN_PACKAGES
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--check", action="store_true", help="only check that the manifests are up to date"
+    )
+    args = parser.parse_args()
+
+    try:
+        manifests = build_manifests()
+    except ManifestError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+
+    outdated = []
+    for package, manifest in manifests.items():
+        path = manifest_path(package)
+        current = None
+        if os.path.isfile(path):
+            with open(path, encoding="utf-8") as f:
+                current = json.load(f)
+        if current == manifest:
+            continue
+        if args.check:
+            outdated.append(path)
+        else:
+            write_manifest(package, manifest)
+            print(f"Updated {path}")
+
+    if outdated:
+        for path in outdated:
+            print(f"Outdated plugin manifest: {path}", file=sys.stderr)
+        print(
+            "Run `python scripts/generate_plugin_manifest.py` to update them.",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,13 +9,31 @@ Usage:
 Assisted By: Claude Code
 """
 
+import queue
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
+
+import yaml
 
 from krkn_lib.k8s import KrknKubernetes
+from krkn_lib.models.k8s import NodeResources
+from krkn_lib.models.krkn import HogConfig
 from krkn_lib.telemetry.ocp import KrknTelemetryOpenshift
 
 from krkn.scenario_plugins.hogs.hogs_scenario_plugin import HogsScenarioPlugin
+from krkn.scenario_plugins.hogs.resource_sampler import (
+    NodeResourceSampler,
+    RateLimiter,
+    ResourceStats,
+)
+
+
+def node_resources(cpu=0, memory=0, disk_space=0):
+    resources = NodeResources()
+    resources.cpu = cpu
+    resources.memory = memory
+    resources.disk_space = disk_space
+    return resources
 
 
 class TestHogsScenarioPlugin(unittest.TestCase):
@@ -35,6 +53,134 @@ class TestHogsScenarioPlugin(unittest.TestCase):
         self.assertEqual(result, ["hog_scenarios"])
         self.assertEqual(len(result), 1)
 
+    def test_record_node_resources(self):
+        """
+        Test the sampled resources are published in the additional telemetry
+        """
+        scenario_telemetry = MagicMock()
+        scenario_telemetry.additional_telemetry = {"time_to_stable": 1}
+
+        HogsScenarioPlugin.record_node_resources(
+            scenario_telemetry, {"node-1": {"samples": 2}}
+        )
+
+        self.assertEqual(
+            scenario_telemetry.additional_telemetry,
+            {"time_to_stable": 1, "node_resources": {"node-1": {"samples": 2}}},
+        )
+
+    @patch("krkn.scenario_plugins.hogs.hogs_scenario_plugin.time.sleep")
+    def test_run_scenario_samples_every_node(self, _):
+        """
+        Test run_scenario samples every node and reports the aggregates
+        """
+        lib_k8s = MagicMock(spec=KrknKubernetes)
+        lib_k8s.get_node_resources_info.return_value = node_resources(cpu=10)
+        lib_k8s.is_pod_running.return_value = False
+        self.plugin.rollback_handler = MagicMock()
+        with open("scenarios/kube/cpu-hog.yml") as f:
+            scenario = yaml.safe_load(f)
+        scenario.update({"duration": 1, "workers": 1})
+        config = HogConfig.from_yaml_dict(scenario)
+        results = {}
+
+        self.plugin.run_scenario(
+            config, lib_k8s, ["node-1", "node-2"], queue.Queue(),
+            sampling_interval=1, sampling_rate_limit=0, node_resources=results,
+        )
+
+        self.assertEqual(sorted(results), ["node-1", "node-2"])
+        lib_k8s.deploy_hog.assert_called()
+
+
+class TestResourceSampler(unittest.TestCase):
+
+    def test_stats_running_mean_and_max(self):
+        """
+        Test the running aggregates match the mean and max of the samples
+        """
+        stats = ResourceStats()
+        for cpu, memory in [(1, 30), (5, 10), (3, 20)]:
+            stats.add(node_resources(cpu=cpu, memory=memory))
+
+        self.assertEqual(stats.count, 3)
+        self.assertAlmostEqual(stats.mean.cpu, 3)
+        self.assertAlmostEqual(stats.mean.memory, 20)
+        self.assertEqual(stats.max.cpu, 5)
+        self.assertEqual(stats.max.memory, 30)
+
+    def test_sampler_waits_interval_between_samples(self):
+        """
+        Test the sampler waits the interval between two samples
+        """
+        sample_func = MagicMock(return_value=node_resources(cpu=1))
+        sampler = NodeResourceSampler("node-1", sample_func, interval=5)
+        now = [1000.0]
+
+        def wait(timeout):
+            now[0] += timeout
+            return False
+
+        with patch(
+            "krkn.scenario_plugins.hogs.resource_sampler.time.time",
+            side_effect=lambda: now[0],
+        ), patch.object(sampler._stop, "wait", side_effect=wait) as mock_wait:
+            sampler.run(until=1020.0)
+
+        self.assertEqual(sample_func.call_count, 4)
+        self.assertTrue(all(c.args[0] == 5 for c in mock_wait.call_args_list))
+        self.assertEqual(sampler.stats.count, 4)
+
+    def test_sampler_series_is_bounded(self):
+        """
+        Test the time series is decimated instead of growing without bound
+        """
+        sampler = NodeResourceSampler(
+            "node-1", lambda: node_resources(cpu=1), interval=1, max_points=10
+        )
+        for _ in range(100):
+            sampler.sample()
+
+        self.assertLess(len(sampler.series), 10)
+        self.assertEqual(sampler.stats.count, 100)
+        self.assertGreater(sampler.to_dict()["interval"], 1)
+
+    def test_sampler_counts_errors(self):
+        """
+        Test a failed sample is skipped and counted
+        """
+        sampler = NodeResourceSampler(
+            "node-1", MagicMock(side_effect=Exception("metrics unavailable"))
+        )
+        sampler.sample()
+
+        self.assertEqual(sampler.errors, 1)
+        self.assertEqual(sampler.stats.count, 0)
+
+    @patch("krkn.scenario_plugins.hogs.resource_sampler.time.sleep")
+    @patch("krkn.scenario_plugins.hogs.resource_sampler.time.monotonic", return_value=0)
+    def test_rate_limiter_delays_requests(self, _, mock_sleep):
+        """
+        Test the rate limiter spaces the requests beyond the burst
+        """
+        limiter = RateLimiter(rate=2)
+
+        for _ in range(3):
+            self.assertTrue(limiter.acquire())
+
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        self.assertEqual(delays, [0.5, 1.0])
+
+    def test_rate_limiter_unbounded(self):
+        """
+        Test a rate of 0 never waits
+        """
+        limiter = RateLimiter(rate=0)
+        with patch("krkn.scenario_plugins.hogs.resource_sampler.time.sleep") as mock_sleep:
+            for _ in range(5):
+                limiter.acquire()
+        mock_sleep.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -47,7 +47,11 @@ Migrated from test_health_checker.py to use the plugin architecture.
 import queue
 import sys
 import os
+import threading
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
@@ -56,6 +60,12 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from krkn_lib.models.telemetry.models import HealthCheck
 from krkn.health_checks import HealthCheckFactory, HealthCheckPluginNotFound
+from krkn.health_checks.http_probe import (
+    HttpProber,
+    ProbeMetrics,
+    ThreadLocalSessions,
+    mount_connection_pool,
+)
 
 
 class TestHttpHealthCheckPlugin(unittest.TestCase):
@@ -507,6 +517,156 @@ class TestHttpHealthCheckPlugin(unittest.TestCase):
         mock_sleep.assert_called_with(5)
 
 
+class _StandInHandler(BaseHTTPRequestHandler):
+    """Local stand-in of the probed services."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path.startswith("/slow"):
+            time.sleep(0.3)
+        status = 500 if self.path.startswith("/fail") else 200
+        self.send_response(status)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+class TestHttpProbe(unittest.TestCase):
+    """Test the concurrent probing engine against a local http.server"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+        cls.server.daemon_threads = True
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.server_thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_probe_all_is_concurrent(self):
+        """Slow endpoints of a cycle are probed at the same time"""
+        from krkn.health_checks.http_health_check_plugin import HttpHealthCheckPlugin
+
+        urls = [f"{self.base_url}/slow/{i}" for i in range(5)]
+        metrics = ProbeMetrics(window=1)
+        with HttpHealthCheckPlugin(iterations=1) as plugin:
+            plugin._sessions.mount(urls)
+            with HttpProber(plugin.make_request, metrics, max_workers=5) as prober:
+                start = time.monotonic()
+                responses = prober.probe_all([(url, None, None, True) for url in urls])
+                elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 1.2)
+        self.assertEqual([r["status_code"] for r in responses], [200] * 5)
+        self.assertEqual(sorted(metrics.urls()), sorted(urls))
+        for url in urls:
+            self.assertGreaterEqual(metrics.to_dict(url)["p50_ms"], 250)
+
+    def test_probe_all_returns_exceptions(self):
+        def request_func(url, auth, headers, verify):
+            raise RuntimeError("boom")
+
+        metrics = ProbeMetrics(window=1)
+        with HttpProber(request_func, metrics) as prober:
+            responses = prober.probe_all([("http://example.com", None, None, True)])
+
+        self.assertIsInstance(responses[0], RuntimeError)
+        self.assertEqual(metrics.to_dict("http://example.com")["error_rate"], 1.0)
+
+    def test_run_health_check_records_latency_metrics(self):
+        """run_health_check attaches the latency metrics to the telemetry"""
+        from krkn.health_checks.http_health_check_plugin import HttpHealthCheckPlugin
+
+        ok_url, fail_url = f"{self.base_url}/ok", f"{self.base_url}/fail"
+        config = {
+            "config": [{"url": ok_url}, {"url": fail_url}],
+            "interval": 0.05,
+            "metrics_window": 1,
+        }
+        telemetry_queue = queue.Queue()
+        with HttpHealthCheckPlugin(iterations=1) as plugin:
+            timer = threading.Timer(0.5, plugin.increment_iterations)
+            timer.start()
+            plugin.run_health_check(config, telemetry_queue)
+
+        records = {record.url: record for record in telemetry_queue.get()}
+        ok_metrics = records[ok_url].latency_metrics
+        fail_metrics = records[fail_url].latency_metrics
+        self.assertGreater(ok_metrics["requests"], 1)
+        self.assertEqual(ok_metrics["error_rate"], 0)
+        self.assertEqual(fail_metrics["error_rate"], 1.0)
+        self.assertLessEqual(ok_metrics["p50_ms"], ok_metrics["p99_ms"])
+        series = ok_metrics["timeseries"]
+        self.assertEqual(series["window"], 1)
+        self.assertEqual(sum(series["requests"]), ok_metrics["requests"])
+        for key in ("error_rate", "p50_ms", "p95_ms", "p99_ms"):
+            self.assertEqual(len(series[key]), len(series["requests"]))
+
+    def test_connection_pool_mounted(self):
+        import requests
+
+        session = requests.Session()
+        mount_connection_pool(
+            session, ["http://a:8080/x", "http://a:8080/y", "https://b/z"], 7
+        )
+        adapter = session.get_adapter("http://a:8080/x")
+        self.assertEqual(adapter._pool_connections, 2)
+        self.assertEqual(adapter._pool_maxsize, 7)
+        self.assertIs(session.get_adapter("https://b/z"), adapter)
+
+    def test_sessions_are_per_thread(self):
+        sessions = ThreadLocalSessions()
+        sessions.mount(["http://a:8080/x", "https://b/z"])
+        main = sessions.get()
+        barrier = threading.Barrier(3)
+
+        def worker_session(_):
+            # the workers are all alive at the same time
+            barrier.wait(5)
+            return sessions.get()
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            workers = list(executor.map(worker_session, range(3)))
+
+        self.assertIs(sessions.get(), main)
+        self.assertEqual(len({id(s) for s in workers + [main]}), 4)
+        for session in workers + [main]:
+            adapter = session.get_adapter("http://a:8080/x")
+            self.assertEqual(adapter._pool_connections, 2)
+            self.assertIs(session.get_adapter("https://b/z"), adapter)
+
+        closed = []
+        for session in workers + [main]:
+            session.close = lambda session=session: closed.append(session)
+        sessions.close()
+        self.assertEqual(len(closed), 4)
+
+    def test_probe_metrics_windows(self):
+        metrics = ProbeMetrics(window=10)
+        for latency in (0.01, 0.02, 0.03, 0.5):
+            metrics.add("u", latency, True, timestamp=100)
+        metrics.add("u", 1.0, False, timestamp=125)
+
+        result = metrics.to_dict("u")
+        self.assertEqual(result["requests"], 5)
+        self.assertEqual(result["error_rate"], 0.2)
+        series = result["timeseries"]
+        self.assertEqual(series["start"], 100)
+        self.assertEqual(series["requests"], [4, 0, 1])
+        self.assertEqual(series["error_rate"], [0, 0, 1.0])
+        self.assertLess(series["p50_ms"][0], series["p99_ms"][0])
+        self.assertGreater(series["p99_ms"][0], 100)
+        self.assertIsNone(metrics.to_dict("unknown"))
+
+
 class TestHttpHealthCheckPluginFactory(unittest.TestCase):
     """Test factory-specific functionality"""
 
@@ -10,15 +10,19 @@ Usage:
 import base64
 import json
 import tempfile
+import threading
 import unittest
 import uuid
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import yaml
 
 from krkn.rollback.config import RollbackContent
 from krkn.scenario_plugins.http_load.http_load_scenario_plugin import HttpLoadScenarioPlugin
+from krkn.utils.latency_histogram import LatencyHistogram, log_buckets
+from krkn.scenario_plugins.http_load.live_metrics import LiveMetrics, parse_timestamp
+from krkn.scenario_plugins.http_load.result_collector import ReportScanner, ResultCollector
 
 
 class TestHttpLoadScenarioPlugin(unittest.TestCase):
@@ -92,6 +96,13 @@ class TestValidateConfig(unittest.TestCase):
         }
         self.assertFalse(self.plugin._validate_config(config))
 
+    def test_invalid_metrics_window(self):
+        config = {
+            "targets": {"endpoints": [{"url": "http://example.com", "method": "GET"}]},
+            "metrics-window": 0,
+        }
+        self.assertFalse(self.plugin._validate_config(config))
+
     def test_invalid_endpoint_not_dict(self):
         config = {
             "targets": {
@@ -224,6 +235,74 @@ class TestAggregateMetrics(unittest.TestCase):
     def test_empty_metrics_list(self):
         self.assertEqual(self.plugin._aggregate_metrics([]), {})
 
+    def test_multiple_pod_percentiles_from_histograms(self):
+        # pod 1 is fast, pod 2 is slow: the cluster-wide p50 falls between
+        # them and the p99 in the slow pod, not in a weighted average
+        metrics_list = [
+            {"requests": 900, "latencies": {"mean": 10, "50th": 10, "99th": 19,
+                                           "max": 19, "min": 1},
+             "buckets": {"0": 900, "20": 0, "100": 0}},
+            {"requests": 100, "latencies": {"mean": 150, "50th": 150, "99th": 199,
+                                           "max": 200, "min": 100},
+             "buckets": {"0": 0, "20": 0, "100": 100}},
+        ]
+        result = self.plugin._aggregate_metrics(metrics_list)
+        latencies = result["latencies"]
+
+        self.assertEqual(latencies["percentiles"], "histogram")
+        self.assertLess(latencies["50th"], 20)
+        self.assertGreaterEqual(latencies["99th"], 100)
+        self.assertEqual(latencies["max"], 200)
+        self.assertEqual(latencies["min"], 1)
+        self.assertAlmostEqual(latencies["mean"], 24)
+        self.assertEqual(result["latency_histogram"], {"0": 900, "20": 0, "100": 100})
+
+    def test_multiple_pod_percentiles_without_histograms(self):
+        metrics_list = [
+            {"requests": 100, "latencies": {"mean": 10, "99th": 20, "max": 30, "min": 1}},
+            {"requests": 300, "latencies": {"mean": 20, "99th": 40, "max": 50, "min": 2}},
+        ]
+        result = self.plugin._aggregate_metrics(metrics_list)
+        latencies = result["latencies"]
+
+        self.assertEqual(latencies["percentiles"], "weighted")
+        self.assertAlmostEqual(latencies["99th"], 35)
+        self.assertEqual(latencies["max"], 50)
+        self.assertEqual(latencies["min"], 1)
+        self.assertNotIn("latency_histogram", result)
+
+
+class TestLatencyHistogram(unittest.TestCase):
+
+    def test_merge_sums_buckets(self):
+        merged = LatencyHistogram.merge([
+            LatencyHistogram.from_vegeta({"0": 1, "10": 2}),
+            LatencyHistogram.from_vegeta({"10": 3, "20": 4}),
+        ])
+        self.assertEqual(merged.to_dict(), {"0": 1, "10": 5, "20": 4})
+        self.assertEqual(merged.total, 10)
+
+    def test_quantiles_interpolated_in_bucket(self):
+        histogram = LatencyHistogram([0, 10, 20, 30], [0, 10, 0, 10])
+        quantiles = histogram.quantiles([0.25, 0.5, 0.75, 1.0], max_latency=50)
+        self.assertEqual(list(quantiles), [15.0, 20.0, 40.0, 50.0])
+
+    def test_record_counts_the_sample_in_its_bucket(self):
+        histogram = LatencyHistogram.empty([0, 10, 20])
+        for latency in (-1, 0, 9.9, 10, 25, 1e9):
+            histogram.record(latency)
+        self.assertEqual(histogram.to_dict(), {"0": 3, "10": 1, "20": 2})
+
+    def test_quantiles_of_empty_histogram(self):
+        self.assertEqual(list(LatencyHistogram([], []).quantiles([0.5])), [0.0])
+
+    def test_log_buckets_increasing(self):
+        buckets = log_buckets(min_latency=1e6, max_latency=1e9, per_decade=5)
+        self.assertEqual(buckets[0], 0)
+        self.assertEqual(buckets[1], 1000000)
+        self.assertEqual(buckets[-1], 1000000000)
+        self.assertEqual(buckets, sorted(set(buckets)))
+
 
 class TestParseMetricsFromLogs(unittest.TestCase):
 
@@ -249,6 +328,187 @@ class TestParseMetricsFromLogs(unittest.TestCase):
         self.assertIsNone(result)
 
 
+class TestReportScanner(unittest.TestCase):
+
+    REPORT = b'{"requests":1000,"latencies":{"mean":50000000},"success":0.99}'
+
+    def test_report_split_across_chunks(self):
+        scanner = ReportScanner()
+        data = b"=== JSON Report ===\n" + self.REPORT + b"\nAttack completed\n"
+        found = False
+        for i in range(0, len(data), 7):
+            found = scanner.feed(data[i:i + 7])
+            if found:
+                break
+
+        self.assertTrue(found)
+        self.assertEqual(scanner.report["requests"], 1000)
+
+    def test_report_without_trailing_newline(self):
+        scanner = ReportScanner()
+        self.assertFalse(scanner.feed(b"verbose line\n" + self.REPORT))
+        self.assertEqual(scanner.close()["requests"], 1000)
+
+    def test_other_lines_are_not_buffered(self):
+        scanner = ReportScanner(max_buffered_bytes=16)
+        scanner.feed(b"x" * 1000 + b"\n" + b"y" * 1000)
+
+        self.assertFalse(scanner.overflow)
+        self.assertEqual(len(scanner._line), 0)
+        self.assertIsNone(scanner.close())
+
+    def test_line_longer_than_the_buffer_is_skipped(self):
+        scanner = ReportScanner(max_buffered_bytes=16)
+        scanner.feed(self.REPORT + b"\n")
+
+        self.assertTrue(scanner.overflow)
+        self.assertIsNone(scanner.close())
+
+
+class TestLiveMetrics(unittest.TestCase):
+
+    @staticmethod
+    def report(requests, success, total):
+        return {"requests": requests, "success": success,
+                "latencies": {"total": total, "mean": total / max(requests, 1)}}
+
+    def test_cumulative_reports_to_windows(self):
+        live = LiveMetrics(window=1)
+        live.add("pod-1", self.report(10, 1.0, 100), timestamp=100.2)
+        live.add("pod-2", self.report(10, 1.0, 300), timestamp=100.7)
+        live.add("pod-1", self.report(20, 0.5, 1100), timestamp=102.1)
+
+        series = live.to_dict()
+
+        self.assertEqual(series["start"], 100)
+        self.assertEqual(series["requests"], [20, 0, 10])
+        self.assertEqual(series["error_rate"], [0.0, 0.0, 1.0])
+        self.assertEqual(series["mean_latency"], [20, 0, 100])
+
+    def test_replayed_reports_are_ignored(self):
+        live = LiveMetrics(window=1)
+        reports = [self.report(10, 1.0, 100), self.report(20, 1.0, 200)]
+        for _ in range(2):
+            for t, report in enumerate(reports):
+                live.add("pod-1", report, timestamp=float(t))
+
+        self.assertEqual(live.to_dict()["requests"], [10, 10])
+
+    def test_histogram_deltas(self):
+        live = LiveMetrics(window=1)
+        first = dict(self.report(10, 1.0, 100), buckets={"0": 10, "100": 0})
+        second = dict(self.report(20, 1.0, 2100), buckets={"0": 10, "100": 10})
+        live.add("pod-1", first, timestamp=0)
+        live.add("pod-1", second, timestamp=1)
+
+        p99 = live.to_dict()["p99_latency"]
+
+        self.assertEqual(p99[0], 0)
+        self.assertEqual(p99[1], 100)
+
+    def test_time_to_recover(self):
+        live = LiveMetrics(window=2)
+        errors = 0
+        # 10 requests per window, failing from the third to the fifth one
+        for t, failed in enumerate([0, 0, 5, 10, 2, 0, 0]):
+            errors += failed
+            requests = 10 * (t + 1)
+            live.add("pod-1", self.report(requests, 1 - errors / requests, 0), timestamp=t * 2)
+
+        recovery = live.time_to_recover()
+
+        self.assertEqual(recovery["start"], 4)
+        self.assertEqual(recovery["time_to_recover"], 6.0)
+        self.assertEqual(recovery["degraded_windows"], 3)
+        self.assertIsNone(LiveMetrics().time_to_recover())
+
+    def test_report_timestamp_preferred(self):
+        self.assertEqual(parse_timestamp("1970-01-01T00:01:40.123456789Z"), 100.123456)
+        self.assertIsNone(parse_timestamp("0001-01-01T00:00:00Z"))
+        self.assertIsNone(parse_timestamp("not a date"))
+
+        live = LiveMetrics(window=10)
+        live.add("pod-1", dict(self.report(1, 1.0, 1), latest="1970-01-01T00:01:40Z"),
+                 timestamp=5000)
+        self.assertEqual(live.to_dict()["start"], 100)
+
+
+class TestResultCollector(unittest.TestCase):
+
+    REPORT = '{"requests":100,"latencies":{"mean":50000000},"success":1.0}'
+
+    def test_reports_streamed_from_followed_logs(self):
+        lib_k8s = MagicMock()
+        stream = MagicMock()
+        stream.stream.return_value = iter([b"log\n", self.REPORT.encode() + b"\n"])
+        lib_k8s.cli.read_namespaced_pod_log.return_value = stream
+
+        reports = ResultCollector(lib_k8s, "default").collect(["pod-1"], 60)
+
+        self.assertEqual(reports["pod-1"]["requests"], 100)
+        self.assertTrue(lib_k8s.cli.read_namespaced_pod_log.call_args.kwargs["follow"])
+        stream.release_conn.assert_called_once()
+        lib_k8s.get_pod_log.assert_not_called()
+
+    def test_every_pod_log_is_followed_at_the_same_time(self):
+        lib_k8s = MagicMock()
+        lib_k8s.is_pod_running.return_value = False
+        pod_names = [f"pod-{i}" for i in range(30)]
+        # every stream returns once all the logs are followed
+        followed = threading.Barrier(len(pod_names), timeout=10)
+
+        def read_log(**_):
+            followed.wait()
+            return self.REPORT + "\n"
+
+        lib_k8s.cli.read_namespaced_pod_log.side_effect = read_log
+
+        reports = ResultCollector(lib_k8s, "default").collect(pod_names, 60)
+
+        self.assertTrue(all(report["requests"] == 100 for report in reports.values()))
+        lib_k8s.get_pod_log.assert_not_called()
+
+    def test_live_reports_passed_to_callback(self):
+        lib_k8s = MagicMock()
+        lib_k8s.is_pod_running.return_value = False
+        interim = '{"requests":50,"latencies":{"mean":1},"success":1.0}'
+        lib_k8s.cli.read_namespaced_pod_log.return_value = (
+            interim + "\n" + self.REPORT + "\nAttack completed\n"
+        )
+        on_report = MagicMock()
+
+        reports = ResultCollector(lib_k8s, "default", on_report=on_report).collect(["pod-1"], 60)
+
+        self.assertEqual(reports["pod-1"]["requests"], 100)
+        self.assertEqual(
+            [c.args[1]["requests"] for c in on_report.call_args_list], [50, 100]
+        )
+        lib_k8s.get_pod_log.assert_not_called()
+
+    def test_fallback_on_full_log_when_follow_fails(self):
+        lib_k8s = MagicMock()
+        lib_k8s.cli.read_namespaced_pod_log.side_effect = Exception("forbidden")
+        lib_k8s.is_pod_running.side_effect = [True, False, False]
+        lib_k8s.get_pod_log.return_value = "log\n" + self.REPORT
+
+        collector = ResultCollector(lib_k8s, "default", poll_interval=0)
+        reports = collector.collect(["pod-1", "pod-2"], 60)
+
+        self.assertEqual(reports["pod-1"]["requests"], 100)
+        self.assertEqual(reports["pod-2"]["requests"], 100)
+        self.assertEqual(lib_k8s.get_pod_log.call_count, 2)
+
+    def test_missing_report(self):
+        lib_k8s = MagicMock()
+        lib_k8s.cli.read_namespaced_pod_log.return_value = "no report"
+        lib_k8s.is_pod_running.return_value = False
+        lib_k8s.get_pod_log.return_value = "no report"
+
+        reports = ResultCollector(lib_k8s, "default").collect(["pod-1"], 60)
+
+        self.assertEqual(reports, {"pod-1": None})
+
+
 class TestHttpLoadRun(unittest.TestCase):
 
     def _create_scenario_file(self, tmp_dir, config=None):
@@ -304,7 +564,7 @@ class TestHttpLoadRun(unittest.TestCase):
             )
 
             self.assertEqual(result, 0)
-            mock_lib_kubernetes.deploy_http_load.assert_called_once()
+            mock_lib_kubernetes.create_pod.assert_called_once()
 
     def test_run_multiple_pods(self):
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -329,7 +589,69 @@ class TestHttpLoadRun(unittest.TestCase):
             )
 
             self.assertEqual(result, 0)
-            self.assertEqual(mock_lib_kubernetes.deploy_http_load.call_count, 3)
+            self.assertEqual(mock_lib_kubernetes.create_pod.call_count, 3)
+
+    def test_run_with_metrics_window_deploys_reporting_pods(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            scenario_file = self._create_scenario_file(
+                tmp_dir, {"metrics-window": 5, "attacker-nodes": {"zone": ["a"]}}
+            )
+            mock_lib_telemetry, mock_lib_kubernetes, mock_scenario_telemetry = (
+                self._create_mocks()
+            )
+            mock_lib_kubernetes.is_pod_running.return_value = False
+            mock_lib_kubernetes.get_pod_log.return_value = '{"requests":100}'
+
+            plugin = HttpLoadScenarioPlugin()
+            with patch.object(ResultCollector, "__init__", return_value=None) as init, \
+                    patch.object(ResultCollector, "collect", return_value={}):
+                result = plugin.run(
+                    run_uuid=str(uuid.uuid4()),
+                    scenario=scenario_file,
+                    lib_telemetry=mock_lib_telemetry,
+                    scenario_telemetry=mock_scenario_telemetry,
+                )
+
+            self.assertEqual(result, 0)
+            mock_lib_kubernetes.deploy_http_load.assert_not_called()
+            pod_body, namespace, _ = mock_lib_kubernetes.create_pod.call_args.args
+            self.assertEqual(namespace, "default")
+            container = pod_body["spec"]["containers"][0]
+            env = {e["name"]: e["value"] for e in container["env"]}
+            self.assertEqual(env["REPORT_EVERY"], "5s")
+            self.assertTrue(env["BUCKETS"].startswith("[0ns,100000ns,"))
+            self.assertIn('-buckets="$BUCKETS"', container["args"][0])
+            self.assertEqual(env["KEEPALIVE"], "true")
+            self.assertIn("-every=", container["args"][0])
+            self.assertIn("affinity", pod_body["spec"])
+            self.assertIsNotNone(init.call_args.kwargs["on_report"])
+
+    def test_run_without_metrics_window_stops_at_the_report(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            scenario_file = self._create_scenario_file(tmp_dir)
+            mock_lib_telemetry, mock_lib_kubernetes, mock_scenario_telemetry = (
+                self._create_mocks()
+            )
+
+            plugin = HttpLoadScenarioPlugin()
+            with patch.object(ResultCollector, "__init__", return_value=None) as init, \
+                    patch.object(ResultCollector, "collect", return_value={}):
+                plugin.run(
+                    run_uuid=str(uuid.uuid4()),
+                    scenario=scenario_file,
+                    lib_telemetry=mock_lib_telemetry,
+                    scenario_telemetry=mock_scenario_telemetry,
+                )
+
+            # the pods still report their latency histogram, only once
+            mock_lib_kubernetes.deploy_http_load.assert_not_called()
+            pod_body = mock_lib_kubernetes.create_pod.call_args.args[0]
+            container = pod_body["spec"]["containers"][0]
+            env = {e["name"]: e["value"] for e in container["env"]}
+            self.assertNotIn("REPORT_EVERY", env)
+            self.assertIn('-buckets="$BUCKETS"', container["args"][0])
+            self.assertNotIn("-every=", container["args"][0])
+            self.assertIsNone(init.call_args.kwargs["on_report"])
 
     def test_run_invalid_config(self):
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -350,7 +672,7 @@ class TestHttpLoadRun(unittest.TestCase):
             )
 
             self.assertEqual(result, 1)
-            mock_lib_kubernetes.deploy_http_load.assert_not_called()
+            mock_lib_kubernetes.create_pod.assert_not_called()
 
     def test_run_deploy_exception(self):
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -359,7 +681,7 @@ class TestHttpLoadRun(unittest.TestCase):
                 self._create_mocks()
             )
 
-            mock_lib_kubernetes.deploy_http_load.side_effect = Exception("Deploy failed")
+            mock_lib_kubernetes.create_pod.side_effect = Exception("Deploy failed")
 
             plugin = HttpLoadScenarioPlugin()
             result = plugin.run(
@@ -72,7 +72,7 @@ class NetworkScenariosTest(unittest.TestCase):
         """Test getting default interface from a node"""
         mock_kubecli = Mock()
         mock_pod_template = Mock()
-        mock_pod_template.render.return_value = "pod_yaml_content"
+        mock_pod_template.render.return_value = "metadata:\n  name: fedtools-1"
 
         mock_kubecli.create_pod.return_value = None
         mock_kubecli.exec_cmd_in_pod.return_value = (
@@ -97,7 +97,7 @@ class NetworkScenariosTest(unittest.TestCase):
         """Test verifying interface when input list is empty"""
         mock_kubecli = Mock()
         mock_pod_template = Mock()
-        mock_pod_template.render.return_value = "pod_yaml_content"
+        mock_pod_template.render.return_value = "metadata:\n  name: fedtools-1"
 
         mock_kubecli.create_pod.return_value = None
         mock_kubecli.exec_cmd_in_pod.return_value = (
@@ -119,7 +119,7 @@ class NetworkScenariosTest(unittest.TestCase):
         """Test verifying interface with valid interface list"""
         mock_kubecli = Mock()
         mock_pod_template = Mock()
-        mock_pod_template.render.return_value = "pod_yaml_content"
+        mock_pod_template.render.return_value = "metadata:\n  name: fedtools-1"
 
         mock_kubecli.create_pod.return_value = None
         mock_kubecli.exec_cmd_in_pod.return_value = (
@@ -143,7 +143,7 @@ class NetworkScenariosTest(unittest.TestCase):
         """Test verifying interface with an interface that doesn't exist"""
         mock_kubecli = Mock()
         mock_pod_template = Mock()
-        mock_pod_template.render.return_value = "pod_yaml_content"
+        mock_pod_template.render.return_value = "metadata:\n  name: fedtools-1"
 
         mock_kubecli.create_pod.return_value = None
         mock_kubecli.exec_cmd_in_pod.return_value = (
@@ -264,12 +264,12 @@ class NetworkScenariosTest(unittest.TestCase):
             namespace="default"
         )
 
-    @patch('time.sleep', return_value=None)
-    @patch('time.time')
-    def test_wait_for_job_success(self, mock_time, mock_sleep):
-        """Test waiting for jobs to complete successfully"""
+    @patch('krkn.scenario_plugins.native.job_tracker.time.sleep', return_value=None)
+    @patch('krkn.scenario_plugins.native.job_tracker.SharedInformer')
+    def test_wait_for_job_success(self, mock_informer, mock_sleep):
+        """Test waiting for jobs to complete successfully when they can't be watched"""
         mock_kubecli = Mock()
-        mock_time.side_effect = [0, 10, 20]
+        mock_informer.return_value.wait_for_sync.return_value = False
 
         mock_response1 = Mock()
         mock_response1.status.succeeded = 1
@@ -288,13 +288,14 @@ class NetworkScenariosTest(unittest.TestCase):
         )
 
         self.assertEqual(mock_kubecli.get_job_status.call_count, 2)
+        mock_informer.return_value.stop.assert_called_once()
 
-    @patch('time.sleep', return_value=None)
-    @patch('time.time')
-    def test_wait_for_job_timeout(self, mock_time, mock_sleep):
+    @patch('krkn.scenario_plugins.native.job_tracker.time.sleep', return_value=None)
+    @patch('krkn.scenario_plugins.native.job_tracker.SharedInformer')
+    def test_wait_for_job_timeout(self, mock_informer, mock_sleep):
         """Test waiting for jobs times out"""
         mock_kubecli = Mock()
-        mock_time.side_effect = [0, 350]
+        mock_informer.return_value.wait_for_sync.return_value = False
 
         mock_response = Mock()
         mock_response.status.succeeded = None
@@ -306,7 +307,7 @@ class NetworkScenariosTest(unittest.TestCase):
             ingress_shaping.wait_for_job(
                 kubecli=mock_kubecli,
                 job_list=["job1"],
-                timeout=300
+                timeout=0
             )
 
         self.assertIn("timeout", str(context.exception))
@@ -454,7 +455,7 @@ class NetworkScenariosTest(unittest.TestCase):
         """Test creating virtual interfaces on a node"""
         mock_kubecli = Mock()
         mock_pod_template = Mock()
-        mock_pod_template.render.return_value = "pod_yaml"
+        mock_pod_template.render.return_value = "metadata:\n  name: modtools-1"
 
         mock_kubecli.create_pod.return_value = None
         mock_kubecli.exec_cmd_in_pod.return_value = None
@@ -476,7 +477,7 @@ class NetworkScenariosTest(unittest.TestCase):
         """Test deleting virtual interfaces from nodes"""
         mock_kubecli = Mock()
         mock_pod_template = Mock()
-        mock_pod_template.render.return_value = "pod_yaml"
+        mock_pod_template.render.return_value = "metadata:\n  name: modtools-1"
 
         mock_kubecli.create_pod.return_value = None
         mock_kubecli.delete_pod.return_value = None
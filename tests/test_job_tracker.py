@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+
+"""
+Test suite for the job tracker of the native network plugins
+
+Test Coverage:
+- Job completion followed through the watch events
+- Polling fallback when the jobs can't be watched
+- Concurrent inspection of the jobs
+
+IMPORTANT: These tests use mocking and do NOT require any Kubernetes cluster.
+All Kubernetes API calls are mocked via unittest.mock.
+
+Usage:
+    python -m unittest tests/test_job_tracker.py -v
+
+    # Run with coverage
+    python -m coverage run -a -m unittest tests/test_job_tracker.py -v
+"""
+
+import datetime
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from krkn.scenario_plugins.native.job_tracker import (
+    JobTracker,
+    for_each_job,
+    job_selector,
+    job_timestamp,
+)
+
+
+def job(name, succeeded=None, failed=None, created=None, completed=None):
+    status = {}
+    if succeeded is not None:
+        status["succeeded"] = succeeded
+    if failed is not None:
+        status["failed"] = failed
+    if completed is not None:
+        status["completionTime"] = completed
+    metadata = {"name": name, "namespace": "default"}
+    if created is not None:
+        metadata["creationTimestamp"] = created
+    return {"metadata": metadata, "status": status}
+
+
+class FakeInformer:
+    """Replays a list of events to the listeners from a background thread"""
+
+    events = []
+
+    def __init__(self, resource, list_func, list_args=(), list_kwargs=None):
+        self.list_kwargs = list_kwargs
+        self.listeners = []
+        self.stopped = False
+
+    def add_listener(self, listener):
+        self.listeners.append(listener)
+
+    def start(self):
+        def replay():
+            for event_type, obj in self.events:
+                for listener in self.listeners:
+                    listener(event_type, obj)
+
+        threading.Thread(target=replay, daemon=True).start()
+
+    def wait_for_sync(self, timeout=None):
+        return True
+
+    def stop(self):
+        self.stopped = True
+
+
+class TestJobTracker(unittest.TestCase):
+    def test_job_selector(self):
+        """Test that the jobs are selected by their job-name label"""
+        self.assertEqual(
+            job_selector(["chaos-b", "chaos-a", "chaos-b"]),
+            "job-name in (chaos-a,chaos-b)",
+        )
+
+    @patch("krkn.scenario_plugins.native.job_tracker.SharedInformer", FakeInformer)
+    def test_wait_on_events(self):
+        """Test that the jobs are followed through the watch events"""
+        FakeInformer.events = [
+            ("ADDED", job("job1")),
+            ("ADDED", job("other", succeeded=1)),
+            ("MODIFIED", job("job2", failed=1)),
+            ("DELETED", job("job1", succeeded=1)),
+            ("MODIFIED", job("job1", succeeded=1)),
+        ]
+        kubecli = MagicMock()
+
+        tracker = JobTracker(kubecli, ["job1", "job2"])
+        tracker.wait(timeout=5)
+
+        self.assertEqual(tracker.results, {"job1": "succeeded", "job2": "failed"})
+        self.assertEqual(tracker.failed, ["job2"])
+        self.assertEqual(sorted(tracker.completion_times), ["job1", "job2"])
+        kubecli.get_job_status.assert_not_called()
+
+    @patch("krkn.scenario_plugins.native.job_tracker.SharedInformer", FakeInformer)
+    def test_completion_time_from_creation_timestamp(self):
+        """Test that the latency is measured from the creation of the job"""
+        FakeInformer.events = [
+            (
+                "MODIFIED",
+                job(
+                    "job1",
+                    succeeded=1,
+                    created="2026-10-17T10:00:00Z",
+                    completed="2026-10-17T10:01:30Z",
+                ),
+            ),
+        ]
+
+        tracker = JobTracker(MagicMock(), ["job1"])
+        tracker.wait(timeout=5)
+
+        self.assertEqual(tracker.completion_times, {"job1": 90.0})
+
+    @patch("krkn.scenario_plugins.native.job_tracker.SharedInformer", FakeInformer)
+    def test_wait_on_events_timeout(self):
+        """Test that the tracker times out if a job never completes"""
+        FakeInformer.events = [("ADDED", job("job1", succeeded=1))]
+
+        tracker = JobTracker(MagicMock(), ["job1", "job2"])
+        with self.assertRaises(Exception) as context:
+            tracker.wait(timeout=0.1)
+
+        self.assertIn("timeout", str(context.exception))
+        self.assertEqual(tracker.pending, ["job2"])
+
+    @patch("krkn.scenario_plugins.native.job_tracker.time.sleep", return_value=None)
+    @patch("krkn.scenario_plugins.native.job_tracker.SharedInformer")
+    def test_polling_fallback(self, mock_informer, mock_sleep):
+        """Test that every sweep of the polling fallback sleeps once"""
+        mock_informer.return_value.wait_for_sync.return_value = False
+        running = MagicMock()
+        running.status.succeeded = None
+        running.status.failed = None
+        done = MagicMock()
+        done.status.succeeded = 1
+        done.status.failed = None
+        kubecli = MagicMock()
+        kubecli.get_job_status.side_effect = [running, running, done, done]
+
+        tracker = JobTracker(kubecli, ["job1", "job2"])
+        tracker.wait(timeout=300)
+
+        self.assertEqual(kubecli.get_job_status.call_count, 4)
+        self.assertEqual(mock_sleep.call_count, 1)
+        self.assertEqual(tracker.results, {"job1": "succeeded", "job2": "succeeded"})
+
+    def test_job_timestamp(self):
+        """Test that model datetimes and raw RFC 3339 strings are both parsed"""
+        created = datetime.datetime(2026, 10, 17, 10, tzinfo=datetime.timezone.utc)
+        self.assertEqual(job_timestamp("2026-10-17T10:00:00Z"), created.timestamp())
+        self.assertEqual(job_timestamp(created), created.timestamp())
+        self.assertIsNone(job_timestamp(None))
+        self.assertIsNone(job_timestamp("not a date"))
+
+    def test_for_each_job_concurrent(self):
+        """Test that the jobs are inspected concurrently"""
+        barrier = threading.Barrier(3, timeout=5)
+        seen = []
+
+        def inspect(job_name):
+            barrier.wait()
+            seen.append(job_name)
+
+        for_each_job(inspect, ["job1", "job2", "job3"])
+
+        self.assertEqual(sorted(seen), ["job1", "job2", "job3"])
+
+    def test_for_each_job_raises(self):
+        """Test that the errors are raised to the caller"""
+        def inspect(job_name):
+            raise Exception(f"{job_name} failed")
+
+        with self.assertRaises(Exception):
+            for_each_job(inspect, ["job1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
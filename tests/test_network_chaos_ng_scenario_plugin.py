@@ -9,11 +9,19 @@ Usage:
 Assisted By: Claude Code
 """
 
+import queue
+import threading
+import time
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from krkn.scenario_plugins.network_chaos_ng.network_chaos_ng_scenario_plugin import NetworkChaosNgScenarioPlugin
 from krkn.scenario_plugins.network_chaos_ng.modules import utils
+from krkn.scenario_plugins.network_chaos_ng.parallel_execution import (
+    BatchBarrier,
+    ParallelExecutor,
+    sync_batch,
+)
 
 
 class TestNetworkChaosNgScenarioPlugin(unittest.TestCase):
@@ -109,5 +117,176 @@ class TestNetworkChaosNgUtils(unittest.TestCase):
         mock_logging_warning.assert_called_once_with("[]: Warning message")
 
 
+class TestParallelExecutor(unittest.TestCase):
+
+    def test_batches_default_single_batch(self):
+        """
+        Test that without limits all the targets run in a single batch
+        """
+        executor = ParallelExecutor()
+        self.assertEqual(executor.batches(["a", "b", "c"]), [["a", "b", "c"]])
+
+    def test_batches_capped_by_max_parallelism(self):
+        """
+        Test that batches never exceed max_parallelism
+        """
+        executor = ParallelExecutor(max_parallelism=2, batch_size=5)
+        self.assertEqual(
+            executor.batches(["a", "b", "c", "d", "e"]),
+            [["a", "b"], ["c", "d"], ["e"]],
+        )
+        executor = ParallelExecutor(max_parallelism=4, batch_size=3)
+        self.assertEqual(
+            executor.batches(["a", "b", "c", "d"]), [["a", "b", "c"], ["d"]]
+        )
+
+    def test_bounded_concurrency(self):
+        """
+        Test that at most max_parallelism targets run at the same time
+        """
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+
+        def func(target, error_queue):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+
+        executor = ParallelExecutor(max_parallelism=2, batch_size=1)
+        timings = executor.run([f"t{i}" for i in range(6)], func, queue.Queue())
+
+        self.assertEqual(len(timings), 6)
+        self.assertLessEqual(peak[0], 2)
+
+    def test_batch_injects_together(self):
+        """
+        Test that the targets of a batch inject the chaos after all of
+        them are ready
+        """
+        def func(target, error_queue):
+            # the slowest target delays the injection of the whole batch
+            time.sleep(0.2 if target == "slow" else 0)
+            sync_batch()
+
+        executor = ParallelExecutor()
+        timings = executor.run(["fast", "slow"], func, queue.Queue())
+
+        injections = [t.injection_timestamp for t in timings]
+        self.assertTrue(all(injections))
+        self.assertLess(abs(injections[0] - injections[1]), 0.1)
+        fast = next(t for t in timings if t.target == "fast")
+        self.assertGreaterEqual(fast.injection_timestamp - fast.start_timestamp, 0.15)
+
+    def test_failed_target_leaves_batch(self):
+        """
+        Test that a target failing before the injection doesn't block the
+        rest of its batch and its error is reported
+        """
+        def func(target, error_queue):
+            if target == "bad":
+                error_queue.put("bad failed")
+                return
+            sync_batch()
+
+        executor = ParallelExecutor(barrier_timeout=5)
+        error_queue = queue.Queue()
+        start = time.time()
+        timings = executor.run(["good", "bad"], func, error_queue)
+
+        self.assertLess(time.time() - start, 2)
+        self.assertEqual(error_queue.get_nowait(), "bad failed")
+        bad = next(t for t in timings if t.target == "bad")
+        good = next(t for t in timings if t.target == "good")
+        self.assertEqual(bad.error, "bad failed")
+        self.assertIsNone(bad.injection_timestamp)
+        self.assertIsNotNone(good.injection_timestamp)
+        self.assertIsNone(good.error)
+
+    def test_exception_is_reported(self):
+        """
+        Test that an exception raised by the module is reported as an error
+        """
+        def func(target, error_queue):
+            raise Exception("boom")
+
+        error_queue = queue.Queue()
+        timings = ParallelExecutor().run(["a"], func, error_queue)
+
+        self.assertEqual(error_queue.get_nowait(), "boom")
+        self.assertEqual(timings[0].error, "boom")
+
+    def test_barrier_timeout(self):
+        """
+        Test that the barrier gives up after its timeout
+        """
+        barrier = BatchBarrier(2, timeout=0.05)
+        self.assertFalse(barrier.arrive())
+
+    def test_sync_batch_outside_batch(self):
+        """
+        Test that sync_batch is a no-op outside of a parallel execution
+        """
+        sync_batch()
+
+    @patch("krkn.scenario_plugins.network_chaos_ng.parallel_execution.time.sleep")
+    def test_batch_delay(self, mock_sleep):
+        """
+        Test that the batches are started batch_delay seconds apart
+        """
+        executor = ParallelExecutor(batch_size=1, batch_delay=3)
+        executor.run(["a", "b", "c"], lambda target, error_queue: None, queue.Queue())
+        self.assertEqual(mock_sleep.call_count, 2)
+        mock_sleep.assert_called_with(3)
+
+
+class TestRunParallel(unittest.TestCase):
+
+    def _module(self, run):
+        module = MagicMock()
+        config = MagicMock()
+        config.id = "pod_network_filter"
+        config.max_parallelism = 0
+        config.batch_size = 0
+        config.batch_delay = 0
+        module.get_config.return_value = (MagicMock(), config)
+        module.run.side_effect = run
+        return module
+
+    def test_run_parallel_records_timings(self):
+        """
+        Test that the per target timings are added to the telemetry
+        """
+        module = self._module(lambda target, error_queue: None)
+        scenario_telemetry = MagicMock()
+        scenario_telemetry.additional_telemetry = None
+
+        NetworkChaosNgScenarioPlugin().run_parallel(
+            ["a", "b"], module, scenario_telemetry
+        )
+
+        timings = scenario_telemetry.additional_telemetry["target_timings"][
+            "pod_network_filter"
+        ]
+        self.assertEqual(sorted(t["target"] for t in timings), ["a", "b"])
+        self.assertIn("duration", timings[0])
+
+    def test_run_parallel_raises_on_error(self):
+        """
+        Test that the errors of the targets fail the module
+        """
+        def run(target, error_queue):
+            if target == "b":
+                error_queue.put("b failed")
+
+        module = self._module(run)
+        with self.assertRaises(Exception) as context:
+            NetworkChaosNgScenarioPlugin().run_parallel(["a", "b"], module)
+        self.assertIn("b failed", str(context.exception))
+
+
 if __name__ == "__main__":
     unittest.main()
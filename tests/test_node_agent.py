@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+
+"""
+Test suite for the node agent pool shared by the native network plugins
+
+Test Coverage:
+- One agent pod per node, reused by all the probes and deleted on close
+- Batched execution of several commands with a single exec
+- Scoped pools for the callers without a scenario pool
+
+IMPORTANT: These tests use mocking and do NOT require any Kubernetes cluster.
+All Kubernetes API calls are mocked via unittest.mock.
+
+Usage:
+    python -m unittest tests/test_node_agent.py -v
+
+    # Run with coverage
+    python -m coverage run -a -m unittest tests/test_node_agent.py -v
+"""
+
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+from krkn.scenario_plugins.native.node_agent import (
+    SECTION_MARKER,
+    NodeAgentPool,
+    node_agents,
+)
+from krkn.scenario_plugins.native.pod_network_outage.pod_network_outage_plugin import (
+    apply_ingress_policy,
+    get_pod_interfaces,
+)
+
+
+def pod_template():
+    template = MagicMock()
+    template.render.side_effect = (
+        lambda regex_name, nodename, image: f"metadata:\n  name: modtools-{nodename}"
+    )
+    return template
+
+
+class TestNodeAgentPool(unittest.TestCase):
+    def test_agent_created_once_per_node(self):
+        """Test that the probes of a node share a single agent pod"""
+        kubecli = MagicMock()
+        pool = NodeAgentPool(kubecli, pod_template(), "image")
+
+        self.assertEqual(pool.get("node1"), "modtools-node1")
+        pool.exec("node1", ["ip r"])
+        pool.exec("node1", ["ip -br addr show"])
+        pool.exec("node2", ["ip r"])
+
+        self.assertEqual(kubecli.create_pod.call_count, 2)
+        self.assertEqual(kubecli.exec_cmd_in_pod.call_count, 3)
+        kubecli.delete_pod.assert_not_called()
+
+        pool.close()
+        deleted = sorted(call.args[0] for call in kubecli.delete_pod.call_args_list)
+        self.assertEqual(deleted, ["modtools-node1", "modtools-node2"])
+
+    def test_agents_of_different_nodes_created_concurrently(self):
+        """Test that creating an agent doesn't hold back the other nodes"""
+        kubecli = MagicMock()
+        node1_creating = threading.Event()
+        release_node1 = threading.Event()
+
+        def create_pod(body, namespace, timeout):
+            if body["metadata"]["name"] == "modtools-node1":
+                node1_creating.set()
+                release_node1.wait(5)
+
+        kubecli.create_pod.side_effect = create_pod
+        pool = NodeAgentPool(kubecli, pod_template(), "image")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(pool.get, "node1")
+            self.assertTrue(node1_creating.wait(5))
+            waiter = executor.submit(pool.get, "node1")
+            # node2 is created while node1 is still being created
+            self.assertEqual(pool.get("node2"), "modtools-node2")
+            self.assertFalse(waiter.done())
+            release_node1.set()
+            self.assertEqual(first.result(5), "modtools-node1")
+            self.assertEqual(waiter.result(5), "modtools-node1")
+        self.assertEqual(kubecli.create_pod.call_count, 2)
+
+    def test_failed_creation_is_retried(self):
+        """Test that a failed agent creation is not cached"""
+        kubecli = MagicMock()
+        kubecli.create_pod.side_effect = [Exception("quota"), None]
+        pool = NodeAgentPool(kubecli, pod_template(), "image")
+
+        with self.assertRaises(Exception):
+            pool.get("node1")
+        self.assertEqual(pool.get("node1"), "modtools-node1")
+        pool.close()
+        kubecli.delete_pod.assert_called_once_with("modtools-node1", "default")
+
+    def test_exec_sections(self):
+        """Test that several commands are run with one exec and split back"""
+        kubecli = MagicMock()
+        kubecli.exec_cmd_in_pod.return_value = (
+            f"{SECTION_MARKER} a\nfirst\n{SECTION_MARKER} b\n"
+            f"{SECTION_MARKER} c\nthird\nline\n"
+        )
+        pool = NodeAgentPool(kubecli, pod_template(), "image")
+
+        result = pool.exec_sections("node1", {"a": "cmd a", "b": "cmd b", "c": "cmd c"})
+
+        self.assertEqual(result, {"a": "first", "b": "", "c": "third\nline"})
+        kubecli.exec_cmd_in_pod.assert_called_once()
+        script = kubecli.exec_cmd_in_pod.call_args.args[0][0]
+        for command in ["cmd a", "cmd b", "cmd c"]:
+            self.assertIn(command, script)
+
+    def test_scoped_pool(self):
+        """Test that a scoped pool deletes its agents and a shared one doesn't"""
+        kubecli = MagicMock()
+        with node_agents(None, kubecli, pod_template(), "image") as pool:
+            pool.get("node1")
+        kubecli.delete_pod.assert_called_once_with("modtools-node1", "default")
+
+        kubecli.reset_mock()
+        shared = NodeAgentPool(kubecli, pod_template(), "image")
+        with node_agents(shared, kubecli, pod_template(), "image") as pool:
+            self.assertIs(pool, shared)
+            pool.get("node1")
+        kubecli.delete_pod.assert_not_called()
+
+
+class TestPodInterfaces(unittest.TestCase):
+    def test_get_pod_interfaces_single_exec(self):
+        """Test that the interfaces of all the pods of a node need one exec"""
+        kubecli = MagicMock()
+        kubecli.exec_cmd_in_pod.return_value = (
+            f"{SECTION_MARKER} 10.0.0.1\nveth1\n"
+            f"{SECTION_MARKER} 10.0.0.2\n"
+            f"{SECTION_MARKER} ip-addr\n"
+            "    inet 10.0.0.2/23 brd 10.0.1.255 scope global eth9\n"
+        )
+
+        result = get_pod_interfaces(
+            "node1", ["10.0.0.1", "10.0.0.2"], pod_template(), "br-int", kubecli
+        )
+
+        self.assertEqual(result, {"10.0.0.1": "veth1", "10.0.0.2": "eth9"})
+        kubecli.create_pod.assert_called_once()
+        kubecli.exec_cmd_in_pod.assert_called_once()
+        kubecli.delete_pod.assert_called_once()
+
+    def test_apply_ingress_policy_reuses_agent(self):
+        """Test that the ingress policy of many pods uses a single agent"""
+        kubecli = MagicMock()
+        ips = [f"10.0.0.{i}" for i in range(30)]
+        kubecli.exec_cmd_in_pod.side_effect = lambda command, *args, **kwargs: (
+            "\n".join(f"{SECTION_MARKER} {ip}\nveth{ip}" for ip in ips)
+            if isinstance(command, list) and SECTION_MARKER in command[0]
+            else ""
+        )
+        job_template = MagicMock()
+        job_template.render.side_effect = (
+            lambda jobname, nodename, image, cmd: f"metadata:\n  name: {jobname}"
+        )
+        agents = NodeAgentPool(kubecli, pod_template(), "image")
+
+        jobs = apply_ingress_policy(
+            "latency",
+            "node1",
+            ips,
+            job_template,
+            pod_template(),
+            {"latency": "50ms"},
+            60,
+            "br-int",
+            kubecli,
+            "parallel",
+            "image",
+            agents,
+        )
+
+        self.assertEqual(len(jobs), 30)
+        kubecli.create_pod.assert_called_once()
+        kubecli.delete_pod.assert_not_called()
+        agents.close()
+        kubecli.delete_pod.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Test suite for the manifest based plugin registry (krkn/plugin_registry.py)
+
+Usage:
+    python -m coverage run -a -m unittest tests/test_plugin_registry.py -v
+"""
+
+import importlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "scripts")))
+
+from generate_plugin_manifest import build_manifests  # noqa: E402
+
+from krkn.health_checks import HealthCheckFactory  # noqa: E402
+from krkn.plugin_registry import (  # noqa: E402
+    LazyPluginRegistry,
+    ManifestError,
+    generate_manifest,
+    load_manifest,
+    manifest_path,
+    write_manifest,
+)
+from krkn.scenario_plugins.abstract_scenario_plugin import AbstractScenarioPlugin  # noqa: E402
+from krkn.scenario_plugins.scenario_plugin_factory import (  # noqa: E402
+    ScenarioPluginFactory,
+    ScenarioPluginNotFound,
+)
+
+PLUGIN_SOURCE = """
+from krkn.scenario_plugins.abstract_scenario_plugin import AbstractScenarioPlugin
+{imports}
+
+class {class_name}(AbstractScenarioPlugin):
+    def run(self, run_uuid, scenario, krkn_config, lib_telemetry, scenario_telemetry):
+        return 0
+
+    def get_scenario_types(self) -> list[str]:
+        return {types!r}
+"""
+
+
+class TemporaryPluginPackage:
+    """Plugin package written in a temporary directory added to sys.path"""
+
+    def __init__(self, test: unittest.TestCase):
+        self.root = tempfile.mkdtemp()
+        self.name = f"lazy_plugins_{id(test)}"
+        os.makedirs(os.path.join(self.root, self.name))
+        open(os.path.join(self.root, self.name, "__init__.py"), "w").close()
+        sys.path.insert(0, self.root)
+        importlib.invalidate_caches()
+        test.addCleanup(self.cleanup)
+
+    def add_plugin(self, folder: str, module: str, types: list[str], imports: str = ""):
+        directory = os.path.join(self.root, self.name, folder)
+        os.makedirs(directory, exist_ok=True)
+        open(os.path.join(directory, "__init__.py"), "w").close()
+        class_name = module.title().replace("_", "")
+        with open(os.path.join(directory, module + ".py"), "w") as f:
+            f.write(PLUGIN_SOURCE.format(imports=imports, class_name=class_name, types=types))
+        importlib.invalidate_caches()
+        return f"{self.name}.{folder}.{module}"
+
+    def write_manifest(self):
+        write_manifest(self.name, self.generate())
+
+    def generate(self):
+        return generate_manifest(
+            self.name, "_scenario_plugin", "AbstractScenarioPlugin", "get_scenario_types"
+        )
+
+    def cleanup(self):
+        sys.path.remove(self.root)
+        for module in [m for m in sys.modules if m.startswith(self.name)]:
+            del sys.modules[module]
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+class TestPluginManifest(unittest.TestCase):
+
+    def test_committed_manifests_are_up_to_date(self):
+        for package, manifest in build_manifests().items():
+            with open(manifest_path(package)) as f:
+                self.assertEqual(
+                    json.load(f),
+                    manifest,
+                    f"run scripts/generate_plugin_manifest.py to update {package}",
+                )
+
+    def test_manifest_is_generated_without_importing_the_plugins(self):
+        package = TemporaryPluginPackage(self)
+        module = package.add_plugin(
+            "alpha", "alpha_scenario_plugin", ["alpha_scenarios", "a_scenarios"],
+            imports="import sdk_that_is_not_installed",
+        )
+
+        manifest = package.generate()
+
+        self.assertEqual(len(manifest["plugins"]), 1)
+        self.assertEqual(
+            {k: v for k, v in manifest["plugins"][0].items() if k != "sha256"},
+            {"module": module, "class": "AlphaScenarioPlugin",
+             "types": ["alpha_scenarios", "a_scenarios"]},
+        )
+        self.assertEqual(len(manifest["plugins"][0]["sha256"]), 64)
+        self.assertNotIn(module, sys.modules)
+
+    def test_duplicated_types_are_rejected(self):
+        package = TemporaryPluginPackage(self)
+        package.add_plugin("alpha", "alpha_scenario_plugin", ["same_scenarios"])
+        package.add_plugin("beta", "beta_scenario_plugin", ["same_scenarios"])
+
+        with self.assertRaises(ManifestError):
+            package.generate()
+
+    def test_outdated_manifest_is_ignored(self):
+        package = TemporaryPluginPackage(self)
+        package.add_plugin("alpha", "alpha_scenario_plugin", ["alpha_scenarios"])
+        package.write_manifest()
+        self.assertIsNotNone(load_manifest(package.name, "_scenario_plugin"))
+
+        package.add_plugin("beta", "beta_scenario_plugin", ["beta_scenarios"])
+        self.assertIsNone(load_manifest(package.name, "_scenario_plugin"))
+
+    def test_manifest_of_a_modified_module_is_ignored(self):
+        package = TemporaryPluginPackage(self)
+        package.add_plugin("alpha", "alpha_scenario_plugin", ["alpha_scenarios"])
+        package.write_manifest()
+
+        # same module list, the types of the plugin changed
+        package.add_plugin("alpha", "alpha_scenario_plugin", ["renamed_scenarios"])
+        self.assertIsNone(load_manifest(package.name, "_scenario_plugin"))
+
+        package.write_manifest()
+        manifest = load_manifest(package.name, "_scenario_plugin")
+        self.assertEqual(manifest["plugins"][0]["types"], ["renamed_scenarios"])
+
+
+class TestLazyPluginRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.package = TemporaryPluginPackage(self)
+        self.alpha = self.package.add_plugin(
+            "alpha", "alpha_scenario_plugin", ["alpha_scenarios", "a_scenarios"]
+        )
+        self.broken = self.package.add_plugin(
+            "broken", "broken_scenario_plugin", ["broken_scenarios"],
+            imports="import sdk_that_is_not_installed",
+        )
+        self.package.write_manifest()
+
+    def test_plugins_are_imported_on_first_use(self):
+        factory = ScenarioPluginFactory(self.package.name)
+
+        self.assertIsInstance(factory.loaded_plugins, LazyPluginRegistry)
+        self.assertEqual(len(factory.loaded_plugins), 3)
+        self.assertEqual(factory.get_class_names()["a_scenarios"], "AlphaScenarioPlugin")
+        self.assertNotIn(self.alpha, sys.modules)
+
+        plugin = factory.create_plugin("alpha_scenarios")
+
+        self.assertIsInstance(plugin, AbstractScenarioPlugin)
+        self.assertIn(self.alpha, sys.modules)
+        self.assertIs(factory.loaded_plugins["a_scenarios"], type(plugin))
+        self.assertNotIn(self.broken, sys.modules)
+
+    def test_import_failure_is_reported(self):
+        factory = ScenarioPluginFactory(self.package.name)
+
+        with self.assertRaises(ScenarioPluginNotFound):
+            factory.create_plugin("broken_scenarios")
+
+        self.assertNotIn("broken_scenarios", factory.loaded_plugins)
+        self.assertEqual(factory.failed_plugins[0][:2], (self.broken, "BrokenScenarioPlugin"))
+        self.assertIn("sdk_that_is_not_installed", factory.failed_plugins[0][2])
+
+    def test_full_scan_without_lazy(self):
+        os.remove(os.path.join(self.package.root, self.package.name, "broken",
+                               "broken_scenario_plugin.py"))
+        factory = ScenarioPluginFactory(self.package.name, lazy=False)
+
+        self.assertIsInstance(factory.loaded_plugins, dict)
+        self.assertEqual(sorted(factory.loaded_plugins), ["a_scenarios", "alpha_scenarios"])
+
+
+class TestHealthCheckFactoryManifest(unittest.TestCase):
+
+    def test_config_keys_come_from_the_manifest(self):
+        lazy = HealthCheckFactory()
+        full = HealthCheckFactory(lazy=False)
+
+        self.assertIsInstance(lazy.loaded_plugins, LazyPluginRegistry)
+        self.assertEqual(lazy.config_key_map, full.config_key_map)
+        self.assertEqual(sorted(lazy.loaded_plugins), sorted(full.loaded_plugins))
+        self.assertEqual(
+            type(lazy.create_plugin("simple_health_check")).__name__,
+            "SimpleHealthCheckPlugin",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,14 +9,23 @@ Usage:
 Assisted By: Claude Code
 """
 
+import json
+import re
+import threading
+import time
 import unittest
-from unittest.mock import MagicMock
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 from krkn_lib.k8s import KrknKubernetes
 from krkn_lib.telemetry.ocp import KrknTelemetryOpenshift
 
 from krkn.scenario_plugins.pod_disruption.pod_disruption_scenario_plugin import PodDisruptionScenarioPlugin
 from krkn.scenario_plugins.pod_disruption.models.models import InputParams
+from krkn.scenario_plugins.pod_disruption import pod_selection
+from krkn.scenario_plugins.pod_disruption.pod_recovery_waiter import PodRecoveryWaiter, pod_matcher
+from krkn.cache import SharedInformer
 
 
 class TestPodDisruptionScenarioPlugin(unittest.TestCase):
@@ -45,7 +54,7 @@ class TestKillingPodsMode(unittest.TestCase):
         """Set up test fixtures for killing_pods mode tests."""
         self.plugin = PodDisruptionScenarioPlugin()
         self.kubecli = MagicMock(spec=KrknKubernetes)
-        self.plugin.get_pods = MagicMock()
+        self.plugin.select_target_pods = MagicMock()
         self.plugin.wait_for_pods = MagicMock(return_value=0)
 
     def tearDown(self):
@@ -82,7 +91,7 @@ class TestKillingPodsMode(unittest.TestCase):
     def test_not_enough_pods_returns_error(self):
         """Returns 1 and never calls delete_pod when fewer pods exist than kill count."""
         config = InputParams({"kill": 3, "execution": "serial"})
-        self.plugin.get_pods.return_value = [("pod1", "ns1"), ("pod2", "ns1")]
+        self.plugin.select_target_pods.return_value = ([("pod1", "ns1"), ("pod2", "ns1")], set())
 
         result = self.plugin.killing_pods(config, self.kubecli)
 
@@ -92,7 +101,7 @@ class TestKillingPodsMode(unittest.TestCase):
     def test_serial_mode_calls_delete_in_order(self):
         """Serial mode deletes all selected pods one at a time."""
         config = InputParams({"kill": 2, "execution": "serial"})
-        self.plugin.get_pods.return_value = [("pod1", "ns1"), ("pod2", "ns1")]
+        self.plugin.select_target_pods.return_value = ([("pod1", "ns1"), ("pod2", "ns1")], set())
 
         result = self.plugin.killing_pods(config, self.kubecli)
 
@@ -105,7 +114,7 @@ class TestKillingPodsMode(unittest.TestCase):
         """Parallel mode deletes all selected pods and calls delete_pod for each concurrently."""
         config = InputParams({"kill": 2, "execution": "parallel"})
         pods = [("pod1", "ns1"), ("pod2", "ns1")]
-        self.plugin.get_pods.return_value = pods
+        self.plugin.select_target_pods.return_value = (pods, set())
 
         # Use a barrier to prove threads run concurrently. If they run serially, 
         # the first thread will block forever waiting for the second.
@@ -127,7 +136,7 @@ class TestKillingPodsMode(unittest.TestCase):
     def test_parallel_mode_propagates_delete_exception(self):
         """Exceptions raised during parallel deletion bubble up correctly."""
         config = InputParams({"kill": 2, "execution": "parallel"})
-        self.plugin.get_pods.return_value = [("pod1", "ns1"), ("pod2", "ns1")]
+        self.plugin.select_target_pods.return_value = ([("pod1", "ns1"), ("pod2", "ns1")], set())
 
         def side_effect(name, namespace):
             if name == "pod1":
@@ -144,11 +153,11 @@ class TestKillingPodsMode(unittest.TestCase):
     def test_excluded_pods_are_not_deleted_in_serial_mode(self):
         """Pods matched by exclude_label are skipped and never passed to delete_pod (serial)."""
         config = InputParams({"kill": 2, "execution": "serial", "exclude_label": "protected=true"})
-        # get_pods is called twice: first for target pods, then for excluded pods
-        self.plugin.get_pods.side_effect = [
+        # target pods and excluded pods come from a single selection
+        self.plugin.select_target_pods.return_value = (
             [("pod1", "ns1"), ("pod2", "ns1")],  # target pods
-            [("pod1", "ns1")],                    # excluded pods
-        ]
+            {("pod1", "ns1")},                    # excluded pods
+        )
 
         result = self.plugin.killing_pods(config, self.kubecli)
 
@@ -159,10 +168,10 @@ class TestKillingPodsMode(unittest.TestCase):
     def test_excluded_pods_are_not_deleted_in_parallel_mode(self):
         """Pods matched by exclude_label are skipped and never passed to delete_pod (parallel)."""
         config = InputParams({"kill": 2, "execution": "parallel", "exclude_label": "protected=true"})
-        self.plugin.get_pods.side_effect = [
+        self.plugin.select_target_pods.return_value = (
             [("pod1", "ns1"), ("pod2", "ns1")],  # target pods
-            [("pod1", "ns1")],                    # excluded pods
-        ]
+            {("pod1", "ns1")},                    # excluded pods
+        )
 
         result = self.plugin.killing_pods(config, self.kubecli)
 
@@ -187,7 +196,7 @@ class TestKillingPodsMode(unittest.TestCase):
     def test_serial_mode_force_passes_grace_period_zero(self):
         """Serial mode with force=True calls delete_pod with grace_period_seconds=0."""
         config = InputParams({"kill": 2, "execution": "serial", "force": True})
-        self.plugin.get_pods.return_value = [("pod1", "ns1"), ("pod2", "ns1")]
+        self.plugin.select_target_pods.return_value = ([("pod1", "ns1"), ("pod2", "ns1")], set())
 
         result = self.plugin.killing_pods(config, self.kubecli)
 
@@ -199,7 +208,7 @@ class TestKillingPodsMode(unittest.TestCase):
     def test_serial_mode_graceful_no_grace_period_kwarg(self):
         """Serial mode with force=False (default) calls delete_pod without grace_period_seconds."""
         config = InputParams({"kill": 1, "execution": "serial", "force": False})
-        self.plugin.get_pods.return_value = [("pod1", "ns1")]
+        self.plugin.select_target_pods.return_value = ([("pod1", "ns1")], set())
 
         result = self.plugin.killing_pods(config, self.kubecli)
 
@@ -209,7 +218,7 @@ class TestKillingPodsMode(unittest.TestCase):
     def test_parallel_mode_force_passes_grace_period_zero(self):
         """Parallel mode with force=True calls delete_pod with grace_period_seconds=0."""
         config = InputParams({"kill": 2, "execution": "parallel", "force": True})
-        self.plugin.get_pods.return_value = [("pod1", "ns1"), ("pod2", "ns1")]
+        self.plugin.select_target_pods.return_value = ([("pod1", "ns1"), ("pod2", "ns1")], set())
 
         result = self.plugin.killing_pods(config, self.kubecli)
 
@@ -221,7 +230,7 @@ class TestKillingPodsMode(unittest.TestCase):
     def test_parallel_mode_graceful_no_grace_period_kwarg(self):
         """Parallel mode with force=False (default) calls delete_pod without grace_period_seconds."""
         config = InputParams({"kill": 2, "execution": "parallel", "force": False})
-        self.plugin.get_pods.return_value = [("pod1", "ns1"), ("pod2", "ns1")]
+        self.plugin.select_target_pods.return_value = ([("pod1", "ns1"), ("pod2", "ns1")], set())
 
         result = self.plugin.killing_pods(config, self.kubecli)
 
@@ -231,5 +240,256 @@ class TestKillingPodsMode(unittest.TestCase):
         self.kubecli.delete_pod.assert_any_call("pod2", "ns1")
 
 
+
+def _pod_dict(name, phase="Running", namespace="default", node="worker-0", labels=None, deleting=False, ready_at=None):
+    metadata = {"name": name, "namespace": namespace, "labels": labels or {"app": "web"}, "resourceVersion": "1"}
+    if deleting:
+        metadata["deletionTimestamp"] = "2025-01-01T00:00:00Z"
+    status = {"phase": phase}
+    if ready_at:
+        status["conditions"] = [{"type": "Ready", "status": "True", "lastTransitionTime": ready_at}]
+    return {"metadata": metadata, "spec": {"nodeName": node}, "status": status}
+
+
+class TestPodRecoveryWaiter(unittest.TestCase):
+
+    def _informer(self, pods):
+        list_func = MagicMock(return_value=SimpleNamespace(
+            data=json.dumps({"metadata": {"resourceVersion": "1"}, "items": pods})
+        ))
+        informer = SharedInformer("pods", list_func)
+        informer._relist()
+        return informer
+
+    def _emit_later(self, informer, *events, delay=0.05):
+        def _emit():
+            for event in events:
+                time.sleep(delay)
+                informer._handle_event(event)
+        thread = threading.Thread(target=_emit)
+        thread.start()
+        self.addCleanup(thread.join)
+
+    def test_returns_as_soon_as_the_pods_are_running(self):
+        informer = self._informer([_pod_dict("a"), _pod_dict("b", deleting=True)])
+        waiter = PodRecoveryWaiter(informer, pod_matcher("default"), label_selector="app=web")
+        self._emit_later(
+            informer,
+            {"type": "ADDED", "object": _pod_dict("c", phase="Pending")},
+            {"type": "MODIFIED", "object": _pod_dict("c")},
+        )
+
+        start = time.monotonic()
+        self.assertTrue(waiter.wait(2, timeout=5))
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertEqual(list(waiter.recovery_times), ["default/c"])
+        self.assertLess(waiter.recovery_times["default/c"], 2)
+
+    def test_times_out_and_ignores_other_pods(self):
+        informer = self._informer([_pod_dict("a")])
+        waiter = PodRecoveryWaiter(informer, pod_matcher("default", node_names=["worker-0"]))
+        self._emit_later(
+            informer,
+            {"type": "ADDED", "object": _pod_dict("x", namespace="other")},
+            {"type": "ADDED", "object": _pod_dict("y", node="worker-1")},
+        )
+        self.assertFalse(waiter.wait(2, timeout=0.3))
+        self.assertEqual(waiter.recovery_times, {})
+
+    def test_pods_recovered_before_the_wait_are_timed_from_their_ready_condition(self):
+        informer = self._informer([
+            _pod_dict("a", ready_at="2025-01-01T00:00:05Z"),
+            _pod_dict("b", ready_at="2024-12-31T00:00:00Z"),
+        ])
+        start = datetime(2025, 1, 1, tzinfo=timezone.utc).timestamp()
+        waiter = PodRecoveryWaiter(informer, pod_matcher(".*"), start_time=start)
+        self.assertTrue(waiter.wait(2, timeout=1))
+        self.assertEqual(waiter.recovery_times, {"default/a": 5.0})
+
+    def test_wait_for_pods_falls_back_to_polling_without_a_watch(self):
+        plugin = PodDisruptionScenarioPlugin()
+        plugin._get_pods_informers = MagicMock(return_value=(None, False))
+        plugin.get_pods = MagicMock(return_value=[("a", "default")])
+        kubecli = MagicMock(spec=KrknKubernetes)
+        self.assertEqual(
+            plugin.wait_for_pods("app=web", None, "default", 1, 0, 5, kubecli, None, None), 0
+        )
+        plugin.get_pods.assert_called_once()
+
+    def test_wait_for_pods_stops_the_scoped_informer(self):
+        plugin = PodDisruptionScenarioPlugin()
+        informer = self._informer([_pod_dict("a")])
+        informer.stop = MagicMock()
+        plugin._get_pods_informers = MagicMock(return_value=([informer], True))
+        kubecli = MagicMock(spec=KrknKubernetes)
+        self.assertEqual(
+            plugin.wait_for_pods("app=web", None, "default", 1, 10, 5, kubecli, None, None), 0
+        )
+        self.assertEqual(
+            plugin.wait_for_pods("app=web", None, "default", 2, 10, 0.2, kubecli, None, None), 1
+        )
+        self.assertEqual(informer.stop.call_count, 2)
+
+    def test_waits_on_the_informers_of_every_namespace(self):
+        first = self._informer([_pod_dict("a", namespace="app-1")])
+        second = self._informer([])
+        waiter = PodRecoveryWaiter([first, second], pod_matcher("app-.*"))
+        self._emit_later(second, {"type": "ADDED", "object": _pod_dict("b", namespace="app-2")})
+
+        self.assertTrue(waiter.wait(2, timeout=5))
+        self.assertEqual(list(waiter.recovery_times), ["app-2/b"])
+
+    def test_fallback_informers_are_scoped_to_the_target_namespaces(self):
+        plugin = PodDisruptionScenarioPlugin()
+        kubecli = MagicMock(spec=KrknKubernetes)
+        kubecli.cli = MagicMock()
+        kubecli.list_namespaces_by_regex.return_value = ["app-1", "app-2"]
+        with patch(
+            "krkn.scenario_plugins.pod_disruption.pod_disruption_scenario_plugin.SharedInformer"
+        ) as informer_class:
+            informers, scoped = plugin._get_pods_informers(None, "app-.*", ["worker-0"], kubecli, 5)
+
+        self.assertTrue(scoped)
+        self.assertEqual(len(informers), 2)
+        for call, namespace in zip(informer_class.call_args_list, ["app-1", "app-2"]):
+            self.assertIs(call.args[1], kubecli.cli.list_namespaced_pod)
+            self.assertEqual(call.kwargs["list_args"], (namespace,))
+            self.assertEqual(
+                call.kwargs["list_kwargs"],
+                {"field_selector": "status.phase=Running,spec.nodeName=worker-0"},
+            )
+
+    def test_fallback_informer_of_a_label_selector_watches_the_selected_namespaces(self):
+        plugin = PodDisruptionScenarioPlugin()
+        kubecli = MagicMock(spec=KrknKubernetes)
+        kubecli.cli = MagicMock()
+        with patch(
+            "krkn.scenario_plugins.pod_disruption.pod_disruption_scenario_plugin.SharedInformer"
+        ) as informer_class:
+            informers, scoped = plugin._get_pods_informers("app=web", "app", None, kubecli, 5)
+
+        # like the selection, a single LIST filtered by label, the namespace
+        # prefix match is applied by the pod matcher
+        self.assertEqual(len(informers), 1)
+        self.assertIs(informer_class.call_args.args[1], kubecli.cli.list_pod_for_all_namespaces)
+        kubecli.list_namespaces_by_regex.assert_not_called()
+
+    def test_no_matching_namespace_falls_back_to_polling(self):
+        plugin = PodDisruptionScenarioPlugin()
+        kubecli = MagicMock(spec=KrknKubernetes)
+        kubecli.cli = MagicMock()
+        kubecli.list_namespaces_by_regex.return_value = []
+        with patch(
+            "krkn.scenario_plugins.pod_disruption.pod_disruption_scenario_plugin.SharedInformer"
+        ) as informer_class:
+            self.assertEqual(
+                plugin._get_pods_informers(None, "missing", None, kubecli, 5), (None, False)
+            )
+        informer_class.assert_not_called()
+
+    def test_fallback_informer_of_a_label_selector_is_filtered(self):
+        plugin = PodDisruptionScenarioPlugin()
+        kubecli = MagicMock(spec=KrknKubernetes)
+        kubecli.cli = MagicMock()
+        with patch(
+            "krkn.scenario_plugins.pod_disruption.pod_disruption_scenario_plugin.SharedInformer"
+        ) as informer_class:
+            plugin._get_pods_informers("app=web", ".*", None, kubecli, 5)
+
+        call = informer_class.call_args
+        self.assertIs(call.args[1], kubecli.cli.list_pod_for_all_namespaces)
+        self.assertEqual(
+            call.kwargs["list_kwargs"],
+            {"field_selector": "status.phase=Running", "label_selector": "app=web"},
+        )
+
+
+class TestPodSelection(unittest.TestCase):
+
+    def setUp(self):
+        self.kubecli = MagicMock(spec=KrknKubernetes)
+        self.kubecli.cli = MagicMock()
+        pods = [
+            _pod_dict("web-0", namespace="app-1", node="worker-0"),
+            _pod_dict("web-1", namespace="app-1", node="worker-1", labels={"app": "web", "protected": "true"}),
+            _pod_dict("web-2", namespace="app-2", node="worker-2"),
+            _pod_dict("web-3", namespace="other", node="worker-0"),
+        ]
+        self.kubecli.cli.list_pod_for_all_namespaces.side_effect = [
+            SimpleNamespace(data=json.dumps({"metadata": {"continue": "next"}, "items": pods[:2]})),
+            SimpleNamespace(data=json.dumps({"metadata": {}, "items": pods[2:]})),
+        ]
+        self.kubecli.list_namespaces_by_regex.side_effect = lambda regex: [
+            ns for ns in ["app-1", "app-2", "other"] if re.match(regex, ns)
+        ]
+        self.kubecli.cli.list_namespaced_pod.side_effect = lambda namespace, **kwargs: SimpleNamespace(
+            data=json.dumps({
+                "metadata": {},
+                "items": [pod for pod in pods if pod["metadata"]["namespace"] == namespace],
+            })
+        )
+
+    def test_single_list_for_many_nodes(self):
+        pods, excluded = pod_selection.select_pods(
+            self.kubecli,
+            "app-.*",
+            label_selector="app=web",
+            field_selector="status.phase=Running",
+            node_names=["worker-0", "worker-1"] + [f"worker-{i}" for i in range(3, 300)],
+            exclude_label="protected=true",
+        )
+
+        self.assertEqual(pods, [("web-0", "app-1"), ("web-1", "app-1")])
+        self.assertEqual(excluded, {("web-1", "app-1")})
+        calls = self.kubecli.cli.list_pod_for_all_namespaces.call_args_list
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(calls[0].kwargs["label_selector"], "app=web")
+        self.assertEqual(calls[0].kwargs["field_selector"], "status.phase=Running")
+        self.assertEqual(calls[1].kwargs["_continue"], "next")
+
+    def test_single_node_is_filtered_server_side(self):
+        pod_selection.select_pods(
+            self.kubecli, ".*", name_pattern="web-.*", field_selector="status.phase=Running", node_names=["worker-0"]
+        )
+        kwargs = self.kubecli.cli.list_namespaced_pod.call_args_list[0].kwargs
+        self.assertEqual(kwargs["field_selector"], "status.phase=Running,spec.nodeName=worker-0")
+        self.assertNotIn("label_selector", kwargs)
+
+    def test_name_pattern_lists_the_target_namespaces_only(self):
+        pods, _ = pod_selection.select_pods(self.kubecli, "app-.*", name_pattern="web-[02]")
+
+        self.assertEqual(pods, [("web-0", "app-1"), ("web-2", "app-2")])
+        self.assertEqual(
+            [c.args[0] for c in self.kubecli.cli.list_namespaced_pod.call_args_list],
+            ["app-1", "app-2"],
+        )
+        self.kubecli.cli.list_pod_for_all_namespaces.assert_not_called()
+
+    def test_namespace_name_matches_like_the_label_path(self):
+        by_name, _ = pod_selection.select_pods(self.kubecli, "app", name_pattern="web-.*")
+        by_label, _ = pod_selection.select_pods(self.kubecli, "app", label_selector="app=web")
+
+        self.assertEqual(by_name, [("web-0", "app-1"), ("web-1", "app-1"), ("web-2", "app-2")])
+        self.assertEqual(by_label, by_name)
+        self.kubecli.list_namespaces_by_regex.assert_called_once_with("app")
+
+    def test_select_target_pods_resolves_the_node_label_selector_once(self):
+        plugin = PodDisruptionScenarioPlugin()
+        self.kubecli.list_nodes.return_value = ["worker-0", "worker-2"]
+        config = InputParams({
+            "namespace_pattern": ".*",
+            "label_selector": "app=web",
+            "node_label_selector": "node-role.kubernetes.io/worker=",
+            "exclude_label": "protected=true",
+        })
+
+        pods, excluded = plugin.select_target_pods(config, self.kubecli)
+
+        self.assertEqual(pods, [("web-0", "app-1"), ("web-2", "app-2"), ("web-3", "other")])
+        self.assertEqual(excluded, set())
+        self.kubecli.list_nodes.assert_called_once()
+        self.assertEqual(self.kubecli.cli.list_pod_for_all_namespaces.call_count, 2)
+
+
 if __name__ == "__main__":
     unittest.main()
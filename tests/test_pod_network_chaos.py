@@ -11,12 +11,16 @@ Assisted By: Claude Code
 
 import unittest
 import queue
+import threading
 from unittest.mock import MagicMock, patch, call
 from dataclasses import dataclass
 
 from krkn.scenario_plugins.network_chaos_ng.modules.pod_network_chaos import (
     PodNetworkChaosModule,
 )
+from krkn.scenario_plugins.network_chaos_ng.modules.helper_pod_pool import (
+    HelperPodPool,
+)
 from krkn.scenario_plugins.network_chaos_ng.models import (
     NetworkChaosConfig,
     NetworkChaosScenarioType,
@@ -145,13 +149,13 @@ class TestPodNetworkChaosModule(unittest.TestCase):
         "krkn.scenario_plugins.network_chaos_ng.modules.pod_network_chaos.common_set_limit_rules"
     )
     @patch(
-        "krkn.scenario_plugins.network_chaos_ng.modules.pod_network_chaos.setup_network_chaos_ng_scenario"
+        "krkn.scenario_plugins.network_chaos_ng.modules.helper_pod_pool.deploy_network_chaos_ng_pod"
     )
     @patch("krkn.scenario_plugins.network_chaos_ng.modules.pod_network_chaos.log_info")
     def test_run_success(
         self,
         mock_log_info,
-        mock_setup,
+        mock_deploy,
         mock_set_rules,
         mock_delete_rules,
         mock_sleep,
@@ -164,8 +168,8 @@ class TestPodNetworkChaosModule(unittest.TestCase):
         mock_pod_info.nodeName = "worker-1"
         self.mock_kubernetes.get_pod_info.return_value = mock_pod_info
 
-        # Mock setup returns container_ids and interfaces
-        mock_setup.return_value = (["container-123"], ["eth0"])
+        # Mock the container ids of the target
+        self.mock_kubernetes.get_container_ids.return_value = ["container-123"]
 
         # Mock get_pod_pids
         self.mock_kubernetes.get_pod_pids.return_value = ["1234"]
@@ -177,8 +181,8 @@ class TestPodNetworkChaosModule(unittest.TestCase):
             "test-pod", "default"
         )
 
-        # Verify setup was called
-        mock_setup.assert_called_once()
+        # Verify the helper pod was deployed
+        mock_deploy.assert_called_once()
 
         # Verify pids were resolved
         self.mock_kubernetes.get_pod_pids.assert_called_once()
@@ -196,10 +200,10 @@ class TestPodNetworkChaosModule(unittest.TestCase):
         self.assertEqual(self.mock_kubernetes.delete_pod.call_count, 1)
 
     @patch(
-        "krkn.scenario_plugins.network_chaos_ng.modules.pod_network_chaos.setup_network_chaos_ng_scenario"
+        "krkn.scenario_plugins.network_chaos_ng.modules.helper_pod_pool.deploy_network_chaos_ng_pod"
     )
     @patch("krkn.scenario_plugins.network_chaos_ng.modules.pod_network_chaos.log_info")
-    def test_run_pod_info_not_found(self, mock_log_info, mock_setup):
+    def test_run_pod_info_not_found(self, mock_log_info, mock_deploy):
         """
         Test run raises exception when pod info cannot be retrieved
         """
@@ -211,12 +215,12 @@ class TestPodNetworkChaosModule(unittest.TestCase):
         self.assertIn("impossible to retrieve infos", str(context.exception))
 
     @patch(
-        "krkn.scenario_plugins.network_chaos_ng.modules.pod_network_chaos.setup_network_chaos_ng_scenario"
+        "krkn.scenario_plugins.network_chaos_ng.modules.helper_pod_pool.deploy_network_chaos_ng_pod"
     )
     @patch("krkn.scenario_plugins.network_chaos_ng.modules.pod_network_chaos.log_error")
     @patch("krkn.scenario_plugins.network_chaos_ng.modules.pod_network_chaos.log_info")
     def test_run_no_interfaces_detected(
-        self, mock_log_info, mock_log_error, mock_setup
+        self, mock_log_info, mock_log_error, mock_deploy
     ):
         """
         Test run handles case when no network interfaces detected
@@ -226,8 +230,9 @@ class TestPodNetworkChaosModule(unittest.TestCase):
         mock_pod_info.nodeName = "worker-1"
         self.mock_kubernetes.get_pod_info.return_value = mock_pod_info
 
-        # Mock setup returns empty interfaces
-        mock_setup.return_value = (["container-123"], [])
+        # Mock the container ids of the target
+        self.mock_kubernetes.get_container_ids.return_value = ["container-123"]
+        self.mock_kubernetes.exec_cmd_in_pod.return_value = ""
 
         # Set config to auto-detect interfaces
         self.config.interfaces = []
@@ -239,10 +244,10 @@ class TestPodNetworkChaosModule(unittest.TestCase):
         self.assertIn("no network interface", str(mock_log_error.call_args))
 
     @patch(
-        "krkn.scenario_plugins.network_chaos_ng.modules.pod_network_chaos.setup_network_chaos_ng_scenario"
+        "krkn.scenario_plugins.network_chaos_ng.modules.helper_pod_pool.deploy_network_chaos_ng_pod"
     )
     @patch("krkn.scenario_plugins.network_chaos_ng.modules.pod_network_chaos.log_info")
-    def test_run_no_container_id(self, mock_log_info, mock_setup):
+    def test_run_no_container_id(self, mock_log_info, mock_deploy):
         """
         Test run raises exception when container id cannot be resolved
         """
@@ -251,8 +256,8 @@ class TestPodNetworkChaosModule(unittest.TestCase):
         mock_pod_info.nodeName = "worker-1"
         self.mock_kubernetes.get_pod_info.return_value = mock_pod_info
 
-        # Mock setup returns empty container_ids
-        mock_setup.return_value = ([], ["eth0"])
+        # Mock the container ids of the target
+        self.mock_kubernetes.get_container_ids.return_value = []
 
         with self.assertRaises(Exception) as context:
             self.module.run("test-pod")
@@ -260,10 +265,10 @@ class TestPodNetworkChaosModule(unittest.TestCase):
         self.assertIn("impossible to resolve container id", str(context.exception))
 
     @patch(
-        "krkn.scenario_plugins.network_chaos_ng.modules.pod_network_chaos.setup_network_chaos_ng_scenario"
+        "krkn.scenario_plugins.network_chaos_ng.modules.helper_pod_pool.deploy_network_chaos_ng_pod"
     )
     @patch("krkn.scenario_plugins.network_chaos_ng.modules.pod_network_chaos.log_info")
-    def test_run_no_pids(self, mock_log_info, mock_setup):
+    def test_run_no_pids(self, mock_log_info, mock_deploy):
         """
         Test run raises exception when pids cannot be resolved
         """
@@ -272,8 +277,8 @@ class TestPodNetworkChaosModule(unittest.TestCase):
         mock_pod_info.nodeName = "worker-1"
         self.mock_kubernetes.get_pod_info.return_value = mock_pod_info
 
-        # Mock setup
-        mock_setup.return_value = (["container-123"], ["eth0"])
+        # Mock the container ids of the target
+        self.mock_kubernetes.get_container_ids.return_value = ["container-123"]
 
         # Mock get_pod_pids returns empty
         self.mock_kubernetes.get_pod_pids.return_value = []
@@ -291,13 +296,13 @@ class TestPodNetworkChaosModule(unittest.TestCase):
         "krkn.scenario_plugins.network_chaos_ng.modules.pod_network_chaos.common_set_limit_rules"
     )
     @patch(
-        "krkn.scenario_plugins.network_chaos_ng.modules.pod_network_chaos.setup_network_chaos_ng_scenario"
+        "krkn.scenario_plugins.network_chaos_ng.modules.helper_pod_pool.deploy_network_chaos_ng_pod"
     )
     @patch("krkn.scenario_plugins.network_chaos_ng.modules.pod_network_chaos.log_info")
     def test_run_uses_configured_interfaces(
         self,
         mock_log_info,
-        mock_setup,
+        mock_deploy,
         mock_set_rules,
         mock_delete_rules,
         mock_sleep,
@@ -310,8 +315,8 @@ class TestPodNetworkChaosModule(unittest.TestCase):
         mock_pod_info.nodeName = "worker-1"
         self.mock_kubernetes.get_pod_info.return_value = mock_pod_info
 
-        # Mock setup returns different interfaces
-        mock_setup.return_value = (["container-123"], ["eth0", "eth1"])
+        # Mock the container ids of the target
+        self.mock_kubernetes.get_container_ids.return_value = ["container-123"]
 
         # Mock get_pod_pids
         self.mock_kubernetes.get_pod_pids.return_value = ["1234"]
@@ -327,10 +332,10 @@ class TestPodNetworkChaosModule(unittest.TestCase):
         self.assertEqual(call_args[0][2], ["eth2"])
 
     @patch(
-        "krkn.scenario_plugins.network_chaos_ng.modules.pod_network_chaos.setup_network_chaos_ng_scenario"
+        "krkn.scenario_plugins.network_chaos_ng.modules.helper_pod_pool.deploy_network_chaos_ng_pod"
     )
     @patch("krkn.scenario_plugins.network_chaos_ng.modules.pod_network_chaos.log_info")
-    def test_run_with_error_queue(self, mock_log_info, mock_setup):
+    def test_run_with_error_queue(self, mock_log_info, mock_deploy):
         """
         Test run with error_queue for parallel execution
         """
@@ -339,8 +344,8 @@ class TestPodNetworkChaosModule(unittest.TestCase):
         mock_pod_info.nodeName = "worker-1"
         self.mock_kubernetes.get_pod_info.return_value = mock_pod_info
 
-        # Mock setup to raise exception
-        mock_setup.side_effect = Exception("Test error")
+        # Mock the helper deployment to raise exception
+        mock_deploy.side_effect = Exception("Test error")
 
         error_queue = queue.Queue()
         self.module.run("test-pod", error_queue)
@@ -358,13 +363,13 @@ class TestPodNetworkChaosModule(unittest.TestCase):
         "krkn.scenario_plugins.network_chaos_ng.modules.pod_network_chaos.common_set_limit_rules"
     )
     @patch(
-        "krkn.scenario_plugins.network_chaos_ng.modules.pod_network_chaos.setup_network_chaos_ng_scenario"
+        "krkn.scenario_plugins.network_chaos_ng.modules.helper_pod_pool.deploy_network_chaos_ng_pod"
     )
     @patch("krkn.scenario_plugins.network_chaos_ng.modules.pod_network_chaos.log_info")
     def test_run_passes_correct_pids(
         self,
         mock_log_info,
-        mock_setup,
+        mock_deploy,
         mock_set_rules,
         mock_delete_rules,
         mock_sleep,
@@ -377,8 +382,8 @@ class TestPodNetworkChaosModule(unittest.TestCase):
         mock_pod_info.nodeName = "worker-1"
         self.mock_kubernetes.get_pod_info.return_value = mock_pod_info
 
-        # Mock setup
-        mock_setup.return_value = (["container-123"], ["eth0"])
+        # Mock the container ids of the target
+        self.mock_kubernetes.get_container_ids.return_value = ["container-123"]
 
         # Mock get_pod_pids
         test_pids = ["1234", "5678"]
@@ -404,13 +409,13 @@ class TestPodNetworkChaosModule(unittest.TestCase):
         "krkn.scenario_plugins.network_chaos_ng.modules.pod_network_chaos.common_set_limit_rules"
     )
     @patch(
-        "krkn.scenario_plugins.network_chaos_ng.modules.pod_network_chaos.setup_network_chaos_ng_scenario"
+        "krkn.scenario_plugins.network_chaos_ng.modules.helper_pod_pool.deploy_network_chaos_ng_pod"
     )
     @patch("krkn.scenario_plugins.network_chaos_ng.modules.pod_network_chaos.log_info")
     def test_run_ingress_egress_flags(
         self,
         mock_log_info,
-        mock_setup,
+        mock_deploy,
         mock_set_rules,
         mock_delete_rules,
         mock_sleep,
@@ -423,8 +428,8 @@ class TestPodNetworkChaosModule(unittest.TestCase):
         mock_pod_info.nodeName = "worker-1"
         self.mock_kubernetes.get_pod_info.return_value = mock_pod_info
 
-        # Mock setup
-        mock_setup.return_value = (["container-123"], ["eth0"])
+        # Mock the container ids of the target
+        self.mock_kubernetes.get_container_ids.return_value = ["container-123"]
 
         # Mock get_pod_pids
         self.mock_kubernetes.get_pod_pids.return_value = ["1234"]
@@ -447,5 +452,101 @@ class TestPodNetworkChaosModule(unittest.TestCase):
         self.assertEqual(delete_call_args[0][1], False)  # ingress
 
 
+class TestHelperPodPool(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_kubernetes = MagicMock()
+        self.config = NetworkChaosConfig(
+            id="test-pod-network-chaos",
+            image="test-image",
+            wait_duration=1,
+            test_duration=0,
+            label_selector="app=web",
+            service_account="",
+            taints=[],
+            namespace="default",
+            instance_count=0,
+            target="",
+            execution="parallel",
+            interfaces=["eth0"],
+            ingress=True,
+            egress=True,
+        )
+        patcher = patch(
+            "krkn.scenario_plugins.network_chaos_ng.modules.helper_pod_pool.deploy_network_chaos_ng_pod"
+        )
+        self.mock_deploy = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_one_helper_per_node_while_held(self):
+        pool = HelperPodPool(self.config, self.mock_kubernetes, "pod-network-chaos")
+        pool.hold()
+
+        helpers = [pool.acquire(node) for node in ["worker-0", "worker-0", "worker-1"]]
+        for helper in helpers:
+            pool.release(helper)
+
+        self.assertIs(helpers[0], helpers[1])
+        self.assertEqual(self.mock_deploy.call_count, 2)
+        self.mock_kubernetes.delete_pod.assert_not_called()
+
+        pool.close()
+        self.assertEqual(self.mock_kubernetes.delete_pod.call_count, 2)
+
+    def test_concurrent_targets_share_a_single_deployment(self):
+        pool = HelperPodPool(self.config, self.mock_kubernetes, "pod-network-chaos")
+        pool.hold()
+        helpers = []
+        lock = threading.Lock()
+
+        def _acquire():
+            helper = pool.acquire("worker-0", True)
+            with lock:
+                helpers.append(helper)
+
+        threads = [threading.Thread(target=_acquire) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.mock_deploy.call_count, 1)
+        self.assertEqual(len({helper.name for helper in helpers}), 1)
+        self.assertEqual(helpers[0].users, 10)
+
+    def test_helper_is_deleted_by_the_last_user_when_not_held(self):
+        pool = HelperPodPool(self.config, self.mock_kubernetes, "pod-network-chaos")
+        first = pool.acquire("worker-0")
+        second = pool.acquire("worker-0")
+        pool.release(first)
+        self.mock_kubernetes.delete_pod.assert_not_called()
+        pool.release(second)
+        self.mock_kubernetes.delete_pod.assert_called_once_with(first.name, "default")
+
+    @patch("krkn.scenario_plugins.network_chaos_ng.modules.pod_network_chaos.time.sleep")
+    @patch("krkn.scenario_plugins.network_chaos_ng.modules.pod_network_chaos.common_delete_limit_rules")
+    @patch("krkn.scenario_plugins.network_chaos_ng.modules.pod_network_chaos.common_set_limit_rules")
+    def test_module_deploys_one_helper_per_node(self, mock_set_rules, mock_delete_rules, mock_sleep):
+        mock_kubecli = MagicMock()
+        mock_kubecli.get_lib_kubernetes.return_value = self.mock_kubernetes
+        self.mock_kubernetes.get_pod_info.side_effect = lambda name, namespace: MagicMock(
+            nodeName="worker-0" if name.startswith("a") else "worker-1"
+        )
+        self.mock_kubernetes.get_container_ids.return_value = ["container-123"]
+        self.mock_kubernetes.get_pod_pids.return_value = ["1234"]
+        module = PodNetworkChaosModule(self.config, mock_kubecli)
+
+        module.setup()
+        errors = queue.Queue()
+        for target in ["a-1", "a-2", "a-3", "b-1"]:
+            module.run(target, errors)
+        module.teardown()
+
+        self.assertTrue(errors.empty())
+        self.assertEqual(self.mock_deploy.call_count, 2)
+        self.assertEqual(mock_set_rules.call_count, 4)
+        self.assertEqual(self.mock_kubernetes.delete_pod.call_count, 2)
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
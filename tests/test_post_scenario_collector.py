@@ -0,0 +1,139 @@
+"""
+Test suite for krkn/utils/PostScenarioCollector.py and the pipelined
+post scenario stage of AbstractScenarioPlugin.run_scenarios
+
+Usage:
+    python -m coverage run -a -m unittest tests/test_post_scenario_collector.py -v
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from krkn_lib.telemetry.ocp import KrknTelemetryOpenshift
+
+from krkn.scenario_plugins.abstract_scenario_plugin import AbstractScenarioPlugin
+from krkn.utils import PostScenarioCollector
+
+
+class RecordingScenarioPlugin(AbstractScenarioPlugin):
+    def __init__(self, events: list):
+        super().__init__("recording_scenario")
+        self.events = events
+
+    def run(self, run_uuid, scenario, lib_telemetry, scenario_telemetry):
+        self.events.append(f"run {scenario}")
+        return 0
+
+    def get_scenario_types(self):
+        return ["recording_scenario"]
+
+
+class TestPostScenarioCollector(unittest.TestCase):
+
+    def test_tasks_run_in_submission_order(self):
+        collector = PostScenarioCollector()
+        executed = []
+        for i in range(5):
+            collector.submit(f"task {i}", executed.append, i)
+        collector.drain()
+        self.assertEqual(executed, [0, 1, 2, 3, 4])
+
+    def test_submit_does_not_block(self):
+        collector = PostScenarioCollector()
+        release = threading.Event()
+        start = time.monotonic()
+        collector.submit("slow task", release.wait, 5)
+        self.assertLess(time.monotonic() - start, 1)
+        release.set()
+        collector.drain()
+
+    def test_errors_are_logged_not_raised(self):
+        collector = PostScenarioCollector()
+
+        def failing():
+            raise RuntimeError("boom")
+
+        with self.assertLogs(level="ERROR") as logs:
+            collector.submit("collect something", failing)
+            collector.drain()
+        self.assertIn("failed to collect something: boom", logs.output[0])
+
+    def test_completed_tasks_are_not_kept(self):
+        collector = PostScenarioCollector()
+        for i in range(5):
+            collector.submit(f"task {i}", lambda: None)
+            time.sleep(0.01)
+        self.assertLessEqual(len(collector._pending), 2)
+        collector.drain()
+
+    def test_inline_mode_runs_immediately(self):
+        collector = PostScenarioCollector(background=False)
+        executed = []
+        collector.submit("inline", executed.append, "done")
+        self.assertEqual(executed, ["done"])
+        collector.drain()
+
+
+class TestPipelinedRunScenarios(unittest.TestCase):
+
+    def setUp(self):
+        self.telemetry = Mock(spec=KrknTelemetryOpenshift)
+        self.telemetry.set_parameters_base64.return_value = {"test": "config"}
+        self.telemetry.get_telemetry_request_id.return_value = "request-id"
+        self.telemetry.get_lib_kubernetes.return_value = Mock()
+
+    def _run(self, async_collection: bool, collector: PostScenarioCollector = None):
+        events = []
+        plugin = RecordingScenarioPlugin(events)
+
+        def collect_logs(telemetry, config, request_id, start, end):
+            time.sleep(0.05)
+            events.append("logs")
+
+        config = {
+            "tunings": {"wait_duration": 0, "async_collection": async_collection},
+            "telemetry": {"events_backup": False},
+        }
+        with patch(
+            "krkn.scenario_plugins.abstract_scenario_plugin.utils.collect_and_put_ocp_logs",
+            side_effect=collect_logs,
+        ), patch(
+            "krkn.scenario_plugins.abstract_scenario_plugin.cleanup_rollback_version_files"
+        ), patch(
+            "krkn.scenario_plugins.abstract_scenario_plugin.cerberus.publish_kraken_status"
+        ), patch(
+            "krkn.scenario_plugins.abstract_scenario_plugin.os.path.exists",
+            return_value=True,
+        ):
+            failed, telemetries = plugin.run_scenarios(
+                "uuid", ["a.yaml", "b.yaml"], config, self.telemetry, collector
+            )
+            if collector is not None:
+                events.append("returned")
+                collector.drain()
+        self.assertEqual(failed, [])
+        self.assertEqual(len(telemetries), 2)
+        return events
+
+    def test_collection_overlaps_next_scenario(self):
+        events = self._run(async_collection=True)
+        # the second scenario starts before the logs of the first are
+        # collected, all the collection is done before returning
+        self.assertEqual(events[:2], ["run a.yaml", "run b.yaml"])
+        self.assertEqual(events.count("logs"), 2)
+
+    def test_sequential_collection_when_disabled(self):
+        events = self._run(async_collection=False)
+        self.assertEqual(events, ["run a.yaml", "logs", "run b.yaml", "logs"])
+
+    def test_run_collector_is_drained_by_the_caller(self):
+        events = self._run(async_collection=True, collector=PostScenarioCollector())
+        # run_scenarios returns without waiting for the collection
+        self.assertEqual(events[:3], ["run a.yaml", "run b.yaml", "returned"])
+        self.assertEqual(events.count("logs"), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,11 +10,12 @@ Usage:
     python -m unittest tests/test_prometheus_client.py -v
 """
 
+import gzip
 import json
 import os
 import tempfile
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from krkn.prometheus import client
 
@@ -501,5 +502,142 @@ class TestMetricsQueryRouting(unittest.TestCase):
             os.unlink(profile_path)
 
 
+class TestMetricsStreaming(unittest.TestCase):
+    """Tests for the streaming export of the metrics() function."""
+
+    def setUp(self):
+        self.prom_cli = MagicMock()
+        self.elastic = MagicMock()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        patcher = patch.object(client.tempfile, "gettempdir", return_value=self.tmp_dir.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.telemetry_json = json.dumps({
+            "scenarios": [{
+                "affected_pods": {},
+                "affected_nodes": [{"node_name": "worker-0", "ready_time": 10}],
+            }],
+            "health_checks": [],
+            "virt_checks": [],
+        })
+        f = tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False)
+        import yaml
+        yaml.dump({"metrics": [
+            {"query": "first", "metricName": "first"},
+            {"query": "second", "metricName": "second"},
+            {"query": "third", "metricName": "third", "instant": True},
+        ]}, f)
+        f.close()
+        self.profile_path = f.name
+        self.addCleanup(os.unlink, self.profile_path)
+
+        def range_query(query, start_time=None, end_time=None, granularity=10):
+            return [{"metric": {"pod": query}, "values": [[1000000 + i, str(i)] for i in range(3)]}]
+
+        self.prom_cli.process_prom_query_in_range.side_effect = range_query
+        self.prom_cli.process_query.return_value = [{"metric": {}, "value": [1000000, "7"]}]
+
+    def _metrics(self, elastic, **kwargs):
+        return client.metrics(
+            self.prom_cli,
+            elastic,
+            "test-uuid",
+            1000000.0,
+            1000060.0,
+            self.profile_path,
+            "test-metrics-index",
+            self.telemetry_json,
+            **kwargs,
+        )
+
+    def _local_file(self, suffix=".json"):
+        return os.path.join(self.tmp_dir.name, "krkn_metrics", f"test-metrics-index_test-uuid{suffix}")
+
+    def test_uploads_profile_order_in_batches(self):
+        """Records are uploaded in bulks of batch_size in the profile order."""
+        self.elastic.upload_metrics_to_elasticsearch.return_value = 0
+
+        exported = self._metrics(self.elastic, batch_size=3, max_in_flight=2)
+
+        self.assertEqual(exported, 8)
+        batches = [
+            c.kwargs["raw_data"] for c in self.elastic.upload_metrics_to_elasticsearch.call_args_list
+        ]
+        self.assertEqual([len(b) for b in batches], [3, 3, 2])
+        records = [r for b in batches for r in b]
+        self.assertEqual(
+            [r["metricName"] for r in records],
+            ["first"] * 3 + ["second"] * 3 + ["third", "affected_nodes_recovery"],
+        )
+        self.assertEqual(records[1]["pod"], "first")
+        self.assertEqual(records[1]["value"], 1.0)
+        self.assertEqual(os.listdir(os.path.dirname(self._local_file())), [])
+
+    def test_saves_every_record_without_elastic(self):
+        """Without elastic every record is saved in the run_uuid/metrics JSON file."""
+        exported = self._metrics(None, batch_size=2)
+
+        with open(self._local_file()) as f:
+            saved = json.load(f)
+        self.assertEqual(exported, 8)
+        self.assertEqual(saved["run_uuid"], "test-uuid")
+        self.assertEqual(len(saved["metrics"]), 8)
+        self.assertEqual(saved["metrics"][6]["value"], 7.0)
+
+    def test_compressed_local_file(self):
+        """With compress the local file is gzipped."""
+        self._metrics(None, compress=True)
+
+        with gzip.open(self._local_file(".json.gz"), "rt") as f:
+            saved = json.load(f)
+        self.assertEqual(len(saved["metrics"]), 8)
+        self.assertFalse(os.path.exists(self._local_file()))
+
+    def test_failed_upload_saves_every_record_to_disk(self):
+        """After a failed bulk every record of the run is saved locally."""
+        self.elastic.upload_metrics_to_elasticsearch.side_effect = [0, -1]
+
+        exported = self._metrics(self.elastic, batch_size=3)
+
+        with open(self._local_file()) as f:
+            saved = json.load(f)
+        self.assertEqual(exported, 8)
+        self.assertEqual(self.elastic.upload_metrics_to_elasticsearch.call_count, 2)
+        self.assertEqual(len(saved["metrics"]), 8)
+        self.assertEqual(saved["metrics"][0]["metricName"], "first")
+
+    def test_unwritable_local_file_falls_back_to_upload_only(self):
+        """A local file that can't be created doesn't abort the upload."""
+        self.elastic.upload_metrics_to_elasticsearch.return_value = 0
+
+        with patch.object(client.os, "makedirs", side_effect=PermissionError("read-only")):
+            exported = self._metrics(self.elastic, batch_size=3)
+
+        self.assertEqual(exported, 8)
+        self.assertEqual(self.elastic.upload_metrics_to_elasticsearch.call_count, 3)
+
+    def test_failed_replace_is_logged(self):
+        """An error saving the local file doesn't mask the upload failure."""
+        self.elastic.upload_metrics_to_elasticsearch.return_value = -1
+
+        with patch.object(client.os, "replace", side_effect=OSError("disk full")), \
+                self.assertLogs(level="ERROR") as logs:
+            exported = self._metrics(self.elastic)
+
+        self.assertEqual(exported, 0)
+        self.assertTrue(any("disk full" in line for line in logs.output))
+        self.assertEqual(os.listdir(os.path.dirname(self._local_file())), [])
+
+    def test_failed_query_is_skipped(self):
+        """A failing query does not stop the export of the other metrics."""
+        self.prom_cli.process_query.side_effect = Exception("query failed")
+        self.elastic.upload_metrics_to_elasticsearch.return_value = 0
+
+        exported = self._metrics(self.elastic)
+
+        self.assertEqual(exported, 7)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -24,10 +24,19 @@ How to run these tests:
 """
 
 import datetime
+import json
+import threading
+import time
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import Mock, patch, MagicMock
+from urllib.parse import parse_qs, urlparse
 
-from krkn.prometheus.collector import slo_passed, evaluate_slos
+from prometheus_api_client import PrometheusConnect
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from krkn.prometheus.collector import SloSampleStore, slo_passed, evaluate_slos, fetch_slo_samples
 
 
 class TestSLOPassed(unittest.TestCase):
@@ -398,5 +407,237 @@ class TestEvaluateSLOs(unittest.TestCase):
         self.assertIn("test_slo", call_args[1])
 
 
+class TestSloSampleStore(unittest.TestCase):
+    """Test cases for the local evaluation of SLO windows."""
+
+    def setUp(self):
+        self.start = datetime.datetime(2025, 1, 1, 0, 0, 0)
+        self.end = datetime.datetime(2025, 1, 1, 1, 0, 0)
+        self.store = SloSampleStore(self.start, self.end)
+
+    def _ts(self, minutes):
+        return (self.start + datetime.timedelta(minutes=minutes)).timestamp()
+
+    def test_window_slicing_matches_slo_passed(self):
+        """Test only the samples inside the window decide the status."""
+        self.store.add("slo", [
+            {"values": [[self._ts(0), "0"], [self._ts(10), "1"]]},
+            {"values": [[self._ts(10), "0"], [self._ts(40), "0"]]},
+        ])
+        self.assertFalse(self.store.evaluate(self.start, self.end)["slo"])
+        self.assertFalse(
+            self.store.evaluate(self.start + datetime.timedelta(minutes=10), self.end)["slo"]
+        )
+        self.assertTrue(
+            self.store.evaluate(self.start + datetime.timedelta(minutes=11), self.end)["slo"]
+        )
+
+    def test_empty_window_and_non_numeric_values_pass(self):
+        """Test absence of data and non numeric samples are a pass."""
+        self.store.add("empty", [])
+        self.store.add("nan", [{"values": [[self._ts(5), "invalid"]]}])
+        self.assertEqual(self.store.evaluate(self.start, self.end), {"empty": True, "nan": True})
+
+    def test_failed_query_fails_every_window(self):
+        """Test a failed query is a failure in every window."""
+        self.store.add("failed", None)
+        self.assertEqual(self.store.evaluate(self.start, self.end), {"failed": False})
+
+    def test_covers(self):
+        """Test covers only accepts windows inside the fetched range."""
+        self.assertTrue(self.store.covers(self.start, self.end))
+        self.assertFalse(self.store.covers(self.start, self.end + datetime.timedelta(seconds=1)))
+
+    def test_fetch_slo_samples_queries_every_slo_once(self):
+        """Test fetch_slo_samples issues one range query per SLO."""
+        mock_prom = Mock()
+        mock_prom.process_prom_query_in_range.return_value = [
+            {"values": [[self._ts(30), "1"]]}
+        ]
+        store = fetch_slo_samples(
+            mock_prom,
+            [{"name": "a", "expr": "a"}, {"name": "b", "expr": "b"}],
+            self.start,
+            self.end,
+        )
+        self.assertEqual(mock_prom.process_prom_query_in_range.call_count, 2)
+        self.assertEqual(store.evaluate(self.start, self.end), {"a": False, "b": False})
+        early_end = self.start + datetime.timedelta(minutes=20)
+        self.assertEqual(store.evaluate(self.start, early_end), {"a": True, "b": True})
+
+
+    def test_long_windows_are_fetched_in_chunks_below_the_points_limit(self):
+        """Test a window longer than the points per series limit is split."""
+        mock_prom = Mock()
+        start = self.start
+        end = start + datetime.timedelta(hours=40)
+        late = (start + datetime.timedelta(hours=35)).timestamp()
+
+        def query(expr, start_time, end_time):
+            if start_time.timestamp() <= late <= end_time.timestamp():
+                return [{"values": [[late, "1"]]}]
+            return [{"values": [[start_time.timestamp(), "0"]]}]
+
+        mock_prom.process_prom_query_in_range.side_effect = query
+        store = fetch_slo_samples(mock_prom, [{"name": "a", "expr": "a"}], start, end)
+
+        calls = mock_prom.process_prom_query_in_range.call_args_list
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(calls[0].kwargs["start_time"], start)
+        self.assertEqual(calls[-1].kwargs["end_time"], end)
+        for call in calls:
+            points = (call.kwargs["end_time"] - call.kwargs["start_time"]).total_seconds() / 10 + 1
+            self.assertLessEqual(points, 11000)
+        self.assertEqual(
+            calls[1].kwargs["start_time"] - calls[0].kwargs["end_time"],
+            datetime.timedelta(seconds=10),
+        )
+        self.assertEqual(store.evaluate(start, end), {"a": False})
+
+
+class FakePrometheusHandler(BaseHTTPRequestHandler):
+    """Serves /api/v1/query_range, the behaviour of every query is driven
+    by the ``behaviours`` dict of the server: query -> list of actions
+    consumed one per request (``("ok", value)``, ``("status", code)`` or
+    ``("sleep", seconds)``)."""
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        query = parse_qs(urlparse(self.path).query)["query"][0]
+        with server.lock:
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            server.requests.append(query)
+            actions = server.behaviours.get(query, [("ok", "0")])
+            action = actions.pop(0) if len(actions) > 1 else actions[0]
+        try:
+            kind, arg = action
+            if kind == "sleep":
+                time.sleep(arg)
+                kind, arg = "ok", "0"
+            if kind == "status":
+                self.send_response(arg)
+                self.end_headers()
+                self.wfile.write(b"error")
+                return
+            body = {
+                "status": "success",
+                "data": {
+                    "resultType": "matrix",
+                    "result": [{"metric": {}, "values": [[1735689600, arg]]}],
+                },
+            }
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(json.dumps(body).encode())
+        except (BrokenPipeError, ConnectionResetError):
+            # the client gave up on a slow query
+            pass
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+
+class FakePrometheusClient:
+    """Same requests of KrknPrometheus on a real PrometheusConnect, other
+    test modules replace krkn_lib with stubs when collected first."""
+
+    def __init__(self, url):
+        self.prom_cli = PrometheusConnect(url=url, disable_ssl=True)
+
+    def process_prom_query_in_range(self, query, start_time=None, end_time=None, granularity=10):
+        return self.prom_cli.custom_query_range(
+            query=query,
+            start_time=start_time,
+            end_time=end_time,
+            step=f"{granularity}s",
+        )
+
+
+class TestEvaluateSLOsFakePrometheus(unittest.TestCase):
+    """Concurrent SLO evaluation against a local fake Prometheus."""
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), FakePrometheusHandler)
+        self.server.daemon_threads = True
+        self.server.lock = threading.Lock()
+        self.server.in_flight = 0
+        self.server.max_in_flight = 0
+        self.server.requests = []
+        self.server.behaviours = {}
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.prom_cli = FakePrometheusClient(f"http://127.0.0.1:{self.server.server_port}")
+        self.start_time = datetime.datetime(2025, 1, 1, 0, 0, 0)
+        self.end_time = datetime.datetime(2025, 1, 1, 1, 0, 0)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_queries_run_concurrently_with_bounded_in_flight(self):
+        slos = [{"name": f"slo{i}", "expr": f"q{i}"} for i in range(8)]
+        for i in range(8):
+            self.server.behaviours[f"q{i}"] = [("sleep", 0.2)]
+        start = time.monotonic()
+        results = evaluate_slos(
+            self.prom_cli, slos, self.start_time, self.end_time, max_in_flight=4
+        )
+        elapsed = time.monotonic() - start
+        self.assertEqual(results, {f"slo{i}": True for i in range(8)})
+        self.assertEqual(list(results.keys()), [f"slo{i}" for i in range(8)])
+        self.assertLessEqual(self.server.max_in_flight, 4)
+        self.assertGreater(self.server.max_in_flight, 1)
+        self.assertLess(elapsed, 8 * 0.2)
+
+    def test_failing_slo_and_server_error_retry(self):
+        self.server.behaviours["flaky"] = [("status", 503), ("ok", "0")]
+        self.server.behaviours["firing"] = [("ok", "1")]
+        results = evaluate_slos(
+            self.prom_cli,
+            [{"name": "flaky", "expr": "flaky"}, {"name": "firing", "expr": "firing"}],
+            self.start_time,
+            self.end_time,
+            retries=2,
+            retry_backoff=0.01,
+        )
+        self.assertEqual(results, {"flaky": True, "firing": False})
+        self.assertEqual(self.server.requests.count("flaky"), 2)
+
+    def test_bad_query_is_not_retried(self):
+        self.server.behaviours["bad"] = [("status", 400)]
+        results = evaluate_slos(
+            self.prom_cli,
+            [{"name": "bad", "expr": "bad"}],
+            self.start_time,
+            self.end_time,
+            retries=3,
+            retry_backoff=0.01,
+        )
+        self.assertEqual(results, {"bad": False})
+        self.assertEqual(self.server.requests.count("bad"), 1)
+
+    def test_query_timeout(self):
+        # prometheus_api_client retries read timeouts with its own backoff,
+        # disable it to measure the query timeout alone
+        connect = self.prom_cli.prom_cli
+        connect._session.mount(connect.url, HTTPAdapter(max_retries=Retry(0)))
+        self.server.behaviours["slow"] = [("sleep", 3)]
+        start = time.monotonic()
+        results = evaluate_slos(
+            self.prom_cli,
+            [{"name": "slow", "expr": "slow"}, {"name": "fast", "expr": "fast"}],
+            self.start_time,
+            self.end_time,
+            query_timeout=0.2,
+        )
+        self.assertEqual(results, {"slow": False, "fast": True})
+        self.assertLess(time.monotonic() - start, 2)
+
+
 if __name__ == '__main__':
     unittest.main()
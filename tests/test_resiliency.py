@@ -317,6 +317,30 @@ class TestResiliencyScenarioReports(unittest.TestCase):
         self.assertEqual(self.res.scenario_reports[0]["name"], "test_scenario")
         self.assertEqual(self.res.scenario_reports[0]["weight"], 1.5)
 
+    @patch('krkn.resiliency.resiliency.evaluate_slos')
+    @patch('krkn.resiliency.resiliency.calculate_resiliency_score')
+    def test_add_scenario_report_passes_evaluation_options(self, mock_calc_score, mock_eval_slos):
+        """Test the slo_evaluation options are forwarded to evaluate_slos."""
+        mock_eval_slos.return_value = {"slo1": True}
+        mock_calc_score.return_value = (100, {"passed": 1, "failed": 0, "total_points": 3, "points_lost": 0})
+        res = Resiliency(
+            alerts_yaml_path=self.temp_file,
+            slo_evaluation={"max_in_flight": 2, "query_timeout": 30, "retries": 1},
+        )
+
+        res.add_scenario_report(
+            scenario_name="test_scenario",
+            prom_cli=self.mock_prom,
+            start_time=datetime.datetime(2025, 1, 1, 0, 0, 0),
+            end_time=datetime.datetime(2025, 1, 1, 1, 0, 0),
+        )
+
+        kwargs = mock_eval_slos.call_args.kwargs
+        self.assertEqual(kwargs["max_in_flight"], 2)
+        self.assertEqual(kwargs["query_timeout"], 30)
+        self.assertEqual(kwargs["retries"], 1)
+        self.assertEqual(kwargs["retry_backoff"], 1.0)
+
     @patch('krkn.resiliency.resiliency.evaluate_slos')
     def test_finalize_report_calculates_weighted_average(self, mock_eval_slos):
         """Test that finalize_report calculates weighted average correctly."""
@@ -608,6 +632,93 @@ class TestResiliencyAddScenarioReports(unittest.TestCase):
         self.assertEqual(self.res.scenario_reports[0]["name"], "real_scenario_name")
 
 
+class TestResiliencySinglePass(unittest.TestCase):
+    """Test cases for the single_pass SLO evaluation mode."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            import yaml
+            yaml.dump([
+                {"expr": "up == 0", "severity": "critical", "description": "slo1"},
+                {"expr": "cpu > 80", "severity": "warning", "description": "slo2"},
+            ], f)
+            self.temp_file = f.name
+
+        self.res = Resiliency(alerts_yaml_path=self.temp_file, slo_evaluation={"single_pass": True})
+        self.mock_prom = Mock()
+        self.start = datetime.datetime(2025, 1, 1, 0, 0, 0)
+        self.middle = datetime.datetime(2025, 1, 1, 0, 30, 0)
+        self.end = datetime.datetime(2025, 1, 1, 1, 0, 0)
+
+    def tearDown(self):
+        """Clean up temp files."""
+        if os.path.exists(self.temp_file):
+            os.unlink(self.temp_file)
+
+    def _range_result(self, firing_at):
+        return [{"metric": {}, "values": [[firing_at.timestamp(), "1"]]}]
+
+    @patch('krkn.resiliency.resiliency.evaluate_slos')
+    def test_windows_are_evaluated_with_one_query_per_slo(self, mock_eval_slos):
+        """Test every SLO is fetched once and each window is sliced locally."""
+        first_half = datetime.datetime(2025, 1, 1, 0, 10, 0)
+        self.mock_prom.process_prom_query_in_range.side_effect = lambda expr, **kwargs: (
+            self._range_result(first_half) if expr == "up == 0" else []
+        )
+        telemetries = [
+            {"scenario": "first", "start_timestamp": self.start.timestamp(), "end_timestamp": self.middle.timestamp()},
+            {"scenario": "second", "start_timestamp": self.middle.timestamp(), "end_timestamp": self.end.timestamp()},
+        ]
+
+        self.res.add_scenario_reports(
+            scenario_telemetries=telemetries,
+            prom_cli=self.mock_prom,
+            scenario_type="pod_scenarios",
+            batch_start_dt=self.start,
+            batch_end_dt=self.end,
+        )
+        self.assertEqual(self.res.scenario_reports, [])
+
+        self.res.finalize_report(
+            prom_cli=self.mock_prom,
+            total_start_time=self.start,
+            total_end_time=self.end,
+        )
+
+        self.assertEqual(self.mock_prom.process_prom_query_in_range.call_count, 2)
+        mock_eval_slos.assert_not_called()
+        self.assertEqual([rep["name"] for rep in self.res.scenario_reports], ["first", "second"])
+        self.assertEqual(self.res.scenario_reports[0]["slo_results"], {"slo1": False, "slo2": True})
+        self.assertEqual(self.res.scenario_reports[1]["slo_results"], {"slo1": True, "slo2": True})
+        self.assertIn("resiliency_report", telemetries[0])
+        self.assertEqual(self.res.summary["passed_slos"], 1)
+        self.assertEqual(self.res.summary["total_slos"], 2)
+
+    def test_failed_query_fails_the_slo_in_every_window(self):
+        """Test a failed fetch marks the SLO as failed like evaluate_slos."""
+        def query(expr, **kwargs):
+            if expr == "up == 0":
+                raise Exception("connection refused")
+            return []
+        self.mock_prom.process_prom_query_in_range.side_effect = query
+
+        self.res.add_scenario_reports(
+            scenario_telemetries=[{"scenario": "only"}],
+            prom_cli=self.mock_prom,
+            scenario_type="pod_scenarios",
+            batch_start_dt=self.start,
+            batch_end_dt=self.end,
+        )
+        self.res.evaluate_pending_reports(
+            prom_cli=self.mock_prom,
+            total_start_time=self.start,
+            total_end_time=self.end,
+        )
+
+        self.assertEqual(self.res.scenario_reports[0]["slo_results"], {"slo1": False, "slo2": True})
+
+
 class TestFinalizeAndSave(unittest.TestCase):
     """Test cases for finalize_and_save method."""
 
@@ -222,6 +222,177 @@ class TestRollbackConfig:
             ]
             assert result_filenames == expected_order
 
+def rollback_noop(rollback_content: "RollbackContent", lib_telemetry: "KrknTelemetryOpenshift") -> None:
+    pass
+
+
+def rollback_failing(rollback_content: "RollbackContent", lib_telemetry: "KrknTelemetryOpenshift") -> None:
+    raise RuntimeError("rollback failed")
+
+
+class TestRollbackStore:
+
+    def write_version_file(self, versions_dir, context, file_name):
+        os.makedirs(os.path.join(versions_dir, context), exist_ok=True)
+        path = os.path.join(versions_dir, context, file_name)
+        with open(path, "w") as f:
+            f.write("# dummy content")
+        return path
+
+    def test_pending_lookup_and_state_transitions(self, tmpdir):
+        from krkn.rollback.store import RollbackStore, EXECUTED, FAILED
+
+        versions_dir = str(tmpdir)
+        store = RollbackStore(versions_dir)
+        assert store.initialize() is True
+        paths = {}
+        for run_uuid, scenario_type, timestamp in [
+            ("run-a", "pod_scenarios", 1000),
+            ("run-a", "pod_scenarios", 3000),
+            ("run-a", "node_scenarios", 2000),
+            ("run-b", "pod_scenarios", 4000),
+        ]:
+            path = self.write_version_file(
+                versions_dir, f"1-{run_uuid}", f"{scenario_type}_{timestamp}_abcdefgh.py"
+            )
+            store.add(path, run_uuid, scenario_type, timestamp)
+            paths[timestamp] = path
+
+        assert [e.version_file for e in store.pending("run-a", "pod_scenarios")] == [
+            paths[3000], paths[1000]
+        ]
+        assert [e.timestamp for e in store.pending()] == [4000, 3000, 2000, 1000]
+
+        os.rename(paths[3000], f"{paths[3000]}.executed")
+        assert store.mark_executed(paths[3000])
+        assert store.mark_failed(paths[1000], "boom")
+        assert not store.mark_executed(os.path.join(versions_dir, "unknown.py"))
+
+        entries = {e.timestamp: e for e in store.entries("run-a", "pod_scenarios")}
+        assert entries[3000].state == EXECUTED
+        assert entries[3000].current_file == f"{paths[3000]}.executed"
+        assert (entries[1000].state, entries[1000].attempts, entries[1000].error) == (FAILED, 1, "boom")
+        # failed rollbacks are retried
+        assert [e.timestamp for e in store.pending("run-a", "pod_scenarios")] == [1000]
+
+        store.remove([paths[1000]])
+        assert store.pending("run-a", "pod_scenarios") == []
+
+    def test_existing_files_are_indexed_once(self, tmpdir):
+        from unittest.mock import patch
+        from krkn.rollback.store import RollbackStore, EXECUTED, PENDING
+
+        versions_dir = str(tmpdir.mkdir("versions_existing"))
+        pending = self.write_version_file(versions_dir, "123-abcdefgh", "scenario_1000_12345678.py")
+        executed = self.write_version_file(versions_dir, "123-abcdefgh", "scenario_2000_12345678.py")
+        os.rename(executed, f"{executed}.executed")
+
+        with patch.object(RollbackConfig, "versions_directory", versions_dir):
+            assert RollbackConfig.search_rollback_version_files("abcdefgh") == [pending]
+            states = {e.version_file: e.state for e in RollbackConfig.get_store().entries()}
+            assert states == {pending: PENDING, executed: EXECUTED}
+
+            # files written outside of the index after the import aren't scanned again
+            self.write_version_file(versions_dir, "456-abcdefgh", "scenario_3000_12345678.py")
+            assert RollbackConfig.search_rollback_version_files("abcdefgh") == [pending]
+        assert RollbackStore(versions_dir).initialize() is False
+
+    def test_interrupted_execution_is_reconciled(self, tmpdir):
+        from krkn.rollback.store import RollbackStore, EXECUTED
+
+        versions_dir = str(tmpdir)
+        store = RollbackStore(versions_dir)
+        store.initialize()
+        executed = self.write_version_file(versions_dir, "1-run", "scenario_1000_abcdefgh.py")
+        deleted = self.write_version_file(versions_dir, "1-run", "scenario_2000_abcdefgh.py")
+        store.add(executed, "run", "scenario", 1000)
+        store.add(deleted, "run", "scenario", 2000)
+        # crash between the rename of the file and the update of the index
+        os.rename(executed, f"{executed}.executed")
+        os.remove(deleted)
+
+        assert [store.reconcile(e) for e in store.pending("run")] == [None, None]
+        assert [(e.version_file, e.state) for e in store.entries("run")] == [(executed, EXECUTED)]
+
+    def test_compact_deletes_old_executed_versions(self, tmpdir):
+        from krkn.rollback.store import RollbackStore
+
+        versions_dir = str(tmpdir)
+        store = RollbackStore(versions_dir)
+        store.initialize()
+        executed = self.write_version_file(versions_dir, "1-old", "scenario_1000_abcdefgh.py")
+        pending = self.write_version_file(versions_dir, "2-new", "scenario_2000_abcdefgh.py")
+        store.add(executed, "old", "scenario", 1000)
+        store.add(pending, "new", "scenario", 2000)
+        os.rename(executed, f"{executed}.executed")
+        store.mark_executed(executed)
+
+        assert store.compact(retention=3600) == 0
+        assert store.compact(retention=0) == 1
+        assert not os.path.exists(os.path.dirname(executed))
+        assert os.path.exists(pending)
+        assert [e.version_file for e in store.entries()] == [pending]
+
+    def test_rollback_handler_indexes_and_executes_versions(self, tmpdir):
+        from unittest.mock import Mock, patch
+        from krkn.rollback.config import RollbackContent
+        from krkn.rollback.handler import (
+            RollbackHandler,
+            cleanup_rollback_version_files,
+            execute_rollback_version_files,
+        )
+        from krkn.rollback.serialization import Serializer
+        from krkn.rollback.store import EXECUTED, FAILED
+
+        versions_dir = str(tmpdir.mkdir("versions_handler"))
+        scenario_type = "test_scenarios"
+        handler = RollbackHandler(scenario_type, Serializer(scenario_type))
+
+        with patch.object(RollbackConfig, "versions_directory", versions_dir):
+            handler.set_context("run-handler")
+            handler.set_rollback_callable(rollback_noop, RollbackContent(resource_identifier="noop"))
+            handler.set_rollback_callable(rollback_failing, RollbackContent(resource_identifier="fail"))
+            handler.clear_context()
+
+            version_files = RollbackConfig.search_rollback_version_files("run-handler", scenario_type)
+            assert len(version_files) == 2
+            failing, noop = version_files
+
+            with pytest.raises(RuntimeError):
+                execute_rollback_version_files(
+                    Mock(), "run-handler", scenario_type, ignore_auto_rollback_config=True
+                )
+            states = {e.version_file: e.state for e in RollbackConfig.get_store().entries()}
+            assert states == {failing: FAILED, noop: "pending"}
+
+            os.remove(failing)
+            execute_rollback_version_files(
+                Mock(), "run-handler", scenario_type, ignore_auto_rollback_config=True
+            )
+            entries = RollbackConfig.get_store().entries("run-handler")
+            assert [(e.version_file, e.state) for e in entries] == [(noop, EXECUTED)]
+            assert os.path.exists(f"{noop}.executed")
+
+            handler.set_context("run-cleanup")
+            handler.set_rollback_callable(rollback_noop, RollbackContent(resource_identifier="noop"))
+            handler.clear_context()
+            cleanup_rollback_version_files("run-cleanup", scenario_type)
+            assert RollbackConfig.get_store().entries("run-cleanup") == []
+
+    def test_rollback_handler_without_context_does_not_raise(self, tmpdir):
+        from unittest.mock import Mock, patch
+        from krkn.rollback.config import RollbackContent
+        from krkn.rollback.handler import RollbackHandler
+
+        versions_dir = str(tmpdir.mkdir("versions_no_context"))
+        serializer = Mock()
+        serializer.serialize_callable.return_value = os.path.join(versions_dir, "unexpected.py")
+        handler = RollbackHandler("test_scenarios", serializer)
+
+        with patch.object(RollbackConfig, "versions_directory", versions_dir):
+            handler.set_rollback_callable(rollback_noop, RollbackContent(resource_identifier="noop"))
+            assert RollbackConfig.get_store().entries() == []
+
 class TestRollbackCommand:
 
     @pytest.mark.parametrize("auto_rollback", [True, False], ids=["enabled_rollback", "disabled_rollback"])
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+
+"""
+Test suite for the concurrent ScenarioScheduler
+
+Usage:
+    python -m coverage run -a -m unittest tests/test_scenario_scheduler.py -v
+"""
+
+import threading
+import time
+import unittest
+
+from krkn.scheduler import (
+    ScenarioScheduler,
+    ScheduledScenario,
+    get_scenario_entry_type,
+)
+
+
+class RecordingRunner:
+    """Runs entries sleeping a fixed time and records the overlaps."""
+
+    def __init__(self, duration: float = 0.05, fail: set = None):
+        self.duration = duration
+        self.fail = fail or set()
+        self.lock = threading.Lock()
+        self.running: set[str] = set()
+        self.max_running = 0
+        self.overlaps: set[frozenset] = set()
+        self.started: list[str] = []
+
+    def __call__(self, entry: ScheduledScenario):
+        with self.lock:
+            for other in self.running:
+                self.overlaps.add(frozenset((entry.name, other)))
+            self.running.add(entry.name)
+            self.started.append(entry.name)
+            self.max_running = max(self.max_running, len(self.running))
+        time.sleep(self.duration)
+        with self.lock:
+            self.running.discard(entry.name)
+        if entry.name in self.fail:
+            raise RuntimeError(f"{entry.name} exploded")
+        return [], []
+
+
+def _entry(name, scenario_type=None, **kwargs):
+    return ScheduledScenario(
+        name=name,
+        scenario_type=scenario_type or f"{name}_scenarios",
+        scenarios=[f"{name}.yaml"],
+        **kwargs,
+    )
+
+
+class TestScheduledScenarioConfig(unittest.TestCase):
+
+    def test_entry_type_ignores_scheduling_keys(self):
+        entry = {
+            "name": "etcd",
+            "depends_on": ["a"],
+            "pod_disruption_scenarios": ["etcd.yml"],
+        }
+        self.assertEqual(
+            get_scenario_entry_type(entry), "pod_disruption_scenarios"
+        )
+
+    def test_entry_with_two_types_raises(self):
+        with self.assertRaises(ValueError):
+            get_scenario_entry_type({"a": [], "b": []})
+
+    def test_from_config_default_names(self):
+        entries = ScheduledScenario.from_config(
+            [
+                {"pod_disruption_scenarios": ["a.yml"]},
+                {"pod_disruption_scenarios": ["b.yml"]},
+                {"hog_scenarios": ["c.yml"], "concurrency_group": "nodes"},
+            ]
+        )
+        self.assertEqual(
+            [e.name for e in entries],
+            [
+                "pod_disruption_scenarios-0",
+                "pod_disruption_scenarios-1",
+                "hog_scenarios",
+            ],
+        )
+        self.assertEqual(entries[2].concurrency_group, "nodes")
+        self.assertEqual(entries[2].scenarios, ["c.yml"])
+
+    def test_from_config_string_depends_on(self):
+        entries = ScheduledScenario.from_config(
+            [
+                {"name": "a", "hog_scenarios": ["a.yml"]},
+                {"name": "b", "pod_disruption_scenarios": ["b.yml"], "depends_on": "a"},
+            ]
+        )
+        self.assertEqual(entries[1].depends_on, ["a"])
+
+
+class TestScenarioSchedulerValidation(unittest.TestCase):
+
+    def test_unknown_dependency(self):
+        with self.assertRaises(ValueError) as ctx:
+            ScenarioScheduler([_entry("a", depends_on=["missing"])])
+        self.assertIn("unknown entry 'missing'", str(ctx.exception))
+
+    def test_dependency_cycle(self):
+        with self.assertRaises(ValueError) as ctx:
+            ScenarioScheduler(
+                [
+                    _entry("a", depends_on=["c"]),
+                    _entry("b", depends_on=["a"]),
+                    _entry("c", depends_on=["b"]),
+                    _entry("d"),
+                ]
+            )
+        self.assertIn("['a', 'b', 'c']", str(ctx.exception))
+
+    def test_duplicate_names(self):
+        with self.assertRaises(ValueError):
+            ScenarioScheduler([_entry("a"), _entry("a", "other")])
+
+    def test_invalid_max_parallel(self):
+        with self.assertRaises(ValueError):
+            ScenarioScheduler([_entry("a")], max_parallel=0)
+
+    def test_invalid_group_limit(self):
+        with self.assertRaises(ValueError):
+            ScenarioScheduler([_entry("a")], group_limits={"g": 0})
+
+
+class TestScenarioSchedulerRun(unittest.TestCase):
+
+    def test_independent_entries_run_concurrently(self):
+        runner = RecordingRunner()
+        scheduler = ScenarioScheduler(
+            [_entry(n) for n in "abcd"], max_parallel=4
+        )
+        start = time.monotonic()
+        results = scheduler.run(runner)
+        self.assertEqual(len(results), 4)
+        self.assertEqual(runner.max_running, 4)
+        self.assertLess(time.monotonic() - start, 0.15)
+
+    def test_max_parallel_is_honoured(self):
+        runner = RecordingRunner(duration=0.02)
+        ScenarioScheduler([_entry(n) for n in "abcdef"], max_parallel=2).run(
+            runner
+        )
+        self.assertEqual(runner.max_running, 2)
+
+    def test_depends_on_orders_entries(self):
+        runner = RecordingRunner()
+        results = ScenarioScheduler(
+            [_entry("b", depends_on=["a"]), _entry("a")], max_parallel=4
+        ).run(runner)
+        self.assertEqual(runner.started, ["a", "b"])
+        by_name = {r.entry.name: r for r in results}
+        self.assertGreaterEqual(
+            by_name["b"].start_timestamp, by_name["a"].end_timestamp
+        )
+
+    def test_exclusive_with_is_symmetric(self):
+        runner = RecordingRunner()
+        ScenarioScheduler(
+            [_entry("a"), _entry("b", exclusive_with=["a"]), _entry("c")],
+            max_parallel=4,
+        ).run(runner)
+        self.assertNotIn(frozenset(("a", "b")), runner.overlaps)
+        self.assertIn(frozenset(("a", "c")), runner.overlaps)
+
+    def test_same_scenario_type_never_overlaps(self):
+        runner = RecordingRunner()
+        ScenarioScheduler(
+            [_entry("a", "pod_disruption_scenarios"),
+             _entry("b", "pod_disruption_scenarios")],
+            max_parallel=4,
+        ).run(runner)
+        self.assertEqual(runner.max_running, 1)
+
+    def test_concurrency_group_limits(self):
+        runner = RecordingRunner()
+        ScenarioScheduler(
+            [_entry(n, concurrency_group="nodes") for n in "abcd"],
+            max_parallel=4,
+            group_limits={"nodes": 2},
+        ).run(runner)
+        self.assertEqual(runner.max_running, 2)
+
+    def test_concurrency_group_default_limit(self):
+        runner = RecordingRunner()
+        ScenarioScheduler(
+            [_entry(n, concurrency_group="etcd") for n in "abc"] + [_entry("d")],
+            max_parallel=4,
+        ).run(runner)
+        self.assertEqual(runner.max_running, 2)
+
+    def test_exception_marks_entry_failed(self):
+        runner = RecordingRunner(fail={"a"})
+        results = ScenarioScheduler(
+            [_entry("a"), _entry("b", depends_on=["a"])]
+        ).run(runner)
+        by_name = {r.entry.name: r for r in results}
+        self.assertEqual(by_name["a"].failed_scenarios, ["a.yaml"])
+        self.assertIn("exploded", by_name["a"].error)
+        # dependants still run once the dependency ended
+        self.assertIsNone(by_name["b"].error)
+
+    def test_on_complete_false_stops_scheduling(self):
+        runner = RecordingRunner()
+        completed = []
+
+        def on_complete(result):
+            completed.append(result.entry.name)
+            return False
+
+        results = ScenarioScheduler(
+            [_entry("a"), _entry("b", depends_on=["a"])]
+        ).run(runner, on_complete=on_complete)
+        self.assertEqual([r.entry.name for r in results], ["a"])
+        self.assertEqual(completed, ["a"])
+
+    def test_should_stop_waits_running_entries(self):
+        runner = RecordingRunner()
+        polls = []
+
+        def should_stop():
+            polls.append(1)
+            return len(polls) > 1
+
+        results = ScenarioScheduler(
+            [_entry("a"), _entry("b", depends_on=["a"])]
+        ).run(runner, should_stop=should_stop)
+        self.assertEqual([r.entry.name for r in results], ["a"])
+
+    def test_end_timestamp_is_taken_when_the_entry_returns(self):
+        runner = RecordingRunner(duration=0.05)
+        returned = {}
+
+        def on_complete(result):
+            returned[result.entry.name] = time.time()
+            # the other entry completes while this callback runs
+            time.sleep(0.3)
+            return True
+
+        results = ScenarioScheduler([_entry("a"), _entry("b")]).run(
+            runner, on_complete=on_complete
+        )
+        second = results[1]
+        self.assertLess(second.end_timestamp, returned[second.entry.name] - 0.2)
+        self.assertLess(second.end_timestamp - second.start_timestamp, 0.2)
+
+    def test_completions_are_processed_while_paused(self):
+        runner = RecordingRunner(duration=0.05)
+        completed = []
+        paused = threading.Event()
+        paused.set()
+
+        def on_complete(result):
+            completed.append(result.entry.name)
+            return True
+
+        while_paused = []
+
+        def resume():
+            time.sleep(0.3)
+            while_paused.extend([list(completed), list(runner.started)])
+            paused.clear()
+
+        started = []
+
+        def should_pause():
+            if not started:
+                started.append(1)
+                threading.Thread(target=resume).start()
+                return False
+            return paused.is_set()
+
+        results = ScenarioScheduler(
+            [_entry("a"), _entry("b", depends_on=["a"])]
+        ).run(
+            runner,
+            on_complete=on_complete,
+            should_pause=should_pause,
+            poll_interval=0.01,
+        )
+        # the running entry was processed, the dependant was held back
+        self.assertEqual(while_paused, [["a"], ["a"]])
+        self.assertEqual([r.entry.name for r in results], ["a", "b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+
+"""
+Test suite for the shared informer cache (krkn/cache)
+
+Usage:
+    python -m coverage run -a -m unittest tests/test_shared_informer.py -v
+"""
+
+import json
+import queue
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from kubernetes import watch
+from kubernetes.client.rest import ApiException
+
+from krkn.cache import InformerCache, SharedInformer
+from krkn.cache import lookups
+from krkn.cache.informer_cache import NODES, PODS, _node_name
+from krkn.cache.shared_informer import parse_label_selector, is_equality_selector
+
+
+def _pod(name, namespace="default", node="worker-0", phase="Running", labels=None, rv="1"):
+    return {
+        "metadata": {
+            "name": name,
+            "namespace": namespace,
+            "labels": labels or {},
+            "resourceVersion": rv,
+        },
+        "spec": {"nodeName": node},
+        "status": {"phase": phase},
+    }
+
+
+def _node(name, ready=True, labels=None, rv="1"):
+    return {
+        "metadata": {"name": name, "labels": labels or {}, "resourceVersion": rv},
+        "status": {
+            "conditions": [
+                {"type": "MemoryPressure", "status": "False"},
+                {"type": "Ready", "status": "True" if ready else "False"},
+            ]
+        },
+    }
+
+
+class FakeList:
+    """list function serving the configured LISTs, each LIST is a list of
+    pages and a LIST after the last one returns the last one again."""
+
+    def __init__(self, *lists):
+        self.lists = lists
+        self.calls = []
+        self._list = -1
+        self._page = 0
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append(kwargs)
+        if "_continue" in kwargs:
+            self._page += 1
+        else:
+            self._list = min(self._list + 1, len(self.lists) - 1)
+            self._page = 0
+        return SimpleNamespace(data=json.dumps(self.lists[self._list][self._page]))
+
+
+class FakeWatch:
+    """Watch streaming the events pushed to a shared queue, a None item
+    ends the current watch request."""
+
+    def __init__(self, events: queue.Queue, requests: list):
+        self.events = events
+        self.requests = requests
+        self.stopped = False
+
+    def stream(self, func, *args, **kwargs):
+        self.requests.append(kwargs)
+        while not self.stopped:
+            try:
+                event = self.events.get(timeout=0.05)
+            except queue.Empty:
+                continue
+            if event is None:
+                return
+            if isinstance(event, Exception):
+                raise event
+            yield event
+
+    def stop(self):
+        self.stopped = True
+
+
+class InformerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.events = queue.Queue()
+        self.watch_requests = []
+
+    def _informer(self, list_func, **kwargs):
+        informer = SharedInformer(
+            "pods",
+            list_func,
+            watch_factory=lambda: FakeWatch(self.events, self.watch_requests),
+            **kwargs,
+        )
+        self.addCleanup(informer.stop)
+        return informer
+
+    def _wait(self, condition, timeout=5):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if condition():
+                return True
+            time.sleep(0.01)
+        self.fail("condition not met in time")
+
+
+class TestSharedInformer(InformerTestCase):
+    def test_list_is_paginated_and_watch_resumes_from_resource_version(self):
+        list_func = FakeList([
+            {"metadata": {"continue": "next"}, "items": [_pod("a")]},
+            {"metadata": {"resourceVersion": "10"}, "items": [_pod("b")]},
+        ])
+        informer = self._informer(list_func, page_size=1)
+        informer.start()
+
+        self.assertTrue(informer.wait_for_sync(5))
+        self.assertEqual(sorted(p["metadata"]["name"] for p in informer.list()), ["a", "b"])
+        self._wait(lambda: self.watch_requests)
+        self.assertEqual(self.watch_requests[0]["resource_version"], "10")
+        self.assertEqual(list_func.calls[1]["_continue"], "next")
+
+        self.events.put({"type": "ADDED", "object": _pod("c", rv="11")})
+        self.events.put(None)
+        self._wait(lambda: len(self.watch_requests) == 2)
+        self.assertEqual(self.watch_requests[1]["resource_version"], "11")
+        self.assertEqual(len(list_func.calls), 2)
+
+    def test_events_update_the_indexes(self):
+        list_func = FakeList([
+            {"metadata": {"resourceVersion": "1"}, "items": [
+                _pod("a", labels={"app": "web"}, node="worker-0"),
+                _pod("b", labels={"app": "db"}, node="worker-1"),
+            ]},
+        ])
+        informer = self._informer(list_func, index_func=lambda o: o["spec"]["nodeName"])
+        informer.start()
+        informer.wait_for_sync(5)
+
+        self.events.put({"type": "MODIFIED", "object": _pod("a", labels={"app": "db"}, node="worker-1", rv="2")})
+        self.events.put({"type": "DELETED", "object": _pod("b", labels={"app": "db"}, node="worker-1", rv="3")})
+        self.events.put({"type": "BOOKMARK", "object": {"metadata": {"resourceVersion": "5"}}})
+        self._wait(lambda: informer.resource_version == "5")
+
+        self.assertEqual([p["metadata"]["name"] for p in informer.list(label_selector="app=db")], ["a"])
+        self.assertEqual(informer.list(label_selector="app=web"), [])
+        self.assertEqual([p["metadata"]["name"] for p in informer.list(index="worker-1")], ["a"])
+        self.assertEqual(informer.list(index="worker-0"), [])
+        self.assertIsNone(informer.get("b", "default"))
+        self.assertEqual(informer.metrics()["events"], 2)
+
+    def test_gone_triggers_a_new_list(self):
+        list_func = FakeList(
+            [{"metadata": {"resourceVersion": "1"}, "items": [_pod("a")]}],
+            [{"metadata": {"resourceVersion": "20"}, "items": [_pod("z")]}],
+        )
+        informer = self._informer(list_func)
+        informer.start()
+        informer.wait_for_sync(5)
+
+        self.events.put(ApiException(status=410, reason="Gone"))
+        self._wait(lambda: informer.resource_version == "20")
+        self.assertEqual([p["metadata"]["name"] for p in informer.list()], ["z"])
+        self.assertEqual(informer.metrics()["relists"], 2)
+
+    def test_error_event_of_a_real_watch_triggers_a_new_list(self):
+        list_func = FakeList(
+            [{"metadata": {"resourceVersion": "1"}, "items": [_pod("a")]}],
+            [{"metadata": {"resourceVersion": "20"}, "items": [_pod("z")]}],
+        )
+        lines = [
+            {"type": "ADDED", "object": _pod("b", rv="2")},
+            {"type": "ERROR", "object": {
+                "kind": "Status", "apiVersion": "v1", "status": "Failure",
+                "message": "too old resource version: 2 (15)",
+                "reason": "Expired", "code": 410,
+            }},
+        ]
+        watch_requests = []
+
+        def list_pods(*args, **kwargs):
+            """
+            :return: V1PodList
+            """
+            if not kwargs.get("watch"):
+                return list_func(*args, **kwargs)
+            watch_requests.append(kwargs)
+            if len(watch_requests) > 1:
+                # keep the next watches open until the informer is stopped
+                time.sleep(0.2)
+                return MagicMock(stream=lambda **_: iter([]))
+            return MagicMock(stream=lambda **_: iter(
+                [(json.dumps(line) + "\n").encode() for line in lines]
+            ))
+
+        informer = SharedInformer("pods", list_pods, watch_factory=watch.Watch)
+        self.addCleanup(informer.stop)
+        informer.start()
+
+        self._wait(lambda: informer.resource_version == "20")
+        self.assertEqual([p["metadata"]["name"] for p in informer.list()], ["z"])
+        self.assertEqual(informer.metrics()["relists"], 2)
+        self.assertEqual(watch_requests[0]["resource_version"], "1")
+
+    def test_listeners_receive_the_events(self):
+        list_func = FakeList([{"metadata": {"resourceVersion": "1"}, "items": [_pod("a")]}])
+        informer = self._informer(list_func)
+        received = []
+        informer.add_listener(lambda event_type, obj: received.append((event_type, obj["metadata"]["name"])))
+        informer.start()
+        informer.wait_for_sync(5)
+        self.events.put({"type": "DELETED", "object": _pod("a", rv="2")})
+        self._wait(lambda: len(received) == 2)
+        self.assertEqual(received, [("ADDED", "a"), ("DELETED", "a")])
+
+    def test_staleness(self):
+        informer = self._informer(FakeList([{"metadata": {"resourceVersion": "1"}, "items": []}]))
+        self.assertEqual(informer.staleness(), float("inf"))
+        informer.start()
+        informer.wait_for_sync(5)
+        self.assertLess(informer.staleness(), 5)
+
+
+class TestLabelSelector(unittest.TestCase):
+    def test_parse(self):
+        self.assertEqual(
+            parse_label_selector("app=web, tier==front,env!=prod,critical,!canary"),
+            [
+                ("=", "app", "web"),
+                ("=", "tier", "front"),
+                ("!=", "env", "prod"),
+                ("exists", "critical", None),
+                ("!", "canary", None),
+            ],
+        )
+
+    def test_set_based_selectors_are_not_supported(self):
+        self.assertTrue(is_equality_selector("app=web"))
+        self.assertFalse(is_equality_selector("app in (web,db)"))
+
+
+class TestInformerCacheLookups(InformerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.cache = InformerCache()
+        self.cache.configure({"enabled": True, "sync_timeout": 5})
+        self.addCleanup(self.cache.stop)
+        self.node_list = FakeList([{"metadata": {"resourceVersion": "1"}, "items": [
+            _node("master-0", labels={"node-role.kubernetes.io/master": ""}),
+            _node("worker-0", labels={"node-role.kubernetes.io/worker": ""}),
+            _node("worker-1", ready=False, labels={"node-role.kubernetes.io/worker": ""}),
+        ]}])
+        self.pod_list = FakeList([{"metadata": {"resourceVersion": "1"}, "items": [
+            _pod("kraken-deployment-abc", namespace="chaos", node="worker-0"),
+            _pod("etcd-0", namespace="openshift-etcd", node="master-0", labels={"app": "etcd"}),
+            _pod("etcd-1", namespace="openshift-etcd", node="master-0", labels={"app": "etcd"}, phase="Pending"),
+        ]}])
+        watch_factory = lambda: FakeWatch(queue.Queue(), [])
+        self.cache.factories = {
+            NODES: lambda kubecli: SharedInformer("nodes", self.node_list, watch_factory=watch_factory),
+            PODS: lambda kubecli: SharedInformer(
+                "pods", self.pod_list, index_func=_node_name, watch_factory=watch_factory
+            ),
+        }
+        self.kubecli = MagicMock()
+        patcher = unittest.mock.patch.object(lookups, "informer_cache", self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_nodes_are_served_by_the_cache(self):
+        self.assertEqual(lookups.list_ready_nodes(self.kubecli), ["master-0", "worker-0"])
+        self.assertEqual(
+            lookups.list_killable_nodes(self.kubecli, "node-role.kubernetes.io/worker"), []
+        )
+        self.assertEqual(lookups.list_nodes(self.kubecli, "node-role.kubernetes.io/worker"), ["worker-0", "worker-1"])
+        self.assertEqual(len(self.node_list.calls), 1)
+        self.kubecli.list_ready_nodes.assert_not_called()
+        self.kubecli.find_kraken_node.assert_not_called()
+
+    def test_select_pods(self):
+        informer = lookups.pods_informer(self.kubecli, "app=etcd")
+        self.assertEqual(
+            lookups.select_pods(informer, "openshift-.*", label_selector="app=etcd", phase="Running"),
+            [("etcd-0", "openshift-etcd")],
+        )
+        self.assertEqual(
+            lookups.select_pods(informer, ".*", name_pattern="kraken-.*", node_names=["worker-0"]),
+            [("kraken-deployment-abc", "chaos")],
+        )
+
+    def test_disabled_cache_falls_back_to_the_apiserver(self):
+        self.cache.enabled = False
+        self.kubecli.list_ready_nodes.return_value = ["worker-0"]
+        self.assertEqual(lookups.list_ready_nodes(self.kubecli, "a=b"), ["worker-0"])
+        self.kubecli.list_ready_nodes.assert_called_once_with("a=b")
+
+    def test_set_based_selector_falls_back_to_the_apiserver(self):
+        self.kubecli.list_ready_nodes.return_value = ["worker-0"]
+        lookups.list_ready_nodes(self.kubecli, "role in (a,b)")
+        self.kubecli.list_ready_nodes.assert_called_once_with("role in (a,b)")
+
+
+if __name__ == "__main__":
+    unittest.main()
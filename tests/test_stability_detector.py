@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+
+"""
+Test suite for the adaptive cluster stability gate (krkn/stability)
+
+Usage:
+    python -m coverage run -a -m unittest tests/test_stability_detector.py -v
+"""
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
+
+from krkn_lib.models.k8s import AffectedPod, PodsStatus
+from krkn_lib.models.telemetry import ScenarioTelemetry
+
+from krkn.scenario_plugins.abstract_scenario_plugin import AbstractScenarioPlugin
+from krkn.stability import (
+    AbstractStabilityCheck,
+    NodeReadinessCheck,
+    PodReadinessCheck,
+    PrometheusProbeCheck,
+    StabilityDetector,
+)
+
+
+def _pod(namespace, ready=True, phase="Running"):
+    return SimpleNamespace(
+        metadata=SimpleNamespace(namespace=namespace),
+        status=SimpleNamespace(
+            phase=phase,
+            conditions=[
+                SimpleNamespace(type="Ready", status="True" if ready else "False")
+            ],
+        ),
+    )
+
+
+def _node(name, ready=True):
+    return SimpleNamespace(
+        metadata=SimpleNamespace(name=name),
+        status=SimpleNamespace(
+            conditions=[
+                SimpleNamespace(type="MemoryPressure", status="False"),
+                SimpleNamespace(type="Ready", status="True" if ready else "False"),
+            ]
+        ),
+    )
+
+
+def _page(items):
+    return SimpleNamespace(items=items)
+
+
+class SequenceCheck(AbstractStabilityCheck):
+    """Check returning a preconfigured sequence of results."""
+
+    def __init__(self, results):
+        self.results = list(results)
+        self.snapshots = 0
+
+    def snapshot(self, scenario_config=None):
+        self.snapshots += 1
+
+    def is_stable(self, scenario_telemetry):
+        if len(self.results) > 1:
+            return self.results.pop(0)
+        return self.results[0]
+
+    def describe(self):
+        return "sequence check"
+
+
+class TestPodReadinessCheck(unittest.TestCase):
+
+    def setUp(self):
+        self.kubecli = Mock()
+        self.kubecli.request_chunk_size = 500
+
+    def _pods(self, namespaces):
+        """Serves get_all_pod_info from a list of ready pod states per namespace."""
+        def get_all_pod_info(namespace):
+            return [_page(namespaces[namespace].pop(0))]
+        self.kubecli.get_all_pod_info.side_effect = get_all_pod_info
+
+    def test_stable_when_ready_pods_match_snapshot(self):
+        self.kubecli.list_namespaces.return_value = ["app", "db", "other"]
+        self._pods({
+            "app": [
+                [_pod("app"), _pod("app")],
+                [_pod("app"), _pod("app", ready=False)],
+                [_pod("app"), _pod("app")],
+            ],
+            "db": [[_pod("db")], [_pod("db")], [_pod("db"), _pod("db")]],
+        })
+        check = PodReadinessCheck(self.kubecli)
+        check.snapshot({"scenarios": [{"namespace_pattern": "^(app|db)$"}]})
+        telemetry = ScenarioTelemetry()
+        self.assertFalse(check.is_stable(telemetry))
+        self.assertTrue(check.is_stable(telemetry))
+        self.kubecli.list_continue_helper.assert_not_called()
+
+    def test_only_affected_namespaces_are_checked(self):
+        self.kubecli.list_namespaces.return_value = ["app", "other"]
+        self._pods({
+            "app": [[_pod("app")], [_pod("app")]],
+            "other": [[_pod("other")]],
+        })
+        check = PodReadinessCheck(self.kubecli)
+        check.snapshot([{"config": {"namespace": "app"}}, {"namespaces": ["other"]}])
+        telemetry = ScenarioTelemetry()
+        telemetry.affected_pods = PodsStatus()
+        telemetry.affected_pods.recovered.append(
+            AffectedPod(pod_name="p", namespace="app")
+        )
+        self.assertTrue(check.is_stable(telemetry))
+        self.assertEqual(
+            [c.args[0] for c in self.kubecli.get_all_pod_info.call_args_list],
+            ["app", "other", "app"],
+        )
+
+    def test_no_cluster_wide_listing_without_target_namespaces(self):
+        check = PodReadinessCheck(self.kubecli)
+        check.snapshot({"node_scenarios": [{"actions": ["node_stop_start_scenario"]}]})
+        # no baseline, the gate falls back to the timer
+        self.assertIsNone(check._baseline)
+        self.assertFalse(check.is_stable(ScenarioTelemetry()))
+        self.kubecli.list_continue_helper.assert_not_called()
+        self.kubecli.get_all_pod_info.assert_not_called()
+
+    def test_snapshot_served_by_the_informer_cache(self):
+        informer = Mock()
+        informer.list.side_effect = lambda predicate: [
+            pod for pod in [
+                {"metadata": {"namespace": "app"},
+                 "status": {"phase": "Running",
+                            "conditions": [{"type": "Ready", "status": "True"}]}},
+                {"metadata": {"namespace": "db"}, "status": {"phase": "Pending"}},
+            ] if predicate(pod)
+        ]
+        with patch(
+            "krkn.stability.pod_readiness_check.pods_informer", return_value=informer
+        ):
+            check = PodReadinessCheck(self.kubecli)
+            check.snapshot()
+            self.assertTrue(check.is_stable(ScenarioTelemetry()))
+        self.assertEqual(check._baseline, {"app": 1})
+        self.kubecli.get_all_pod_info.assert_not_called()
+        self.kubecli.list_namespaces.assert_not_called()
+
+    def test_configured_namespaces(self):
+        self.kubecli.get_all_pod_info.side_effect = [
+            [_page([_pod("app")])],
+            [_page([])],
+        ]
+        check = PodReadinessCheck(self.kubecli, ["app"])
+        check.snapshot()
+        self.assertFalse(check.is_stable(ScenarioTelemetry()))
+        self.kubecli.list_continue_helper.assert_not_called()
+
+    def test_not_stable_without_snapshot(self):
+        self.assertFalse(
+            PodReadinessCheck(self.kubecli).is_stable(ScenarioTelemetry())
+        )
+
+
+class TestNodeReadinessCheck(unittest.TestCase):
+
+    def test_nodes_not_ready_before_chaos_are_ignored(self):
+        kubecli = Mock()
+        kubecli.request_chunk_size = 500
+        kubecli.list_continue_helper.side_effect = [
+            [_page([_node("a"), _node("b", ready=False)])],
+            [_page([_node("a", ready=False), _node("b", ready=False)])],
+            [_page([_node("a"), _node("b", ready=False)])],
+        ]
+        check = NodeReadinessCheck(kubecli, "node-role=worker")
+        check.snapshot()
+        self.assertFalse(check.is_stable(ScenarioTelemetry()))
+        self.assertTrue(check.is_stable(ScenarioTelemetry()))
+        self.assertEqual(
+            kubecli.list_continue_helper.call_args.kwargs["label_selector"],
+            "node-role=worker",
+        )
+
+
+class TestPrometheusProbeCheck(unittest.TestCase):
+
+    def test_quiet_when_no_samples(self):
+        check = PrometheusProbeCheck(["ALERTS", "up == 0"], "http://prom")
+        client = Mock()
+        client.process_query.side_effect = [[], [{"value": 1}], [], []]
+        check._prom_client = client
+        self.assertFalse(check.is_stable(ScenarioTelemetry()))
+        self.assertTrue(check.is_stable(ScenarioTelemetry()))
+
+    def test_query_error_is_not_stable(self):
+        check = PrometheusProbeCheck(["ALERTS"], "http://prom")
+        check._prom_client = Mock()
+        check._prom_client.process_query.side_effect = Exception("down")
+        self.assertFalse(check.is_stable(ScenarioTelemetry()))
+
+    def test_requires_url(self):
+        with self.assertRaises(ValueError):
+            PrometheusProbeCheck(["ALERTS"], "")
+
+
+class TestStabilityDetector(unittest.TestCase):
+
+    @patch("krkn.stability.stability_detector.time.sleep")
+    def test_returns_after_consecutive_checks(self, mock_sleep):
+        check = SequenceCheck([False, True, False, True, True])
+        detector = StabilityDetector([check], interval=1, consecutive_checks=2)
+        time_to_stable = detector.wait_for_stable(60, ScenarioTelemetry())
+        self.assertIsNotNone(time_to_stable)
+        self.assertEqual(mock_sleep.call_count, 4)
+
+    def test_timeout_returns_none(self):
+        detector = StabilityDetector(
+            [SequenceCheck([False])], interval=0.01, consecutive_checks=1
+        )
+        self.assertIsNone(detector.wait_for_stable(0.05, ScenarioTelemetry()))
+
+    def test_check_exception_is_not_stable(self):
+        check = Mock(spec=AbstractStabilityCheck)
+        check.is_stable.side_effect = Exception("api down")
+        check.describe.return_value = "broken"
+        detector = StabilityDetector([check], interval=0.01, consecutive_checks=1)
+        self.assertIsNone(detector.wait_for_stable(0.03, ScenarioTelemetry()))
+
+    def test_from_config_disabled(self):
+        self.assertIsNone(StabilityDetector.from_config(None, Mock()))
+        self.assertIsNone(
+            StabilityDetector.from_config({"enabled": False}, Mock())
+        )
+
+    def test_from_config_builds_checks(self):
+        detector = StabilityDetector.from_config(
+            {
+                "enabled": True,
+                "interval": 2,
+                "prometheus_queries": ["ALERTS"],
+            },
+            Mock(),
+            {"prometheus_url": "http://prom"},
+        )
+        self.assertIn("pod readiness", detector.describe())
+        self.assertIn("node readiness", detector.describe())
+        self.assertIn("prometheus probe", detector.describe())
+
+    def test_invalid_config(self):
+        with self.assertRaises(ValueError):
+            StabilityDetector([SequenceCheck([True])], interval=0)
+        with self.assertRaises(ValueError):
+            StabilityDetector.from_config(
+                {"enabled": True, "check_pods": False, "check_nodes": False},
+                Mock(),
+            )
+
+
+class GatePlugin(AbstractScenarioPlugin):
+    def __init__(self):
+        super().__init__("gate_scenario")
+
+    def run(self, run_uuid, scenario, lib_telemetry, scenario_telemetry):
+        return 0
+
+    def get_scenario_types(self):
+        return ["gate_scenario"]
+
+
+class TestRunScenariosStabilityGate(unittest.TestCase):
+
+    @patch("krkn.scenario_plugins.abstract_scenario_plugin.cerberus.publish_kraken_status")
+    @patch("krkn.scenario_plugins.abstract_scenario_plugin.cleanup_rollback_version_files")
+    @patch("krkn.scenario_plugins.abstract_scenario_plugin.utils.collect_and_put_ocp_logs")
+    @patch("krkn.scenario_plugins.abstract_scenario_plugin.os.path.exists", return_value=True)
+    @patch("krkn.scenario_plugins.abstract_scenario_plugin.StabilityDetector.from_config")
+    @patch("time.sleep")
+    def test_gate_replaces_sleep_and_records_time_to_stable(
+        self, mock_sleep, mock_from_config, *_
+    ):
+        check = SequenceCheck([True])
+        mock_from_config.return_value = StabilityDetector(
+            [check], consecutive_checks=1
+        )
+        telemetry = MagicMock()
+        telemetry.set_parameters_base64.return_value = {}
+        config = {
+            "tunings": {"wait_duration": 300, "stability_gate": {"enabled": True}},
+            "telemetry": {"events_backup": False},
+        }
+        _, telemetries = GatePlugin().run_scenarios(
+            "uuid", ["a.yaml", "b.yaml"], config, telemetry
+        )
+        mock_sleep.assert_not_called()
+        self.assertEqual(check.snapshots, 2)
+        for scenario_telemetry in telemetries:
+            self.assertIn("time_to_stable", scenario_telemetry.additional_telemetry)
+            self.assertLess(
+                scenario_telemetry.additional_telemetry["time_to_stable"], 300
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -30,6 +30,15 @@ from krkn.scenario_plugins.storage_throttle.storage_throttle_utils import (
     parse_byte_value as _parse_byte_value,
     parse_duration_value as _parse_duration_value,
 )
+from krkn.scenario_plugins.storage_throttle.storage_throttle_targets import (
+    ThrottleTarget,
+    apply_script,
+    group_by_node,
+    parse_proc_cgroup,
+    parse_readback,
+    proc_cgroup_command,
+    reset_script,
+)
 from krkn.rollback.config import RollbackContent
 
 
@@ -1076,6 +1085,279 @@ class TestRunScenario(unittest.TestCase):
             self.assertEqual(mock_k8s.exec_cmd_in_pod.call_count, 6)
 
 
+class TestThrottleTargets(unittest.TestCase):
+    """Helpers of the multi-target mode."""
+
+    CID_A = "abc123def4567890123456789012"
+    CID_B = "fed987cba6543210987654321098"
+
+    def make_target(self, pod_name="app-a", node_name="worker-1",
+                    cgroup_path="/kubepods.slice/crio-abc.scope"):
+        return ThrottleTarget(
+            pod_name=pod_name, container_name="app",
+            container_id=self.CID_A, node_name=node_name,
+            mount_path="/data", maj_min="8:16", cgroup_path=cgroup_path,
+        )
+
+    def test_proc_cgroup_command(self):
+        cmd = proc_cgroup_command([self.CID_A, self.CID_B])
+        self.assertIn("-e %s -e %s" % (self.CID_A, self.CID_B), cmd)
+        self.assertIn("/proc/[0-9]*/cgroup", cmd)
+        self.assertIn("nsenter --cgroup=/proc/1/ns/cgroup grep -H -F", cmd)
+
+    def test_parse_proc_cgroup_v2(self):
+        output = (
+            "/proc/10/cgroup:0::/kubepods.slice/crio-conmon-%s.scope\n"
+            "/proc/11/cgroup:0::/kubepods.slice/crio-%s.scope\n"
+            "/proc/12/cgroup:0::/kubepods.slice/crio-%s.scope/container\n"
+            % (self.CID_A, self.CID_A, self.CID_B)
+        )
+        paths = parse_proc_cgroup(output, [self.CID_A, self.CID_B], "v2")
+        self.assertEqual(
+            paths,
+            {
+                self.CID_A: "/kubepods.slice/crio-%s.scope" % self.CID_A,
+                self.CID_B: "/kubepods.slice/crio-%s.scope" % self.CID_B,
+            },
+        )
+
+    def test_parse_proc_cgroup_v1_uses_blkio(self):
+        output = (
+            "/proc/11/cgroup:7:memory:/kubepods/podx/memory-%s\n"
+            "/proc/11/cgroup:4:blkio:/kubepods/podx/%s\n" % (self.CID_A, self.CID_A)
+        )
+        paths = parse_proc_cgroup(output, [self.CID_A], "v1")
+        self.assertEqual(paths, {self.CID_A: "/kubepods/podx/%s" % self.CID_A})
+
+    def test_parse_proc_cgroup_outside_namespace_ignored(self):
+        output = "/proc/11/cgroup:0::/../../kubepods.slice/crio-%s.scope\n" % self.CID_A
+        self.assertEqual(parse_proc_cgroup(output, [self.CID_A], "v2"), {})
+
+    def test_parse_proc_cgroup_host_namespace_line_resolved(self):
+        # private cgroup namespace line of the reader, then the line read
+        # from the host cgroup namespace
+        output = (
+            "/proc/11/cgroup:0::/../../kubepods.slice/crio-%s.scope\n"
+            "/proc/11/cgroup:0::/kubepods.slice/kubepods-burstable.slice/crio-%s.scope\n"
+            % (self.CID_A, self.CID_A)
+        )
+        self.assertEqual(
+            parse_proc_cgroup(output, [self.CID_A], "v2"),
+            {self.CID_A: "/kubepods.slice/kubepods-burstable.slice/crio-%s.scope" % self.CID_A},
+        )
+
+    def test_group_by_node(self):
+        targets = [
+            self.make_target("a", "worker-1"),
+            self.make_target("b", "worker-2"),
+            self.make_target("c", "worker-1"),
+        ]
+        groups = group_by_node(targets)
+        self.assertEqual(list(groups), ["worker-1", "worker-2"])
+        self.assertEqual([t.pod_name for t in groups["worker-1"]], ["a", "c"])
+
+    def test_apply_script_v2(self):
+        script = apply_script(
+            [self.make_target()], "v2", {"rbps": 1048576, "wbps": 524288}
+        )
+        self.assertIn(
+            "echo '8:16 rbps=1048576 wbps=524288' > "
+            "/sys/fs/cgroup/kubepods.slice/crio-abc.scope/io.max",
+            script,
+        )
+        self.assertIn("cat /sys/fs/cgroup/kubepods.slice/crio-abc.scope/io.max", script)
+
+    def test_apply_script_v1(self):
+        script = apply_script(
+            [self.make_target(cgroup_path="/kubepods/podx/abc")], "v1",
+            {"riops": 100, "wiops": 50},
+        )
+        self.assertIn(
+            "echo '8:16 100' > "
+            "/sys/fs/cgroup/blkio/kubepods/podx/abc/blkio.throttle.read_iops_device",
+            script,
+        )
+        self.assertNotIn("'8:16 100' > /sys/fs/cgroup/blkio/kubepods/podx/abc/"
+                         "blkio.throttle.read_bps_device", script)
+
+    def test_reset_script(self):
+        targets = [self.make_target("a"), self.make_target("b")]
+        script = reset_script(targets, "v2")
+        self.assertEqual(script.count("rbps=max wbps=max riops=max wiops=max"), 2)
+        script = reset_script(targets, "v1")
+        self.assertEqual(script.count("echo '8:16 0'"), 8)
+
+    def test_parse_readback(self):
+        output = (
+            "### krkn-throttle app-a\n8:16 rbps=1048576 wbps=524288\n"
+            "### krkn-throttle app-b\n8:32 rbps=1048576 wbps=524288\n"
+        )
+        self.assertEqual(
+            parse_readback(output),
+            {
+                "app-a": "8:16 rbps=1048576 wbps=524288",
+                "app-b": "8:32 rbps=1048576 wbps=524288",
+            },
+        )
+
+
+class TestRunMultiTarget(unittest.TestCase):
+
+    def setUp(self):
+        self.plugin = StorageThrottleScenarioPlugin()
+        # Avoid RollbackHandler persisting to disk during unit tests
+        self.plugin.rollback_handler.set_rollback_callable = MagicMock()
+
+    def make_pod(self, container_id, node_name="worker-1", pvc_name="pvc1"):
+        mock_volume = MagicMock()
+        mock_volume.pvcName = pvc_name
+        mock_volume.name = "vol1"
+        mock_vol_mount = MagicMock()
+        mock_vol_mount.name = "vol1"
+        mock_vol_mount.mountPath = "/data"
+        mock_container = MagicMock()
+        mock_container.name = "app"
+        mock_container.volumeMounts = [mock_vol_mount]
+        mock_container.containerId = "cri-o://%s" % container_id
+        mock_pod = MagicMock()
+        mock_pod.volumes = [mock_volume]
+        mock_pod.containers = [mock_container]
+        mock_pod.nodeName = node_name
+        return mock_pod
+
+    def run_scenario(self, config, mock_k8s):
+        mock_telemetry = MagicMock(spec=KrknTelemetryOpenshift)
+        mock_telemetry.get_lib_kubernetes.return_value = mock_k8s
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "scenario.yaml")
+            with open(path, "w") as f:
+                yaml.dump({"storage_throttle_scenario": config}, f)
+            return self.plugin.run(
+                run_uuid="uuid", scenario=path,
+                lib_telemetry=mock_telemetry, scenario_telemetry=MagicMock(),
+            )
+
+    def test_invalid_pvc_names_rejected(self):
+        mock_k8s = MagicMock(spec=KrknKubernetes)
+        result = self.run_scenario(
+            {"namespace": "default", "pvc_names": "", "duration": 10}, mock_k8s
+        )
+        self.assertEqual(result, 1)
+
+    @patch(
+        "krkn.scenario_plugins.storage_throttle."
+        "storage_throttle_scenario_plugin.time.sleep"
+    )
+    def test_run_label_selector_same_node(self, mock_sleep):
+        """Two pods on the same node share one privileged pod and every
+        step is a single exec for the node."""
+        cid_a = "abc123def4567890123456789012"
+        cid_b = "fed987cba6543210987654321098"
+        pods = {"app-a": self.make_pod(cid_a), "app-b": self.make_pod(cid_b)}
+
+        mock_k8s = MagicMock(spec=KrknKubernetes)
+        mock_k8s.list_pods.return_value = ["app-a", "app-b"]
+        mock_k8s.get_pod_info.side_effect = lambda name, namespace: pods[name]
+        mock_k8s.deploy_io_throttle_pod.return_value = "io-throttle-12345"
+        mock_k8s.exec_cmd_in_pod.side_effect = [
+            "8:16\n",      # maj_min of app-a
+            "8:32\n",      # maj_min of app-b
+            "cgroup2fs\n",  # _detect_cgroup_version
+            "/proc/11/cgroup:0::/kubepods.slice/crio-%s.scope\n"
+            "/proc/12/cgroup:0::/kubepods.slice/crio-%s.scope\n"
+            % (cid_a, cid_b),
+            "### krkn-throttle app-a\n8:16 rbps=1048576 wbps=524288\n"
+            "### krkn-throttle app-b\n8:32 rbps=1048576 wbps=524288\n",
+            "",             # batched removal
+        ]
+
+        result = self.run_scenario(
+            {
+                "namespace": "default",
+                "label_selector": "app=my-app",
+                "throttle_type": "bandwidth",
+                "duration": 10,
+            },
+            mock_k8s,
+        )
+
+        self.assertEqual(result, 0)
+        mock_k8s.list_pods.assert_called_once_with(
+            "default", label_selector="app=my-app"
+        )
+        mock_k8s.deploy_io_throttle_pod.assert_called_once()
+        mock_k8s.delete_pod.assert_called_once_with("io-throttle-12345", "default")
+        self.assertEqual(mock_k8s.exec_cmd_in_pod.call_count, 6)
+        self.plugin.rollback_handler.set_rollback_callable.assert_called_once()
+        reset_cmd = mock_k8s.exec_cmd_in_pod.call_args_list[-1][0][0][-1]
+        self.assertIn("crio-%s.scope/io.max" % cid_a, reset_cmd)
+        self.assertIn("crio-%s.scope/io.max" % cid_b, reset_cmd)
+
+    @patch(
+        "krkn.scenario_plugins.storage_throttle."
+        "storage_throttle_scenario_plugin.time.sleep"
+    )
+    def test_run_pvc_names_one_pod_per_node(self, mock_sleep):
+        cid_a = "abc123def4567890123456789012"
+        cid_b = "fed987cba6543210987654321098"
+        pods = {
+            "app-a": self.make_pod(cid_a, "worker-1", "pvc-a"),
+            "app-b": self.make_pod(cid_b, "worker-2", "pvc-b"),
+        }
+        pvcs = {}
+        for pvc_name, pod_name in (("pvc-a", "app-a"), ("pvc-b", "app-b")):
+            pvcs[pvc_name] = MagicMock()
+            pvcs[pvc_name].podNames = [pod_name]
+
+        mock_k8s = MagicMock(spec=KrknKubernetes)
+        mock_k8s.get_pvc_info.side_effect = lambda name, namespace: pvcs[name]
+        mock_k8s.get_pod_info.side_effect = lambda name, namespace: pods[name]
+        mock_k8s.deploy_io_throttle_pod.side_effect = ["io-throttle-1", "io-throttle-2"]
+        mock_k8s.exec_cmd_in_pod.side_effect = [
+            "8:16\n",
+            "8:32\n",
+            "cgroup2fs\n",
+            "/proc/11/cgroup:0::/kubepods.slice/crio-%s.scope\n" % cid_a,
+            "cgroup2fs\n",
+            "/proc/12/cgroup:0::/kubepods.slice/crio-%s.scope\n" % cid_b,
+            "### krkn-throttle app-a\n8:16 riops=100 wiops=50\n",
+            "### krkn-throttle app-b\n8:32 riops=100 wiops=50\n",
+            "",
+            "",
+        ]
+
+        result = self.run_scenario(
+            {
+                "namespace": "default",
+                "pvc_names": ["pvc-a", "pvc-b"],
+                "throttle_type": "iops",
+                "duration": 10,
+            },
+            mock_k8s,
+        )
+
+        self.assertEqual(result, 0)
+        self.assertEqual(mock_k8s.deploy_io_throttle_pod.call_count, 2)
+        self.assertEqual(mock_k8s.delete_pod.call_count, 2)
+        self.assertEqual(mock_k8s.exec_cmd_in_pod.call_count, 10)
+        self.assertEqual(
+            self.plugin.rollback_handler.set_rollback_callable.call_count, 2
+        )
+
+    def test_run_no_valid_target(self):
+        mock_k8s = MagicMock(spec=KrknKubernetes)
+        mock_k8s.list_pods.return_value = ["app-a"]
+        mock_k8s.get_pod_info.return_value = None
+
+        result = self.run_scenario(
+            {"namespace": "default", "label_selector": "app=my-app", "duration": 10},
+            mock_k8s,
+        )
+
+        self.assertEqual(result, 1)
+        mock_k8s.deploy_io_throttle_pod.assert_not_called()
+
+
 class TestRollbackThrottle(unittest.TestCase):
 
     def test_rollback_success_v2_stored_cgroup(self):
@@ -1155,5 +1437,40 @@ class TestRollbackThrottle(unittest.TestCase):
         self.assertIn("Failed to rollback", error_msg)
 
 
+    def test_rollback_multi_target(self):
+        """Multi-target rollback resets every target with a single exec."""
+        mock_telemetry = MagicMock(spec=KrknTelemetryOpenshift)
+        mock_k8s = MagicMock()
+        mock_telemetry.get_lib_kubernetes.return_value = mock_k8s
+        mock_k8s.exec_cmd_in_pod.return_value = ""
+
+        rollback_data = {
+            "priv_pod_name": "io-throttle-12345",
+            "cgroup_version": "v2",
+            "targets": [
+                {"pod_name": "app-a", "maj_min": "8:16",
+                 "cgroup_path": "/kubepods.slice/crio-abc.scope"},
+                {"pod_name": "app-b", "maj_min": "8:32",
+                 "cgroup_path": "/kubepods.slice/crio-def.scope"},
+            ],
+        }
+        encoded = base64.b64encode(
+            json.dumps(rollback_data).encode("utf-8")
+        ).decode("utf-8")
+
+        StorageThrottleScenarioPlugin.rollback_throttle(
+            RollbackContent(namespace="default", resource_identifier=encoded),
+            mock_telemetry,
+        )
+
+        mock_k8s.exec_cmd_in_pod.assert_called_once()
+        cmd = mock_k8s.exec_cmd_in_pod.call_args[0][0][-1]
+        self.assertIn("echo '8:16 rbps=max", cmd)
+        self.assertIn("echo '8:32 rbps=max", cmd)
+        mock_k8s.delete_pod.assert_called_once_with(
+            "io-throttle-12345", "default"
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
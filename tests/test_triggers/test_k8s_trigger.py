@@ -9,6 +9,7 @@ Usage:
 Assisted By: Claude Code
 """
 
+import threading
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -494,5 +495,56 @@ class TestK8sTriggerClientInit(unittest.TestCase):
         self.assertIs(result, mock_dyn)
 
 
+class TestK8sTriggerWatch(unittest.TestCase):
+    """Tests for K8sTrigger.start_watch() with a mocked dynamic client."""
+
+    def _make_trigger(self, **overrides):
+        kubecli = MagicMock()
+        kubecli.dyn_client = MagicMock()
+        config = {
+            "type": "k8s",
+            "apiVersion": "apps/v1",
+            "kind": "Deployment",
+            "name": "nginx",
+            "namespace": "default",
+            "condition": "status.readyReplicas >= 1",
+        }
+        config.update(overrides)
+        return K8sTrigger(config, kubecli=kubecli), kubecli
+
+    def test_watch_disabled(self):
+        trigger, kubecli = self._make_trigger(watch=False)
+        self.assertFalse(trigger.start_watch(lambda result: None))
+        kubecli.dyn_client.watch.assert_not_called()
+
+    def test_watch_pushes_state_changes(self):
+        """The current state then every watch event is pushed."""
+        trigger, kubecli = self._make_trigger()
+        mock_api = MagicMock()
+        kubecli.dyn_client.resources.get.return_value = mock_api
+        mock_api.get.return_value = {"status": {"readyReplicas": 0}}
+        kubecli.dyn_client.watch.return_value = iter([
+            {"type": "MODIFIED", "object": {"status": {"readyReplicas": 2}}},
+            {"type": "MODIFIED", "object": {"status": {}}},
+            {"type": "DELETED", "object": {"status": {"readyReplicas": 2}}},
+        ])
+
+        results = []
+        done = threading.Event()
+
+        def on_change(result):
+            results.append(result)
+            if len(results) == 4:
+                trigger.stop_watch()
+                done.set()
+
+        self.assertTrue(trigger.start_watch(on_change))
+        self.assertTrue(done.wait(5))
+        self.assertEqual(results, [False, True, False, False])
+        _, kwargs = kubecli.dyn_client.watch.call_args
+        self.assertEqual(kwargs["name"], "nginx")
+        self.assertEqual(kwargs["namespace"], "default")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -9,6 +9,8 @@ Usage:
 Assisted By: Claude Code
 """
 
+import threading
+import time
 import unittest
 from unittest.mock import patch
 
@@ -39,6 +41,39 @@ class StubTrigger(AbstractTrigger):
         self._result = result
 
 
+class BlockingTrigger(StubTrigger):
+    """Trigger whose evaluation blocks until released."""
+
+    def __init__(self, result: bool, name: str = "blocking"):
+        super().__init__(result, name)
+        self.release = threading.Event()
+        self.calls = 0
+
+    def evaluate(self) -> bool:
+        self.calls += 1
+        self.release.wait(5)
+        return self._result
+
+
+class WatchTrigger(StubTrigger):
+    """Trigger pushing its state, must never be polled."""
+
+    def __init__(self, name: str = "watch"):
+        super().__init__(False, name)
+        self.on_change = None
+        self.stopped = False
+
+    def evaluate(self) -> bool:
+        raise AssertionError("a watched trigger must not be polled")
+
+    def start_watch(self, on_change) -> bool:
+        self.on_change = on_change
+        return True
+
+    def stop_watch(self):
+        self.stopped = True
+
+
 def _make_config(**overrides):
     """Build a minimal valid trigger config dict with overrides."""
     config = {
@@ -306,6 +341,117 @@ class TestTriggerManager(unittest.TestCase):
             TriggerManager(config)
         self.assertIn("numeric", str(ctx.exception))
 
+
+    # ------------------------------------------------------------------
+    # Concurrent evaluation
+    # ------------------------------------------------------------------
+
+    @patch.object(TriggerManager, "_build_trigger")
+    def test_any_of_short_circuits_slow_trigger(self, mock_build):
+        """mode=any_of, a fast satisfied trigger doesn't wait for a slow one."""
+        slow = BlockingTrigger(False, "slow")
+        mock_build.side_effect = [slow, StubTrigger(True, "fast")]
+
+        config = _make_config(
+            mode="any_of",
+            evaluation_timeout=5,
+            conditions=[
+                {"type": "command", "cmd": "a"},
+                {"type": "command", "cmd": "b"},
+            ],
+        )
+        manager = TriggerManager(config)
+        start = time.monotonic()
+        try:
+            self.assertTrue(manager.wait_for_triggers())
+            self.assertLess(time.monotonic() - start, 2)
+        finally:
+            slow.release.set()
+
+    @patch.object(TriggerManager, "_build_trigger")
+    def test_all_of_short_circuits_on_first_false(self, mock_build):
+        """mode=all_of, an unsatisfied trigger ends the poll."""
+        slow = BlockingTrigger(True, "slow")
+        mock_build.side_effect = [slow, StubTrigger(False, "fast")]
+
+        config = _make_config(
+            mode="all_of",
+            timeout=0.5,
+            interval=0.1,
+            evaluation_timeout=5,
+            conditions=[
+                {"type": "command", "cmd": "a"},
+                {"type": "command", "cmd": "b"},
+            ],
+        )
+        manager = TriggerManager(config)
+        start = time.monotonic()
+        try:
+            self.assertFalse(manager.wait_for_triggers())
+            self.assertLess(time.monotonic() - start, 2)
+            # the pending evaluation was reused, never submitted twice
+            self.assertEqual(slow.calls, 1)
+        finally:
+            slow.release.set()
+
+    @patch.object(TriggerManager, "_build_trigger")
+    def test_evaluation_timeout(self, mock_build):
+        """A trigger not answering in time counts as not satisfied."""
+        slow = BlockingTrigger(True, "slow")
+        mock_build.side_effect = [slow]
+
+        config = _make_config(
+            timeout=0.5,
+            interval=0.1,
+            evaluation_timeout=0.1,
+            conditions=[{"type": "command", "cmd": "a"}],
+        )
+        manager = TriggerManager(config)
+        try:
+            self.assertFalse(manager.wait_for_triggers())
+            self.assertEqual(slow.calls, 1)
+        finally:
+            slow.release.set()
+
+    @patch.object(TriggerManager, "_build_trigger")
+    def test_watched_trigger_push_wakes_up_poll(self, mock_build):
+        """A state pushed by a watched trigger is seen without polling it."""
+        watched = WatchTrigger("watched")
+        mock_build.side_effect = [watched, StubTrigger(True, "polled")]
+
+        config = _make_config(
+            mode="all_of",
+            timeout=10,
+            interval=10,
+            conditions=[
+                {"type": "k8s"},
+                {"type": "command", "cmd": "b"},
+            ],
+        )
+        manager = TriggerManager(config)
+        timer = threading.Timer(0.2, lambda: watched.on_change(True))
+        timer.start()
+        start = time.monotonic()
+        self.assertTrue(manager.wait_for_triggers())
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertTrue(watched.stopped)
+        self.assertEqual(
+            [t["satisfied"] for t in manager.get_status()["triggers"]],
+            [True, True],
+        )
+
+    def test_invalid_evaluation_timeout_raises(self):
+        config = _make_config(evaluation_timeout=0)
+        with self.assertRaises(ValueError) as ctx:
+            TriggerManager(config)
+        self.assertIn("evaluation_timeout", str(ctx.exception))
+
+    def test_invalid_max_workers_raises(self):
+        config = _make_config(max_workers="many")
+        with self.assertRaises(ValueError) as ctx:
+            TriggerManager(config)
+        self.assertIn("numeric", str(ctx.exception))
+
     # ------------------------------------------------------------------
     # get_status() tests
     # ------------------------------------------------------------------
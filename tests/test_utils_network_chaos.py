@@ -9,6 +9,7 @@ Usage:
 Assisted By: Claude Code
 """
 
+import subprocess
 import unittest
 from unittest.mock import MagicMock, patch, call
 
@@ -28,6 +29,18 @@ from krkn.scenario_plugins.network_chaos_ng.modules.utils_network_chaos import (
     CLASS_ID,
     NETEM_HANDLE,
 )
+from krkn.scenario_plugins.network_chaos_ng.modules.utils_batch import (
+    BATCH_OK,
+    group_by_netns,
+    iptables_delete_rule,
+    iptables_restore_script,
+    sequence_script,
+    transaction_script,
+)
+from krkn.scenario_plugins.network_chaos_ng.modules.utils_network_filter import (
+    apply_network_rules,
+    clean_network_rules_namespaced,
+)
 
 
 class TestNormalizers(unittest.TestCase):
@@ -386,7 +399,7 @@ class TestCommonSetLimitRules(unittest.TestCase):
         Set up mock kubecli for all tests
         """
         self.mock_kubecli = MagicMock()
-        self.mock_kubecli.exec_cmd_in_pod.return_value = ""
+        self.mock_kubecli.exec_cmd_in_pod.return_value = BATCH_OK
 
     @patch("krkn.scenario_plugins.network_chaos_ng.modules.utils_network_chaos.log_info")
     def test_set_egress_only(self, mock_log_info):
@@ -408,8 +421,11 @@ class TestCommonSetLimitRules(unittest.TestCase):
             pids=None,
         )
 
-        # Should call exec_cmd_in_pod for egress tree only (3 commands, no shaping step)
-        self.assertEqual(self.mock_kubecli.exec_cmd_in_pod.call_count, 3)
+        # The 3 egress tree commands are batched in a single exec
+        self.assertEqual(self.mock_kubecli.exec_cmd_in_pod.call_count, 1)
+        command = self.mock_kubecli.exec_cmd_in_pod.call_args[0][0][0]
+        self.assertIn("tc qdisc add dev eth0 root handle 100: htb default 1", command)
+        self.assertIn("netem delay 50ms loss 10%", command)
 
     @patch("krkn.scenario_plugins.network_chaos_ng.modules.utils_network_chaos.log_info")
     def test_set_ingress_only(self, mock_log_info):
@@ -454,9 +470,8 @@ class TestCommonSetLimitRules(unittest.TestCase):
             pids=None,
         )
 
-        # 3 egress tree commands + ingress commands (modprobe, ip link add, ip link set,
-        # tc qdisc ingress, tc filter, tc qdisc htb, tc class, tc netem = 8)
-        self.assertGreater(self.mock_kubecli.exec_cmd_in_pod.call_count, 8)
+        # one exec for the egress tree and one for the ingress shaping
+        self.assertEqual(self.mock_kubecli.exec_cmd_in_pod.call_count, 2)
 
     @patch("krkn.scenario_plugins.network_chaos_ng.modules.utils_network_chaos.log_info")
     def test_set_with_pids(self, mock_log_info):
@@ -511,8 +526,8 @@ class TestCommonSetLimitRules(unittest.TestCase):
 
         # Should log error when all commands fail
         mock_log_error.assert_called()
-        # Should log warnings for each failed command
-        self.assertEqual(mock_log_warning.call_count, 3)
+        # Should log a warning for the rolled back batch
+        self.assertEqual(mock_log_warning.call_count, 1)
 
 
 class TestCommonDeleteLimitRules(unittest.TestCase):
@@ -522,7 +537,7 @@ class TestCommonDeleteLimitRules(unittest.TestCase):
         Set up mock kubecli for all tests
         """
         self.mock_kubecli = MagicMock()
-        self.mock_kubecli.exec_cmd_in_pod.return_value = ""
+        self.mock_kubecli.exec_cmd_in_pod.return_value = BATCH_OK
 
     @patch("krkn.scenario_plugins.network_chaos_ng.modules.utils_network_chaos.log_info")
     def test_delete_egress_only(self, mock_log_info):
@@ -581,8 +596,8 @@ class TestCommonDeleteLimitRules(unittest.TestCase):
             target="test-target",
         )
 
-        # Should call exec_cmd_in_pod for both egress and ingress
-        self.assertGreater(self.mock_kubecli.exec_cmd_in_pod.call_count, 3)
+        # one exec for the egress cleanup and one for the ingress cleanup
+        self.assertEqual(self.mock_kubecli.exec_cmd_in_pod.call_count, 2)
 
     @patch("krkn.scenario_plugins.network_chaos_ng.modules.utils_network_chaos.log_info")
     def test_delete_with_pids(self, mock_log_info):
@@ -632,5 +647,89 @@ class TestCommonDeleteLimitRules(unittest.TestCase):
         mock_log_error.assert_called()
 
 
+class TestRuleBatching(unittest.TestCase):
+
+    def _sh(self, script):
+        return subprocess.run(["sh", "-c", script], capture_output=True, text=True)
+
+    def test_group_by_netns_preserves_order(self):
+        groups = group_by_netns([
+            "nsenter --target 1 --net -- tc a",
+            "nsenter --target 2 --net -- tc a",
+            "nsenter --target 1 --net -- tc b",
+            "tc host",
+        ])
+        self.assertEqual(
+            groups,
+            {
+                "nsenter --target 1 --net -- ": ["tc a", "tc b"],
+                "nsenter --target 2 --net -- ": ["tc a"],
+                "": ["tc host"],
+            },
+        )
+
+    def test_iptables_restore_script(self):
+        script = iptables_restore_script([
+            "iptables -I INPUT 1 -i eth0 -p tcp --dport 80 -j DROP",
+            "iptables -I OUTPUT 1 -p udp -j DROP",
+        ])
+        self.assertTrue(script.endswith("| iptables-restore --noflush"))
+        payload = self._sh(script.replace("| iptables-restore --noflush", "")).stdout
+        self.assertEqual(
+            payload.splitlines(),
+            ["*filter", "-I INPUT 1 -i eth0 -p tcp --dport 80 -j DROP", "-I OUTPUT 1 -p udp -j DROP", "COMMIT"],
+        )
+
+    def test_iptables_delete_rule(self):
+        self.assertEqual(
+            iptables_delete_rule("nsenter --target 12 --net -- iptables -I INPUT 1 -i eth0 -p tcp -j DROP"),
+            "nsenter --target 12 --net -- iptables -D INPUT -i eth0 -p tcp -j DROP",
+        )
+
+    def test_transaction_rolls_back_on_failure(self):
+        script = transaction_script(["echo one", "false", "echo never"], ["echo undo"])
+        result = self._sh(script)
+        self.assertNotEqual(result.returncode, 0)
+        self.assertEqual(result.stdout.split(), ["one"])
+
+        result = self._sh(transaction_script(["echo one", "true || true"], ["echo undo"]))
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(result.stdout.split(), ["one"])
+
+    def test_sequence_runs_every_command(self):
+        result = self._sh(sequence_script(["echo one", "false", "echo two"]))
+        self.assertNotEqual(result.returncode, 0)
+        self.assertEqual(result.stdout.split(), ["one", "two"])
+
+    def test_filter_rules_use_one_exec_per_netns(self):
+        kubecli = MagicMock()
+        kubecli.exec_cmd_in_pod.return_value = BATCH_OK
+        pids = ["1", "2", "3"]
+        input_rules = [
+            f"nsenter --target {pid} --net -- iptables -I INPUT 1 -i eth0 -p {protocol} --dport {port} -j DROP"
+            for pid in pids for port in range(10) for protocol in ("tcp", "udp")
+        ]
+
+        apply_network_rules(kubecli, input_rules, [], "chaos-pod", "default", False, "node")
+        self.assertEqual(kubecli.exec_cmd_in_pod.call_count, 3)
+
+        kubecli.reset_mock()
+        clean_network_rules_namespaced(kubecli, input_rules, [], "chaos-pod", "default", pids)
+        self.assertEqual(kubecli.exec_cmd_in_pod.call_count, 3)
+        command = kubecli.exec_cmd_in_pod.call_args[0][0][0]
+        self.assertTrue(command.startswith("nsenter --target 3 --net -- sh -c"))
+        self.assertIn("-D INPUT -i eth0", command)
+
+    def test_filter_rules_fall_back_to_one_exec_per_rule(self):
+        kubecli = MagicMock()
+        kubecli.exec_cmd_in_pod.return_value = "iptables-restore: command not found"
+        rules = ["iptables -I INPUT 1 -p tcp -j DROP", "iptables -I INPUT 1 -p udp -j DROP"]
+
+        apply_network_rules(kubecli, rules, [], "chaos-pod", "default", False, "node")
+
+        self.assertEqual(kubecli.exec_cmd_in_pod.call_count, 3)
+        kubecli.exec_cmd_in_pod.assert_called_with([rules[1]], "chaos-pod", "default")
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
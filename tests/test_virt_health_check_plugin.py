@@ -28,16 +28,26 @@ How to run:
 Migrated from test_virt_checker.py to use the plugin architecture.
 """
 
+import json
 import queue
 import sys
 import os
 import unittest
+from datetime import datetime
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from krkn.health_checks import HealthCheckFactory, HealthCheckPluginNotFound
+from krkn.health_checks.ssh_session_pool import (
+    SSH_ERROR,
+    ProbeLatencies,
+    SshResult,
+    SshSessionPool,
+)
+from krkn.health_checks.vmi_status_tracker import VmiStatusTracker
 
 
 class TestVirtHealthCheckPlugin(unittest.TestCase):
@@ -1037,5 +1047,413 @@ class TestVirtHealthCheckPluginLabelSelector(unittest.TestCase):
         )
 
 
+def _vmi(name, namespace="default", phase="Running", ready=True, ip="10.0.0.1",
+         node="worker-1", labels=None):
+    return {
+        "metadata": {
+            "name": name,
+            "namespace": namespace,
+            "labels": labels or {},
+            "resourceVersion": "1",
+        },
+        "status": {
+            "phase": phase,
+            "nodeName": node,
+            "interfaces": [{"ipAddress": ip}],
+            "conditions": [{"type": "Ready", "status": "True" if ready else "False"}],
+        },
+    }
+
+
+def _vmi_list(*vmis):
+    return SimpleNamespace(
+        data=json.dumps({"items": list(vmis), "metadata": {"resourceVersion": "10"}})
+    )
+
+
+@patch("krkn.cache.shared_informer.SharedInformer.start")
+class TestVmiStatusTracker(unittest.TestCase):
+    """Tests for the list/watch based VMI status tracker (the watch thread is not started)"""
+
+    def setUp(self):
+        self.kubecli = MagicMock()
+        self.kubecli.list_namespaces_by_regex.return_value = ["default"]
+        self.client = self.kubecli.custom_object_client
+
+    def _tracker(self, namespace="default", **kwargs):
+        tracker = VmiStatusTracker(self.kubecli, namespace, **kwargs)
+        self.addCleanup(tracker.stop)
+        return tracker
+
+    def test_plain_namespace_is_listed_namespaced(self, _):
+        self.client.list_namespaced_custom_object.return_value = _vmi_list(
+            _vmi("vm-1", labels={"app": "db"}), _vmi("other", labels={"app": "db"})
+        )
+        tracker = self._tracker(name_pattern="vm-.*", label_selector="app=db")
+        tracker.start()
+
+        args, kwargs = self.client.list_namespaced_custom_object.call_args
+        self.assertEqual(args, ("kubevirt.io", "v1", "default", "virtualmachineinstances"))
+        self.assertEqual(kwargs["label_selector"], "app=db")
+        self.client.list_cluster_custom_object.assert_not_called()
+        # the label selector is applied server side, the name regex client side
+        self.assertEqual([v["metadata"]["name"] for v in tracker.list()], ["vm-1"])
+        self.assertTrue(tracker.is_ready("vm-1", "default"))
+        self.assertIsNone(tracker.get("other", "default"))
+
+    def test_namespace_regex_is_listed_cluster_wide(self, _):
+        self.kubecli.list_namespaces_by_regex.return_value = ["test-1", "test-2"]
+        self.client.list_cluster_custom_object.return_value = _vmi_list(
+            _vmi("vm-1", namespace="test-1"), _vmi("vm-2", namespace="prod")
+        )
+        tracker = self._tracker("test-.*")
+        tracker.start()
+
+        self.client.list_namespaced_custom_object.assert_not_called()
+        self.assertEqual([v["metadata"]["name"] for v in tracker.list()], ["vm-1"])
+        self.assertTrue(tracker.is_ready("vm-1", "test-.*"))
+        self.assertIsNone(tracker.get("vm-2"))
+        self.assertEqual(tracker.get_vmi("vm-1", "test-.*")["metadata"]["namespace"], "test-1")
+
+    def test_plain_namespace_matches_the_namespaces_it_prefixes(self, _):
+        # same namespaces as KrknKubernetes.get_vmis, which matches the
+        # namespace regex from the start of the names
+        self.kubecli.list_namespaces_by_regex.return_value = ["default", "default-2"]
+        self.client.list_cluster_custom_object.return_value = _vmi_list(
+            _vmi("vm-1"), _vmi("vm-2", namespace="default-2"), _vmi("vm-3", namespace="prod")
+        )
+        tracker = self._tracker()
+        tracker.start()
+
+        self.kubecli.list_namespaces_by_regex.assert_called_once_with("default")
+        self.client.list_namespaced_custom_object.assert_not_called()
+        self.assertEqual([v["metadata"]["name"] for v in tracker.list()], ["vm-1", "vm-2"])
+        self.assertEqual(tracker.get("vm-2", "default").namespace, "default-2")
+        self.assertTrue(tracker.is_ready("vm-2", "default-2"))
+
+    def test_ready_transitions_are_timestamped(self, _):
+        self.client.list_namespaced_custom_object.return_value = _vmi_list(_vmi("vm-1"))
+        tracker = self._tracker()
+        tracker.start()
+        state = tracker.get("vm-1", "default")
+        self.assertTrue(state.ready)
+        self.assertIsNone(state.last_transition)
+
+        before = datetime.now()
+        tracker._on_event("MODIFIED", _vmi("vm-1", phase="Failed", ip="10.0.0.2", node="worker-2"))
+        tracker._on_event("MODIFIED", _vmi("vm-1", phase="Failed", ip="10.0.0.2", node="worker-2"))
+        self.assertFalse(tracker.is_ready("vm-1", "default"))
+        self.assertEqual((state.phase, state.ip_address, state.node_name), ("Failed", "10.0.0.2", "worker-2"))
+        self.assertEqual(len(state.transitions), 1)
+        self.assertGreaterEqual(state.last_transition, before)
+
+        tracker._on_event("MODIFIED", _vmi("vm-1"))
+        tracker._on_event("DELETED", _vmi("vm-1"))
+        self.assertEqual([ready for _, ready in state.transitions], [False, True, False])
+        self.assertTrue(state.deleted)
+        self.assertIsNone(tracker.get_vmi("vm-1", "default"))
+
+    def test_list_errors_are_raised(self, _):
+        self.client.list_namespaced_custom_object.side_effect = Exception("forbidden")
+        with self.assertRaises(Exception):
+            self._tracker().start()
+
+
+class TestVirtHealthCheckPluginVmiWatch(unittest.TestCase):
+    """Tests for the virt health check reading the VMIs from the tracker"""
+
+    def setUp(self):
+        self.factory = HealthCheckFactory()
+        if "virt_health_check" not in self.factory.loaded_plugins:
+            self.skipTest("Virt health check plugin not loaded (missing dependencies)")
+        self.mock_kubecli = MagicMock()
+        self.mock_kubecli.list_namespaces_by_regex.return_value = ["default"]
+        self.mock_kubecli.custom_object_client.list_namespaced_custom_object.return_value = (
+            _vmi_list(_vmi("vm-1"), _vmi("vm-2", ip="10.0.0.2"))
+        )
+        self.plugin = self.factory.create_plugin(
+            "virt_health_check", iterations=1, krkn_lib=self.mock_kubecli
+        )
+        patcher = patch("krkn.cache.shared_informer.SharedInformer.start")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch("krkn.health_checks.virt_health_check_plugin.lookups")
+    @patch("krkn.health_checks.virt_health_check_plugin.KubevirtVmOutageScenarioPlugin")
+    def test_vmis_are_read_from_the_tracker(self, mock_plugin_class, mock_lookups):
+        mock_plugin_class.return_value.k8s_client = self.mock_kubecli
+
+        self.assertTrue(self.plugin._initialize_from_config({"namespace": "default"}))
+        self.addCleanup(self.plugin.vmi_tracker.stop)
+
+        self.assertEqual([vm.vm_name for vm in self.plugin.vm_list], ["vm-1", "vm-2"])
+        self.mock_kubecli.get_vmis.assert_not_called()
+        self.assertTrue(self.plugin.check_vmi_ready("vm-1", "default"))
+        self.plugin.vmi_tracker._on_event("MODIFIED", _vmi("vm-1", ready=False))
+        self.assertFalse(self.plugin.check_vmi_ready("vm-1", "default"))
+        mock_lookups.get_vmi.assert_not_called()
+
+    @patch("krkn.health_checks.virt_health_check_plugin.KubevirtVmOutageScenarioPlugin")
+    def test_vmi_watch_disabled_uses_get_vmis(self, mock_plugin_class):
+        mock_plugin_class.return_value.k8s_client = self.mock_kubecli
+        self.mock_kubecli.get_vmis.return_value = []
+
+        config = {"namespace": "default", "vmi_watch": False}
+        self.assertTrue(self.plugin._initialize_from_config(config))
+
+        self.assertIsNone(self.plugin.vmi_tracker)
+        self.mock_kubecli.get_vmis.assert_called_once_with(".*", "default", label_selector=None)
+        self.mock_kubecli.custom_object_client.list_namespaced_custom_object.assert_not_called()
+
+    @patch("krkn.health_checks.virt_health_check_plugin.KubevirtVmOutageScenarioPlugin")
+    def test_failed_list_falls_back_to_get_vmis(self, mock_plugin_class):
+        mock_plugin_class.return_value.k8s_client = self.mock_kubecli
+        self.mock_kubecli.custom_object_client.list_namespaced_custom_object.side_effect = (
+            Exception("forbidden")
+        )
+        self.mock_kubecli.get_vmis.return_value = [_vmi("vm-1")]
+
+        self.assertTrue(self.plugin._initialize_from_config({"namespace": "default"}))
+
+        self.assertIsNone(self.plugin.vmi_tracker)
+        self.assertEqual([vm.vm_name for vm in self.plugin.vm_list], ["vm-1"])
+
+    @patch("krkn.health_checks.virt_health_check_plugin.time.sleep")
+    def test_segment_boundary_is_the_watched_transition(self, mock_sleep):
+        tracker = VmiStatusTracker(self.mock_kubecli, "default")
+        tracker.start()
+        self.addCleanup(tracker.stop)
+        self.plugin.vmi_tracker = tracker
+        self.plugin.only_failures = False
+        self.plugin.disconnected = False
+        vm = MagicMock(vm_name="vm-1", namespace="default", ip_address="10.0.0.1",
+                       node_name="worker-1", new_ip_address="")
+
+        transition = []
+        def fail_between_checks(*_):
+            if not transition:
+                tracker._on_event("MODIFIED", _vmi("vm-1", ready=False))
+                transition.append(tracker.get("vm-1", "default").last_transition)
+            else:
+                self.plugin.current_iterations = self.plugin.iterations
+        mock_sleep.side_effect = fail_between_checks
+
+        with patch.object(self.plugin, "get_vm_access", return_value=True):
+            telemetry_queue = queue.SimpleQueue()
+            self.plugin._run_virt_check_batch([vm], telemetry_queue)
+
+        healthy, not_ready = telemetry_queue.get_nowait()
+        self.assertTrue(healthy.vmi_ready)
+        self.assertFalse(not_ready.vmi_ready)
+        self.assertEqual(healthy.end_timestamp, transition[0].isoformat())
+        self.assertEqual(not_ready.start_timestamp, transition[0].isoformat())
+
+
+class FakeSsh:
+    """run function standing in for the ssh client: a master creates its
+    control socket, a command returns the next configured result."""
+
+    def __init__(self, results=None, connect_returncode=0):
+        self.results = list(results or [])
+        self.connect_returncode = connect_returncode
+        self.calls = []
+
+    def __call__(self, command, **kwargs):
+        self.calls.append(command)
+        control_path = next(
+            o.split("=", 1)[1] for o in command if o.startswith("ControlPath=")
+        )
+        if "ControlMaster=yes" in command:
+            if self.connect_returncode == 0:
+                open(control_path, "w").close()
+            return SimpleNamespace(returncode=self.connect_returncode, stdout="", stderr="denied")
+        if "-O" in command:
+            if os.path.exists(control_path):
+                os.remove(control_path)
+            return SimpleNamespace(returncode=0, stdout="", stderr="")
+        returncode, output = self.results.pop(0) if self.results else (0, "")
+        return SimpleNamespace(returncode=returncode, stdout=output, stderr="")
+
+    def count(self, marker):
+        return len([c for c in self.calls if marker in c])
+
+
+class TestSshSessionPool(unittest.TestCase):
+    """Tests for the ControlMaster session pool of the disconnected checks"""
+
+    def _pool(self, fake):
+        pool = SshSessionPool(run_func=fake)
+        self.addCleanup(pool.close_all)
+        return pool
+
+    def test_session_is_reused_across_probes(self):
+        fake = FakeSsh([(0, "Permission denied"), (0, "Permission denied")])
+        pool = self._pool(fake)
+
+        first = pool.run("core@worker-1", "ssh root@10.0.0.1")
+        second = pool.run("core@worker-1", "ssh root@10.0.0.1")
+
+        self.assertEqual(fake.count("ControlMaster=yes"), 1)
+        self.assertEqual(fake.count("ControlMaster=no"), 2)
+        self.assertIsNotNone(first.connect_latency)
+        self.assertIsNone(second.connect_latency)
+        self.assertIsNotNone(second.command_latency)
+        self.assertTrue(second.ok)
+        self.assertEqual(fake.calls[-1][-2:], ["core@worker-1", "ssh root@10.0.0.1"])
+
+    def test_failed_session_reconnects_on_next_probe(self):
+        fake = FakeSsh([(SSH_ERROR, "broken pipe"), (0, "Permission denied")])
+        pool = self._pool(fake)
+
+        self.assertFalse(pool.run("core@worker-1", "true").ok)
+        self.assertFalse(pool.is_connected("core@worker-1"))
+        self.assertIsNotNone(pool.run("core@worker-1", "true").connect_latency)
+        self.assertEqual(fake.count("ControlMaster=yes"), 2)
+
+    def test_expired_session_reconnects(self):
+        fake = FakeSsh()
+        pool = self._pool(fake)
+        pool.connect("core@worker-1")
+        os.remove(pool._control_path("core@worker-1"))
+
+        self.assertIsNotNone(pool.connect("core@worker-1"))
+
+    def test_connect_failure_is_a_failed_result(self):
+        fake = FakeSsh(connect_returncode=SSH_ERROR)
+        result = self._pool(fake).run("core@worker-1", "true")
+
+        self.assertFalse(result.ok)
+        self.assertIn("denied", result.output)
+        self.assertEqual(fake.count("ControlMaster=no"), 0)
+
+    def test_probe_latencies(self):
+        latencies = ProbeLatencies()
+        latencies.add("vm-1", connect_latency=0.2, command_latency=0.01)
+        latencies.add("vm-1", command_latency=0.03)
+
+        metrics = latencies.to_dict("vm-1")
+        self.assertEqual((metrics["connects"], metrics["commands"]), (1, 2))
+        self.assertEqual(metrics["connect_max_ms"], 200.0)
+        self.assertEqual(metrics["command_mean_ms"], 20.0)
+        self.assertEqual(metrics["command_max_ms"], 30.0)
+        # interpolated in a bucket of the first probe
+        self.assertGreaterEqual(metrics["command_p50_ms"], 10 / 1.3)
+        self.assertLessEqual(metrics["command_p50_ms"], 10 * 1.3)
+        self.assertIsNone(latencies.to_dict("vm-2"))
+
+    def test_probe_latencies_memory_is_bounded(self):
+        latencies = ProbeLatencies()
+        for i in range(10000):
+            latencies.add("vm-1", command_latency=0.001 * (i % 100 + 1))
+
+        stats = latencies._command["vm-1"]
+        self.assertEqual(stats.count, 10000)
+        self.assertLess(stats.histogram.counts.size, 100)
+        metrics = latencies.to_dict("vm-1")
+        self.assertAlmostEqual(metrics["command_p50_ms"], 50, delta=50 * 0.3)
+        self.assertAlmostEqual(metrics["command_p95_ms"], 95, delta=95 * 0.3)
+        self.assertEqual(metrics["command_max_ms"], 100.0)
+
+    def test_close_all_is_registered_at_exit(self):
+        fake = FakeSsh()
+        with patch("krkn.health_checks.ssh_session_pool.atexit") as mock_atexit:
+            pool = self._pool(fake)
+            mock_atexit.register.assert_called_once_with(pool.close_all)
+            pool.run("core@worker-1", "true")
+            pool.close_all()
+            mock_atexit.unregister.assert_called_once_with(pool.close_all)
+        self.assertEqual(fake.count("-O"), 1)
+        self.assertFalse(os.path.exists(pool._control_dir))
+
+
+class TestVirtHealthCheckPluginSshSessions(unittest.TestCase):
+    """Tests for the access probes reusing their SSH sessions"""
+
+    def setUp(self):
+        self.factory = HealthCheckFactory()
+        if "virt_health_check" not in self.factory.loaded_plugins:
+            self.skipTest("Virt health check plugin not loaded (missing dependencies)")
+        self.plugin = self.factory.create_plugin(
+            "virt_health_check", iterations=1, krkn_lib=MagicMock()
+        )
+        self.plugin.namespace = "default"
+
+    @patch("krkn.health_checks.virt_health_check_plugin.invoke_no_exit")
+    def test_disconnected_probe_runs_on_the_node_session(self, mock_invoke):
+        self.plugin.ssh_pool = MagicMock()
+        self.plugin.ssh_pool.run.return_value = SshResult(
+            0, "root@10.0.0.1: Permission denied (publickey).", 0.5, 0.02
+        )
+
+        result = self.plugin.check_disconnected_access("10.0.0.1", "worker-1", "vm-1")
+
+        self.assertEqual(result, (True, None, None))
+        mock_invoke.assert_not_called()
+        destination, command = self.plugin.ssh_pool.run.call_args[0]
+        self.assertEqual(destination, "core@worker-1")
+        self.assertIn("root@10.0.0.1", command)
+        metrics = self.plugin.probe_latencies.to_dict("vm-1")
+        self.assertEqual(metrics["connect_p50_ms"], 500.0)
+        self.assertEqual(metrics["command_p50_ms"], 20.0)
+
+    def test_failed_node_session_falls_back_to_the_ssh_node(self):
+        self.plugin.ssh_node = "bastion"
+        self.plugin.vmi_tracker = None
+        self.plugin.kube_vm_plugin = MagicMock()
+        self.plugin.kube_vm_plugin.get_vmi.return_value = {
+            "status": {"interfaces": [{"ipAddress": "10.0.0.1"}], "nodeName": "worker-1"}
+        }
+        self.plugin.ssh_pool = MagicMock()
+        self.plugin.ssh_pool.run.side_effect = [
+            SshResult(SSH_ERROR, "Connection refused", None, None),
+            SshResult(0, "Permission denied", None, 0.02),
+        ]
+
+        result = self.plugin.check_disconnected_access("10.0.0.1", "worker-1", "vm-1")
+
+        self.assertEqual(result, (True, "10.0.0.1", None))
+        self.assertEqual(self.plugin.ssh_pool.run.call_args[0][0], "core@bastion")
+
+    @patch("krkn.health_checks.virt_health_check_plugin.KubevirtVmOutageScenarioPlugin")
+    def test_pool_is_created_for_disconnected_checks_only(self, mock_plugin_class):
+        mock_plugin_class.return_value.k8s_client.get_vmis.return_value = []
+        config = {"namespace": "default", "vmi_watch": False}
+
+        self.assertTrue(self.plugin._initialize_from_config(config))
+        self.assertIsNone(self.plugin.ssh_pool)
+
+        config.update(disconnected=True)
+        self.assertTrue(self.plugin._initialize_from_config(config))
+        self.addCleanup(self.plugin.ssh_pool.close_all)
+        self.assertIsInstance(self.plugin.ssh_pool, SshSessionPool)
+
+    @patch("krkn.health_checks.virt_health_check_plugin.invoke_no_exit")
+    def test_virtctl_target_that_worked_is_tried_first(self, mock_invoke):
+        mock_invoke.side_effect = lambda cmd: "True" if "root@vmi/vm-1" in cmd else "False"
+
+        self.assertTrue(self.plugin.get_vm_access("vm-1", "default"))
+        self.assertTrue(self.plugin.get_vm_access("vm-1", "default"))
+
+        self.assertEqual(mock_invoke.call_count, 3)
+        self.assertEqual(self.plugin.probe_latencies.to_dict("vm-1")["connects"], 2)
+
+    @patch("krkn.health_checks.virt_health_check_plugin.time.sleep")
+    def test_latency_metrics_are_attached_to_the_last_record(self, mock_sleep):
+        def stop(*_):
+            self.plugin.current_iterations = self.plugin.iterations
+        mock_sleep.side_effect = stop
+        vm = MagicMock(vm_name="vm-1", namespace="default", ip_address="10.0.0.1",
+                       node_name="worker-1", new_ip_address="")
+        self.plugin.probe_latencies.add("vm-1", connect_latency=0.1)
+
+        with patch.object(self.plugin, "get_vm_access", return_value=True), \
+             patch.object(self.plugin, "check_vmi_ready", return_value=True):
+            telemetry_queue = queue.SimpleQueue()
+            self.plugin._run_virt_check_batch([vm], telemetry_queue)
+
+        (record,) = telemetry_queue.get_nowait()
+        self.assertEqual(record.latency_metrics["connects"], 1)
+
+
 if __name__ == "__main__":
     unittest.main()